@@ -32,8 +32,19 @@ SOLID Principles Demonstrated:
 """
 
 import json
+import multiprocessing
 import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
@@ -53,6 +64,25 @@ from infrastructure.repositories.arxiv_paper_repository import ArxivPaperReposit
 from infrastructure.repositories.in_memory_paper_repository import (
     InMemoryPaperRepository,
 )
+from infrastructure.repositories.rate_limited_paper_repository import (
+    RateLimitedPaperRepository,
+)
+from infrastructure.repositories.coalescing_paper_repository import (
+    CoalescingPaperRepository,
+    QueryGroup,
+    QueryPlanner,
+)
+from infrastructure.batch_job_journal import BatchJobJournal
+from infrastructure.concept_extraction_manifest import ConceptExtractionManifest
+from infrastructure.paper_fingerprint_index import PaperFingerprintIndex
+from infrastructure.pdf_blob_store import PdfBlobStore
+from infrastructure.extracted_text_cache import ExtractedTextCache
+from infrastructure.download_extract_pipeline import DownloadExtractPipeline
+from infrastructure.timed_process_pool import TimedProcessPoolExecutor
+from infrastructure.run_metrics import RunMetrics
+from infrastructure.http_response_cache import HttpResponseCache
+from infrastructure.shared_rate_limiter import SharedRateLimiter
+from domain.services.paper_download_service import PaperDownloadService
 from domain.entities.research_paper import ResearchPaper
 
 # Concept extraction imports (with graceful fallback)
@@ -60,7 +90,10 @@ try:
     from application.use_cases.extract_paper_concepts_use_case import (
         ExtractPaperConceptsUseCase,
     )
-    from domain.services.concept_extractor import ConceptExtractor
+    from domain.services.concept_extractor import (
+        ConceptExtractor,
+        TFIDFConceptExtractor,
+    )
     from domain.services.concept_hierarchy_builder import ConceptHierarchyBuilder
     from infrastructure.pdf_extractor import PyPDF2TextExtractor
     from infrastructure.json_concept_repository import JSONConceptRepository
@@ -97,6 +130,14 @@ class BatchProcessor:
     - Research concept discovery and visualization
     """
 
+    JOURNAL_FILENAME = ".batch_journal.jsonl"
+
+    # Per-strategy search results, reused when a resumed run skips the search
+    SEARCH_RESULTS_FILENAME = ".search_results.json"
+
+    # Bump when extraction output changes so cached concepts are re-extracted
+    CONCEPT_EXTRACTOR_VERSION = "1.0"
+
     def __init__(
         self,
         config_dir: str = "config",
@@ -105,6 +146,15 @@ class BatchProcessor:
         enable_concept_extraction: bool = False,
         concept_extractor=None,
         hierarchy_builder=None,
+        max_workers: int = 1,
+        resume: bool = False,
+        pipeline_downloads: bool = False,
+        download_workers: int = 4,
+        response_cache: Optional[HttpResponseCache] = None,
+        coalesce_queries: bool = False,
+        rate_limiter: Optional[SharedRateLimiter] = None,
+        refresh_pdfs: bool = False,
+        extraction_timeout: float = TimedProcessPoolExecutor.DEFAULT_TIMEOUT_SECONDS,
     ):
         """
         Initialize batch processor with configuration and output paths.
@@ -116,6 +166,20 @@ class BatchProcessor:
             enable_concept_extraction: Whether to extract concepts from downloaded papers
             concept_extractor: Optional custom concept extractor (for testing)
             hierarchy_builder: Optional custom hierarchy builder (for testing)
+            max_workers: Number of strategies to run concurrently (1 = sequential)
+            resume: Skip stages the job journal records as completed
+            pipeline_downloads: Extract concepts from each PDF as soon as it
+                is downloaded, overlapping downloads with extraction
+            download_workers: Download threads per strategy
+            response_cache: Optional on-disk HTTP cache for paper source queries
+            coalesce_queries: Merge overlapping strategy queries into shared
+                API calls before processing
+            rate_limiter: Optional host-wide limiter shared with other batch
+                processes; API searches and PDF downloads draw from it
+            refresh_pdfs: Re-check already downloaded PDFs with conditional
+                requests and replace the ones that changed upstream
+            extraction_timeout: Seconds one PDF's concept extraction may take
+                in a worker process before the worker is replaced
 
         Educational Notes:
         - Uses pathlib for cross-platform file operations
@@ -126,6 +190,42 @@ class BatchProcessor:
         self.config_dir = Path(config_dir)
         self.output_dir = Path(output_dir)
         self.max_papers = max_papers
+        self.max_workers = max(1, max_workers)
+        self.resume = resume
+        self.refresh_pdfs = refresh_pdfs
+        self.pipeline_downloads = pipeline_downloads
+        self.download_workers = max(1, download_workers)
+        self.response_cache = response_cache
+        self.coalesce_queries = coalesce_queries
+        self.rate_limiter = rate_limiter
+        self.extraction_timeout = extraction_timeout
+
+        # Query groups planned before processing (empty = no coalescing)
+        self._query_groups: List[QueryGroup] = []
+        self._coalescing_repositories: List[CoalescingPaperRepository] = []
+
+        # Per-stage wall time, item and byte counts for the run report
+        self.metrics = RunMetrics()
+
+        # requests.Session is not guaranteed thread-safe: one per download thread
+        self._download_services = threading.local()
+
+        # Durable record of completed stages for resumable runs
+        self.journal = BatchJobJournal(self.output_dir / self.JOURNAL_FILENAME)
+
+        # Persistent record of every stored paper, shared by all configurations
+        # and runs, so a paper is only ever stored under one strategy
+        self.paper_index = PaperFingerprintIndex(
+            self.output_dir / PaperFingerprintIndex.FILENAME
+        )
+
+        # One copy of each PDF, hard-linked into every strategy's pdfs/
+        self.pdf_store = PdfBlobStore(self.output_dir / PdfBlobStore.DIRNAME)
+
+        # Extracted PDF text by content hash, so re-extraction skips parsing
+        self.text_cache = ExtractedTextCache(
+            self.output_dir / ExtractedTextCache.DIRNAME
+        )
 
         # Concept extraction configuration
         self.enable_concept_extraction = enable_concept_extraction
@@ -140,9 +240,27 @@ class BatchProcessor:
             "papers_stored": 0,
             "duplicates_filtered": 0,
             "concepts_extracted": 0,
+            "strategies_resumed": 0,
             "errors": [],
         }
 
+        # Guards processed_papers and processing_stats when strategies run
+        # concurrently; re-entrant so helpers can nest under one acquisition
+        self._state_lock = threading.RLock()
+
+        # Concept extraction pool shared by every strategy's pipeline
+        self._extraction_pool: Optional[Executor] = None
+
+    def _increment_stat(self, stat_name: str, amount: int = 1) -> None:
+        """Atomically add to a numeric processing statistic."""
+        with self._state_lock:
+            self.processing_stats[stat_name] += amount
+
+    def _record_error(self, error_msg: str) -> None:
+        """Atomically append an error message to the processing statistics."""
+        with self._state_lock:
+            self.processing_stats["errors"].append(error_msg)
+
     def discover_configurations(self) -> Dict[str, Path]:
         """
         Discover all YAML configuration files in the config directory.
@@ -191,7 +309,7 @@ class BatchProcessor:
             return KeywordConfig.from_yaml_file(str(config_path))
         except Exception as e:
             error_msg = f"Failed to load configuration {config_path}: {e}"
-            self.processing_stats["errors"].append(error_msg)
+            self._record_error(error_msg)
             raise Exception(error_msg) from e
 
     def create_output_structure(self, config_name: str, strategy_name: str) -> Path:
@@ -221,12 +339,19 @@ class BatchProcessor:
 
         return strategy_dir
 
-    def deduplicate_papers(self, papers: List[ResearchPaper]) -> List[ResearchPaper]:
+    def deduplicate_papers(
+        self,
+        papers: List[ResearchPaper],
+        config_name: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+    ) -> List[ResearchPaper]:
         """
         Remove duplicate papers based on DOI and maintain most recent papers.
 
         Args:
             papers: List of research papers to deduplicate
+            config_name: Configuration being processed (enables the persistent index)
+            strategy_name: Strategy being processed (enables the persistent index)
 
         Returns:
             List of unique papers, sorted by publication date (most recent first)
@@ -236,6 +361,9 @@ class BatchProcessor:
         - Handles papers without DOIs by using title similarity
         - Sorts by publication date to ensure most recent papers are kept
         - Updates global tracking set to prevent cross-strategy duplicates
+        - Holds the state lock so concurrent strategies cannot both claim a paper
+        - Consults the persistent fingerprint index so papers stored by another
+          strategy in an earlier run are not stored (or downloaded) again
         """
         unique_papers = []
         local_dois = set()
@@ -243,26 +371,50 @@ class BatchProcessor:
         # Sort papers by publication date (most recent first)
         sorted_papers = sorted(papers, key=lambda p: p.publication_date, reverse=True)
 
-        for paper in sorted_papers:
-            # Use DOI as primary deduplication key
-            paper_key = (
-                paper.doi if paper.doi else f"title:{paper.title.lower().strip()}"
-            )
-
-            # Check both local (within this batch) and global (across all strategies) duplicates
-            if paper_key not in local_dois and paper_key not in self.processed_papers:
-                unique_papers.append(paper)
-                local_dois.add(paper_key)
-                self.processed_papers.add(paper_key)
+        with self._state_lock:
+            for paper in sorted_papers:
+                # Use DOI as primary deduplication key
+                paper_key = (
+                    paper.doi if paper.doi else f"title:{paper.title.lower().strip()}"
+                )
 
-                # Respect maximum papers limit
-                if len(unique_papers) >= self.max_papers:
-                    break
-            else:
-                self.processing_stats["duplicates_filtered"] += 1
+                # Check both local (within this batch) and global (across all strategies) duplicates
+                if (
+                    paper_key not in local_dois
+                    and paper_key not in self.processed_papers
+                    and not self._stored_by_other_strategy(
+                        paper, config_name, strategy_name
+                    )
+                ):
+                    unique_papers.append(paper)
+                    local_dois.add(paper_key)
+                    self.processed_papers.add(paper_key)
+
+                    # Respect maximum papers limit
+                    if len(unique_papers) >= self.max_papers:
+                        break
+                else:
+                    self._increment_stat("duplicates_filtered")
 
         return unique_papers
 
+    def _stored_by_other_strategy(
+        self,
+        paper: ResearchPaper,
+        config_name: Optional[str],
+        strategy_name: Optional[str],
+    ) -> bool:
+        """
+        Check the persistent index for a copy stored under another strategy.
+
+        A paper indexed under the strategy being processed is not a duplicate:
+        it is simply being refreshed (e.g. after its metadata.json was lost).
+        """
+        if config_name is None or strategy_name is None:
+            return False
+        location = self.paper_index.locate(paper)
+        return location is not None and location != (config_name, strategy_name)
+
     def serialize_papers(self, papers: List[ResearchPaper]) -> List[Dict]:
         """
         Convert ResearchPaper objects to JSON-serializable dictionaries.
@@ -369,7 +521,13 @@ class BatchProcessor:
         - Implements idempotent behavior by checking download history
         - Uses DOI as primary identifier, falls back to title matching
         - Prevents duplicate downloads across multiple runs
+        - In refresh mode every paper is passed on: the download service
+          asks the server whether each known PDF changed, which costs a
+          bodiless 304 answer for the ones that did not
         """
+        if self.refresh_pdfs:
+            return True
+
         downloaded_papers = existing_metadata.get("downloaded_papers", {})
         paper_key = paper.doi if paper.doi else f"title:{paper.title.lower().strip()}"
 
@@ -381,7 +539,7 @@ class BatchProcessor:
         output_path: Path,
         config_name: str,
         strategy_name: str,
-    ) -> None:
+    ) -> bool:
         """
         Save strategy results to JSON file with metadata.
 
@@ -391,6 +549,9 @@ class BatchProcessor:
             config_name: Configuration name for metadata
             strategy_name: Strategy name for metadata
 
+        Returns:
+            True if the results were written, False if saving failed
+
         Educational Notes:
         - Creates comprehensive metadata for research provenance
         - Uses JSON for cross-platform data interchange
@@ -468,15 +629,24 @@ class BatchProcessor:
 
             # Extract concepts if enabled
             if self.enable_concept_extraction:
-                self._extract_and_save_concepts(output_path, config_name, strategy_name)
+                self._extract_and_save_concepts(
+                    output_path, config_name, strategy_name, papers
+                )
+
+            return True
 
         except Exception as e:
             error_msg = f"Failed to save results for {config_name}/{strategy_name}: {e}"
-            self.processing_stats["errors"].append(error_msg)
+            self._record_error(error_msg)
             print(f"    ❌ {error_msg}")
+            return False
 
     def _extract_and_save_concepts(
-        self, output_path: Path, config_name: str, strategy_name: str
+        self,
+        output_path: Path,
+        config_name: str,
+        strategy_name: str,
+        papers: Optional[List[ResearchPaper]] = None,
     ) -> None:
         """
         Extract concepts from downloaded PDFs and save hierarchy for GUI.
@@ -485,130 +655,248 @@ class BatchProcessor:
             output_path: Strategy output directory containing PDFs
             config_name: Configuration name for context
             strategy_name: Strategy name for context
+            papers: The strategy's papers, used to extract each PDF together
+                with the paper it belongs to
 
         Educational Notes:
         - Integrates concept extraction with batch processing
         - Creates GUI-compatible concept hierarchy files
         - Handles errors gracefully to maintain system stability
         - Uses dependency injection for testability
+        - Extracts incrementally: every PDF is extracted on its own and its
+          concepts are cached under its content hash, so only new or changed
+          PDFs are extracted and their results are merged with the cached ones
         """
         # If extractors are injected (testing mode), skip availability check
-        if self._concept_extractor is not None or self._hierarchy_builder is not None:
-            try:
-                print(f"    🧠 Extracting concepts for {strategy_name}...")
-
-                pdfs_dir = output_path / "pdfs"
-                if not pdfs_dir.exists() or not any(pdfs_dir.glob("*.pdf")):
-                    print(f"    ⚠️  No PDFs found in {pdfs_dir}")
-                    return
-
-                # Use injected extractors (for testing)
-                concept_extractor = self._concept_extractor
-                hierarchy_builder = self._hierarchy_builder
-
-                # Extract concepts from PDFs
-                if hasattr(concept_extractor, "extract_from_directory"):
-                    # Mock extractor (for testing)
-                    extraction_result = concept_extractor.extract_from_directory(
-                        pdfs_dir
-                    )
-                else:
-                    # Real concept extraction using use case
-                    extraction_result = self._extract_concepts_with_use_case(pdfs_dir)
-
-                if not extraction_result or not extraction_result.get("concepts"):
-                    print(f"    ⚠️  No concepts extracted for {strategy_name}")
-                    return
-
-                # Build concept hierarchy
-                if hasattr(hierarchy_builder, "build_hierarchy"):
-                    # Mock hierarchy builder (for testing)
-                    hierarchy_result = hierarchy_builder.build_hierarchy(
-                        extraction_result["concepts"]
-                    )
-                else:
-                    # Real hierarchy building
-                    hierarchy_result = self._build_concept_hierarchy(
-                        extraction_result["concepts"]
-                    )
-
-                # Save concepts and hierarchy files
-                self._save_concept_files(
-                    output_path,
-                    extraction_result,
-                    hierarchy_result,
-                    config_name,
-                    strategy_name,
-                )
-
-                concept_count = len(extraction_result.get("concepts", []))
-                self.processing_stats["concepts_extracted"] += concept_count
-                print(f"    ✅ Extracted and saved {concept_count} concepts")
-
-            except Exception as e:
-                error_msg = (
-                    f"Concept extraction failed for {config_name}/{strategy_name}: {e}"
-                )
-                self.processing_stats["errors"].append(error_msg)
-                print(f"    ❌ {error_msg}")
+        injected = (
+            self._concept_extractor is not None or self._hierarchy_builder is not None
+        )
+        if not injected and not CONCEPT_EXTRACTION_AVAILABLE:
+            print(f"    ⚠️  Concept extraction not available for {strategy_name}")
             return
 
-        # Production mode - check if concept extraction is available
-        if not CONCEPT_EXTRACTION_AVAILABLE:
-            print(f"    ⚠️  Concept extraction not available for {strategy_name}")
+        if self._stage_already_completed(
+            config_name, strategy_name, BatchJobJournal.HIERARCHY
+        ):
+            print(f"    ⏭️  Concepts already extracted for {strategy_name}")
             return
 
         try:
             print(f"    🧠 Extracting concepts for {strategy_name}...")
 
             pdfs_dir = output_path / "pdfs"
-            if not pdfs_dir.exists() or not any(pdfs_dir.glob("*.pdf")):
+            pdf_paths = sorted(pdfs_dir.glob("*.pdf")) if pdfs_dir.exists() else []
+            if not pdf_paths:
                 print(f"    ⚠️  No PDFs found in {pdfs_dir}")
                 return
 
-            # Extract concepts from PDFs using production use case
-            extraction_result = self._extract_concepts_with_use_case(pdfs_dir)
+            manifest = self._open_concept_manifest(output_path)
+            pending = manifest.plan(pdf_paths)
+
+            if (
+                not pending
+                and manifest.hierarchy_built
+                and (output_path / "concepts.json").exists()
+                and (output_path / "concept_hierarchy.json").exists()
+            ):
+                print(f"    ⏭️  Concepts up to date for {strategy_name}")
+                self._mark_concept_stages_completed(config_name, strategy_name)
+                return
+
+            if pending:
+                print(f"    📄 {len(pending)} of {len(pdf_paths)} PDFs need extraction")
+                self._extract_pending_pdfs(pending, manifest, papers or [])
+                manifest.save()
+            elif manifest.has_changes:
+                manifest.save()
 
-            if not extraction_result or not extraction_result.get("concepts"):
+            extraction_result = manifest.merged_extraction_result()
+            if not extraction_result.get("concepts"):
                 print(f"    ⚠️  No concepts extracted for {strategy_name}")
                 return
 
-            # Build concept hierarchy using production hierarchy builder
-            hierarchy_result = self._build_concept_hierarchy(
-                extraction_result["concepts"]
+            self._save_concepts_file(
+                output_path, extraction_result, config_name, strategy_name
+            )
+            self._mark_stage_completed(
+                config_name,
+                strategy_name,
+                BatchJobJournal.CONCEPT_EXTRACTION,
+                {
+                    "concepts": len(extraction_result["concepts"]),
+                    "pdfs_extracted": len(pending),
+                },
             )
 
-            # Save concepts and hierarchy files
-            self._save_concept_files(
-                output_path,
-                extraction_result,
-                hierarchy_result,
+            # Build concept hierarchy and save it for GUI visualization
+            hierarchy_result = self._run_hierarchy_building(
+                extraction_result["concepts"]
+            )
+            self._save_hierarchy_file(
+                output_path, hierarchy_result, config_name, strategy_name
+            )
+            manifest.mark_hierarchy_built()
+            self._mark_stage_completed(
                 config_name,
                 strategy_name,
+                BatchJobJournal.HIERARCHY,
+                {"total_concepts": hierarchy_result.get("total_concepts", 0)},
             )
 
             concept_count = len(extraction_result.get("concepts", []))
-            self.processing_stats["concepts_extracted"] += concept_count
+            self._increment_stat("concepts_extracted", concept_count)
             print(f"    ✅ Extracted and saved {concept_count} concepts")
 
         except Exception as e:
             error_msg = (
                 f"Concept extraction failed for {config_name}/{strategy_name}: {e}"
             )
-            self.processing_stats["errors"].append(error_msg)
+            self._record_error(error_msg)
             print(f"    ❌ {error_msg}")
 
-    def _create_default_concept_extractor(self):
-        """Create default concept extractor for production use."""
+    def _open_concept_manifest(self, output_path: Path) -> ConceptExtractionManifest:
+        """Load the strategy's concept extraction manifest."""
+        return ConceptExtractionManifest(
+            output_path / ConceptExtractionManifest.FILENAME,
+            extractor_version=self._concept_extractor_version(),
+        )
+
+    def _concept_extractor_version(self) -> str:
+        """
+        Identify the extractor configuration for manifest invalidation.
+
+        Educational Note:
+        Bumping CONCEPT_EXTRACTOR_VERSION (or swapping the extractor class)
+        changes this identifier, which discards every cached result.
+        """
+        extractor = self._concept_extractor
+        extractor_name = (
+            type(extractor).__name__
+            if extractor is not None
+            else "ExtractPaperConceptsUseCase"
+        )
+        return f"{extractor_name}:{self.CONCEPT_EXTRACTOR_VERSION}"
+
+    def _extract_pending_pdfs(
+        self,
+        pdf_paths: List[Path],
+        manifest: ConceptExtractionManifest,
+        papers: List[ResearchPaper],
+    ) -> None:
+        """
+        Extract each pending PDF on its own and cache it in the manifest.
+
+        Educational Notes:
+        - PDFs are matched to their papers by download filename, so the
+          production use case extracts them with extract_concepts_from_paper,
+          exactly as pipeline workers do
+        - A PDF that fails is not recorded and is retried on the next run;
+          the other PDFs of the strategy keep their results
+        - The production extractor runs in the shared process pool, so a
+          PDF that hangs times out instead of stalling the run
+        """
+        papers_by_pdf = {
+            PaperDownloadService.pdf_filename(paper): paper for paper in papers
+        }
+        injected = (
+            self._concept_extractor is not None or self._hierarchy_builder is not None
+        )
+        if not injected:
+            self._extract_pending_pdfs_in_pool(pdf_paths, manifest, papers_by_pdf)
+            return
+
+        use_case = None
+        if not hasattr(self._concept_extractor, "extract_from_directory"):
+            use_case = self._create_default_concept_extractor(
+                stage_timer=self.metrics.record, text_cache=self.text_cache
+            )
+
+        for pdf_path in pdf_paths:
+            try:
+                result = self._extract_concepts_for_pdf(
+                    papers_by_pdf.get(pdf_path.name), pdf_path, use_case
+                )
+            except Exception as e:
+                self._record_error(f"Concept extraction failed for {pdf_path}: {e}")
+                print(f"    ❌ Concept extraction failed for {pdf_path.name}: {e}")
+                continue
+            if result is not None:
+                # Record empty results too, so text-less PDFs are not retried
+                manifest.record(pdf_path, result)
+
+    def _extract_pending_pdfs_in_pool(
+        self,
+        pdf_paths: List[Path],
+        manifest: ConceptExtractionManifest,
+        papers_by_pdf: Dict[str, ResearchPaper],
+    ) -> None:
+        """Extract pending PDFs in the shared process pool, with timeouts."""
+        pool = self._shared_extraction_pool(in_threads=False)
+        extract = partial(_extract_concepts_in_worker, text_cache=self.text_cache)
+        futures = {
+            pool.submit(extract, papers_by_pdf.get(pdf_path.name), pdf_path): pdf_path
+            for pdf_path in pdf_paths
+        }
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                self._record_error(f"Concept extraction failed for {pdf_path}: {e}")
+                print(f"    ❌ Concept extraction failed for {pdf_path.name}: {e}")
+                continue
+            self.metrics.merge(result.pop("stage_samples", []))
+            manifest.record(pdf_path, result)
+
+    def _mark_concept_stages_completed(
+        self, config_name: str, strategy_name: str
+    ) -> None:
+        """Journal both concept stages when cached results are already current."""
+        for stage in (BatchJobJournal.CONCEPT_EXTRACTION, BatchJobJournal.HIERARCHY):
+            self._mark_stage_completed(config_name, strategy_name, stage)
+
+    def _run_hierarchy_building(self, concept_dicts: List[Dict]) -> Dict:
+        """Build the hierarchy with the injected builder or the production builder."""
+        with self.metrics.stage("hierarchy_building", items=len(concept_dicts)):
+            if hasattr(self._hierarchy_builder, "build_hierarchy"):
+                # Mock hierarchy builder (for testing)
+                return self._hierarchy_builder.build_hierarchy(concept_dicts)
+            return self._build_concept_hierarchy(concept_dicts)
+
+    @staticmethod
+    def _create_default_concept_extractor(stage_timer=None, text_cache=None):
+        """
+        Create default concept extractor for production use.
+
+        Args:
+            stage_timer: Optional RunMetrics.record-compatible callback that
+                times PDF text extraction and each concept strategy
+            text_cache: Optional ExtractedTextCache consulted before parsing
+
+        Educational Note:
+        The TF-IDF strategy scores terms against the document frequencies
+        stored next to the repository's concepts. It records the terms of
+        every paper it scores there, so each paper is weighted by
+        its domain's stored corpus without refitting.
+        """
         if not CONCEPT_EXTRACTION_AVAILABLE:
             return None
 
         # Create real concept extraction use case
-        pdf_extractor = PyPDF2TextExtractor()
+        pdf_extractor = PyPDF2TextExtractor(
+            stage_timer=stage_timer, text_cache=text_cache
+        )
         concept_repo = JSONConceptRepository(storage_directory="concept_storage")
+        tfidf_strategy = TFIDFConceptExtractor(
+            document_frequencies=concept_repo.document_frequencies
+        )
 
         return ExtractPaperConceptsUseCase(
-            pdf_extractor=pdf_extractor, concept_repository=concept_repo
+            pdf_extractor=pdf_extractor,
+            concept_repository=concept_repo,
+            concept_extractor=ConceptExtractor(
+                strategies=[tfidf_strategy], stage_timer=stage_timer
+            ),
         )
 
     def _create_default_hierarchy_builder(self):
@@ -618,29 +906,63 @@ class BatchProcessor:
 
         return ConceptHierarchyBuilder()
 
-    def _extract_concepts_with_use_case(self, pdfs_dir: Path) -> Dict:
-        """Extract concepts using the real use case."""
-        # Create extraction use case
-        use_case = self._create_default_concept_extractor()
+    @classmethod
+    def _extract_concepts_with_use_case(
+        cls, use_case, paper: Optional[ResearchPaper], pdf_path: Path
+    ) -> Dict:
+        """
+        Extract one PDF's concepts using the real use case.
+
+        Educational Note:
+        A PDF whose paper is unknown (e.g. left behind by an earlier run) is
+        extracted as a one-file domain, which infers the paper from the file.
+        """
         if not use_case:
             return {"concepts": [], "total_extracted": 0}
 
-        # Process all PDFs in directory using the correct method
-        paper_concepts_list = use_case.extract_concepts_from_domain(
-            domain_name=pdfs_dir.parent.name,  # Use strategy name as domain
-            papers_directory=pdfs_dir,
-        )
-
-        # Extract all concepts from all papers into a flat list
-        all_concepts = []
-        for paper_concepts in paper_concepts_list:
-            all_concepts.extend(paper_concepts.concepts)
+        if paper is not None:
+            paper_concepts_list = [
+                use_case.extract_concepts_from_paper(paper=paper, pdf_path=pdf_path)
+            ]
+        else:
+            paper_concepts_list = cls._with_staged_pdf(
+                pdf_path,
+                lambda staging_dir: use_case.extract_concepts_from_domain(
+                    domain_name=pdf_path.parent.parent.name,  # The strategy name
+                    papers_directory=staging_dir,
+                ),
+            )
 
         # Convert Concept objects to dictionaries for JSON serialization
-        concept_dicts = [concept.to_dict() for concept in all_concepts]
-
+        concept_dicts = [
+            concept.to_dict()
+            for paper_concepts in paper_concepts_list
+            for concept in paper_concepts.concepts
+        ]
         return {"concepts": concept_dicts, "total_extracted": len(concept_dicts)}
 
+    @staticmethod
+    def _with_staged_pdf(pdf_path: Path, extract_directory):
+        """
+        Run a directory-based extractor on exactly one PDF.
+
+        Educational Note:
+        The PDF is hard-linked (or copied) into a private staging directory
+        next to the pdfs/ folder, which is removed afterwards.
+        """
+        staging_dir = Path(
+            tempfile.mkdtemp(prefix=".concept_staging_", dir=pdf_path.parent.parent)
+        )
+        try:
+            target = staging_dir / pdf_path.name
+            try:
+                os.link(pdf_path, target)
+            except OSError:
+                shutil.copy2(pdf_path, target)
+            return extract_directory(staging_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
     def _build_concept_hierarchy(self, concept_dicts: List[Dict]) -> Dict:
         """Build concept hierarchy using real hierarchy builder."""
         hierarchy_builder = self._create_default_hierarchy_builder()
@@ -666,18 +988,14 @@ class BatchProcessor:
             "total_concepts": len(hierarchical_dicts),
         }
 
-    def _save_concept_files(
+    def _save_concepts_file(
         self,
         output_path: Path,
         extraction_result: Dict,
-        hierarchy_result: Dict,
         config_name: str,
         strategy_name: str,
     ) -> None:
-        """Save concept and hierarchy files for GUI consumption."""
-        current_time = datetime.now(timezone.utc).isoformat()
-
-        # Save individual concepts file
+        """Save the extracted concepts file for GUI consumption."""
         concepts_file = output_path / "concepts.json"
         concepts_data = {
             "concepts": extraction_result.get("concepts", []),
@@ -685,7 +1003,7 @@ class BatchProcessor:
                 "total_extracted": extraction_result.get("total_extracted", 0),
                 "processing_time": extraction_result.get("processing_time", 0),
                 "quality_score": extraction_result.get("quality_score", 0),
-                "extracted_at": current_time,
+                "extracted_at": datetime.now(timezone.utc).isoformat(),
                 "config_name": config_name,
                 "strategy_name": strategy_name,
             },
@@ -694,14 +1012,21 @@ class BatchProcessor:
         with open(concepts_file, "w", encoding="utf-8") as f:
             json.dump(concepts_data, f, indent=2, ensure_ascii=False)
 
-        # Save concept hierarchy file for GUI visualization
+    def _save_hierarchy_file(
+        self,
+        output_path: Path,
+        hierarchy_result: Dict,
+        config_name: str,
+        strategy_name: str,
+    ) -> None:
+        """Save the concept hierarchy file for GUI visualization."""
         hierarchy_file = output_path / "concept_hierarchy.json"
         hierarchy_data = {
             "root_concepts": hierarchy_result.get("root_concepts", []),
             "visualization_metadata": {
                 "domain": config_name,
                 "strategy": strategy_name,
-                "generated_at": current_time,
+                "generated_at": datetime.now(timezone.utc).isoformat(),
                 "total_concepts": hierarchy_result.get("total_concepts", 0),
                 "max_depth": hierarchy_result.get("max_depth", 0),
                 "visualization_type": "d3_hierarchy",
@@ -711,6 +1036,287 @@ class BatchProcessor:
         with open(hierarchy_file, "w", encoding="utf-8") as f:
             json.dump(hierarchy_data, f, indent=2, ensure_ascii=False)
 
+    def _run_download_pipeline(
+        self,
+        papers: List[ResearchPaper],
+        output_path: Path,
+        config_name: str,
+        strategy_name: str,
+    ) -> None:
+        """
+        Download PDFs and, in pipeline mode, extract their concepts as they land.
+
+        Args:
+            papers: Deduplicated papers to download
+            output_path: Strategy output directory
+            config_name: Configuration name for context
+            strategy_name: Strategy name for context
+
+        Educational Notes:
+        - Every mode downloads here, after deduplication, through the
+          processor's own download service (blob store, resumable and
+          conditional requests, pdf_download metrics)
+        - In pipeline mode download threads and extraction workers run at
+          the same time, so network waits and CPU work overlap instead of
+          alternating; otherwise concepts are extracted once all PDFs are in
+        - Each extraction result is cached in the concept manifest right
+          away; the later per-strategy concept step then only merges the
+          cached results and builds the hierarchy
+        - The production extractor runs in a process pool that gives each
+          PDF extraction_timeout seconds; injected extractors (tests) are
+          not picklable and run in threads instead. Either pool is shared
+          by every strategy of the batch run
+        """
+        pdfs_dir = output_path / "pdfs"
+        pdfs_dir.mkdir(parents=True, exist_ok=True)
+
+        injected = (
+            self._concept_extractor is not None or self._hierarchy_builder is not None
+        )
+        extract = on_result = executor = manifest = None
+        if (
+            self.pipeline_downloads
+            and self.enable_concept_extraction
+            and (injected or CONCEPT_EXTRACTION_AVAILABLE)
+        ):
+            manifest = self._open_concept_manifest(output_path)
+            manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+            def record_result(paper, pdf_path, result):
+                self.metrics.merge(result.pop("stage_samples", []))
+                manifest.record(pdf_path, result)
+
+            on_result = record_result
+
+            if injected:
+                extract = self._extract_concepts_for_pdf
+            else:
+                extract = partial(
+                    _extract_concepts_in_worker, text_cache=self.text_cache
+                )
+            executor = self._shared_extraction_pool(in_threads=injected)
+
+        pipeline = DownloadExtractPipeline(
+            download=lambda paper: self._download_pdf(paper, pdfs_dir),
+            extract=extract,
+            on_result=on_result,
+            download_workers=self.download_workers,
+            executor=executor,
+        )
+        print(
+            f"    ⬇️  Downloading {len(papers)} papers "
+            f"({self.download_workers} download threads)"
+        )
+        stats = pipeline.run(papers)
+
+        if manifest is not None and manifest.has_changes:
+            manifest.save()
+
+        for error in stats.errors:
+            print(f"    ⚠️  {error}")
+        print(
+            f"    📥 Downloaded {stats.downloaded}/{len(papers)} PDFs"
+            + (f", extracted {stats.extracted}" if extract is not None else "")
+        )
+        if stats.extraction_failures:
+            self._record_error(
+                f"Concept extraction failed for {stats.extraction_failures} PDFs "
+                f"in {config_name}/{strategy_name}"
+            )
+
+    def _shared_extraction_pool(self, in_threads: bool) -> Executor:
+        """
+        Return the concept extraction pool shared by the whole batch run.
+
+        Educational Note:
+        A pool per strategy would spawn cpu_count workers for every strategy,
+        each re-importing the extractor. One pool per run pays that start-up
+        cost once, and concurrent strategies simply submit to the same
+        workers. The process pool terminates and replaces a worker whose PDF
+        exceeds extraction_timeout, failing only that PDF.
+        """
+        with self._state_lock:
+            if self._extraction_pool is None:
+                workers = os.cpu_count() or 1
+                if in_threads:
+                    self._extraction_pool = ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="extract"
+                    )
+                else:
+                    self._extraction_pool = TimedProcessPoolExecutor(
+                        max_workers=workers,
+                        timeout=self.extraction_timeout,
+                        mp_context=_worker_process_context(),
+                    )
+            return self._extraction_pool
+
+    def close_extraction_pool(self) -> None:
+        """Shut down the shared concept extraction pool, if one was started."""
+        with self._state_lock:
+            pool, self._extraction_pool = self._extraction_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _extract_concepts_for_pdf(
+        self, paper: Optional[ResearchPaper], pdf_path: Path, use_case=None
+    ) -> Dict:
+        """
+        Extract one PDF with the injected extractor or the production use case.
+
+        Args:
+            paper: Paper the PDF belongs to, if known
+            pdf_path: PDF to extract
+            use_case: Production use case to reuse; created when not given
+        """
+        with self.metrics.stage("concept_extraction") as timing:
+            if hasattr(self._concept_extractor, "extract_from_directory"):
+                # Mock extractor (for testing)
+                result = self._with_staged_pdf(
+                    pdf_path, self._concept_extractor.extract_from_directory
+                )
+            else:
+                if use_case is None:
+                    use_case = self._create_default_concept_extractor(
+                        stage_timer=self.metrics.record, text_cache=self.text_cache
+                    )
+                result = self._extract_concepts_with_use_case(use_case, paper, pdf_path)
+            timing.items = len(result.get("concepts", [])) if result else 0
+        return result
+
+    def _download_pdf(self, paper: ResearchPaper, pdfs_dir: Path) -> Optional[Path]:
+        """Download one paper's PDF, recording its latency and size."""
+        with self.metrics.stage("pdf_download") as timing:
+            pdf_path = self._download_service().download_single_paper(paper, pdfs_dir)
+            if pdf_path:
+                timing.nbytes = Path(pdf_path).stat().st_size
+            else:
+                timing.items = 0
+        return pdf_path
+
+    def _download_service(self) -> PaperDownloadService:
+        """
+        Return the calling thread's download service.
+
+        Every batch download goes through this service, in all modes, so
+        each PDF is looked up in the blob store before it is fetched and
+        stored there once.
+        """
+        service = getattr(self._download_services, "service", None)
+        if service is None:
+            service = PaperDownloadService(
+                base_output_dir=str(self.output_dir),
+                rate_limiter=self.rate_limiter,
+                resume_partial_downloads=True,
+                blob_store=self.pdf_store,
+                refresh=self.refresh_pdfs,
+            )
+            self._download_services.service = service
+        return service
+
+    def _stage_already_completed(
+        self, config_name: str, strategy_name: str, stage: str
+    ) -> bool:
+        """Check whether a resumed run may skip a journaled stage."""
+        return self.resume and self.journal.is_completed(
+            config_name, strategy_name, stage
+        )
+
+    def _mark_stage_completed(
+        self,
+        config_name: str,
+        strategy_name: str,
+        stage: str,
+        details: Optional[Dict] = None,
+    ) -> None:
+        """Record a finished stage in the job journal."""
+        self.journal.mark_completed(config_name, strategy_name, stage, details)
+
+    def _save_search_results(
+        self, output_path: Path, papers: List[ResearchPaper]
+    ) -> None:
+        """
+        Persist a strategy's search results so a resumed run can skip the search.
+
+        Educational Note:
+        The results are written before the search stage is journaled and
+        replaced atomically, so a journaled search always has its results
+        on disk. The arXiv ID is kept as well, because it is what the PDF
+        download URL is built from.
+        """
+        records = self.serialize_papers(papers)
+        for record, paper in zip(records, papers):
+            record["arxiv_id"] = paper.arxiv_id
+
+        results_file = output_path / self.SEARCH_RESULTS_FILENAME
+        temp_file = results_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump({"papers": records}, f, indent=2, ensure_ascii=False)
+        os.replace(temp_file, results_file)
+
+    def _load_search_results(self, output_path: Path) -> List[ResearchPaper]:
+        """Load the search results saved by _save_search_results (empty if unusable)."""
+        results_file = output_path / self.SEARCH_RESULTS_FILENAME
+        if not results_file.exists():
+            return []
+        try:
+            with open(results_file, "r", encoding="utf-8") as f:
+                records = json.load(f).get("papers", [])
+            return [
+                ResearchPaper(
+                    title=record["title"],
+                    authors=record["authors"],
+                    publication_date=datetime.fromisoformat(record["publication_date"]),
+                    abstract=record.get("abstract") or "",
+                    doi=record.get("doi"),
+                    arxiv_id=record.get("arxiv_id"),
+                    url=record.get("url"),
+                    venue=record.get("venue"),
+                    citation_count=record.get("citation_count") or 0,
+                    keywords=record.get("keywords") or [],
+                )
+                for record in records
+            ]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"    ⚠️  Could not load saved search results: {e}")
+            return []
+
+    def _resume_completed_download(
+        self, output_path: Path, config_name: str, strategy_name: str
+    ) -> None:
+        """
+        Finish a strategy whose search and downloads were journaled earlier.
+
+        Educational Notes:
+        - Restores the strategy's paper keys so cross-strategy deduplication
+          behaves as if the search had run in this process
+        - Only the stages the journal does not record are executed
+        """
+        print(f"    ⏭️  Search and download already completed for {strategy_name}")
+
+        papers_file = output_path / "papers.json"
+        try:
+            with open(papers_file, "r", encoding="utf-8") as f:
+                saved_papers = json.load(f).get("papers", [])
+        except (OSError, json.JSONDecodeError):
+            saved_papers = []
+
+        with self._state_lock:
+            for paper in saved_papers:
+                title = paper.get("title") or ""
+                paper_key = paper.get("doi") or f"title:{title.lower().strip()}"
+                self.processed_papers.add(paper_key)
+
+        if self.enable_concept_extraction:
+            self._extract_and_save_concepts(
+                output_path,
+                config_name,
+                strategy_name,
+                self._load_search_results(output_path),
+            )
+
+        self._increment_stat("strategies_processed")
+        self._increment_stat("strategies_resumed")
+
     def process_strategy(
         self,
         use_case: ExecuteKeywordSearchUseCase,
@@ -732,16 +1338,46 @@ class BatchProcessor:
         - Creates organized output structure as specified
         - Integrates concept extraction for enhanced insights
         """
+        started = time.perf_counter()
         try:
             print(f"  🔍 Processing strategy: {strategy_name}")
 
             # Create output directory structure first
             output_path = self.create_output_structure(config_name, strategy_name)
 
-            # Execute the search strategy with PDF downloads enabled, using the correct output directory
-            papers = use_case.execute_strategy(
-                strategy_name, download_papers=True, output_dir=output_path
-            )
+            # Resumed runs skip straight past journaled search and download stages
+            if self._stage_already_completed(
+                config_name, strategy_name, BatchJobJournal.DOWNLOAD
+            ):
+                self._resume_completed_download(output_path, config_name, strategy_name)
+                return
+
+            # Resumed runs reuse journaled search results instead of querying
+            # again; an empty result may have been an API error, so it is not
+            papers = None
+            if self._stage_already_completed(
+                config_name, strategy_name, BatchJobJournal.SEARCH
+            ):
+                papers = self._load_search_results(output_path)
+                if papers:
+                    print(f"    ⏭️  Search already completed for {strategy_name}")
+
+            if not papers:
+                # Search only: PDFs are downloaded by the processor after
+                # deduplication, so papers stored by another strategy or
+                # configuration are never fetched again
+                with self.metrics.stage("search") as timing:
+                    papers = use_case.execute_strategy(
+                        strategy_name, download_papers=False, output_dir=output_path
+                    )
+                    timing.items = len(papers) if papers else 0
+                self._save_search_results(output_path, papers or [])
+                self._mark_stage_completed(
+                    config_name,
+                    strategy_name,
+                    BatchJobJournal.SEARCH,
+                    {"papers_found": len(papers) if papers else 0},
+                )
 
             if not papers:
                 print(f"    ⚠️  No papers found for strategy {strategy_name}")
@@ -765,24 +1401,48 @@ class BatchProcessor:
                 print(
                     f"    ✅ All papers already downloaded for strategy {strategy_name}"
                 )
+                self._mark_stage_completed(
+                    config_name,
+                    strategy_name,
+                    BatchJobJournal.DOWNLOAD,
+                    {"papers_stored": 0},
+                )
+                # A run that stopped during extraction stored its papers but
+                # not its concepts; extraction skips itself once journaled
+                if self.enable_concept_extraction:
+                    self._extract_and_save_concepts(
+                        output_path, config_name, strategy_name, papers
+                    )
                 return
 
             # Apply deduplication and limit to only new papers
-            unique_papers = self.deduplicate_papers(new_papers)
+            unique_papers = self.deduplicate_papers(
+                new_papers, config_name, strategy_name
+            )
 
-            # Save results with metadata
-            self.save_strategy_results(
+            # Download only the papers that survived deduplication
+            self._run_download_pipeline(
                 unique_papers, output_path, config_name, strategy_name
             )
 
-            # Extract concepts if enabled
-            if self.enable_concept_extraction:
-                self._extract_and_save_concepts(output_path, config_name, strategy_name)
+            # Save results with metadata; downloads count as done once persisted
+            if self.save_strategy_results(
+                unique_papers, output_path, config_name, strategy_name
+            ):
+                self.paper_index.add_many(unique_papers, config_name, strategy_name)
+                self._mark_stage_completed(
+                    config_name,
+                    strategy_name,
+                    BatchJobJournal.DOWNLOAD,
+                    {"papers_stored": len(unique_papers)},
+                )
+
+            # Concepts are extracted inside save_strategy_results when enabled
 
             # Update statistics
-            self.processing_stats["strategies_processed"] += 1
-            self.processing_stats["papers_found"] += len(papers)
-            self.processing_stats["papers_stored"] += len(unique_papers)
+            self._increment_stat("strategies_processed")
+            self._increment_stat("papers_found", len(papers))
+            self._increment_stat("papers_stored", len(unique_papers))
             print(
                 f"    📊 Found {len(papers)} papers, {len(papers) - len(new_papers)} already downloaded, {len(unique_papers)} new papers saved"
             )
@@ -791,9 +1451,12 @@ class BatchProcessor:
             error_msg = (
                 f"Error processing strategy {strategy_name} in {config_name}: {e}"
             )
-            self.processing_stats["errors"].append(error_msg)
+            self._record_error(error_msg)
             print(f"    ❌ {error_msg}")
 
+        finally:
+            self.metrics.record("strategy", time.perf_counter() - started)
+
     def process_configuration(
         self, config_name: str, config_path: Path, repository
     ) -> None:
@@ -811,6 +1474,27 @@ class BatchProcessor:
         - Implements strategy iteration with error isolation
         - Uses dependency injection for repository flexibility
         """
+        prepared = self._prepare_configuration(config_name, config_path, repository)
+        if prepared is None:
+            return
+
+        use_case, strategy_names = prepared
+        self._run_strategy_jobs(
+            [(use_case, config_name, strategy_name) for strategy_name in strategy_names]
+        )
+
+        self._increment_stat("configs_processed")
+        print(f"  ✅ Configuration {config_name} processed successfully")
+
+    def _prepare_configuration(
+        self, config_name: str, config_path: Path, repository
+    ) -> Optional[Tuple[ExecuteKeywordSearchUseCase, List[str]]]:
+        """
+        Load a configuration and build the use case that runs its strategies.
+
+        Returns:
+            Tuple of (use case, strategy names), or None if loading failed
+        """
         try:
             print(f"\n📂 Processing configuration: {config_name}")
 
@@ -821,20 +1505,87 @@ class BatchProcessor:
             use_case = ExecuteKeywordSearchUseCase(repository)
             use_case.keyword_config = config  # Inject configuration
 
-            # Process each strategy in the configuration
             strategy_names = config.list_strategies()
             print(f"  📋 Found {len(strategy_names)} strategies")
 
-            for strategy_name in strategy_names:
-                self.process_strategy(use_case, config_name, strategy_name)
-
-            self.processing_stats["configs_processed"] += 1
-            print(f"  ✅ Configuration {config_name} processed successfully")
+            return use_case, strategy_names
 
         except Exception as e:
             error_msg = f"Error processing configuration {config_name}: {e}"
-            self.processing_stats["errors"].append(error_msg)
+            self._record_error(error_msg)
             print(f"  ❌ {error_msg}")
+            return None
+
+    def _run_strategy_jobs(
+        self, jobs: List[Tuple[ExecuteKeywordSearchUseCase, str, str]]
+    ) -> None:
+        """
+        Execute (use_case, config_name, strategy_name) jobs on the worker pool.
+
+        Educational Notes:
+        - Strategies are I/O bound (API calls, PDF downloads), so threads suffice
+        - process_strategy isolates its own errors, so one failure never stops the pool
+        - With max_workers=1 jobs run inline, preserving the original ordering
+        """
+        if self.max_workers == 1 or len(jobs) <= 1:
+            for use_case, config_name, strategy_name in jobs:
+                self.process_strategy(use_case, config_name, strategy_name)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs)),
+            thread_name_prefix="strategy",
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.process_strategy, use_case, config_name, strategy_name
+                ): (config_name, strategy_name)
+                for use_case, config_name, strategy_name in jobs
+            }
+            for future in as_completed(futures):
+                config_name, strategy_name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    error_msg = f"Error processing strategy {strategy_name} in {config_name}: {e}"
+                    self._record_error(error_msg)
+                    print(f"    ❌ {error_msg}")
+
+    def _process_configurations_concurrently(
+        self, configs: Dict[str, Path], repository
+    ) -> None:
+        """
+        Run the strategies of every configuration on one shared worker pool.
+
+        Educational Notes:
+        - Flattening all strategies into one queue keeps every worker busy,
+          instead of idling while a small configuration finishes
+        - The repository is wrapped so all workers share one request budget,
+          unless a shared rate limiter already budgets every request
+        """
+        if self.rate_limiter is None:
+            repository = RateLimitedPaperRepository(repository)
+        repository = self._coalesced(repository)
+
+        jobs = []
+        prepared_configs = []
+        for config_name, config_path in configs.items():
+            prepared = self._prepare_configuration(config_name, config_path, repository)
+            if prepared is None:
+                continue
+            use_case, strategy_names = prepared
+            jobs.extend(
+                (use_case, config_name, strategy_name)
+                for strategy_name in strategy_names
+            )
+            prepared_configs.append(config_name)
+
+        print(f"\n⚙️  Running {len(jobs)} strategies on {self.max_workers} workers")
+        self._run_strategy_jobs(jobs)
+
+        for config_name in prepared_configs:
+            self._increment_stat("configs_processed")
+            print(f"  ✅ Configuration {config_name} processed successfully")
 
     def run_all_configurations(self, use_arxiv: bool = True) -> None:
         """
@@ -848,16 +1599,27 @@ class BatchProcessor:
         - Implements comprehensive error handling and recovery
         - Provides detailed progress reporting and statistics
         - Uses repository pattern for flexible data sources
+        - Runs strategies on a shared worker pool when max_workers > 1
         """
         start_time = datetime.now(timezone.utc)
         print("🚀 Starting batch processing of research paper configurations...")
         print(f"   📂 Config directory: {self.config_dir}")
         print(f"   💾 Output directory: {self.output_dir}")
         print(f"   📄 Max papers per strategy: {self.max_papers}")
+        print(f"   ⚙️  Strategy workers: {self.max_workers}")
         print(
             f"   🧠 Concept extraction: {'enabled' if self.enable_concept_extraction else 'disabled'}"
         )
 
+        if self.refresh_pdfs:
+            print("   🔄 Refreshing downloaded PDFs with conditional requests")
+
+        if self.resume:
+            print(f"   🔁 Resuming: {len(self.journal)} completed stages in journal")
+        else:
+            # A fresh run must never skip work because of an older journal
+            self.journal.reset()
+
         try:
             # Discover all configuration files
             configs = self.discover_configurations()
@@ -867,23 +1629,105 @@ class BatchProcessor:
 
             # Choose repository based on configuration
             if use_arxiv:
-                repository = ArxivPaperRepository()
+                repository = ArxivPaperRepository(
+                    response_cache=self.response_cache, rate_limiter=self.rate_limiter
+                )
                 print("\n🔗 Using arXiv API for paper search")
+                if self.rate_limiter is not None:
+                    print(f"   🚦 Shared rate limits: {self.rate_limiter.state_dir}")
+                if self.response_cache is not None:
+                    mode = "replay only" if self.response_cache.replay_only else "on"
+                    print(
+                        f"   🗄️  HTTP cache ({mode}): {self.response_cache.cache_dir}"
+                    )
             else:
                 repository = InMemoryPaperRepository()
                 print("\n💾 Using sample data for testing")
 
-            # Process each configuration
-            for config_name, config_path in configs.items():
-                self.process_configuration(config_name, config_path, repository)
+            if self.coalesce_queries:
+                self._query_groups = self._plan_query_coalescing(configs)
+
+            # Process each configuration, sharing one worker pool when parallel
+            if self.max_workers > 1:
+                self._process_configurations_concurrently(configs, repository)
+            else:
+                repository = self._coalesced(repository)
+                for config_name, config_path in configs.items():
+                    self.process_configuration(config_name, config_path, repository)
 
         except Exception as e:
             error_msg = f"Critical error in batch processing: {e}"
-            self.processing_stats["errors"].append(error_msg)
+            self._record_error(error_msg)
             print(f"❌ {error_msg}")
 
+        finally:
+            self.close_extraction_pool()
+
         # Print comprehensive summary
         self.print_processing_summary(start_time)
+        self.write_metrics_report()
+
+    def _plan_query_coalescing(self, configs: Dict[str, Path]) -> List[QueryGroup]:
+        """
+        Group every strategy's search terms into as few API queries as possible.
+
+        Educational Notes:
+        - Runs before any configuration is processed, so the planner sees all
+          strategies across all configuration files at once
+        - Strategies are only merged when their date settings agree
+        - Configurations that fail to load are skipped here; processing
+          reports the error when it reaches them
+        """
+        queries = {}
+        for config_name, config_path in configs.items():
+            try:
+                config = KeywordConfig.from_yaml_file(str(config_path))
+            except Exception:
+                continue
+
+            search_config = config.search_configuration
+            for strategy_name in config.list_strategies():
+                strategy = config.get_strategy(strategy_name)
+                compatibility_key = (
+                    search_config.start_year,
+                    search_config.end_year,
+                    repr(sorted(strategy.date_range.items())),
+                )
+                queries[f"{config_name}/{strategy_name}"] = (
+                    strategy.get_all_terms(),
+                    strategy.search_limit,
+                    compatibility_key,
+                )
+
+        groups = QueryPlanner().plan(queries)
+        print(
+            f"\n🔗 Query plan: {len(queries)} strategy queries "
+            f"in {len(groups)} API query groups"
+        )
+        return groups
+
+    def _coalesced(self, repository):
+        """Wrap the repository with the planned query coalescing, if any."""
+        if not self._query_groups:
+            return repository
+        coalescing = CoalescingPaperRepository(repository, self._query_groups)
+        self._coalescing_repositories.append(coalescing)
+        return coalescing
+
+    def write_metrics_report(self) -> None:
+        """
+        Write the per-stage timing report next to the results.
+
+        Educational Notes:
+        - run_metrics.json is for scripts and historical comparison
+        - run_metrics.prom can be picked up by the Prometheus node exporter's
+          textfile collector to chart nightly runs
+        """
+        try:
+            json_path, prometheus_path = self.metrics.write_report(self.output_dir)
+            print(f"📊 Stage metrics written to {json_path} and {prometheus_path}")
+        except OSError as e:
+            self._record_error(f"Failed to write metrics report: {e}")
 
     def print_processing_summary(self, start_time: datetime) -> None:
         """
@@ -914,7 +1758,30 @@ class BatchProcessor:
         print(f"💾 Papers stored: {self.processing_stats['papers_stored']}")
         print(f"🔄 Duplicates filtered: {self.processing_stats['duplicates_filtered']}")
         print(f"🧠 Concepts extracted: {self.processing_stats['concepts_extracted']}")
+        if self.resume:
+            print(
+                f"🔁 Strategies resumed: {self.processing_stats['strategies_resumed']}"
+            )
         print(f"⏱️  Processing time: {processing_time:.2f} seconds")
+        if self._coalescing_repositories:
+            served = sum(r.queries_served for r in self._coalescing_repositories)
+            api_calls = sum(r.api_calls for r in self._coalescing_repositories)
+            print(f"🔗 Strategy queries served: {served} with {api_calls} API calls")
+
+        stage_summary = self.metrics.summary()
+        cache_hits = stage_summary.get("pdf_text_cache_hit", {}).get("count", 0)
+        if cache_hits:
+            parsed = stage_summary.get("pdf_text_extraction", {}).get("count", 0)
+            print(f"🗃️  Extracted-text cache: {cache_hits} hits, {parsed} PDFs parsed")
+
+        if stage_summary:
+            print("\n⏱️  Stage timings (p50 / p95 / max seconds, count):")
+            for stage, stats in stage_summary.items():
+                print(
+                    f"  {stage:<40} {stats['p50_seconds']:8.3f} "
+                    f"{stats['p95_seconds']:8.3f} {stats['max_seconds']:8.3f} "
+                    f"{stats['count']:6d}"
+                )
 
         if self.processing_stats["errors"]:
             print(f"\n⚠️  Errors encountered: {len(self.processing_stats['errors'])}")
@@ -928,12 +1795,79 @@ class BatchProcessor:
             print("   Concept files: concepts.json, concept_hierarchy.json")
 
 
+def _worker_process_context() -> multiprocessing.context.BaseContext:
+    """
+    Return the start method for extraction worker processes.
+
+    Educational Note:
+    The batch processor runs strategies and downloads on threads, so a
+    forked worker could inherit a lock some other thread held at fork time
+    and deadlock on it. forkserver (or spawn where it is unavailable)
+    starts workers from a clean process instead.
+    """
+    method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return multiprocessing.get_context(method)
+
+
+# Per-process concept extraction use case (and its metrics) for pipeline workers
+_worker_concept_extractor = None
+_worker_metrics = RunMetrics()
+
+
+def _extract_concepts_in_worker(
+    paper: Optional[ResearchPaper],
+    pdf_path: Path,
+    text_cache: Optional[ExtractedTextCache] = None,
+) -> Dict:
+    """
+    Extract concepts from one PDF inside a process-pool worker.
+
+    Educational Note:
+    Process pools pickle the callable by reference, so this must be a
+    module-level function. The use case is created once per worker process
+    and reused for every PDF that worker receives. The text cache pickles
+    as its location and reconnects in the worker. A PDF without a known
+    paper is extracted as a one-file domain, as in the parent process.
+    """
+    global _worker_concept_extractor
+    if _worker_concept_extractor is None:
+        _worker_concept_extractor = BatchProcessor._create_default_concept_extractor(
+            stage_timer=_worker_metrics.record, text_cache=text_cache
+        )
+
+    with _worker_metrics.stage("concept_extraction") as timing:
+        result = BatchProcessor._extract_concepts_with_use_case(
+            _worker_concept_extractor, paper, pdf_path
+        )
+        timing.items = result["total_extracted"]
+
+    # Samples recorded in this process travel back with the result
+    result["stage_samples"] = _worker_metrics.drain()
+    return result
+
+
 def run_batch_processing(
     config_dir: str = "config",
     output_dir: str = "outputs",
     max_papers: int = 100,
     use_arxiv: bool = True,
     enable_concept_extraction: bool = False,
+    max_workers: int = 1,
+    resume: bool = False,
+    pipeline_downloads: bool = False,
+    download_workers: int = 4,
+    http_cache_dir: Optional[str] = None,
+    http_cache_ttl: float = HttpResponseCache.DEFAULT_TTL_SECONDS,
+    http_cache_max_bytes: int = HttpResponseCache.DEFAULT_MAX_BYTES,
+    replay_only: bool = False,
+    coalesce_queries: bool = False,
+    rate_limit_dir: Optional[str] = None,
+    refresh_pdfs: bool = False,
+    extraction_timeout: float = TimedProcessPoolExecutor.DEFAULT_TIMEOUT_SECONDS,
 ) -> None:
     """
     Entry point for batch processing functionality.
@@ -944,6 +1878,20 @@ def run_batch_processing(
         max_papers: Maximum papers to store per strategy
         use_arxiv: Whether to use arXiv API or sample data
         enable_concept_extraction: Whether to extract concepts from downloaded papers
+        max_workers: Number of strategies to run concurrently
+        resume: Continue an interrupted run using the job journal
+        pipeline_downloads: Overlap PDF downloads with concept extraction
+        download_workers: Download threads per strategy
+        http_cache_dir: Directory of the on-disk HTTP response cache (None disables it)
+        http_cache_ttl: Seconds before a cached response is refetched
+        http_cache_max_bytes: Size bound of the response cache
+        replay_only: Serve paper source queries only from the cache
+        coalesce_queries: Merge overlapping strategy queries into shared API calls
+        rate_limit_dir: Directory of the rate limit buckets shared by the
+            user's concurrent batch processes (default: XDG_RUNTIME_DIR or a
+            per-user directory in the system temp dir)
+        refresh_pdfs: Re-check downloaded PDFs and replace those that changed
+        extraction_timeout: Seconds allowed for one PDF's concept extraction
 
     Educational Notes:
     - Provides clean entry point for CLI integration
@@ -953,11 +1901,29 @@ def run_batch_processing(
     - Supports concept extraction for enhanced functionality
     """
     try:
+        response_cache = None
+        if http_cache_dir or replay_only:
+            response_cache = HttpResponseCache(
+                Path(http_cache_dir or Path(output_dir) / ".http_cache"),
+                ttl_seconds=http_cache_ttl,
+                max_bytes=http_cache_max_bytes,
+                replay_only=replay_only,
+            )
+
         processor = BatchProcessor(
             config_dir=config_dir,
             output_dir=output_dir,
             max_papers=max_papers,
             enable_concept_extraction=enable_concept_extraction,
+            max_workers=max_workers,
+            resume=resume,
+            pipeline_downloads=pipeline_downloads,
+            download_workers=download_workers,
+            response_cache=response_cache,
+            coalesce_queries=coalesce_queries,
+            rate_limiter=SharedRateLimiter(rate_limit_dir and Path(rate_limit_dir)),
+            refresh_pdfs=refresh_pdfs,
+            extraction_timeout=extraction_timeout,
         )
         processor.run_all_configurations(use_arxiv=use_arxiv)
 
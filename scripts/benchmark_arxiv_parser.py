@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+arXiv Atom Parser Benchmark
+
+Compares the streaming arXiv Atom parser with feedparser on recorded arXiv
+responses, both for parsing alone and for the full conversion into
+ResearchPaper entities that ArxivPaperRepository performs.
+
+Recorded feeds come from any combination of:
+- Atom files given on the command line
+- The arXiv responses stored in an HTTP response cache (--http-cache-dir)
+- A synthetic feed of N copies of the recorded test entry (--synthetic N)
+
+Educational Notes:
+- Demonstrates benchmarking with repeated runs and the best time reported,
+  which filters out noise from other processes
+- Shows measuring peak memory with tracemalloc alongside wall time
+- Verifies that both parsers produced the same papers before comparing
+  speed: a fast parser that drops fields is not an optimization
+
+Usage:
+    python scripts/benchmark_arxiv_parser.py --synthetic 1000
+    python scripts/benchmark_arxiv_parser.py --http-cache-dir outputs/.http_cache
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+import tracemalloc
+import zlib
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import feedparser  # noqa: E402
+
+from src.infrastructure.http_response_cache import HttpResponseCache  # noqa: E402
+from src.infrastructure.repositories.arxiv_atom_parser import (  # noqa: E402
+    iter_arxiv_entries,
+)
+from src.infrastructure.repositories.arxiv_paper_repository import (  # noqa: E402
+    ArxivPaperRepository,
+)
+
+SAMPLE_FEED = PROJECT_ROOT / "tests" / "fixtures" / "arxiv_sample_feed.xml"
+
+
+def synthetic_feed(entry_count: int) -> bytes:
+    """Build a feed of entry_count copies of the recorded test entry."""
+    content = SAMPLE_FEED.read_text(encoding="utf-8")
+    start = content.index("<entry>")
+    end = content.index("</entry>") + len("</entry>")
+    entries = "".join(
+        content[start:end].replace("2401.01234", f"2401.{index:05d}")
+        for index in range(entry_count)
+    )
+    return (content[:start] + entries + "</feed>").encode("utf-8")
+
+
+def cached_feeds(cache_dir: Path) -> List[Tuple[str, bytes]]:
+    """Load the arXiv API responses recorded in an HTTP response cache."""
+    db_path = Path(cache_dir) / HttpResponseCache.FILENAME
+    connection = sqlite3.connect(str(db_path))
+    try:
+        rows = connection.execute(
+            "SELECT url, body FROM responses WHERE url LIKE '%arxiv.org/api/%'"
+        ).fetchall()
+    finally:
+        connection.close()
+    return [(url, zlib.decompress(body)) for url, body in rows]
+
+
+def best_of(repeats: int, work: Callable[[], int]) -> Tuple[float, int, int]:
+    """
+    Run work() repeatedly.
+
+    Returns:
+        Best wall time in seconds, the item count, and peak traced bytes
+    """
+    best = float("inf")
+    count = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        count = work()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        work()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, count, peak
+
+
+def benchmark_feed(name: str, content: bytes, repeats: int) -> bool:
+    """Benchmark one feed, print a report and return whether results match."""
+    repositories = {
+        parser: ArxivPaperRepository(feed_parser=parser)
+        for parser in ArxivPaperRepository.FEED_PARSERS
+    }
+
+    def convert(parser: str) -> list:
+        repo = repositories[parser]
+        return [
+            repo._convert_arxiv_entry_to_paper(entry)
+            for entry in repo._parse_entries(content)
+        ]
+
+    reference = [
+        (p.arxiv_id, p.title, p.abstract, p.authors, p.publication_date, p.doi)
+        for p in convert("feedparser")
+        if p
+    ]
+    streamed = [
+        (p.arxiv_id, p.title, p.abstract, p.authors, p.publication_date, p.doi)
+        for p in convert("streaming")
+        if p
+    ]
+    identical = reference == streamed
+
+    measurements = {
+        ("parse", "feedparser"): lambda: len(feedparser.parse(content).entries),
+        ("parse", "streaming"): lambda: sum(1 for _ in iter_arxiv_entries(content)),
+        ("parse+convert", "feedparser"): lambda: len(convert("feedparser")),
+        ("parse+convert", "streaming"): lambda: len(convert("streaming")),
+    }
+
+    print(f"\n📄 {name} ({len(content) / 1024:.0f} KiB)")
+    print(
+        f"   {'stage':<15}{'parser':<12}{'entries':>8}{'seconds':>10}"
+        f"{'entries/s':>12}{'peak MiB':>10}"
+    )
+    results = {}
+    for (stage, parser), work in measurements.items():
+        seconds, count, peak = best_of(repeats, work)
+        results[(stage, parser)] = seconds
+        rate = count / seconds if seconds else 0.0
+        print(
+            f"   {stage:<15}{parser:<12}{count:>8}{seconds:>10.4f}"
+            f"{rate:>12.0f}{peak / 2**20:>10.2f}"
+        )
+
+    for stage in ("parse", "parse+convert"):
+        streaming = results[(stage, "streaming")]
+        if streaming:
+            speedup = results[(stage, "feedparser")] / streaming
+            print(f"   ⚡ {stage}: streaming parser is {speedup:.1f}x faster")
+    print(f"   {'✅' if identical else '❌'} papers identical: {identical}")
+    return identical
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the streaming arXiv parser against feedparser"
+    )
+    parser.add_argument("feeds", nargs="*", type=Path, help="Recorded Atom files")
+    parser.add_argument(
+        "--http-cache-dir",
+        type=Path,
+        help="HTTP response cache whose arXiv responses should be benchmarked",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        help="Also benchmark a synthetic feed with this many entries",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    feeds = [(str(path), path.read_bytes()) for path in args.feeds]
+    if args.http_cache_dir:
+        feeds.extend(cached_feeds(args.http_cache_dir))
+    if args.synthetic or not feeds:
+        count = args.synthetic or 1000
+        feeds.append((f"synthetic feed, {count} entries", synthetic_feed(count)))
+
+    all_identical = True
+    for name, content in feeds:
+        all_identical &= benchmark_feed(name, content, max(1, args.repeats))
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+PDF Backend Benchmark
+
+Compares the PDF libraries PyPDF2TextExtractor can read pages with (see
+src/infrastructure/pdf_backends.py) on the PDFs downloaded into outputs/:
+how fast each one reads them, how many it fails on, and how closely its
+text matches PyPDF2's, the reference every backend falls back to.
+
+Educational Notes:
+- Demonstrates measuring fidelity alongside speed: a backend that is fast
+  because it drops text is not an optimization. Fidelity is the share of
+  words (as a multiset) a backend's text has in common with PyPDF2's, so
+  reading order and hyphenation do not count as differences
+- Shows deduplicating by inode: strategy directories hard-link the same
+  stored PDF many times, and each file should be read once
+- Reports failures per backend, since tolerance of odd files is the other
+  half of the trade-off
+
+Usage:
+    python scripts/benchmark_pdf_backends.py
+    python scripts/benchmark_pdf_backends.py outputs/healthcare_medical_cybersecurity
+    python scripts/benchmark_pdf_backends.py --limit 50 --backends pymupdf pypdf2
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.infrastructure.pdf_backends import (  # noqa: E402
+    BACKENDS,
+    PdfBackend,
+    PyPDF2Backend,
+    select_backends,
+)
+
+WORD = re.compile(r"\w+")
+
+
+def find_pdfs(roots: List[Path], limit: Optional[int]) -> List[Path]:
+    """Return the distinct PDFs under the roots, one path per inode."""
+    seen = set()
+    pdfs = []
+    for root in roots:
+        candidates = [root] if root.is_file() else sorted(root.rglob("*.pdf"))
+        for path in candidates:
+            if not path.is_file():
+                continue
+            stat = path.stat()
+            if (stat.st_dev, stat.st_ino) in seen:
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+            pdfs.append(path)
+            if limit and len(pdfs) >= limit:
+                return pdfs
+    return pdfs
+
+
+def read_pdf(backend: PdfBackend, pdf_path: Path) -> Tuple[int, str]:
+    """Read every page of a PDF; returns (page count, joined raw text)."""
+    with backend.open(pdf_path) as document:
+        texts = [
+            document.page_text(index) or "" for index in range(document.page_count)
+        ]
+    return len(texts), "\n".join(texts)
+
+
+def word_bag(text: str) -> Counter:
+    """Lower-cased words of a text, with multiplicity."""
+    return Counter(WORD.findall(text.lower()))
+
+
+def fidelity(candidate: Counter, reference: Counter) -> float:
+    """Share of words two texts have in common, from 0.0 to 1.0."""
+    total = max(sum(candidate.values()), sum(reference.values()))
+    if not total:
+        return 1.0
+    return sum((candidate & reference).values()) / total
+
+
+def run_backend(
+    backend: PdfBackend, pdfs: List[Path], repeats: int
+) -> Tuple[float, int, Dict[Path, str], List[Path]]:
+    """
+    Read all PDFs with one backend, keeping the best of several runs.
+
+    Returns:
+        Best wall time, pages read, text per readable PDF, failed PDFs
+    """
+    best = float("inf")
+    texts: Dict[Path, str] = {}
+    failed: List[Path] = []
+    pages = 0
+    for _ in range(repeats):
+        texts, failed, pages = {}, [], 0
+        start = time.perf_counter()
+        for pdf_path in pdfs:
+            try:
+                count, text = read_pdf(backend, pdf_path)
+            except Exception:
+                failed.append(pdf_path)
+                continue
+            pages += count
+            texts[pdf_path] = text
+        best = min(best, time.perf_counter() - start)
+    return best, pages, texts, failed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the PDF backends on downloaded papers"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[PROJECT_ROOT / "outputs"],
+        help="PDF files or directories searched for PDFs (default: outputs/)",
+    )
+    parser.add_argument("--limit", type=int, help="Benchmark at most this many PDFs")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=[backend.name for backend in BACKENDS],
+        help="Backends to compare (default: every installed backend)",
+    )
+    parser.add_argument("--repeats", type=int, default=1, help="Runs per backend")
+    parser.add_argument(
+        "--show-failures", action="store_true", help="List the PDFs each backend failed"
+    )
+    args = parser.parse_args()
+
+    pdfs = find_pdfs(args.paths, args.limit)
+    if not pdfs:
+        print("❌ No PDFs found; download some papers first")
+        return 1
+    megabytes = sum(path.stat().st_size for path in pdfs) / 2**20
+    backends = select_backends(args.backends)
+
+    print(f"📄 {len(pdfs)} PDFs, {megabytes:.1f} MiB")
+    print(f"🔧 Backends: {', '.join(backend.name for backend in backends)}")
+
+    results = {}
+    for backend in backends:
+        results[backend.name] = run_backend(backend, pdfs, max(1, args.repeats))
+
+    reference = {
+        path: word_bag(text) for path, text in results[PyPDF2Backend.name][2].items()
+    }
+
+    print(
+        f"\n   {'backend':<12}{'read':>6}{'failed':>8}{'pages':>8}{'seconds':>10}"
+        f"{'pages/s':>10}{'MiB/s':>8}{'fidelity':>10}{'worst':>8}"
+    )
+    baseline_seconds = results[PyPDF2Backend.name][0]
+    for name, (seconds, pages, texts, failed) in results.items():
+        scores = [
+            fidelity(word_bag(text), reference[path])
+            for path, text in texts.items()
+            if path in reference
+        ]
+        mean = sum(scores) / len(scores) if scores else 0.0
+        worst = min(scores) if scores else 0.0
+        rate = pages / seconds if seconds else 0.0
+        throughput = megabytes / seconds if seconds else 0.0
+        print(
+            f"   {name:<12}{len(texts):>6}{len(failed):>8}{pages:>8}{seconds:>10.2f}"
+            f"{rate:>10.1f}{throughput:>8.2f}{mean:>10.3f}{worst:>8.3f}"
+        )
+        if args.show_failures:
+            for path in failed:
+                print(f"      ❌ {path}")
+
+    for name, (seconds, *_rest) in results.items():
+        if name != PyPDF2Backend.name and seconds:
+            print(f"   ⚡ {name} is {baseline_seconds / seconds:.1f}x PyPDF2's speed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
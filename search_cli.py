@@ -295,6 +295,17 @@ def handle_batch_processing(args):
     print(f"📁 Output directory: {args.output_dir}")
     print(f"📄 Max papers per strategy: {args.max_papers}")
     print(f"🔗 Data source: {args.source}")
+    print(f"⚙️  Strategy workers: {args.workers}")
+    if args.resume:
+        print("🔁 Resuming from job journal")
+    if args.pipeline:
+        print(f"⬇️  Pipelined downloads: {args.download_workers} threads per strategy")
+    if args.coalesce_queries:
+        print("🔗 Coalescing overlapping strategy queries")
+    if args.replay:
+        print("🗄️  Replaying cached API responses (no network)")
+    elif args.http_cache_dir:
+        print(f"🗄️  HTTP response cache: {args.http_cache_dir}")
     print("=" * 60)
 
     try:
@@ -310,6 +321,18 @@ def handle_batch_processing(args):
             output_dir=args.output_dir,
             max_papers=args.max_papers,
             use_arxiv=(args.source == "arxiv"),
+            max_workers=args.workers,
+            resume=args.resume,
+            pipeline_downloads=args.pipeline,
+            download_workers=args.download_workers,
+            http_cache_dir=args.http_cache_dir,
+            http_cache_ttl=args.http_cache_ttl_hours * 3600,
+            http_cache_max_bytes=args.http_cache_max_mb * 1024 * 1024,
+            replay_only=args.replay,
+            coalesce_queries=args.coalesce_queries,
+            rate_limit_dir=args.rate_limit_dir,
+            refresh_pdfs=args.refresh_pdfs,
+            extraction_timeout=args.extraction_timeout,
         )
 
     except Exception as e:
@@ -524,6 +547,14 @@ Examples:
         help="Download PDFs of found papers (uses arXiv when available)",
     )
 
+    parser.add_argument(
+        "--parallel-downloads",
+        type=int,
+        default=1,
+        help="PDFs to download at once with --download; above 1, interrupted "
+        "downloads are resumed (default: 1)",
+    )
+
     parser.add_argument(
         "--output-dir",
         "-o",
@@ -611,6 +642,74 @@ Examples:
         default="arxiv",
         help="Data source for batch processing (default: arxiv)",
     )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of strategies to process concurrently (default: 1)",
+    )
+    batch_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run, skipping stages already completed",
+    )
+    batch_parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Extract each PDF as soon as it is downloaded instead of after all downloads",
+    )
+    batch_parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=4,
+        help="Download threads per strategy (default: 4)",
+    )
+    batch_parser.add_argument(
+        "--http-cache-dir",
+        help="Cache paper source API responses in this directory",
+    )
+    batch_parser.add_argument(
+        "--http-cache-ttl-hours",
+        type=float,
+        default=24.0,
+        help="Hours before a cached API response is refetched (default: 24)",
+    )
+    batch_parser.add_argument(
+        "--http-cache-max-mb",
+        type=int,
+        default=256,
+        help="Size limit of the API response cache in MB (default: 256)",
+    )
+    batch_parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Serve API responses only from the cache, never from the network "
+        "(default cache: <output-dir>/.http_cache)",
+    )
+    batch_parser.add_argument(
+        "--coalesce-queries",
+        action="store_true",
+        help="Answer strategies with overlapping terms from shared API queries",
+    )
+    batch_parser.add_argument(
+        "--rate-limit-dir",
+        help="Directory of the request budgets shared by your batch processes "
+        "on this machine (default: $XDG_RUNTIME_DIR or a per-user directory "
+        "in the system temp directory)",
+    )
+    batch_parser.add_argument(
+        "--refresh-pdfs",
+        action="store_true",
+        help="Re-check already downloaded PDFs with conditional requests and "
+        "replace the ones that changed upstream",
+    )
+    batch_parser.add_argument(
+        "--extraction-timeout",
+        type=float,
+        default=120.0,
+        help="Seconds one PDF's concept extraction may take before its worker "
+        "process is replaced (default: 120)",
+    )
 
     args = parser.parse_args()
 
@@ -680,10 +779,24 @@ Examples:
     # Handle downloading if requested
     if args.download and results:
         print(f"\n📥 Starting paper downloads...")
-        download_service = PaperDownloadService(base_output_dir=args.output_dir)
+        download_service = PaperDownloadService(
+            base_output_dir=args.output_dir,
+            max_concurrent_downloads=args.parallel_downloads,
+        )
 
-        def progress_callback(current: int, total: int, paper_title: str):
-            print(f"  📄 [{current}/{total}] Downloading: {paper_title[:60]}...")
+        def progress_callback(
+            current: int,
+            total: int,
+            paper_title: str,
+            bytes_per_second: Optional[float] = None,
+        ):
+            if bytes_per_second is None:
+                print(f"  📄 [{current}/{total}] Downloading: {paper_title[:60]}...")
+            else:
+                print(
+                    f"  📄 [{current}/{total}] Downloaded: {paper_title[:60]} "
+                    f"({bytes_per_second / 1024:.0f} KB/s overall)"
+                )
 
         try:
             downloaded_files = download_service.download_papers(
@@ -42,6 +42,7 @@ import networkx as nx
 
 from src.domain.entities.concept import Concept
 from src.domain.value_objects.embedding_vector import EmbeddingVector
+from src.domain.value_objects.document_frequencies import DocumentFrequencySource
 
 
 # =============================================================================
@@ -707,6 +708,16 @@ class StatisticalExtractionStrategy(ConceptExtractionStrategy):
     - Latent Dirichlet Allocation for topic discovery (Blei et al., 2003)
     """
 
+    def __init__(self, document_frequencies: Optional[DocumentFrequencySource] = None):
+        """
+        Initialize the strategy.
+
+        Args:
+            document_frequencies: Per-domain document frequencies; when given,
+                a single paper is scored with true TF-IDF against its domain
+        """
+        self.document_frequencies = document_frequencies
+
     def extract_concepts(
         self, text: str, config: StrategyConfiguration
     ) -> ExtractionResult:
@@ -720,7 +731,9 @@ class StatisticalExtractionStrategy(ConceptExtractionStrategy):
 
         # TF-IDF based extraction
         if config.use_tfidf:
-            tfidf_concepts = self.extract_tfidf_concepts([text], max_concepts=20)
+            tfidf_concepts = self.extract_tfidf_concepts(
+                [text], max_concepts=20, domain=config.domain
+            )
             concepts.extend(tfidf_concepts)
             metadata["techniques_used"].append("tfidf")
             metadata["tfidf_concepts"] = len(tfidf_concepts)
@@ -739,7 +752,7 @@ class StatisticalExtractionStrategy(ConceptExtractionStrategy):
         return ExtractionResult(concepts=concepts, metadata=metadata)
 
     def extract_tfidf_concepts(
-        self, corpus: List[str], max_concepts: int = 20
+        self, corpus: List[str], max_concepts: int = 20, domain: Optional[str] = None
     ) -> List[Concept]:
         """
         Extract concepts using TF-IDF weighting.
@@ -747,8 +760,16 @@ class StatisticalExtractionStrategy(ConceptExtractionStrategy):
         Educational Note:
         TF-IDF (Term Frequency-Inverse Document Frequency) identifies
         terms that are frequent in a document but rare across the corpus,
-        indicating their importance to the specific document.
+        indicating their importance to the specific document. When stored
+        document frequencies exist for the domain they supply the IDF for
+        one document or many, so nothing is refitted per call; a vectorizer
+        is only fitted when there is no stored corpus to consult.
         """
+        if self.document_frequencies is not None and domain:
+            concepts = self._extract_domain_tfidf_concepts(corpus, max_concepts, domain)
+            if concepts is not None:
+                return concepts
+
         if len(corpus) == 1:
             # For single document, use simple term frequency
             return self._extract_term_frequency_concepts(corpus[0], max_concepts)
@@ -996,6 +1017,40 @@ class StatisticalExtractionStrategy(ConceptExtractionStrategy):
 
         return concepts
 
+    def _extract_domain_tfidf_concepts(
+        self, texts: List[str], max_concepts: int, domain: str
+    ) -> Optional[List[Concept]]:
+        """
+        Score the documents' terms by tf x idf against their domain.
+
+        Returns:
+            The top concepts, or None if the domain has no stored documents
+        """
+        word_freq = Counter()
+        for text in texts:
+            word_freq.update(re.findall(WORD_EXTRACTION_PATTERN, text.lower()))
+        words = [word for word, freq in word_freq.items() if freq >= 2]
+        if not words:
+            return []
+
+        corpus = self.document_frequencies.lookup(domain, words)
+        if corpus.is_empty:
+            return None
+
+        scores = np.array([word_freq[word] for word in words]) * corpus.idf_array(words)
+        scores = scores / scores.max()
+        top = np.lexsort((np.array(words), -scores))[:max_concepts]
+        return [
+            Concept(
+                text=words[index],
+                frequency=word_freq[words[index]],
+                relevance_score=float(scores[index]),
+                source_domain=domain,
+                extraction_method="tfidf",
+            )
+            for index in top
+        ]
+
     def _split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences for TextRank processing."""
         # Simple sentence splitting
@@ -1361,13 +1416,28 @@ class MultiStrategyConceptExtractor:
     - Template Method: Defines common workflow for multi-strategy extraction
     """
 
-    def __init__(self, strategies: Optional[List[ConceptExtractionStrategy]] = None):
-        """Initialize with extraction strategies."""
+    def __init__(
+        self,
+        strategies: Optional[List[ConceptExtractionStrategy]] = None,
+        document_frequencies: Optional[DocumentFrequencySource] = None,
+    ):
+        """
+        Initialize with extraction strategies.
+
+        Args:
+            strategies: Strategies to run (default: rule-based, statistical
+                and embedding-based)
+            document_frequencies: Per-domain document frequencies handed to
+                the default statistical strategy, typically the concept
+                repository's store
+        """
         if strategies is None:
             # Default strategy configuration
             self.strategies = [
                 RuleBasedExtractionStrategy(),
-                StatisticalExtractionStrategy(),
+                StatisticalExtractionStrategy(
+                    document_frequencies=document_frequencies
+                ),
                 EmbeddingBasedExtractionStrategy(),
             ]
         else:
@@ -16,6 +16,15 @@ Design Decisions:
 - Saves metadata alongside PDFs for searchability
 - Provides progress tracking for user feedback
 - Handles download failures gracefully
+- Optional concurrent mode: several PDFs in flight at once, a cap on
+  connections per host, and partial `.part` files resumed with HTTP Range
+  requests and renamed into place only when complete
+- Optional content-addressed blob store: each PDF is stored once and
+  strategy directories link to it, so duplicates are never re-downloaded
+- Optional refresh mode: PDFs already on hand are re-requested with
+  conditional headers (If-None-Match / If-Modified-Since) built from the
+  validators they were served with; a 304 Not Modified answer has no body,
+  so refreshing an unchanged corpus costs one small request per paper
 
 Use Cases:
 - Downloading papers found through search
@@ -26,10 +35,15 @@ Use Cases:
 
 import os
 import json
+import email.utils
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Dict, Callable
+from typing import Any, List, Optional, Dict, Callable, Tuple
 from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
 from src.domain.entities.research_paper import ResearchPaper
 
@@ -43,24 +57,94 @@ class PaperDownloadService:
     that span multiple entities.
     """
 
-    def __init__(self, base_output_dir: str = "outputs"):
+    USER_AGENT = "Research-Paper-Aggregator/1.0 (Educational Purpose)"
+    PART_SUFFIX = ".part"
+    # Validators of the response a .part file was started from
+    PART_VALIDATORS_SUFFIX = ".part.json"
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+    DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+    DEFAULT_MAX_RETRIES = 2
+
+    # Response headers recorded as validators, by the names the store uses
+    VALIDATOR_HEADERS = {"etag": "ETag", "last_modified": "Last-Modified"}
+
+    def __init__(
+        self,
+        base_output_dir: str = "outputs",
+        rate_limiter: Any = None,
+        max_concurrent_downloads: int = 1,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        resume_partial_downloads: Optional[bool] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: float = 60,
+        blob_store: Any = None,
+        refresh: bool = False,
+    ):
         """
         Initialize download service with output directory.
 
         Args:
             base_output_dir: Root directory for downloaded papers
+            rate_limiter: Optional limiter with an acquire_for_url(url) method
+                (e.g. SharedRateLimiter); each PDF request then waits for a
+                token from the bucket of the source serving it
+            max_concurrent_downloads: PDFs downloaded at once by
+                download_papers (1 = one after another)
+            max_connections_per_host: Cap on simultaneous downloads from one
+                host by this service
+            resume_partial_downloads: Download into `.part` files and resume
+                them with Range requests; defaults to on in concurrent mode
+            max_retries: Resume attempts after a transfer fails midway
+            chunk_size: Bytes read per chunk of a resumable download
+            timeout: Seconds to wait for the server (connect and each read)
+            blob_store: Optional content-addressed store (e.g. PdfBlobStore)
+                with lookup(url), put(path, url) and link_into(digest, path);
+                PDFs it already holds are linked instead of downloaded;
+                with validators(url), put(path, url, validators) and
+                update_validators(url, validators) it also keeps the HTTP
+                validators needed by refresh mode
+            refresh: Re-request PDFs that are already downloaded with
+                conditional headers and replace them only if they changed
+
+        Educational Note:
+        The limiter and the store are duck-typed so this domain service does
+        not depend on the infrastructure modules that implement them.
         """
         self.base_output_dir = Path(base_output_dir)
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "Research-Paper-Aggregator/1.0 (Educational Purpose)"}
-        )
+        self.rate_limiter = rate_limiter
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        if resume_partial_downloads is None:
+            resume_partial_downloads = self.max_concurrent_downloads > 1
+        self.resume_partial_downloads = resume_partial_downloads
+        self.max_retries = max(0, max_retries)
+        self.chunk_size = max(1, chunk_size)
+        self.timeout = timeout
+        self.blob_store = blob_store
+        self.refresh = refresh
+        self.session = self._create_session()
+        # requests.Session is not guaranteed thread-safe: one per worker
+        self._thread_sessions = threading.local()
+        self._bytes_lock = threading.Lock()
+        self._bytes_downloaded = 0
+        # Connection slots per host, and one lock per destination file so
+        # papers sharing a filename never write the same .part at once
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._destination_locks: Dict[Path, threading.RLock] = {}
+        self._slots_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with the service's User-Agent."""
+        session = requests.Session()
+        session.headers.update({"User-Agent": self.USER_AGENT})
+        return session
 
     def download_papers(
         self,
         papers: List[ResearchPaper],
         strategy_name: str,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        progress_callback: Optional[Callable[..., None]] = None,
         output_dir: Optional[Path] = None,
     ) -> Dict[str, str]:
         """
@@ -69,7 +153,10 @@ class PaperDownloadService:
         Args:
             papers: List of ResearchPaper entities to download
             strategy_name: Name of search strategy used (for organization)
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates, called
+                as (current, total, title) before each sequential download,
+                or as (completed, total, title, bytes_per_second) after each
+                concurrent download, with the aggregate transfer rate so far
             output_dir: Optional specific output directory (otherwise creates date-based one)
 
         Returns:
@@ -90,21 +177,26 @@ class PaperDownloadService:
 
         total_papers = len(papers)
 
-        for i, paper in enumerate(papers):
-            if progress_callback:
-                progress_callback(i + 1, total_papers, paper.title)
-
-            try:
-                # Download paper PDF
-                pdf_path = self._download_paper_pdf(paper, output_dir)
-                if pdf_path:
-                    results[paper.title] = str(pdf_path)
-                    successful_downloads.append(paper)
-                else:
-                    results[paper.title] = "Download failed - No PDF URL available"
-
-            except Exception as e:
-                results[paper.title] = f"Download failed - {str(e)}"
+        if self.max_concurrent_downloads > 1:
+            results, successful_downloads = self._download_concurrently(
+                papers, output_dir, progress_callback
+            )
+        else:
+            for i, paper in enumerate(papers):
+                if progress_callback:
+                    progress_callback(i + 1, total_papers, paper.title)
+
+                try:
+                    # Download paper PDF
+                    pdf_path = self._download_paper_pdf(paper, output_dir)
+                    if pdf_path:
+                        results[paper.title] = str(pdf_path)
+                        successful_downloads.append(paper)
+                    else:
+                        results[paper.title] = "Download failed - No PDF URL available"
+
+                except Exception as e:
+                    results[paper.title] = f"Download failed - {str(e)}"
 
         # Save metadata for successfully downloaded papers
         if successful_downloads:
@@ -161,6 +253,52 @@ class PaperDownloadService:
         Returns:
             Path to downloaded file, or None if download failed
         """
+        if self.blob_store is not None:
+            return self._download_into_blob_store(paper, output_dir)
+        return self._fetch_pdf(paper, output_dir)
+
+    def _download_into_blob_store(
+        self, paper: ResearchPaper, output_dir: Path
+    ) -> Optional[Path]:
+        """
+        Link a PDF from the blob store, downloading it only if it is new.
+
+        Educational Note:
+        The store is keyed by content, but before a download only the URL is
+        known, so the store also remembers which content each URL produced.
+        A fresh download is moved into the store and linked back in place.
+        """
+        pdf_url = self._get_pdf_url(paper)
+        if not pdf_url:
+            return None
+        pdf_path = output_dir / self.pdf_filename(paper)
+
+        with self._destination_lock(pdf_path):
+            digest = self.blob_store.lookup(pdf_url)
+            if digest is not None and not self.refresh:
+                return self.blob_store.link_into(digest, pdf_path)
+
+            # Known PDFs are only fetched again if the server says they changed
+            conditions = self.blob_store.validators(pdf_url) if digest else None
+            fetched = self._fetch_if_modified(
+                pdf_url, pdf_path, paper.title, conditions or None
+            )
+            if fetched is None:
+                # A failed refresh keeps the copy already stored
+                return self.blob_store.link_into(digest, pdf_path) if digest else None
+
+            modified, validators = fetched
+            if modified:
+                digest = self.blob_store.put(pdf_path, pdf_url, validators)
+            else:
+                self.blob_store.update_validators(pdf_url, validators)
+            return self.blob_store.link_into(digest, pdf_path)
+
+    def _fetch_pdf(self, paper: ResearchPaper, output_dir: Path) -> Optional[Path]:
+        """Download a PDF over the network into output_dir."""
+        if self.resume_partial_downloads or self.refresh:
+            return self._download_resumable(paper, output_dir)
+
         # Get PDF URL from paper
         pdf_url = self._get_pdf_url(paper)
         if not pdf_url:
@@ -172,14 +310,19 @@ class PaperDownloadService:
         pdf_path = output_dir / pdf_filename
 
         try:
-            # Download PDF
-            response = self.session.get(pdf_url, timeout=60, stream=True)
-            response.raise_for_status()
-
-            # Save PDF to file
-            with open(pdf_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with self._destination_lock(pdf_path), self._host_slot(pdf_url):
+                # Download PDF, sharing the source's request budget if limited
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire_for_url(pdf_url)
+                response = self._thread_session().get(
+                    pdf_url, timeout=self.timeout, stream=True
+                )
+                response.raise_for_status()
+
+                # Save PDF to file
+                with open(pdf_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
 
             return pdf_path
 
@@ -190,6 +333,353 @@ class PaperDownloadService:
             print(f"Error saving {paper.title}: {e}")
             return None
 
+    def _download_concurrently(
+        self,
+        papers: List[ResearchPaper],
+        output_dir: Path,
+        progress_callback: Optional[Callable[..., None]],
+    ) -> Tuple[Dict[str, str], List[ResearchPaper]]:
+        """
+        Download papers on a thread pool.
+
+        Returns:
+            (results, successful papers), both in the order of `papers`
+        """
+        outcomes: Dict[int, str] = {}
+        started = time.monotonic()
+        with self._bytes_lock:
+            bytes_at_start = self._bytes_downloaded
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_downloads) as pool:
+            futures = {
+                pool.submit(self._download_paper_pdf, paper, output_dir): index
+                for index, paper in enumerate(papers)
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                try:
+                    pdf_path = future.result()
+                    outcomes[index] = (
+                        str(pdf_path)
+                        if pdf_path
+                        else "Download failed - No PDF URL available"
+                    )
+                except Exception as e:
+                    outcomes[index] = f"Download failed - {str(e)}"
+
+                if progress_callback:
+                    elapsed = max(time.monotonic() - started, 1e-9)
+                    with self._bytes_lock:
+                        transferred = self._bytes_downloaded - bytes_at_start
+                    progress_callback(
+                        completed,
+                        len(papers),
+                        papers[index].title,
+                        transferred / elapsed,
+                    )
+
+        results = {}
+        successful = []
+        for index, paper in enumerate(papers):
+            results[paper.title] = outcomes[index]
+            if not outcomes[index].startswith("Download failed"):
+                successful.append(paper)
+        return results, successful
+
+    def _download_resumable(
+        self, paper: ResearchPaper, output_dir: Path
+    ) -> Optional[Path]:
+        """
+        Download a PDF through a `.part` file that survives failed transfers.
+
+        Educational Notes:
+        - A transfer that fails midway keeps its `.part` file; the next
+          attempt (in this call or a later run) asks only for the missing
+          bytes with a Range header
+        - The finished file is renamed into place with os.replace, which is
+          atomic, so a PDF at its final path is always complete
+        - Client errors (404 and friends) are not retried
+        - In refresh mode an existing PDF is re-requested with
+          If-Modified-Since set to its modification time, which is the
+          server's Last-Modified date for files this method downloaded
+
+        Returns:
+            Path to the downloaded PDF, or None if the download failed
+        """
+        pdf_url = self._get_pdf_url(paper)
+        if not pdf_url:
+            return None
+
+        pdf_path = output_dir / self.pdf_filename(paper)
+        with self._destination_lock(pdf_path):
+            conditions = None
+            if pdf_path.exists():
+                if not self.refresh:
+                    return pdf_path
+                conditions = {
+                    "last_modified": email.utils.formatdate(
+                        pdf_path.stat().st_mtime, usegmt=True
+                    )
+                }
+
+            fetched = self._fetch_if_modified(
+                pdf_url, pdf_path, paper.title, conditions
+            )
+        if fetched is None and conditions is None:
+            return None
+        # A failed refresh keeps the copy already downloaded
+        return pdf_path
+
+    def _fetch_if_modified(
+        self,
+        url: str,
+        pdf_path: Path,
+        title: str,
+        conditions: Optional[Dict[str, str]] = None,
+    ) -> Optional[Tuple[bool, Dict[str, str]]]:
+        """
+        Download `url` to `pdf_path` through a resumable `.part` file.
+
+        Args:
+            url: PDF URL
+            pdf_path: Final path of the PDF
+            title: Paper title, for error messages
+            conditions: Validators of the copy already on hand; the server
+                then sends the PDF only if it changed
+
+        Returns:
+            (True, validators) if the PDF was written to pdf_path,
+            (False, validators) if the server answered 304 Not Modified,
+            or None if the download failed
+        """
+        part_path = pdf_path.with_name(pdf_path.name + self.PART_SUFFIX)
+
+        last_error: Optional[Exception] = None
+        with self._destination_lock(pdf_path), self._host_slot(url):
+            for _ in range(self.max_retries + 1):
+                try:
+                    modified, validators = self._transfer(url, part_path, conditions)
+                    if not modified:
+                        return False, validators
+                    os.replace(part_path, pdf_path)
+                    self._part_validators_path(part_path).unlink(missing_ok=True)
+                    self._stamp_last_modified(pdf_path, validators)
+                    return True, validators
+                except requests.RequestException as e:
+                    last_error = e
+                    status = getattr(e.response, "status_code", None) or 0
+                    if 400 <= status < 500:
+                        break
+                except OSError as e:
+                    print(f"Error saving {title}: {e}")
+                    return None
+
+        print(f"Error downloading {title}: {last_error}")
+        return None
+
+    def _transfer(
+        self,
+        url: str,
+        part_path: Path,
+        conditions: Optional[Dict[str, str]] = None,
+    ) -> Tuple[bool, Dict[str, str]]:
+        """
+        Fetch the bytes of `url` that `part_path` does not have yet.
+
+        Args:
+            url: PDF URL
+            part_path: Partial file to complete
+            conditions: Validators turned into If-None-Match and
+                If-Modified-Since headers when starting from scratch
+
+        Returns:
+            (modified, validators): modified is False if the server answered
+            304 Not Modified; validators holds the etag, last_modified and
+            content_length the PDF is now known by
+
+        Raises:
+            requests.RequestException: If the transfer fails or ends early
+
+        Educational Note:
+        A resume is only safe if the file on the server is still the one
+        the part was started from. The validators of that first response
+        are kept next to the part and sent as If-Range: an unchanged file
+        continues with 206, a changed one comes back whole with 200 and the
+        part is rewritten from zero. A part whose origin is unknown is never
+        resumed.
+        """
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        part_validators = self._read_part_validators(part_path) if offset else None
+        if_range = self._if_range_value(part_validators)
+        if offset and if_range is None and part_validators != {}:
+            # No record of the part's version, or none usable with If-Range;
+            # an empty record means the server never offered validators
+            self._discard_part(part_path)
+            offset = 0
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        if if_range and offset:
+            headers["If-Range"] = if_range
+        if conditions and not offset:
+            if conditions.get("etag"):
+                headers["If-None-Match"] = conditions["etag"]
+            if conditions.get("last_modified"):
+                headers["If-Modified-Since"] = conditions["last_modified"]
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire_for_url(url)
+
+        response = self._thread_session().get(
+            url, headers=headers, timeout=self.timeout, stream=True
+        )
+        with response:
+            if response.status_code == 304:
+                # No body; the answer may still carry fresher validators
+                return False, {**(conditions or {}), **self._validators_of(response)}
+            if offset and response.status_code == 416:
+                # Complete only if the server confirms the part's exact size
+                size = response.headers.get("Content-Range", "").rpartition("/")[2]
+                if size.isdigit() and int(size) == offset:
+                    return True, {
+                        **(part_validators or {}),
+                        **self._validators_of(response, offset),
+                    }
+                self._discard_part(part_path)
+                raise requests.HTTPError(
+                    f"Partial file does not match {url}; restarting", response=None
+                )
+            response.raise_for_status()
+            validators = self._validators_of(response)
+
+            if response.status_code != 206:
+                # The file changed (If-Range) or Range was ignored: the whole
+                # file follows, so the part is rewritten from zero
+                offset = 0
+            elif not response.headers.get("Content-Range", "").startswith(
+                f"bytes {offset}-"
+            ):
+                self._discard_part(part_path)
+                raise requests.HTTPError(
+                    f"Unexpected range from {url}; restarting", response=None
+                )
+            if not offset:
+                self._write_part_validators(part_path, validators)
+            length = response.headers.get("Content-Length", "")
+            expected = offset + int(length) if length.isdigit() else None
+
+            with open(part_path, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if chunk:
+                        f.write(chunk)
+                        with self._bytes_lock:
+                            self._bytes_downloaded += len(chunk)
+
+        size = part_path.stat().st_size
+        if expected is not None and size < expected:
+            raise requests.ConnectionError(f"Transfer of {url} ended early")
+        validators["content_length"] = str(size)
+        return True, validators
+
+    def _part_validators_path(self, part_path: Path) -> Path:
+        """Return where the validators of a .part file are kept."""
+        return part_path.with_name(
+            part_path.name[: -len(self.PART_SUFFIX)] + self.PART_VALIDATORS_SUFFIX
+        )
+
+    def _read_part_validators(self, part_path: Path) -> Optional[Dict[str, str]]:
+        """Return the validators a part was started with, or None if unknown."""
+        try:
+            with open(self._part_validators_path(part_path), encoding="utf-8") as f:
+                validators = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return validators if isinstance(validators, dict) else None
+
+    def _write_part_validators(
+        self, part_path: Path, validators: Dict[str, str]
+    ) -> None:
+        """Record the validators of the response a part is written from."""
+        with open(self._part_validators_path(part_path), "w", encoding="utf-8") as f:
+            json.dump(validators, f)
+
+    def _discard_part(self, part_path: Path) -> None:
+        """Delete a part file and its validators."""
+        part_path.unlink(missing_ok=True)
+        self._part_validators_path(part_path).unlink(missing_ok=True)
+
+    @staticmethod
+    def _if_range_value(validators: Optional[Dict[str, str]]) -> Optional[str]:
+        """
+        Pick the If-Range validator: a strong ETag, else Last-Modified.
+
+        Weak ETags ("W/...") may not be used with If-Range.
+        """
+        if not validators:
+            return None
+        etag = validators.get("etag", "")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return validators.get("last_modified") or None
+
+    def _validators_of(
+        self, response: requests.Response, size: Optional[int] = None
+    ) -> Dict[str, str]:
+        """Collect the validators a response carries."""
+        validators = {
+            field: response.headers[header]
+            for field, header in self.VALIDATOR_HEADERS.items()
+            if response.headers.get(header)
+        }
+        if size is not None:
+            validators["content_length"] = str(size)
+        return validators
+
+    @staticmethod
+    def _stamp_last_modified(pdf_path: Path, validators: Dict[str, str]) -> None:
+        """
+        Give a downloaded PDF the server's Last-Modified time.
+
+        The file's own timestamp then serves as the If-Modified-Since
+        validator when no other record of it is kept.
+        """
+        if not validators.get("last_modified"):
+            return
+        try:
+            modified = email.utils.parsedate_to_datetime(validators["last_modified"])
+            os.utime(pdf_path, (time.time(), modified.timestamp()))
+        except (TypeError, ValueError, OverflowError, OSError):
+            pass
+
+    def _thread_session(self) -> requests.Session:
+        """Return the session for the calling thread."""
+        if self.max_concurrent_downloads == 1:
+            return self.session
+        session = getattr(self._thread_sessions, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._thread_sessions.session = session
+        return session
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore limiting this service's connections to a host."""
+        host = urlsplit(url).netloc.lower()
+        with self._slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(
+                    self.max_connections_per_host
+                )
+            return self._host_slots[host]
+
+    def _destination_lock(self, pdf_path: Path) -> threading.RLock:
+        """
+        Return the lock serializing downloads to one destination file.
+
+        Re-entrant, because the resumable path takes it again around the
+        transfer itself.
+        """
+        key = Path(os.path.abspath(pdf_path))
+        with self._slots_lock:
+            return self._destination_locks.setdefault(key, threading.RLock())
+
     def _get_pdf_url(self, paper: ResearchPaper) -> Optional[str]:
         """
         Extract PDF URL from ResearchPaper entity.
@@ -206,7 +696,13 @@ class PaperDownloadService:
 
         return None
 
-    def _sanitize_filename(self, filename: str) -> str:
+    @classmethod
+    def pdf_filename(cls, paper: ResearchPaper) -> str:
+        """Return the filename a paper's PDF is saved under."""
+        return f"{cls._sanitize_filename(paper.title)}.pdf"
+
+    @staticmethod
+    def _sanitize_filename(filename: str) -> str:
         """
         Create a safe filename from paper title.
 
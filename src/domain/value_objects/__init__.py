@@ -17,6 +17,7 @@ Examples of value objects in HRV research:
 - KeywordConfig: Configuration for research paper keyword searches
 - PaperFingerprint: Identity mechanism for duplicate paper detection across sources
 - SourceMetadata: Multi-source paper metadata tracking and quality assessment
+- DocumentFrequencies: Per-domain corpus statistics for TF-IDF scoring
 - QualityScore: Represents data quality metrics
 - Citation: Represents a bibliographic citation
 - DateRange: Represents a time period
@@ -27,6 +28,7 @@ from .search_query import SearchQuery
 from .paper_fingerprint import PaperFingerprint
 from .source_metadata import SourceMetadata
 from .embedding_vector import EmbeddingVector
+from .document_frequencies import DocumentFrequencies, DocumentFrequencySource
 
 __all__ = [
     "KeywordConfig",
@@ -34,4 +36,6 @@ __all__ = [
     "PaperFingerprint",
     "SourceMetadata",
     "EmbeddingVector",
+    "DocumentFrequencies",
+    "DocumentFrequencySource",
 ]
@@ -0,0 +1,115 @@
+"""
+DocumentFrequencies - Corpus statistics for true TF-IDF scoring.
+
+TF-IDF needs two numbers about the corpus: how many documents it holds, and
+in how many of them each term occurs. A single paper cannot provide them,
+which is why TFIDFConceptExtractor settled for a "simplified" score and why
+StatisticalExtractionStrategy refit a vectorizer on every call. This value
+object carries exactly those numbers for the terms of one paper, looked up
+from a persistent per-domain table, so a new paper can be scored against
+its whole domain in O(terms).
+
+Educational Notes:
+- Demonstrates the Value Object pattern: an immutable snapshot of corpus
+  statistics, safe to share between strategies scoring the same paper
+- Shows a domain port (DocumentFrequencySource): the domain says what it
+  needs, infrastructure decides how to store it (see
+  src/infrastructure/document_frequency_store.py)
+- Uses scikit-learn's smoothed IDF, ln((1 + N) / (1 + df)) + 1, so scores
+  agree with TfidfVectorizer's and a term never seen before gets the
+  largest weight rather than a division by zero
+
+Use Cases:
+- Demoting terms that appear in nearly every paper of a domain
+  ("security" in a cybersecurity corpus) below terms specific to one paper
+- Scoring TF-IDF for a single paper without fitting a vectorizer
+"""
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class DocumentFrequencies:
+    """
+    Document count of a corpus and the document frequencies of some terms.
+
+    Attributes:
+        document_count: Number of documents in the corpus
+        frequencies: Number of documents containing each term; terms not
+            listed occur in no document
+    """
+
+    document_count: int = 0
+    frequencies: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.document_count < 0:
+            raise ValueError("Document count cannot be negative")
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the corpus has no documents (IDF carries no information)."""
+        return self.document_count == 0
+
+    def idf(self, term: str) -> float:
+        """Return the smoothed inverse document frequency of a term."""
+        return (
+            math.log((1 + self.document_count) / (1 + self.frequencies.get(term, 0)))
+            + 1
+        )
+
+    def idf_array(self, terms: Sequence[str]) -> np.ndarray:
+        """Return the smoothed IDF of many terms as one array."""
+        counts = np.fromiter(
+            (self.frequencies.get(term, 0) for term in terms),
+            dtype=np.float64,
+            count=len(terms),
+        )
+        return np.log((1 + self.document_count) / (1 + counts)) + 1
+
+    def max_idf(self) -> float:
+        """Return the IDF of a term that occurs in no document."""
+        return math.log(1 + self.document_count) + 1
+
+
+class DocumentFrequencySource(ABC):
+    """
+    Port for looking up document frequencies of a research domain.
+
+    Educational Note:
+    Extraction strategies depend on this interface only. Lookups are by
+    the terms of the paper being scored, so their cost grows with the
+    paper, not with the corpus. A strategy also reports the terms it
+    scores a paper on through add_document, which is how the corpus
+    learns what its papers contain.
+    """
+
+    def add_document(self, domain: str, doc_id: str, terms: Iterable[str]) -> None:
+        """
+        Count a document's terms in its domain, replacing an earlier count.
+
+        Sources over a fixed corpus ignore this (the default does nothing).
+
+        Args:
+            domain: Research domain of the document
+            doc_id: Stable identifier (the paper DOI)
+            terms: Terms occurring in the document; repeats count once
+        """
+
+    @abstractmethod
+    def lookup(self, domain: str, terms: Sequence[str]) -> DocumentFrequencies:
+        """
+        Return the domain's document count and the frequencies of terms.
+
+        Args:
+            domain: Research domain whose corpus is consulted
+            terms: Lower-cased terms to look up
+
+        Returns:
+            DocumentFrequencies (empty for an unknown domain)
+        """
@@ -0,0 +1,184 @@
+"""
+Batch Job Journal - Durable record of completed batch processing stages.
+
+A full batch run touches every configuration and strategy, each of which
+passes through several expensive stages (arXiv search, PDF download, concept
+extraction, hierarchy building). If the process dies halfway through, the
+journal lets the next run pick up where the previous one stopped instead of
+re-querying arXiv and re-downloading PDFs that are already on disk.
+
+Educational Notes:
+- Demonstrates write-ahead logging, the technique databases use for recovery
+- Shows append-only persistence: records are never rewritten, only added
+- Illustrates durability with flush + fsync before reporting success
+- Tolerates torn writes: a partially written last line is ignored on replay
+
+Design Decisions:
+- JSON Lines format: one self-contained record per line, human readable
+- Records are keyed by (config, strategy, stage) so stages resume independently
+- Thread-safe so concurrent strategy workers can share one journal
+- File is created lazily on first write so read-only runs leave no trace
+
+Use Cases:
+- Resuming an interrupted nightly batch run with --resume
+- Auditing which stages ran and when
+- Skipping work whose results are already persisted
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BatchJobJournal:
+    """
+    Append-only journal of completed (config, strategy, stage) units of work.
+
+    Educational Note:
+    The journal only ever records completions. A stage that started but never
+    finished simply has no record, so it is re-run on resume. This keeps the
+    recovery logic trivial: "done" is the only state that needs persisting.
+    """
+
+    SEARCH = "search"
+    DOWNLOAD = "download"
+    CONCEPT_EXTRACTION = "concept_extraction"
+    HIERARCHY = "hierarchy"
+    STAGES = (SEARCH, DOWNLOAD, CONCEPT_EXTRACTION, HIERARCHY)
+
+    def __init__(self, journal_path: Path):
+        """
+        Open (or prepare to create) a journal file.
+
+        Args:
+            journal_path: Location of the JSON Lines journal file
+        """
+        self.journal_path = Path(journal_path)
+        self._lock = threading.Lock()
+        self._completed: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._load()
+
+    def mark_completed(
+        self,
+        config_name: str,
+        strategy_name: str,
+        stage: str,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Durably record that a stage finished successfully.
+
+        Args:
+            config_name: Configuration the strategy belongs to
+            strategy_name: Strategy whose stage completed
+            stage: One of STAGES
+            details: Optional JSON-serializable facts about the stage (counts, etc.)
+
+        Raises:
+            ValueError: If stage is not a known stage name
+        """
+        if stage not in self.STAGES:
+            raise ValueError(f"Unknown batch stage: {stage}")
+
+        record = {
+            "config": config_name,
+            "strategy": strategy_name,
+            "stage": stage,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+            "details": details or {},
+        }
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self._lock:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._completed[(config_name, strategy_name, stage)] = record
+
+    def is_completed(self, config_name: str, strategy_name: str, stage: str) -> bool:
+        """Check whether a stage has a completion record."""
+        with self._lock:
+            return (config_name, strategy_name, stage) in self._completed
+
+    def completed_stages(self, config_name: str, strategy_name: str) -> Set[str]:
+        """Return the set of stages completed for a strategy."""
+        with self._lock:
+            return {
+                stage
+                for (config, strategy, stage) in self._completed
+                if config == config_name and strategy == strategy_name
+            }
+
+    def stage_details(
+        self, config_name: str, strategy_name: str, stage: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the details recorded with a completed stage, if any."""
+        with self._lock:
+            record = self._completed.get((config_name, strategy_name, stage))
+            return dict(record["details"]) if record else None
+
+    def reset(self) -> None:
+        """
+        Forget all completions and remove the journal file.
+
+        Educational Note:
+        A non-resumed run starts a fresh journal so stale completions from an
+        earlier run can never cause work to be skipped unexpectedly.
+        """
+        with self._lock:
+            self._completed.clear()
+            if self.journal_path.exists():
+                self.journal_path.unlink()
+
+    def __len__(self) -> int:
+        """Return the number of completed stages recorded."""
+        with self._lock:
+            return len(self._completed)
+
+    def _load(self) -> None:
+        """Replay the journal file, skipping malformed or truncated lines."""
+        if not self.journal_path.exists():
+            return
+
+        self._terminate_torn_tail()
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    key = (record["config"], record["strategy"], record["stage"])
+                except (json.JSONDecodeError, KeyError, TypeError) as e:
+                    logger.warning(
+                        f"Ignoring unreadable journal line {line_number} in "
+                        f"{self.journal_path}: {e}"
+                    )
+                    continue
+                self._completed[key] = record
+
+    def _terminate_torn_tail(self) -> None:
+        """
+        End a last line left without its newline by a crash mid-write.
+
+        Educational Note:
+        Appends would otherwise join the next record onto the torn line,
+        and replay would then drop both. Terminating it keeps the damage
+        to the torn record, which _load skips if it is unreadable.
+        """
+        with open(self.journal_path, "rb+") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+                f.flush()
+                os.fsync(f.fileno())
@@ -0,0 +1,267 @@
+"""
+Concept Extraction Manifest - Incremental concept extraction bookkeeping.
+
+Concept extraction is the most expensive step of a batch run, yet from one
+night to the next most PDFs in a strategy's pdfs/ folder are unchanged. This
+manifest remembers the content hash of every PDF that has been extracted,
+together with the concepts that extraction produced, so the batch processor
+only has to extract the day's new or changed files.
+
+Educational Notes:
+- Demonstrates content-addressed caching: identity is the SHA-256 of the bytes,
+  not the filename, so a re-downloaded but identical PDF is still a cache hit
+- Shows cheap change detection: size + mtime short-circuit the hash, which is
+  only recomputed when the filesystem suggests the file might have changed
+- Illustrates cache invalidation by version: a new extractor version discards
+  every cached result so stale concepts never leak into new runs
+
+Design Decisions:
+- Every PDF is extracted on its own and its concepts are cached under its
+  content hash, so a changed or removed PDF invalidates exactly one entry and
+  never forces its neighbours to be re-extracted
+- Filenames only point at hashes; two names with identical bytes share one
+  cached result and contribute it once
+- Atomic writes (temp file + rename) so a crash never leaves a torn manifest
+- Stored next to papers.json so each strategy directory is self-describing
+
+Use Cases:
+- Nightly batch runs where only a handful of PDFs are new
+- Re-running extraction after an extractor upgrade (automatic full refresh)
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def compute_file_sha256(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hex digest of a file without loading it into memory.
+
+    Args:
+        file_path: File to hash
+        chunk_size: Bytes read per iteration
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConceptExtractionManifest:
+    """
+    Per-strategy record of which PDFs have been concept-extracted.
+
+    Educational Note:
+    The manifest is a small state machine: plan() compares the folder with
+    what was recorded and returns the PDFs that still need work; record()
+    stores the result of extracting one of them under its content hash;
+    merged_extraction_result() rebuilds the strategy-wide view from the
+    cached result of every PDF in the folder.
+    """
+
+    FILENAME = "concept_manifest.json"
+    MANIFEST_VERSION = "2.0"
+
+    def __init__(self, manifest_path: Path, extractor_version: str):
+        """
+        Load an existing manifest or start an empty one.
+
+        Args:
+            manifest_path: Location of the manifest JSON file
+            extractor_version: Identifier of the extractor configuration;
+                a mismatch with the stored value invalidates every entry
+        """
+        self.manifest_path = Path(manifest_path)
+        self.extractor_version = extractor_version
+        self._pdfs: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._pending_fingerprints: Dict[str, Dict[str, Any]] = {}
+        self._hierarchy_built = False
+        self._changed = False
+        self._load()
+
+    @property
+    def has_changes(self) -> bool:
+        """True if cached results were invalidated or new results recorded."""
+        return self._changed
+
+    @property
+    def hierarchy_built(self) -> bool:
+        """True if the hierarchy was rebuilt after the last change to the cache."""
+        return self._hierarchy_built and not self._changed
+
+    @property
+    def extracted_pdf_names(self) -> List[str]:
+        """Names of PDFs whose concepts are currently cached."""
+        return sorted(self._pdfs)
+
+    def plan(self, pdf_paths: List[Path]) -> List[Path]:
+        """
+        Determine which PDFs need (re-)extraction.
+
+        Forgets PDFs that were changed or removed and returns every PDF
+        whose content hash has no cached result.
+
+        Args:
+            pdf_paths: PDFs currently present in the strategy's pdfs/ folder
+
+        Returns:
+            PDFs that must be passed to the concept extractor
+        """
+        current = {path.name: path for path in pdf_paths}
+        self._pending_fingerprints = {}
+
+        for name in list(self._pdfs):
+            if name not in current:
+                del self._pdfs[name]
+                self._changed = True
+
+        pending = []
+        for name in sorted(current):
+            entry = self._pdfs.get(name)
+            fingerprint = self._fingerprint(current[name], entry)
+            if fingerprint["sha256"] in self._results:
+                # A touched but identical file only refreshes its stat info
+                if fingerprint != entry:
+                    self._pdfs[name] = fingerprint
+                    self._changed = True
+                continue
+            if entry is not None:
+                del self._pdfs[name]
+                self._changed = True
+            self._pending_fingerprints[name] = fingerprint
+            pending.append(current[name])
+        return pending
+
+    def record(self, pdf_path: Path, extraction_result: Dict[str, Any]) -> str:
+        """
+        Cache the concepts extracted from one PDF.
+
+        Args:
+            pdf_path: PDF that was passed to the extractor
+            extraction_result: Dictionary with "concepts" and "total_extracted"
+
+        Returns:
+            Content hash the result was stored under
+        """
+        fingerprint = self._pending_fingerprints.pop(
+            pdf_path.name, None
+        ) or self._fingerprint(pdf_path)
+        concepts = list(extraction_result.get("concepts", []))
+
+        self._results[fingerprint["sha256"]] = {
+            "concepts": concepts,
+            "total_extracted": extraction_result.get("total_extracted", len(concepts)),
+            "extracted_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._pdfs[pdf_path.name] = fingerprint
+        self._changed = True
+        return fingerprint["sha256"]
+
+    def merged_extraction_result(self) -> Dict[str, Any]:
+        """
+        Combine the cached result of every PDF into one strategy-wide result.
+
+        Returns:
+            Dictionary with "concepts" (in filename order) and "total_extracted"
+        """
+        concepts: List[Dict[str, Any]] = []
+        total_extracted = 0
+        seen = set()
+        for name in sorted(self._pdfs):
+            sha256 = self._pdfs[name]["sha256"]
+            result = self._results.get(sha256)
+            if result is None or sha256 in seen:
+                continue
+            seen.add(sha256)
+            concepts.extend(result["concepts"])
+            total_extracted += result.get("total_extracted", len(result["concepts"]))
+        return {"concepts": concepts, "total_extracted": total_extracted}
+
+    def mark_hierarchy_built(self) -> None:
+        """
+        Record that concept_hierarchy.json reflects the current cached concepts.
+
+        Educational Note:
+        Concepts and hierarchy are written in two steps. Tracking the second
+        step separately means a crash between them is detected on the next
+        run and only the (cheap) hierarchy is rebuilt.
+        """
+        self._hierarchy_built = True
+        self.save()
+
+    def save(self) -> None:
+        """Atomically persist the manifest next to the strategy results."""
+        # Results no PDF points at any more belong to removed or changed files
+        referenced = {entry["sha256"] for entry in self._pdfs.values()}
+        self._results = {
+            sha256: result
+            for sha256, result in self._results.items()
+            if sha256 in referenced
+        }
+        data = {
+            "manifest_version": self.MANIFEST_VERSION,
+            "extractor_version": self.extractor_version,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "hierarchy_built": self._hierarchy_built and not self._changed,
+            "pdfs": self._pdfs,
+            "results": self._results,
+        }
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        temp_path.replace(self.manifest_path)
+        self._hierarchy_built = data["hierarchy_built"]
+        self._changed = False
+
+    def _load(self) -> None:
+        """Read the stored manifest, discarding it on version mismatch."""
+        if not self.manifest_path.exists():
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._changed = True
+            return
+
+        if (
+            data.get("manifest_version") != self.MANIFEST_VERSION
+            or data.get("extractor_version") != self.extractor_version
+        ):
+            self._changed = True
+            return
+
+        self._pdfs = data.get("pdfs", {})
+        self._results = data.get("results", {})
+        self._hierarchy_built = bool(data.get("hierarchy_built", False))
+
+    def _fingerprint(
+        self, path: Path, known: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Describe a file by size, mtime and content hash.
+
+        Educational Note:
+        Hashing a large PDF costs a full read. When size and mtime match the
+        recorded values the stored hash is trusted, so unchanged folders are
+        verified with one stat() per file.
+        """
+        stat = path.stat()
+        if (
+            known
+            and known.get("size") == stat.st_size
+            and known.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            sha256 = known["sha256"]
+        else:
+            sha256 = compute_file_sha256(path)
+        return {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
@@ -0,0 +1,248 @@
+"""
+Document Frequency Store - Persistent per-domain document frequencies.
+
+Implements the domain's DocumentFrequencySource port on SQLite. Every time
+TFIDFConceptExtractor scores a paper, the set of terms it scores the paper
+on is recorded here and the document frequency of each term in the paper's
+domain is updated in place. Extraction strategies then look up just the
+terms of the paper they are scoring, which turns IDF into an indexed
+lookup instead of a vectorizer fit over the whole domain.
+
+Educational Notes:
+- Demonstrates incremental maintenance of an aggregate: a document
+  frequency is a count, so adding a paper increments the counts of its
+  terms and nothing else has to be recomputed
+- Shows idempotent updates: saving a paper again first withdraws the terms
+  it was counted with, so re-extraction never counts a paper twice
+- Reuses the store recipe of PaperFingerprintIndex and PdfBlobStore:
+  SQLite in WAL mode with one connection per thread
+
+Design Decisions:
+- A paper contributes every term it repeats at least min_frequency times
+  (lower-cased, whitespace-normalized): the terms it is scored on, not
+  just the concepts picked from them. Counting only picked concepts would
+  feed rankings back into the corpus: a picked term would be demoted on
+  later papers, while a term in every paper that was never picked would
+  keep the largest IDF. Counting every n-gram instead would store a row
+  per n-gram and paper, most of them terms no paper is ever scored on
+- Lookups are batched below SQLite's parameter limit, so a paper with
+  thousands of candidate terms costs a handful of indexed queries
+- The database lives next to the repository's statistics, so it moves and
+  is backed up with the stored concepts
+
+Use Cases:
+- True TF-IDF for TFIDFConceptExtractor and StatisticalExtractionStrategy
+- Inspecting how widespread a concept is within a domain
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Sequence, Union
+
+from src.domain.value_objects.document_frequencies import (
+    DocumentFrequencies,
+    DocumentFrequencySource,
+)
+
+PathLike = Union[str, Path]
+
+
+def normalize_term(term: str) -> str:
+    """Return the form terms are counted under: lower case, single spaces."""
+    return " ".join(term.lower().split())
+
+
+class DocumentFrequencyStore(DocumentFrequencySource):
+    """
+    SQLite table of document frequencies per research domain.
+
+    Educational Note:
+    Three tables: the papers of each domain, the terms each paper was
+    counted with, and the resulting frequency of each term. The first two
+    make updates reversible; the third makes lookups a primary-key read.
+    """
+
+    FILENAME = "document_frequency.sqlite"
+
+    # Terms per lookup query (SQLite allows 999 parameters by default)
+    LOOKUP_BATCH = 500
+
+    def __init__(self, directory: PathLike, timeout: float = 30.0):
+        """
+        Open (or create) a store.
+
+        Args:
+            directory: Directory holding the database file
+            timeout: Seconds to wait for a competing writer
+        """
+        self.directory = Path(directory)
+        self.db_path = self.directory / self.FILENAME
+        self.timeout = timeout
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._initialized = False
+
+    def add_document(self, domain: str, doc_id: str, terms: Iterable[str]) -> None:
+        """
+        Count a document's terms in its domain, replacing an earlier count.
+
+        Args:
+            domain: Research domain of the document
+            doc_id: Stable identifier (the paper DOI)
+            terms: Terms occurring in the document; repeats count once
+        """
+        unique_terms = sorted({normalize_term(term) for term in terms} - {""})
+        connection = self._connection()
+        with self._write_lock, connection:
+            self._begin_write(connection)
+            self._withdraw(connection, domain, doc_id)
+            connection.execute(
+                "INSERT INTO documents (domain, doc_id) VALUES (?, ?)",
+                (domain, doc_id),
+            )
+            connection.executemany(
+                "INSERT INTO postings (domain, doc_id, term) VALUES (?, ?, ?)",
+                [(domain, doc_id, term) for term in unique_terms],
+            )
+            connection.executemany(
+                "INSERT INTO frequencies (domain, term, df) VALUES (?, ?, 1) "
+                "ON CONFLICT (domain, term) DO UPDATE SET df = df + 1",
+                [(domain, term) for term in unique_terms],
+            )
+
+    def remove_document(self, domain: str, doc_id: str) -> None:
+        """Withdraw a document's terms from its domain, if it was counted."""
+        connection = self._connection()
+        with self._write_lock, connection:
+            self._begin_write(connection)
+            self._withdraw(connection, domain, doc_id)
+
+    def lookup(self, domain: str, terms: Sequence[str]) -> DocumentFrequencies:
+        """
+        Return the domain's document count and the frequencies of terms.
+
+        Terms are matched in their normalized form; the returned mapping is
+        keyed by the terms as given.
+        """
+        connection = self._connection()
+        (document_count,) = connection.execute(
+            "SELECT COUNT(*) FROM documents WHERE domain = ?", (domain,)
+        ).fetchone()
+        if not document_count:
+            return DocumentFrequencies()
+
+        by_normalized = {}
+        for term in terms:
+            by_normalized.setdefault(normalize_term(term), []).append(term)
+        normalized = list(by_normalized)
+
+        frequencies = {}
+        for start in range(0, len(normalized), self.LOOKUP_BATCH):
+            batch = normalized[start : start + self.LOOKUP_BATCH]
+            placeholders = ", ".join("?" * len(batch))
+            for term, df in connection.execute(
+                f"SELECT term, df FROM frequencies WHERE domain = ? "
+                f"AND term IN ({placeholders})",
+                (domain, *batch),
+            ):
+                for original in by_normalized[term]:
+                    frequencies[original] = df
+        return DocumentFrequencies(document_count, frequencies)
+
+    def document_count(self, domain: str) -> int:
+        """Return the number of documents counted in a domain."""
+        (count,) = (
+            self._connection()
+            .execute("SELECT COUNT(*) FROM documents WHERE domain = ?", (domain,))
+            .fetchone()
+        )
+        return count
+
+    def domains(self) -> List[str]:
+        """Return the domains that have documents, sorted."""
+        return [
+            row[0]
+            for row in self._connection().execute(
+                "SELECT DISTINCT domain FROM documents ORDER BY domain"
+            )
+        ]
+
+    def close(self) -> None:
+        """Close the calling thread's database connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @staticmethod
+    def _begin_write(connection: sqlite3.Connection) -> None:
+        """
+        Start a write transaction that holds SQLite's write lock from the start.
+
+        Educational Note:
+        The write lock only serializes threads sharing this instance. Every
+        extraction worker process opens its own store, so two of them
+        re-adding one document could both read its old postings before
+        either writes, and withdraw them once but count the new ones twice.
+        BEGIN IMMEDIATE takes the database's write lock before that read.
+        """
+        connection.execute("BEGIN IMMEDIATE")
+
+    def _withdraw(
+        self, connection: sqlite3.Connection, domain: str, doc_id: str
+    ) -> None:
+        """Undo a document's contribution (caller holds the write transaction)."""
+        terms = [
+            (domain, row[0])
+            for row in connection.execute(
+                "SELECT term FROM postings WHERE domain = ? AND doc_id = ?",
+                (domain, doc_id),
+            )
+        ]
+        connection.executemany(
+            "UPDATE frequencies SET df = df - 1 WHERE domain = ? AND term = ?", terms
+        )
+        connection.execute(
+            "DELETE FROM frequencies WHERE domain = ? AND df <= 0", (domain,)
+        )
+        connection.execute(
+            "DELETE FROM postings WHERE domain = ? AND doc_id = ?", (domain, doc_id)
+        )
+        connection.execute(
+            "DELETE FROM documents WHERE domain = ? AND doc_id = ?", (domain, doc_id)
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, creating the schema on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            if not self._initialized:
+                with self._write_lock, connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS documents ("
+                        "domain TEXT NOT NULL, "
+                        "doc_id TEXT NOT NULL, "
+                        "PRIMARY KEY (domain, doc_id))"
+                    )
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS postings ("
+                        "domain TEXT NOT NULL, "
+                        "doc_id TEXT NOT NULL, "
+                        "term TEXT NOT NULL, "
+                        "PRIMARY KEY (domain, doc_id, term))"
+                    )
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS frequencies ("
+                        "domain TEXT NOT NULL, "
+                        "term TEXT NOT NULL, "
+                        "df INTEGER NOT NULL, "
+                        "PRIMARY KEY (domain, term))"
+                    )
+                self._initialized = True
+        return connection
@@ -0,0 +1,338 @@
+"""
+Download/Extract Pipeline - Overlapping network and CPU work per strategy.
+
+Without a pipeline a strategy downloads every PDF before the first one is
+extracted, so the CPU idles during downloads and the network idles during
+extraction. This module connects the two stages with bounded queues: as soon
+as one PDF lands on disk it is handed to an extraction worker while the
+download threads carry on with the next papers.
+
+Educational Notes:
+- Demonstrates the producer/consumer pattern with bounded queues; a full
+  queue blocks the producer (back-pressure), which caps memory no matter how
+  many papers a strategy returns
+- Shows matching the executor to the workload: threads for I/O-bound
+  downloads (the GIL is released while waiting on sockets) and processes for
+  CPU-bound extraction (which the GIL would otherwise serialize)
+- Illustrates sentinel values for orderly shutdown of worker threads
+
+Design Decisions:
+- Stages are plain callables so the pipeline knows nothing about arXiv,
+  PDFs or concepts; the batch processor supplies the actual work
+- Results are delivered through on_result in the calling thread, so callers
+  can update non-thread-safe state (e.g. a manifest) without locks
+- The extraction executor is injectable: process pools need picklable
+  callables, while tests and injected extractors can use a thread pool.
+  A caller running many pipelines passes one shared executor, so worker
+  processes (and what they load) are reused instead of respawned per run
+- A failure in one paper is counted and reported, never fatal to the run;
+  if the extraction stage itself breaks, the download threads are stopped
+  and released before the error propagates
+
+Use Cases:
+- Batch processing strategies that download and extract hundreds of PDFs
+- Any two-stage fetch-then-compute workload with a memory budget
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a queue's input; compared by identity
+_END_OF_INPUT = object()
+
+
+@dataclass
+class PipelineStats:
+    """
+    Counters describing one pipeline run.
+
+    Attributes:
+        downloaded: PDFs that were downloaded successfully
+        download_failures: Papers whose download raised or returned no file
+        extracted: PDFs whose extraction finished successfully
+        extraction_failures: PDFs whose extraction raised
+        errors: Human-readable error messages for failed items
+    """
+
+    downloaded: int = 0
+    download_failures: int = 0
+    extracted: int = 0
+    extraction_failures: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class DownloadExtractPipeline:
+    """
+    Two-stage pipeline: threaded downloads feeding pooled extraction.
+
+    Educational Note:
+    Three bounded buffers limit what is held in memory at once: the paper
+    queue, the downloaded-PDF queue and the number of extraction jobs in
+    flight. Each is at most `queue_size`, so memory use is independent of the
+    number of papers.
+    """
+
+    def __init__(
+        self,
+        download: Callable[[Any], Optional[Path]],
+        extract: Optional[Callable[[Any, Path], Any]] = None,
+        on_result: Optional[Callable[[Any, Path, Any], None]] = None,
+        download_workers: int = 4,
+        extract_workers: Optional[int] = None,
+        queue_size: int = 8,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Configure the pipeline stages.
+
+        Args:
+            download: Called with a paper; returns the PDF path or None
+            extract: Called with (paper, pdf_path) in an extraction worker;
+                must be picklable when a process pool is used. None skips
+                the extraction stage.
+            on_result: Called in the calling thread with (paper, pdf_path,
+                extraction result) for every successful extraction
+            download_workers: Number of download threads
+            extract_workers: Number of extraction workers (default: CPU count)
+            queue_size: Capacity of each queue and of in-flight extractions
+            executor_factory: Builds the extraction executor from a worker
+                count (default: a forkserver ProcessPoolExecutor)
+            executor: Extraction executor owned by the caller; used instead
+                of executor_factory and left running after the run
+        """
+        self.download = download
+        self.extract = extract
+        self.on_result = on_result
+        self.download_workers = max(1, download_workers)
+        self.extract_workers = max(1, extract_workers or os.cpu_count() or 1)
+        self.queue_size = max(1, queue_size)
+        self.executor_factory = executor_factory or self._process_pool
+        self.executor = executor
+
+    @staticmethod
+    def _process_pool(workers: int) -> Executor:
+        """
+        Default extraction executor.
+
+        The download threads are already running when it starts, so workers
+        are started with forkserver (or spawn) rather than forked with
+        whatever locks those threads hold.
+        """
+        method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(method)
+        )
+
+    def run(self, papers: Iterable[Any]) -> PipelineStats:
+        """
+        Download and extract every paper, overlapping the two stages.
+
+        Args:
+            papers: Papers to process
+
+        Returns:
+            PipelineStats summarizing the run
+        """
+        stats = PipelineStats()
+        stats_lock = threading.Lock()
+        stop = threading.Event()
+        paper_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        pdf_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+
+        feeder = threading.Thread(
+            target=self._feed, args=(papers, paper_queue, stop), daemon=True
+        )
+        downloaders = [
+            threading.Thread(
+                target=self._download_worker,
+                args=(paper_queue, pdf_queue, stats, stats_lock, stop),
+                daemon=True,
+            )
+            for _ in range(self.download_workers)
+        ]
+        feeder.start()
+        for thread in downloaders:
+            thread.start()
+
+        try:
+            if self.extract is None:
+                self._drain(pdf_queue)
+            elif self.executor is not None:
+                self._extract_downloads(pdf_queue, self.executor, stats)
+            else:
+                executor = self.executor_factory(self.extract_workers)
+                try:
+                    self._extract_downloads(pdf_queue, executor, stats)
+                finally:
+                    executor.shutdown(wait=True)
+        except BaseException:
+            # Threads blocked on a full queue would otherwise wait forever
+            stop.set()
+            self._discard_until_finished(pdf_queue, downloaders)
+            raise
+
+        feeder.join()
+        for thread in downloaders:
+            thread.join()
+        return stats
+
+    def _feed(
+        self, papers: Iterable[Any], paper_queue: "queue.Queue", stop: threading.Event
+    ) -> None:
+        """Producer: enqueue papers, blocking while the downloaders are busy."""
+        try:
+            for paper in papers:
+                if stop.is_set():
+                    break
+                paper_queue.put(paper)
+        finally:
+            for _ in range(self.download_workers):
+                paper_queue.put(_END_OF_INPUT)
+
+    def _download_worker(
+        self,
+        paper_queue: "queue.Queue",
+        pdf_queue: "queue.Queue",
+        stats: PipelineStats,
+        stats_lock: threading.Lock,
+        stop: threading.Event,
+    ) -> None:
+        """
+        Download papers until the end-of-input sentinel arrives.
+
+        Educational Note:
+        The sentinel is forwarded in a finally block: the extraction loop
+        waits for one per download thread, so a thread that died without
+        sending it would hang the whole pipeline. Once the run is stopped,
+        remaining papers are taken off the queue without being downloaded.
+        """
+        try:
+            while True:
+                paper = paper_queue.get()
+                if paper is _END_OF_INPUT:
+                    return
+                if stop.is_set():
+                    continue
+                try:
+                    pdf_path = self.download(paper)
+                    error = None if pdf_path else "no PDF available"
+                except Exception as e:
+                    pdf_path, error = None, str(e)
+
+                with stats_lock:
+                    if pdf_path:
+                        stats.downloaded += 1
+                    else:
+                        stats.download_failures += 1
+                        stats.errors.append(
+                            f"Download failed for {self._describe(paper)}: {error}"
+                        )
+                if pdf_path:
+                    pdf_queue.put((paper, Path(pdf_path)))
+        finally:
+            pdf_queue.put(_END_OF_INPUT)
+
+    def _extract_downloads(
+        self, pdf_queue: "queue.Queue", executor: Executor, stats: PipelineStats
+    ) -> None:
+        """
+        Submit each downloaded PDF for extraction as soon as it arrives.
+
+        Educational Note:
+        At most `queue_size` extractions are in flight. When the limit is
+        reached this loop waits for one to finish, which in turn leaves the
+        PDF queue full and pauses the downloaders: back-pressure flows all
+        the way up the pipeline.
+        """
+        in_flight: Dict[Future, tuple] = {}
+        finished_downloaders = 0
+
+        while finished_downloaders < self.download_workers:
+            item = pdf_queue.get()
+            if item is _END_OF_INPUT:
+                finished_downloaders += 1
+                continue
+
+            if len(in_flight) >= self.queue_size:
+                self._collect(in_flight, stats, block=True)
+
+            paper, pdf_path = item
+            in_flight[executor.submit(self.extract, paper, pdf_path)] = item
+            self._collect(in_flight, stats, block=False)
+
+        while in_flight:
+            self._collect(in_flight, stats, block=True)
+
+    def _collect(
+        self, in_flight: Dict[Future, tuple], stats: PipelineStats, block: bool
+    ) -> None:
+        """Deliver finished extractions to on_result and forget them."""
+        if block:
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+        else:
+            done = [future for future in in_flight if future.done()]
+
+        for future in done:
+            paper, pdf_path = in_flight.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:
+                stats.extraction_failures += 1
+                stats.errors.append(f"Extraction failed for {pdf_path.name}: {e}")
+                continue
+
+            stats.extracted += 1
+            if self.on_result is not None:
+                try:
+                    self.on_result(paper, pdf_path, result)
+                except Exception as e:
+                    logger.warning(f"Result handler failed for {pdf_path.name}: {e}")
+                    stats.errors.append(
+                        f"Result handling failed for {pdf_path.name}: {e}"
+                    )
+
+    def _drain(self, pdf_queue: "queue.Queue") -> None:
+        """Consume download results when no extraction stage is configured."""
+        finished_downloaders = 0
+        while finished_downloaders < self.download_workers:
+            if pdf_queue.get() is _END_OF_INPUT:
+                finished_downloaders += 1
+
+    @staticmethod
+    def _discard_until_finished(
+        pdf_queue: "queue.Queue", downloaders: List[threading.Thread]
+    ) -> None:
+        """Empty the PDF queue until every download thread has exited."""
+        while any(thread.is_alive() for thread in downloaders):
+            try:
+                pdf_queue.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+    @staticmethod
+    def _describe(paper: Any) -> str:
+        """Short label for a paper in error messages."""
+        title = getattr(paper, "title", None)
+        if not isinstance(title, str) or not title:
+            title = str(paper)
+        return title[:60]
@@ -0,0 +1,254 @@
+"""
+Extracted Text Cache - Compressed PDF text keyed by content and settings.
+
+Parsing a PDF with PyPDF2 is the most expensive step of concept extraction,
+and every pass repeats it, although the text of a given PDF never changes.
+Tuning a concept strategy and re-running extraction therefore re-parses the
+whole corpus just to get the same text again. This cache stores the final
+text of each extraction under the SHA-256 of the PDF's bytes plus the
+extractor settings that shaped it, so the second pass reads compressed text
+from SQLite instead of parsing PDFs.
+
+Educational Notes:
+- Demonstrates content-addressed cache keys: a renamed or re-linked PDF is
+  still a hit, and a PDF replaced upstream under the same name is a miss
+- Shows why configuration belongs in the key: text cleaned differently, or
+  truncated at another length, is a different result and must not be served
+  for the old settings
+- Reuses the HttpResponseCache recipe: zlib-compressed bodies in SQLite
+  (WAL mode, one connection per thread) with least-recently-used eviction
+  under a byte budget
+
+Design Decisions:
+- Hit and miss counts are kept in the database rather than in memory, so
+  lookups made by extraction worker processes are counted too
+- Only successful extractions are cached; failures are retried every time
+- The cache is picklable (it reconnects on the other side), so it can be
+  handed to process-pool workers with the rest of an extractor's settings
+- Digests come from compute_file_sha256, the same hash the concept
+  extraction manifest and the PDF blob store use
+
+Use Cases:
+- Re-running concept extraction with tweaked strategies
+- Sharing extracted text between strategies that link the same stored PDF
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+from src.infrastructure.concept_extraction_manifest import compute_file_sha256
+
+PathLike = Union[str, Path]
+
+
+class ExtractedTextCache:
+    """
+    Size-bounded store of extracted PDF text on disk.
+
+    Educational Note:
+    Callers first build a key from the PDF and their settings with
+    key_for(), then get() and put() by key, so the file is hashed once per
+    extraction however the lookup turns out.
+    """
+
+    DIRNAME = ".text_cache"
+    FILENAME = "extracted_text.sqlite"
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: PathLike,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (or create) a text cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_bytes: Upper bound on stored (compressed) text bytes
+            clock: Wall-clock time source (injectable for tests)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / self.FILENAME
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._initialized = False
+
+    @staticmethod
+    def key_for(pdf_path: PathLike, settings: Dict[str, Any]) -> str:
+        """
+        Build the cache key of a PDF extracted with some settings.
+
+        Args:
+            pdf_path: PDF file; its bytes are hashed, its name is ignored
+            settings: JSON-serializable extractor settings that affect the
+                extracted text
+
+        Returns:
+            Hex SHA-256 digest identifying (content, settings)
+        """
+        digest = compute_file_sha256(Path(pdf_path))
+        normalized = json.dumps([digest, settings], sort_keys=True)
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return cached text and count the lookup as a hit or a miss.
+
+        Returns:
+            The extracted text, or None on a miss
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT body FROM texts WHERE key = ?", (key,)
+        ).fetchone()
+        with self._write_lock, connection:
+            if row is not None:
+                connection.execute(
+                    "UPDATE texts SET accessed_at = ? WHERE key = ?",
+                    (self._clock(), key),
+                )
+            counter = "hits" if row is not None else "misses"
+            connection.execute(
+                "UPDATE counters SET value = value + 1 WHERE name = ?", (counter,)
+            )
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key: str, text: str) -> bool:
+        """
+        Store extracted text, evicting least recently used entries if needed.
+
+        Returns:
+            True if the text was cached (False if it alone exceeds max_bytes)
+        """
+        body = zlib.compress(text.encode("utf-8"))
+        if len(body) > self.max_bytes:
+            return False
+
+        now = self._clock()
+        connection = self._connection()
+        with self._write_lock, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO texts (key, body, size, stored_at, "
+                "accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, body, len(body), now, now),
+            )
+            self._evict(connection)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return lookup and storage statistics.
+
+        Returns:
+            Dict with hits, misses, hit_rate, entries and bytes
+        """
+        connection = self._connection()
+        counters = dict(connection.execute("SELECT name, value FROM counters"))
+        entries, size = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM texts"
+        ).fetchone()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def total_bytes(self) -> int:
+        """Return the stored (compressed) size of all entries."""
+        return self.stats()["bytes"]
+
+    def clear(self) -> None:
+        """Remove every cached text and reset the counters."""
+        connection = self._connection()
+        with self._write_lock, connection:
+            connection.execute("DELETE FROM texts")
+            connection.execute("UPDATE counters SET value = 0")
+
+    def close(self) -> None:
+        """Close the calling thread's database connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self) -> int:
+        return self.stats()["entries"]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the configuration only; connections are per process."""
+        state = self.__dict__.copy()
+        del state["_local"], state["_write_lock"]
+        state["_initialized"] = False
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM texts"
+        ).fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM texts ORDER BY accessed_at ASC"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM texts WHERE key = ?", victims)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, creating the schema on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), timeout=30.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+            if not self._initialized:
+                with self._write_lock, connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS texts ("
+                        "key TEXT PRIMARY KEY, "
+                        "body BLOB NOT NULL, "
+                        "size INTEGER NOT NULL, "
+                        "stored_at REAL NOT NULL, "
+                        "accessed_at REAL NOT NULL)"
+                    )
+                    connection.execute(
+                        "CREATE INDEX IF NOT EXISTS texts_accessed "
+                        "ON texts (accessed_at)"
+                    )
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS counters ("
+                        "name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+                    )
+                    connection.execute(
+                        "INSERT OR IGNORE INTO counters (name, value) "
+                        "VALUES ('hits', 0), ('misses', 0)"
+                    )
+                self._initialized = True
+        return connection
@@ -0,0 +1,355 @@
+"""
+HTTP Response Cache - On-disk cache and offline replay for paper sources.
+
+Batch runs re-issue the same arXiv, PMC and MDPI requests every time they
+execute, even when the previous run finished an hour ago. This module stores
+successful GET responses on disk, keyed by the normalized request, so repeated
+runs (and CI load tests) are served from disk in milliseconds.
+
+Educational Notes:
+- Demonstrates cache keys built from *normalized* requests: parameter order,
+  None-valued parameters and host-name case must not produce different keys
+  for what the server treats as the same request
+- Shows time-to-live (TTL) freshness plus size-bounded least-recently-used
+  (LRU) eviction, the two knobs every production HTTP cache exposes
+- Illustrates a replay-only mode: the network is never touched and a cache
+  miss is reported as a connection error, so tests are deterministic offline
+
+Design Decisions:
+- SQLite (WAL mode) holds the entries: one file, atomic writes, and safe
+  sharing between the threads and processes of a batch run, the same storage
+  choice as PaperFingerprintIndex
+- Bodies are zlib-compressed; Atom and OAI-PMH XML compress about 5-10x
+- Only successful (2xx) GET responses are stored; errors are always retried
+- CachingSession subclasses requests.Session, so repositories keep calling
+  session.get() and existing mocks of requests.Session.get keep working
+- Replay mode ignores the TTL: a stale answer is better than no answer when
+  the network is off limits
+
+Use Cases:
+- Re-running batch processing without re-querying arXiv
+- Offline, reproducible CI load tests from recorded responses
+- Sharing one cache between the arXiv, PMC and MDPI repositories
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CacheMissError(requests.ConnectionError):
+    """
+    Raised in replay-only mode when a request has no cached response.
+
+    Educational Note:
+    Subclassing requests.ConnectionError means every repository's existing
+    network error handling applies unchanged to a replay miss.
+    """
+
+
+class HttpResponseCache:
+    """
+    Size-bounded, TTL-aware store of HTTP responses on disk.
+
+    Educational Note:
+    Each thread gets its own SQLite connection (connections must not be
+    shared across threads), while writes are serialized with a lock so
+    eviction sees a consistent total size.
+    """
+
+    FILENAME = "responses.sqlite"
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        replay_only: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Open (or create) a response cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            ttl_seconds: Age after which a cached response is refetched
+            max_bytes: Upper bound on stored (compressed) body bytes
+            replay_only: Serve only from the cache, never from the network
+            clock: Wall-clock time source (injectable for tests)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / self.FILENAME
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.replay_only = replay_only
+        self._clock = clock
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        with self._write_lock:
+            connection = self._connection()
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    encoding TEXT,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed_at)"
+            )
+            connection.commit()
+
+    @staticmethod
+    def cache_key(method: str, url: str, params: Any = None) -> str:
+        """
+        Build the cache key for a request.
+
+        Query-string parameters in the URL and explicit params are merged,
+        None values are dropped and pairs are sorted, so equivalent requests
+        share a key.
+
+        Args:
+            method: HTTP method
+            url: Request URL (may include a query string)
+            params: Mapping or sequence of (name, value) pairs
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        parts = urlsplit(url)
+        base_url = urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", "", "")
+        )
+        pairs = parse_qsl(parts.query, keep_blank_values=True)
+        pairs.extend(HttpResponseCache._param_pairs(params))
+        normalized = json.dumps(
+            [method.upper(), base_url, sorted(pairs)], separators=(",", ":")
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(
+        self, method: str, url: str, params: Any = None
+    ) -> Optional[requests.Response]:
+        """
+        Return the cached response for a request, if present and fresh.
+
+        In replay-only mode entries never expire.
+
+        Returns:
+            A requests.Response with `from_cache = True`, or None on a miss
+        """
+        key = self.cache_key(method, url, params)
+        row = (
+            self._connection()
+            .execute(
+                "SELECT url, status_code, headers, encoding, body, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        cached_url, status_code, headers, encoding, body, stored_at = row
+        now = self._clock()
+        if not self.replay_only and now - stored_at > self.ttl_seconds:
+            return None
+
+        with self._write_lock:
+            connection = self._connection()
+            connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            connection.commit()
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = encoding
+        response.url = cached_url
+        response.reason = "OK"
+        response._content = zlib.decompress(body)
+        response.from_cache = True
+        return response
+
+    def put(
+        self, method: str, url: str, params: Any, response: requests.Response
+    ) -> bool:
+        """
+        Store a response, evicting least recently used entries if needed.
+
+        Returns:
+            True if the response was cached (only 2xx responses are)
+        """
+        if not 200 <= response.status_code < 300:
+            return False
+
+        body = zlib.compress(response.content)
+        if len(body) > self.max_bytes:
+            return False
+
+        key = self.cache_key(method, url, params)
+        now = self._clock()
+        with self._write_lock:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, headers, encoding, body, size, "
+                "stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url or url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.encoding,
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._evict(connection)
+            connection.commit()
+        return True
+
+    def total_bytes(self) -> int:
+        """Return the stored (compressed) body size of all entries."""
+        row = self._connection().execute("SELECT SUM(size) FROM responses").fetchone()
+        return row[0] or 0
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._write_lock:
+            connection = self._connection()
+            connection.execute("DELETE FROM responses")
+            connection.commit()
+
+    def close(self) -> None:
+        """Close the calling thread's database connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self) -> int:
+        row = self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return row[0]
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+
+        victims = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path), timeout=30.0)
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _param_pairs(params: Any) -> List[Tuple[str, str]]:
+        """Flatten request params into (name, value) string pairs."""
+        if not params:
+            return []
+        items = params.items() if isinstance(params, dict) else params
+        pairs = []
+        for name, value in items:
+            values = value if isinstance(value, (list, tuple)) else [value]
+            pairs.extend((str(name), str(item)) for item in values if item is not None)
+        return pairs
+
+
+class CachingSession(requests.Session):
+    """
+    requests.Session that answers GET requests from an HttpResponseCache.
+
+    Educational Note:
+    Overriding Session.request (which get(), post() etc. all call) caches
+    every GET the repositories make without touching their code paths.
+    Streaming downloads bypass the cache because their bodies are not
+    read into memory.
+    """
+
+    def __init__(self, cache: HttpResponseCache):
+        super().__init__()
+        self.cache = cache
+
+    def request(
+        self, method: str, url: str, params: Any = None, **kwargs: Any
+    ) -> requests.Response:
+        """Serve cacheable requests from disk, storing fresh responses."""
+        cacheable = (
+            method.upper() == "GET"
+            and not kwargs.get("stream")
+            and kwargs.get("data") is None
+            and kwargs.get("json") is None
+        )
+        if not cacheable:
+            return super().request(method, url, params=params, **kwargs)
+
+        cached = self.cache.get(method, url, params)
+        if cached is not None:
+            return cached
+        if self.cache.replay_only:
+            raise CacheMissError(f"No cached response for {url} (replay-only mode)")
+
+        response = super().request(method, url, params=params, **kwargs)
+        self.cache.put(method, url, params, response)
+        return response
+
+
+def create_session(
+    response_cache: Optional[HttpResponseCache], headers: Dict[str, str]
+) -> requests.Session:
+    """
+    Create a repository's HTTP session, cached when a cache is given.
+
+    Args:
+        response_cache: Shared cache, or None for a plain session
+        headers: Default headers such as the User-Agent
+
+    Returns:
+        CachingSession or requests.Session with the headers applied
+    """
+    session = (
+        CachingSession(response_cache)
+        if response_cache is not None
+        else requests.Session()
+    )
+    session.headers.update(headers)
+    return session
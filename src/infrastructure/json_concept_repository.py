@@ -35,6 +35,7 @@ from src.application.use_cases.extract_paper_concepts_use_case import (
     ConceptRepositoryPort,
 )
 from src.domain.entities.paper_concepts import PaperConcepts
+from src.infrastructure.document_frequency_store import DocumentFrequencyStore
 
 
 class JSONConceptRepository(ConceptRepositoryPort):
@@ -47,12 +48,20 @@ class JSONConceptRepository(ConceptRepositoryPort):
     all necessary persistence functionality for the domain.
     """
 
-    def __init__(self, storage_directory: Path):
+    def __init__(
+        self,
+        storage_directory: Path,
+        document_frequencies: Optional[DocumentFrequencyStore] = None,
+    ):
         """
         Initialize repository with storage directory.
 
         Args:
             storage_directory: Directory to store concept files
+            document_frequencies: Per-domain document frequency table
+                stored with the concepts; extractors scoring against it
+                record each paper's candidate terms (default: a store in
+                the statistics directory)
         """
         self.storage_directory = Path(storage_directory)
         self.storage_directory.mkdir(parents=True, exist_ok=True)
@@ -63,6 +72,10 @@ class JSONConceptRepository(ConceptRepositoryPort):
         self.concepts_dir.mkdir(exist_ok=True)
         self.stats_dir.mkdir(exist_ok=True)
 
+        self.document_frequencies = document_frequencies or DocumentFrequencyStore(
+            self.stats_dir
+        )
+
     def save_paper_concepts(self, paper_concepts: PaperConcepts) -> None:
         """
         Save paper concepts to JSON file.
@@ -0,0 +1,217 @@
+"""
+Paper Fingerprint Index - Persistent cross-run duplicate detection.
+
+The batch processor deduplicates papers with an in-memory set that starts
+empty in every process, and each strategy only knows about the papers in its
+own metadata.json. A paper matched by strategies in several configurations is
+therefore downloaded and stored once per configuration, night after night.
+This index remembers every stored paper on disk, keyed by its
+PaperFingerprint, so any strategy in any later run can ask "do we already
+have this paper?" in constant time.
+
+Educational Notes:
+- Demonstrates using SQLite as an embedded key-value store: a PRIMARY KEY
+  lookup touches a handful of B-tree pages regardless of corpus size, and
+  memory use stays flat, unlike a Python set that must hold every key
+- Shows write-ahead-log (WAL) mode, which lets many readers proceed while a
+  single writer commits, including readers in other processes
+- Illustrates batching writes: one transaction per strategy instead of one
+  fsync per paper
+
+Design Decisions:
+- The key is PaperFingerprint.primary_identifier (doi:/arxiv:/pmid:), the
+  same identity the fingerprint's __eq__ uses for reliable identifiers;
+  composite fingerprints also include the publication year
+- First writer wins: the index records where a paper was first stored so the
+  location stays stable across runs
+- One connection per thread, because sqlite3 connections must not be shared
+  across threads by default
+
+Use Cases:
+- Skipping downloads of papers already stored under another configuration
+- Finding which configuration/strategy holds a given paper
+"""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+from src.domain.value_objects.paper_fingerprint import PaperFingerprint
+
+
+class PaperFingerprintIndex:
+    """
+    On-disk set of PaperFingerprints with their storage location.
+
+    Educational Note:
+    The public interface deliberately mirrors a set: `paper in index`,
+    `len(index)` and a bulk add. Callers never see SQL, so the storage engine
+    could be swapped without touching the batch processor.
+    """
+
+    FILENAME = ".paper_index.sqlite"
+
+    _RELIABLE_PREFIXES = ("doi:", "arxiv:", "pmid:")
+
+    def __init__(self, index_path: Path, timeout: float = 30.0):
+        """
+        Open (or create) the index database.
+
+        Args:
+            index_path: Location of the SQLite database file
+            timeout: Seconds to wait for a competing writer before failing
+        """
+        self.index_path = Path(index_path)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._initialized = False
+
+    @staticmethod
+    def fingerprint_key(fingerprint: PaperFingerprint) -> str:
+        """
+        Derive the lookup key for a fingerprint.
+
+        Educational Note:
+        Reliable identifiers are authoritative on their own. Composite
+        identifiers hash the title and first author, and PaperFingerprint
+        equality additionally requires the same publication year, so the
+        year becomes part of the key.
+        """
+        key = fingerprint.primary_identifier
+        if key.startswith(PaperFingerprintIndex._RELIABLE_PREFIXES):
+            return key
+        return f"{key}|{fingerprint.publication_year or ''}"
+
+    def contains(self, paper_or_fingerprint) -> bool:
+        """
+        Check whether a paper has been recorded.
+
+        Args:
+            paper_or_fingerprint: ResearchPaper or PaperFingerprint
+
+        Returns:
+            True if an equal fingerprint is already in the index
+        """
+        return self.locate(paper_or_fingerprint) is not None
+
+    def __contains__(self, paper_or_fingerprint) -> bool:
+        """Support `paper in index`."""
+        return self.contains(paper_or_fingerprint)
+
+    def locate(self, paper_or_fingerprint) -> Optional[Tuple[str, str]]:
+        """
+        Find where a paper was first stored.
+
+        Args:
+            paper_or_fingerprint: ResearchPaper or PaperFingerprint
+
+        Returns:
+            (config_name, strategy_name) tuple, or None if unknown
+        """
+        key = self.fingerprint_key(self._as_fingerprint(paper_or_fingerprint))
+        row = (
+            self._connection()
+            .execute(
+                "SELECT config_name, strategy_name FROM fingerprints WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        return (row[0], row[1]) if row else None
+
+    def add_many(self, papers: Iterable, config_name: str, strategy_name: str) -> int:
+        """
+        Record a strategy's stored papers in a single transaction.
+
+        Args:
+            papers: ResearchPapers (or PaperFingerprints) that were stored
+            config_name: Configuration the papers were stored under
+            strategy_name: Strategy the papers were stored under
+
+        Returns:
+            Number of papers that were not already in the index
+        """
+        added_at = datetime.now(timezone.utc).isoformat()
+        rows = []
+        for item in papers:
+            fingerprint = self._as_fingerprint(item)
+            rows.append(
+                (
+                    self.fingerprint_key(fingerprint),
+                    fingerprint.title_hash,
+                    fingerprint.author_hash,
+                    fingerprint.publication_year,
+                    config_name,
+                    strategy_name,
+                    added_at,
+                )
+            )
+        if not rows:
+            return 0
+
+        connection = self._connection()
+        with self._write_lock, connection:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO fingerprints (key, title_hash, author_hash, "
+                "publication_year, config_name, strategy_name, added_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            return connection.total_changes - before
+
+    def __len__(self) -> int:
+        """Return the number of papers recorded."""
+        row = self._connection().execute("SELECT COUNT(*) FROM fingerprints").fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _as_fingerprint(
+        self, paper_or_fingerprint: Union[PaperFingerprint, object]
+    ) -> PaperFingerprint:
+        """
+        Accept papers and fingerprints interchangeably.
+
+        Duck typing rather than isinstance, because the value object may be
+        imported both as src.domain... and domain... (batch_processor adds
+        src/ to sys.path), which Python treats as two distinct classes.
+        """
+        if hasattr(paper_or_fingerprint, "primary_identifier"):
+            return paper_or_fingerprint
+        existing = getattr(paper_or_fingerprint, "paper_fingerprint", None)
+        if existing is not None:
+            return existing
+        return PaperFingerprint.from_paper(paper_or_fingerprint)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, creating the schema on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.index_path), timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            if not self._initialized:
+                with self._write_lock, connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS fingerprints ("
+                        "key TEXT PRIMARY KEY, "
+                        "title_hash TEXT, "
+                        "author_hash TEXT, "
+                        "publication_year INTEGER, "
+                        "config_name TEXT NOT NULL, "
+                        "strategy_name TEXT NOT NULL, "
+                        "added_at TEXT NOT NULL)"
+                    )
+                self._initialized = True
+        return connection
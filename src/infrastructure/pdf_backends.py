@@ -0,0 +1,276 @@
+"""
+PDF Backends - Interchangeable libraries for reading page text from PDFs.
+
+PyPDF2 is the one PDF library this project requires, and its
+page.extract_text() is among the slowest pure-Python text extractors. C-based
+libraries such as PyMuPDF or pdfium read the same pages many times faster,
+but they are optional installs and every library has its own files it
+chokes on. This module wraps each library behind one small interface, probes
+which ones are installed, and orders them fastest first, so
+PyPDF2TextExtractor can take the speedup where it is available and fall back
+to PyPDF2 for the files a faster library cannot read.
+
+Educational Notes:
+- Demonstrates the Strategy pattern for an infrastructure concern: the
+  extractor's cleanup, budgeting and caching do not care which library
+  produced the raw page text
+- Shows optional-dependency probing with importlib.util.find_spec: a
+  backend is offered only if its library can be imported, and libraries
+  are imported lazily, when a PDF is actually opened
+- Illustrates graceful degradation: the last backend in a chain is always
+  PyPDF2, a hard dependency, so adding fast backends can never make a file
+  unreadable that was readable before
+
+Design Decisions:
+- Backends expose an opened document (page count, text of one page,
+  close) rather than a "whole text" call, so the extractor can keep
+  streaming pages and stop at its length budget with any library
+- Only raw page text is produced here; cleaning stays with TextNormalizer,
+  which keeps the output of all backends comparable
+- Backends are plain picklable objects, so they travel to extraction
+  worker processes with the rest of an extractor's settings
+- MuPDF and pdfium are not thread-safe, and `--workers` runs strategies
+  on threads of one process, so every call into those libraries holds a
+  process-wide lock per library. Threads then take turns inside the C
+  library (still faster than PyPDF2); worker processes each have their
+  own lock and run in parallel
+
+Use Cases:
+- Faster concept extraction on hosts with PyMuPDF or pypdfium2 installed
+- Comparing backends on a corpus (scripts/benchmark_pdf_backends.py)
+"""
+
+import importlib.util
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from PyPDF2 import PdfReader
+
+T = TypeVar("T")
+
+# Calls into MuPDF and pdfium from different threads must not overlap
+_MUPDF_LOCK = threading.RLock()
+_PDFIUM_LOCK = threading.RLock()
+
+
+def _serialized(lock: threading.RLock, call: Callable[..., T]) -> Callable[..., T]:
+    """Wrap a library call so it runs while holding the library's lock."""
+
+    def locked(*args):
+        with lock:
+            return call(*args)
+
+    return locked
+
+
+class PdfDocument:
+    """
+    An open PDF as seen by the text extractor.
+
+    Educational Note:
+    A tiny adapter built from three callables, so each backend can expose
+    its library's document object without a class hierarchy of its own.
+    Use it as a context manager to make sure the file is closed.
+    """
+
+    def __init__(
+        self,
+        page_count: int,
+        page_text: Callable[[int], Optional[str]],
+        close: Callable[[], None],
+    ):
+        self.page_count = page_count
+        self._page_text = page_text
+        self._close = close
+
+    def page_text(self, index: int) -> Optional[str]:
+        """Return the raw text of the page at a zero-based index."""
+        return self._page_text(index)
+
+    def close(self) -> None:
+        """Release the library's resources and the file."""
+        self._close()
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PdfBackend(ABC):
+    """
+    One PDF library able to open a PDF and read the text of its pages.
+
+    Subclasses name the module they need in `requires`; is_available()
+    probes for it without importing it.
+    """
+
+    name = ""
+    requires = ""
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """True if the backend's library is installed."""
+        try:
+            return importlib.util.find_spec(cls.requires) is not None
+        except (ImportError, ValueError):
+            return False
+
+    @abstractmethod
+    def open(self, pdf_path: Path) -> PdfDocument:
+        """
+        Open a PDF for reading.
+
+        Raises:
+            ValueError: If the PDF is password protected
+            Exception: Library-specific errors for unreadable files
+        """
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class PyMuPDFBackend(PdfBackend):
+    """PyMuPDF (MuPDF bindings): the fastest backend, and very tolerant."""
+
+    name = "pymupdf"
+    requires = "fitz"
+
+    def open(self, pdf_path: Path) -> PdfDocument:
+        import fitz
+
+        with _MUPDF_LOCK:
+            document = fitz.open(str(pdf_path))
+            if document.needs_pass and not document.authenticate(""):
+                document.close()
+                raise ValueError(f"PDF is password protected: {pdf_path}")
+            page_count = document.page_count
+        return PdfDocument(
+            page_count,
+            _serialized(
+                _MUPDF_LOCK, lambda index: document.load_page(index).get_text()
+            ),
+            _serialized(_MUPDF_LOCK, document.close),
+        )
+
+
+class PdfiumBackend(PdfBackend):
+    """pypdfium2 (Chrome's PDF engine): fast, with good reading order."""
+
+    name = "pypdfium2"
+    requires = "pypdfium2"
+
+    def open(self, pdf_path: Path) -> PdfDocument:
+        import pypdfium2
+
+        try:
+            with _PDFIUM_LOCK:
+                document = pypdfium2.PdfDocument(str(pdf_path), password="")
+                page_count = len(document)
+        except pypdfium2.PdfiumError as e:
+            if "password" in str(e).lower():
+                raise ValueError(f"PDF is password protected: {pdf_path}")
+            raise
+
+        def page_text(index: int) -> str:
+            page = document[index]
+            text_page = page.get_textpage()
+            try:
+                return text_page.get_text_range()
+            finally:
+                text_page.close()
+                page.close()
+
+        return PdfDocument(
+            page_count,
+            _serialized(_PDFIUM_LOCK, page_text),
+            _serialized(_PDFIUM_LOCK, document.close),
+        )
+
+
+class _PdfReaderBackend(PdfBackend):
+    """Shared logic of the PyPDF2-style libraries (PyPDF2 and pypdf)."""
+
+    def _open_with(self, reader_class: type, pdf_path: Path) -> PdfDocument:
+        file = open(pdf_path, "rb")
+        try:
+            reader = reader_class(file)
+            if reader.is_encrypted:
+                # Try to decrypt with empty password
+                if not reader.decrypt(""):
+                    raise ValueError(f"PDF is password protected: {pdf_path}")
+            return PdfDocument(
+                len(reader.pages),
+                lambda index: reader.pages[index].extract_text(),
+                file.close,
+            )
+        except BaseException:
+            file.close()
+            raise
+
+
+class PypdfBackend(_PdfReaderBackend):
+    """pypdf, PyPDF2's maintained successor, with faster text extraction."""
+
+    name = "pypdf"
+    requires = "pypdf"
+
+    def open(self, pdf_path: Path) -> PdfDocument:
+        import pypdf
+
+        return self._open_with(pypdf.PdfReader, pdf_path)
+
+
+class PyPDF2Backend(_PdfReaderBackend):
+    """PyPDF2, the required dependency and the fallback of last resort."""
+
+    name = "pypdf2"
+    requires = "PyPDF2"
+
+    def open(self, pdf_path: Path) -> PdfDocument:
+        return self._open_with(PdfReader, pdf_path)
+
+
+# Every backend, fastest first
+BACKENDS = (PyMuPDFBackend, PdfiumBackend, PypdfBackend, PyPDF2Backend)
+
+
+def available_backends() -> List[PdfBackend]:
+    """Return an instance of every installed backend, fastest first."""
+    return [backend() for backend in BACKENDS if backend.is_available()]
+
+
+def select_backends(names: Optional[Sequence[str]] = None) -> List[PdfBackend]:
+    """
+    Build a backend chain for PyPDF2TextExtractor.
+
+    Args:
+        names: Backend names in the order to try them (default: every
+            installed backend, fastest first)
+
+    Returns:
+        Backend instances ending with PyPDF2, which is appended if missing
+
+    Raises:
+        ValueError: If a name is unknown or its library is not installed
+    """
+    if names is None:
+        chain = available_backends()
+    else:
+        by_name = {backend.name: backend for backend in BACKENDS}
+        unknown = [name for name in names if name not in by_name]
+        if unknown:
+            raise ValueError(
+                f"Unknown PDF backends: {unknown} (choose from {sorted(by_name)})"
+            )
+        missing = [name for name in names if not by_name[name].is_available()]
+        if missing:
+            raise ValueError(f"PDF backends not installed: {missing}")
+        chain = [by_name[name]() for name in names]
+    if not chain or not isinstance(chain[-1], PyPDF2Backend):
+        chain = [backend for backend in chain if not isinstance(backend, PyPDF2Backend)]
+        chain.append(PyPDF2Backend())
+    return chain
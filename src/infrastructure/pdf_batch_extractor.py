@@ -0,0 +1,367 @@
+"""
+PDF Batch Extractor - Process-pool text extraction with per-file timeouts.
+
+PyPDF2TextExtractor reads one PDF at a time in the calling process. PDF
+parsing is CPU-bound pure Python, so a single process uses one core no
+matter how many the host has, and a pathological PDF (a cyclic object
+graph, a page with millions of operators) can keep extract_text() busy
+forever, stalling the whole run. This module extracts many PDFs in a pool
+of worker processes, gives every file a wall-clock budget, and streams the
+results back as they finish.
+
+Educational Notes:
+- Demonstrates why a stuck computation needs a process, not a thread: a
+  thread cannot be stopped from outside, but a process can be terminated
+  and replaced while the rest of the pool carries on
+- Shows worker recycling: long-lived PyPDF2 workers accumulate memory
+  (caches, fragmented heaps), so each worker exits after a fixed number of
+  files and a fresh one takes its place, as multiprocessing.Pool's
+  maxtasksperchild does
+- Illustrates a streaming results iterator: inputs are consumed lazily, at
+  most one file per worker is in flight, and callers see each result as
+  soon as it exists
+
+Design Decisions:
+- The pool is managed by hand rather than with ProcessPoolExecutor, which
+  can neither enforce a per-task timeout nor kill the one worker that
+  exceeded it; each worker has its own pipe, so the parent always knows
+  which file a worker is on and when it started
+- One task per worker at a time: a timeout then measures the file itself,
+  never time spent queued behind other files; a new worker's clock is
+  restarted once it reports ready, so process start-up is not charged to
+  its first file (but a worker that never starts still times out)
+- Workers build their extractor once, from a picklable factory, and reuse
+  it for every file they process
+- The "forkserver" start method is preferred: forking the multi-threaded
+  batch processor could copy locks held by other threads into the child
+- A worker that dies (crash, out-of-memory kill) fails only its current
+  file; it is replaced like a recycled worker
+- Results are yielded in completion order; each carries its input path
+
+Use Cases:
+- Extracting the text of a whole domain's PDFs on a many-core host
+- Isolating hostile or broken PDFs from the rest of a batch run
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Sent by a worker once its extractor is built, before its first result
+_READY = "ready"
+
+
+@dataclass
+class PdfExtractionResult:
+    """
+    Outcome of extracting one PDF.
+
+    Attributes:
+        pdf_path: The PDF that was processed
+        text: Extracted text, or None if extraction failed
+        error: Error message when extraction failed
+        timed_out: True if the worker was stopped at the per-file timeout
+        seconds: Wall-clock time the file spent in its worker
+    """
+
+    pdf_path: Path
+    text: Optional[str] = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """True if text was extracted."""
+        return self.text is not None
+
+
+def _default_extractor(**options: Any) -> Any:
+    """Build the standard PyPDF2 extractor inside a worker process."""
+    from src.infrastructure.pdf_extractor import PyPDF2TextExtractor
+
+    return PyPDF2TextExtractor(**options)
+
+
+def _extraction_worker(
+    connection: Connection,
+    extractor_factory: Callable[..., Any],
+    extractor_options: Dict[str, Any],
+) -> None:
+    """
+    Worker process loop: extract each PDF sent over the pipe.
+
+    Announces itself with _READY, then receives (index, path) tasks until it
+    gets None and answers each with (index, text, error). Exceptions are
+    reported, never raised, so one bad PDF does not end the worker.
+    """
+    extractor = extractor_factory(**extractor_options)
+    try:
+        connection.send(_READY)
+        while True:
+            task = connection.recv()
+            if task is None:
+                break
+            index, path = task
+            try:
+                text = extractor.extract_text_from_pdf(Path(path))
+                connection.send((index, text, None))
+            except Exception as e:
+                connection.send((index, None, f"{type(e).__name__}: {e}"))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        connection.close()
+
+
+class _Worker:
+    """Parent-side handle of one worker process and its current task."""
+
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        self.completed = 0
+        self.task: Optional[int] = None
+        self.started = 0.0
+
+    def stop(self, graceful: bool = True) -> None:
+        """End the process, asking politely first unless it is stuck."""
+        if graceful and self.process.is_alive():
+            try:
+                self.connection.send(None)
+                self.process.join(1.0)
+            except (BrokenPipeError, OSError):
+                pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class BatchPdfExtractor:
+    """
+    Extract the text of many PDFs in parallel worker processes.
+
+    Educational Note:
+    The parent never parses a PDF. It only hands out file paths, waits on
+    the workers' pipes with a timeout equal to the nearest deadline, and
+    replaces any worker that ran out of time, died, or reached its quota.
+
+    Example:
+        extractor = BatchPdfExtractor(workers=8, timeout=120)
+        for result in extractor.iter_extract(pdfs_dir.glob("*.pdf")):
+            if result.succeeded:
+                index(result.pdf_path, result.text)
+    """
+
+    DEFAULT_TIMEOUT_SECONDS = 120.0
+    DEFAULT_MAX_FILES_PER_WORKER = 50
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_files_per_worker: int = DEFAULT_MAX_FILES_PER_WORKER,
+        extractor_factory: Optional[Callable[..., Any]] = None,
+        extractor_options: Optional[Dict[str, Any]] = None,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        """
+        Configure the pool.
+
+        Args:
+            workers: Worker processes (default: CPU count)
+            timeout: Wall-clock seconds one PDF may take before its worker
+                is terminated
+            max_files_per_worker: Files a worker processes before it is
+                replaced, bounding memory growth
+            extractor_factory: Picklable callable returning an object with
+                extract_text_from_pdf(path); called once per worker with
+                extractor_options (default: PyPDF2TextExtractor)
+            extractor_options: Keyword arguments for the factory
+            mp_context: multiprocessing context (default: forkserver where
+                available, otherwise spawn)
+
+        Raises:
+            ValueError: If timeout or max_files_per_worker is not positive
+        """
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if max_files_per_worker < 1:
+            raise ValueError("max_files_per_worker must be at least 1")
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.max_files_per_worker = max_files_per_worker
+        self.extractor_factory = extractor_factory or _default_extractor
+        self.extractor_options = dict(extractor_options or {})
+        if mp_context is None:
+            method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            mp_context = multiprocessing.get_context(method)
+        self.mp_context = mp_context
+        self.workers_started = 0
+
+    def iter_extract(
+        self, pdf_paths: Iterable[PathLike]
+    ) -> Iterator[PdfExtractionResult]:
+        """
+        Extract PDFs, yielding each result as soon as it is available.
+
+        Args:
+            pdf_paths: PDFs to extract; consumed lazily
+
+        Yields:
+            One PdfExtractionResult per input path, in completion order
+
+        Educational Note:
+        Closing the iterator early (break, garbage collection) shuts the
+        pool down; no worker outlives the loop that used it.
+        """
+        pending = iter(enumerate(Path(path) for path in pdf_paths))
+        paths: Dict[int, Path] = {}
+        idle: List[_Worker] = []
+        busy: Dict[Connection, _Worker] = {}
+        exhausted = False
+
+        try:
+            while True:
+                # Hand out work while there is both work and capacity
+                while not exhausted and len(busy) < self.workers:
+                    task = next(pending, None)
+                    if task is None:
+                        exhausted = True
+                        break
+                    index, path = task
+                    paths[index] = path
+                    worker = self._assign(idle.pop() if idle else None, index, path)
+                    busy[worker.connection] = worker
+
+                if not busy:
+                    return
+
+                now = time.monotonic()
+                next_deadline = min(w.started for w in busy.values()) + self.timeout
+                ready = wait(list(busy), timeout=max(0.0, next_deadline - now))
+
+                for connection in ready:
+                    worker = busy[connection]
+                    index = worker.task
+                    elapsed = time.monotonic() - worker.started
+                    try:
+                        message = connection.recv()
+                    except (EOFError, OSError):
+                        message = None
+                    if message == _READY:
+                        worker.started = time.monotonic()
+                        continue
+                    del busy[connection]
+                    if message is None:
+                        # The worker died mid-file (crash or OOM kill)
+                        worker.process.join(1.0)
+                        code = worker.process.exitcode
+                        worker.stop(graceful=False)
+                        logger.warning(f"Worker died extracting {paths[index]}")
+                        yield PdfExtractionResult(
+                            paths.pop(index),
+                            error=f"Worker process died (exit code {code})",
+                            seconds=elapsed,
+                        )
+                        continue
+
+                    _, text, error = message
+                    worker.task = None
+                    worker.completed += 1
+                    if worker.completed >= self.max_files_per_worker:
+                        worker.stop()
+                    else:
+                        idle.append(worker)
+                    yield PdfExtractionResult(
+                        paths.pop(index), text=text, error=error, seconds=elapsed
+                    )
+
+                now = time.monotonic()
+                for connection, worker in list(busy.items()):
+                    if now - worker.started >= self.timeout:
+                        del busy[connection]
+                        index = worker.task
+                        worker.stop(graceful=False)
+                        logger.warning(
+                            f"Extraction of {paths[index]} exceeded "
+                            f"{self.timeout:g}s; worker terminated"
+                        )
+                        yield PdfExtractionResult(
+                            paths.pop(index),
+                            error=f"Timed out after {self.timeout:g}s",
+                            timed_out=True,
+                            seconds=now - worker.started,
+                        )
+        finally:
+            for worker in list(busy.values()):
+                worker.stop(graceful=False)
+            for worker in idle:
+                worker.stop()
+
+    def extract_all(
+        self, pdf_paths: Iterable[PathLike]
+    ) -> Dict[Path, PdfExtractionResult]:
+        """
+        Extract PDFs and return every result, keyed by path in input order.
+        """
+        paths = [Path(path) for path in pdf_paths]
+        results = {result.pdf_path: result for result in self.iter_extract(paths)}
+        return {path: results[path] for path in paths}
+
+    def _start_worker(self) -> _Worker:
+        """Start a worker process connected by a fresh pipe."""
+        parent_end, child_end = self.mp_context.Pipe()
+        process = self.mp_context.Process(
+            target=_extraction_worker,
+            args=(child_end, self.extractor_factory, self.extractor_options),
+            daemon=True,
+        )
+        process.start()
+        child_end.close()
+        self.workers_started += 1
+        return _Worker(process, parent_end)
+
+    def _assign(self, worker: Optional[_Worker], index: int, path: Path) -> _Worker:
+        """
+        Send one file to a worker and start its clock.
+
+        An idle worker whose pipe turns out to be broken is replaced; with
+        no worker given, a new one is started.
+
+        Returns:
+            The worker now processing the file
+        """
+        if worker is not None:
+            try:
+                worker.connection.send((index, str(path)))
+            except (BrokenPipeError, OSError):
+                worker.stop(graceful=False)
+                worker = None
+            else:
+                worker.task = index
+                worker.started = time.monotonic()
+                return worker
+
+        worker = self._start_worker()
+        worker.task = index
+        worker.started = time.monotonic()
+        worker.connection.send((index, str(path)))
+        return worker
@@ -0,0 +1,274 @@
+"""
+PDF Blob Store - Content-addressed storage for downloaded PDFs.
+
+Every `<config>/<strategy>/pdfs/` directory holds its own copy of each PDF
+its strategy matched, so a paper found by ten strategies is downloaded ten
+times and stored ten times. This store keeps exactly one copy of each PDF,
+named by the SHA-256 of its bytes, and strategy directories get hard links
+(or symlinks) to it. A second index maps each download URL to the content it
+produced, so the store is consulted before anything is downloaded.
+
+Educational Notes:
+- Demonstrates content addressing: the name of a blob is the hash of its
+  contents, so identical files collapse into one and a name can never point
+  at the wrong bytes
+- Shows git-style fan-out directories (objects/ab/abcdef...) that keep any
+  single directory small
+- Hard links make deduplication invisible to readers: a linked file is an
+  ordinary file to PyPDF2, the file browser and the extraction manifest
+
+Design Decisions:
+- Objects are written once and never modified; adding the same content
+  twice is a no-op that discards the second copy
+- Links are created under a temporary name and renamed over the
+  destination, so a strategy's PDF path is always either absent or complete
+- Hard links need the store and the strategy directories on the same file
+  system; otherwise a symlink is used, and a copy as the last resort
+- Digests are computed with compute_file_sha256, the same hash the
+  concept extraction manifest records, so both agree on a PDF's identity
+- The URL index lives in SQLite (WAL mode, one connection per thread), like
+  PaperFingerprintIndex
+- The index also keeps the HTTP validators (ETag, Last-Modified,
+  Content-Length) each URL was served with, so a later refresh can ask the
+  server whether the PDF changed instead of downloading it again
+
+Use Cases:
+- Skipping downloads of PDFs another strategy already fetched
+- Keying downstream caches (extracted text, concepts) on the content hash
+- Cheap periodic refreshes of a whole corpus with conditional requests
+"""
+
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from src.infrastructure.concept_extraction_manifest import compute_file_sha256
+
+PathLike = Union[str, Path]
+
+# HTTP validators recorded per URL, as they are named in the index
+VALIDATOR_FIELDS = ("etag", "last_modified", "content_length")
+
+
+class PdfBlobStore:
+    """
+    Store of PDFs addressed by their SHA-256, with a URL-to-content index.
+
+    Educational Note:
+    The store never tells callers where an object lives on disk unless they
+    ask for it: put() takes a file, link_into() places it. Callers work with
+    digests, which makes them natural cache keys for later stages.
+    """
+
+    DIRNAME = ".pdf_store"
+    INDEX_FILENAME = "index.sqlite"
+
+    def __init__(self, root: PathLike, timeout: float = 30.0):
+        """
+        Open (or create) a store.
+
+        Args:
+            root: Directory holding the objects and the index
+            timeout: Seconds to wait for a competing index writer
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.timeout = timeout
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._initialized = False
+
+    def path_for(self, digest: str) -> Path:
+        """Return the path of the object with a digest."""
+        return self.objects_dir / digest[:2] / f"{digest}.pdf"
+
+    def __contains__(self, digest: str) -> bool:
+        """Support `digest in store`."""
+        return self.path_for(digest).exists()
+
+    def put(
+        self,
+        path: PathLike,
+        url: Optional[str] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Move a downloaded file into the store.
+
+        Args:
+            path: File to add; it is moved (not copied) into the store
+            url: URL the file was downloaded from, recorded for lookup()
+            validators: HTTP validators the URL was served with (keys from
+                VALIDATOR_FIELDS), recorded for validators()
+
+        Returns:
+            SHA-256 hex digest of the file
+        """
+        path = Path(path)
+        digest = compute_file_sha256(path)
+        target = self.path_for(digest)
+        if target.exists():
+            path.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(path, target)
+            except OSError:
+                # Different file system: copy, then drop the original
+                shutil.copyfile(path, target)
+                path.unlink()
+            # Every link shares these bytes, so nobody may write through one
+            os.chmod(target, 0o444)
+        if url:
+            self._record(url, digest, target.stat().st_size, validators or {})
+        return digest
+
+    def lookup(self, url: str) -> Optional[str]:
+        """
+        Return the digest of the content previously downloaded from a URL.
+
+        Returns:
+            Digest, or None if the URL is unknown or its object is missing
+        """
+        row = (
+            self._connection()
+            .execute("SELECT digest FROM urls WHERE url = ?", (url,))
+            .fetchone()
+        )
+        if row is None or row[0] not in self:
+            return None
+        return row[0]
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        Return the HTTP validators recorded for a URL.
+
+        Returns:
+            Dict with the known keys of VALIDATOR_FIELDS; empty if the URL is
+            unknown or was served without validators
+        """
+        row = (
+            self._connection()
+            .execute(
+                f"SELECT {', '.join(VALIDATOR_FIELDS)} FROM urls WHERE url = ?",
+                (url,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return {}
+        return {field: value for field, value in zip(VALIDATOR_FIELDS, row) if value}
+
+    def update_validators(self, url: str, validators: Dict[str, str]) -> None:
+        """
+        Replace the validators of a known URL whose content did not change.
+
+        Used after a 304 Not Modified answer, which may carry fresher
+        validators than the ones the request was made with.
+        """
+        assignments = ", ".join(f"{field} = ?" for field in VALIDATOR_FIELDS)
+        connection = self._connection()
+        with self._write_lock, connection:
+            connection.execute(
+                f"UPDATE urls SET {assignments} WHERE url = ?",
+                (*(validators.get(field) for field in VALIDATOR_FIELDS), url),
+            )
+
+    def link_into(self, digest: str, destination: PathLike) -> Path:
+        """
+        Make `destination` refer to a stored object.
+
+        Tries a hard link, then a symlink, then a copy.
+
+        Returns:
+            The destination path
+        """
+        source = self.path_for(digest)
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temporary = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            os.link(source, temporary)
+        except OSError:
+            try:
+                os.symlink(os.path.abspath(source), temporary)
+            except OSError:
+                shutil.copyfile(source, temporary)
+        os.replace(temporary, destination)
+        return destination
+
+    def digest_of(self, path: PathLike) -> str:
+        """
+        Return the content digest of a file, linked from the store or not.
+
+        Symlinks into the store are resolved by name; anything else is
+        hashed.
+        """
+        resolved = Path(path).resolve()
+        if resolved.parent.parent == self.objects_dir.resolve():
+            return resolved.stem
+        return compute_file_sha256(resolved)
+
+    def close(self) -> None:
+        """Close the calling thread's index connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _record(
+        self, url: str, digest: str, size: int, validators: Dict[str, str]
+    ) -> None:
+        """Remember which content a URL produced, and its validators."""
+        connection = self._connection()
+        with self._write_lock, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO urls (url, digest, size, added_at, "
+                f"{', '.join(VALIDATOR_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    digest,
+                    size,
+                    datetime.now(timezone.utc).isoformat(),
+                    *(validators.get(field) for field in VALIDATOR_FIELDS),
+                ),
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, creating the schema on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.root / self.INDEX_FILENAME), timeout=self.timeout
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            if not self._initialized:
+                with self._write_lock, connection:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS urls ("
+                        "url TEXT PRIMARY KEY, "
+                        "digest TEXT NOT NULL, "
+                        "size INTEGER NOT NULL, "
+                        "added_at TEXT NOT NULL)"
+                    )
+                    # Indexes created before validators were recorded lack
+                    # their columns; rows without validators just refresh
+                    # unconditionally once
+                    columns = {
+                        row[1] for row in connection.execute("PRAGMA table_info(urls)")
+                    }
+                    for field in VALIDATOR_FIELDS:
+                        if field not in columns:
+                            connection.execute(
+                                f"ALTER TABLE urls ADD COLUMN {field} TEXT"
+                            )
+                self._initialized = True
+        return connection
@@ -16,6 +16,20 @@ Design Decisions:
 - Handles text encoding and cleanup
 - Provides detailed error reporting for debugging
 - Optimizes text extraction for research papers
+- Optionally caches extracted text by PDF content hash and settings (see
+  extracted_text_cache), so re-runs skip parsing PDFs they have seen
+- Pages are cleaned one at a time and reading stops at max_text_length;
+  iter_text_chunks() streams them, so memory is bounded by a page rather
+  than by the document
+- Pages are read with the fastest installed PDF library (see
+  pdf_backends), falling back per file to PyPDF2
+- The page reading loop, text cache lookup and length budget are shared
+  with the other PyPDF2TextExtractor copy through PdfPageReader
+- Cleanup is done by the shared TextNormalizer, which also recognizes
+  section headings and drops the reference list by default
+- extract_many() extracts batches in worker processes with per-file
+  timeouts (see pdf_batch_extractor), so one pathological PDF cannot stall
+  a run
 
 Use Cases:
 - Extract text from academic paper PDFs
@@ -24,15 +38,24 @@ Use Cases:
 - Provide error diagnostics for failed extractions
 """
 
-from typing import Optional, Dict, Any
+from typing import Callable, Iterable, Iterator, Optional, Dict, Any, Sequence
 from pathlib import Path
 import logging
-import re
+import sqlite3
+import time
 
 from PyPDF2 import PdfReader
 from PyPDF2.errors import PdfReadError
 
 from src.application.ports.pdf_extractor_port import PDFTextExtractorPort
+from src.infrastructure.extracted_text_cache import ExtractedTextCache
+from src.infrastructure.text_normalizer import TextNormalizer
+from src.infrastructure.pdf_backends import PdfBackend, select_backends
+from src.infrastructure.pdf_page_reader import PdfPageReader
+from src.infrastructure.pdf_batch_extractor import (
+    BatchPdfExtractor,
+    PdfExtractionResult,
+)
 
 
 # Configure logging
@@ -40,7 +63,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class PyPDF2TextExtractor(PDFTextExtractorPort):
+class PyPDF2TextExtractor(PdfPageReader, PDFTextExtractorPort):
     """
     PDF text extraction implementation using PyPDF2.
 
@@ -55,6 +78,10 @@ class PyPDF2TextExtractor(PDFTextExtractorPort):
         min_text_length: int = 100,
         max_text_length: int = 1_000_000,
         clean_text: bool = True,
+        stage_timer: Optional[Callable[[str, float, int, int], None]] = None,
+        text_cache: Optional[ExtractedTextCache] = None,
+        drop_sections: Optional[Iterable[str]] = None,
+        backends: Optional[Sequence[PdfBackend]] = None,
     ):
         """
         Initialize PDF text extractor with configuration.
@@ -63,10 +90,28 @@ class PyPDF2TextExtractor(PDFTextExtractorPort):
             min_text_length: Minimum text length to consider valid
             max_text_length: Maximum text length to process
             clean_text: Whether to clean and normalize extracted text
+            stage_timer: Optional callback receiving (stage, seconds, pages,
+                bytes) for every extraction attempt, for instrumentation
+            text_cache: Optional cache of extracted text; PDFs whose content
+                was already extracted with the same settings are not parsed
+            drop_sections: Section kinds removed while cleaning (default:
+                references; see text_normalizer)
+            backends: PDF libraries to read pages with, in the order to try
+                them for each file (default: every installed backend,
+                fastest first, ending with PyPDF2; see pdf_backends)
+
+        Raises:
+            ValueError: If backends is empty
         """
         self.min_text_length = min_text_length
         self.max_text_length = max_text_length
         self.clean_text = clean_text
+        self.stage_timer = stage_timer
+        self.text_cache = text_cache
+        self.normalizer = TextNormalizer(drop_sections)
+        self.backends = list(backends) if backends is not None else select_backends()
+        if not self.backends:
+            raise ValueError("At least one PDF backend is required")
 
     def extract_text_from_pdf(
         self, pdf_path: Path, extract_metadata: bool = True
@@ -91,81 +136,42 @@ class PyPDF2TextExtractor(PDFTextExtractorPort):
             FileNotFoundError: If PDF file doesn't exist
             ValueError: If PDF cannot be processed or contains insufficient text
         """
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-
-        if not pdf_path.is_file():
-            raise ValueError(f"Path is not a file: {pdf_path}")
+        self._check_pdf_path(pdf_path)
 
-        if pdf_path.suffix.lower() != ".pdf":
-            raise ValueError(f"File is not a PDF: {pdf_path}")
+        cache_key, cached_text = self._lookup_cached_text(pdf_path)
+        if cached_text is not None:
+            return cached_text
 
         logger.info(f"Extracting text from PDF: {pdf_path.name}")
 
+        started = time.perf_counter()
+        progress = {"pages": 0}
         try:
-            # Read PDF file
-            with open(pdf_path, "rb") as file:
-                pdf_reader = PdfReader(file)
+            full_text = " ".join(self._iter_page_texts(pdf_path, progress))
 
-                # Check if PDF is encrypted
-                if pdf_reader.is_encrypted:
-                    # Try to decrypt with empty password
-                    if not pdf_reader.decrypt(""):
-                        raise ValueError(f"PDF is password protected: {pdf_path}")
-
-                # Extract text from all pages
-                text_content = []
-                total_pages = len(pdf_reader.pages)
-
-                if total_pages == 0:
-                    raise ValueError(f"PDF has no pages: {pdf_path}")
-
-                logger.info(f"Processing {total_pages} pages from {pdf_path.name}")
-
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text and page_text.strip():
-                            text_content.append(page_text)
-                        else:
-                            logger.warning(
-                                f"No text extracted from page {page_num + 1}"
-                            )
-
-                    except Exception as e:
-                        logger.warning(f"Error extracting page {page_num + 1}: {e}")
-                        continue
-
-                # Combine all page text
-                full_text = "\n".join(text_content)
-
-                if not full_text.strip():
-                    raise ValueError(f"No text content extracted from PDF: {pdf_path}")
-
-                # Clean and validate text
-                if self.clean_text:
-                    full_text = self._clean_extracted_text(full_text)
-
-                # Validate text length
-                if len(full_text) < self.min_text_length:
-                    raise ValueError(
-                        f"Extracted text too short ({len(full_text)} chars, "
-                        f"minimum {self.min_text_length}): {pdf_path}"
-                    )
-
-                if len(full_text) > self.max_text_length:
-                    logger.warning(
-                        f"Text very long ({len(full_text)} chars), truncating to "
-                        f"{self.max_text_length} chars: {pdf_path.name}"
-                    )
-                    full_text = full_text[: self.max_text_length]
-
-                logger.info(
-                    f"Successfully extracted {len(full_text)} characters "
-                    f"from {pdf_path.name}"
+            if not full_text.strip():
+                raise ValueError(f"No text content extracted from PDF: {pdf_path}")
+
+            # Validate text length
+            if len(full_text) < self.min_text_length:
+                raise ValueError(
+                    f"Extracted text too short ({len(full_text)} chars, "
+                    f"minimum {self.min_text_length}): {pdf_path}"
                 )
 
-                return full_text
+            logger.info(
+                f"Successfully extracted {len(full_text)} characters "
+                f"from {pdf_path.name}"
+            )
+
+            if cache_key is not None:
+                try:
+                    self.text_cache.put(cache_key, full_text)
+                except sqlite3.Error as e:
+                    # The text is good; failing to cache it is not fatal
+                    logger.warning(f"Could not cache text of {pdf_path.name}: {e}")
+
+            return full_text
 
         except PdfReadError as e:
             raise ValueError(f"PDF format error in {pdf_path}: {e}")
@@ -176,70 +182,112 @@ class PyPDF2TextExtractor(PDFTextExtractorPort):
         except Exception as e:
             raise ValueError(f"Unexpected error processing {pdf_path}: {e}")
 
-    def _clean_extracted_text(self, text: str) -> str:
+        finally:
+            self._report_extraction(started, progress["pages"], pdf_path)
+
+    def iter_text_chunks(self, pdf_path: Path) -> Iterator[str]:
         """
-        Clean and normalize extracted PDF text.
+        Stream the cleaned text of a PDF one page at a time.
 
         Educational Note:
-        Text preprocessing is crucial for quality concept extraction.
-        This method handles common PDF extraction artifacts while
-        preserving meaningful research content and formatting.
+        extract_text_from_pdf() has to hold the whole text before it can
+        return it. This generator hands each page to the caller as soon as
+        it is cleaned, and stops reading pages once max_text_length
+        characters have been produced, so a consumer that processes chunks
+        incrementally (see ConceptExtractor.extract_concepts_from_chunks)
+        never holds more than one page of text. Joining the chunks with a
+        single space gives exactly the text extract_text_from_pdf() returns.
 
         Args:
-            text: Raw extracted text
+            pdf_path: Path to the PDF file
 
-        Returns:
-            Cleaned and normalized text
-        """
-        if not text:
-            return ""
+        Yields:
+            Cleaned text of each page that has any, truncated at the length
+            budget; a cached extraction is yielded as one chunk
+
+        Raises:
+            FileNotFoundError: If PDF file doesn't exist
+            ValueError: If PDF cannot be processed
 
-        # Fix common PDF extraction issues
+        Note:
+            Streamed text is not added to the text cache, because it is never
+            held in one piece; the minimum length check is left to the
+            consumer for the same reason.
+        """
+        self._check_pdf_path(pdf_path)
 
-        # 1. Remove excessive whitespace and normalize line breaks
-        text = re.sub(r"\s+", " ", text)
-        text = re.sub(r"\n\s*\n", "\n\n", text)
+        _, cached_text = self._lookup_cached_text(pdf_path)
+        if cached_text is not None:
+            yield cached_text
+            return
 
-        # 2. Fix word breaks caused by line wrapping
-        text = re.sub(r"([a-z])-\s*\n\s*([a-z])", r"\1\2", text)
+        started = time.perf_counter()
+        progress = {"pages": 0}
+        try:
+            yield from self._iter_page_texts(pdf_path, progress)
+        except PdfReadError as e:
+            raise ValueError(f"PDF format error in {pdf_path}: {e}")
+        finally:
+            self._report_extraction(started, progress["pages"], pdf_path)
 
-        # 3. Remove page headers/footers patterns
-        # Remove isolated numbers (likely page numbers)
-        text = re.sub(r"\n\s*\d+\s*\n", "\n", text)
+    def extract_many(
+        self,
+        pdf_paths: Iterable[Path],
+        workers: Optional[int] = None,
+        timeout: float = BatchPdfExtractor.DEFAULT_TIMEOUT_SECONDS,
+        max_files_per_worker: int = BatchPdfExtractor.DEFAULT_MAX_FILES_PER_WORKER,
+    ) -> Iterator[PdfExtractionResult]:
+        """
+        Extract many PDFs in parallel worker processes.
 
-        # Remove copyright notices and similar
-        text = re.sub(r"©.*?\d{4}.*?\n", "", text)
-        text = re.sub(r"Copyright.*?\d{4}.*?\n", "", text, flags=re.IGNORECASE)
+        Educational Note:
+        Each worker builds its own extractor with this one's settings
+        (stage_timer excepted: callbacks cannot cross process boundaries).
+        A PDF that takes longer than `timeout` seconds has its worker
+        terminated and is reported as timed out instead of stalling the run.
 
-        # 4. Fix spacing around punctuation
-        text = re.sub(r"\s+([,.;:!?])", r"\1", text)
-        text = re.sub(r"([,.;:!?])\s+", r"\1 ", text)
+        Args:
+            pdf_paths: PDFs to extract; consumed lazily
+            workers: Worker processes (default: CPU count)
+            timeout: Wall-clock seconds allowed per PDF
+            max_files_per_worker: Files after which a worker is replaced
 
-        # 5. Remove artifacts from tables and figures
-        text = re.sub(
-            r"\b(Figure|Fig|Table|Tab)\s*\d+[a-z]?\b.*?\n",
-            "",
-            text,
-            flags=re.IGNORECASE,
+        Returns:
+            Iterator of PdfExtractionResult, in completion order
+        """
+        batch = BatchPdfExtractor(
+            workers=workers,
+            timeout=timeout,
+            max_files_per_worker=max_files_per_worker,
+            extractor_options={
+                "min_text_length": self.min_text_length,
+                "max_text_length": self.max_text_length,
+                "clean_text": self.clean_text,
+                "text_cache": self.text_cache,
+                "drop_sections": sorted(self.normalizer.drop_sections),
+                "backends": self.backends,
+            },
         )
+        return batch.iter_extract(pdf_paths)
 
-        # 6. Clean up reference patterns
-        text = re.sub(r"\[\s*\d+\s*\]", "", text)  # Remove [1], [2], etc.
-        text = re.sub(r"\(\s*\d+\s*\)", "", text)  # Remove (1), (2), etc.
-
-        # 7. Remove URLs and DOIs from text flow
-        text = re.sub(r"https?://[^\s]+", "", text)
-        text = re.sub(r"doi:\s*[^\s]+", "", text, flags=re.IGNORECASE)
+    def _clean_extracted_text(self, text: str) -> str:
+        """
+        Clean and normalize extracted PDF text.
 
-        # 8. Normalize mathematical expressions
-        text = re.sub(r"\s*=\s*", " = ", text)
-        text = re.sub(r"\s*±\s*", " ± ", text)
+        Educational Note:
+        Text preprocessing is crucial for quality concept extraction.
+        This method handles common PDF extraction artifacts while
+        preserving meaningful research content and formatting. The work
+        is done by the shared TextNormalizer, which also drops the
+        sections listed in drop_sections.
 
-        # 9. Final cleanup
-        text = re.sub(r"\s+", " ", text)  # Normalize remaining whitespace
-        text = text.strip()
+        Args:
+            text: Raw extracted text
 
-        return text
+        Returns:
+            Cleaned and normalized text
+        """
+        return self.normalizer.normalize(text)
 
     def extract_text_with_metadata(self, pdf_path: Path) -> dict:
         """
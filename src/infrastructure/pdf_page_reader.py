@@ -0,0 +1,223 @@
+"""
+PDF Page Reader - Cached, budgeted page-by-page text reading for PDF adapters.
+
+Both PyPDF2TextExtractor modules (src/infrastructure/pdf_extractor.py and
+src/infrastructure/services/pdf_extractor.py) read PDFs the same way: look
+the file up in the extracted-text cache, read its pages with the first PDF
+backend that can, clean each page with the shared TextNormalizer and stop at
+the length budget. This base class holds that reading loop once, so a fix to
+it cannot reach only one of the two adapters.
+
+Educational Notes:
+- Demonstrates sharing behavior through a base class: the adapters keep
+  their own public methods and error messages and inherit the page loop
+- Shows a streaming pipeline of generators: raw pages from the backends
+  feed cleaned pages, which feed whole-document extraction or streaming
+
+Design Decisions:
+- The reader owns no state of its own; it works on the settings attributes
+  every adapter sets up in __init__ (backends, normalizer, clean_text,
+  min_text_length, max_text_length, text_cache, stage_timer)
+- TEXT_CACHE_VERSION lives here, next to the code whose output it versions
+
+Use Cases:
+- Base class of PyPDF2TextExtractor (both copies)
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.infrastructure.extracted_text_cache import ExtractedTextCache
+from src.infrastructure.pdf_backends import PdfBackend
+from src.infrastructure.text_normalizer import TextNormalizer
+
+logger = logging.getLogger(__name__)
+
+
+class PdfPageReader:
+    """
+    Page reading shared by the PDF text extractor adapters.
+
+    Educational Note:
+    Subclasses set the attributes annotated below in their constructor;
+    everything else they need for reading pages comes from here.
+    """
+
+    # Bump when extraction or cleaning changes so cached text is re-extracted
+    TEXT_CACHE_VERSION = "3"
+
+    backends: List[PdfBackend]
+    normalizer: TextNormalizer
+    clean_text: bool
+    min_text_length: int
+    max_text_length: int
+    text_cache: Optional[ExtractedTextCache]
+    stage_timer: Optional[Callable[[str, float, int, int], None]]
+
+    def _check_pdf_path(self, pdf_path: Path) -> None:
+        """Reject paths that are missing, not files, or not PDFs."""
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+
+        if not pdf_path.is_file():
+            raise ValueError(f"Path is not a file: {pdf_path}")
+
+        if pdf_path.suffix.lower() != ".pdf":
+            raise ValueError(f"File is not a PDF: {pdf_path}")
+
+    def _lookup_cached_text(
+        self, pdf_path: Path
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look a PDF up in the text cache.
+
+        Returns:
+            (cache key, cached text); the key is None without a cache and
+            the text is None on a miss
+        """
+        if self.text_cache is None:
+            return None, None
+
+        started = time.perf_counter()
+        cache_key = self.text_cache.key_for(pdf_path, self._cache_settings())
+        cached_text = self.text_cache.get(cache_key)
+        if cached_text is not None:
+            logger.info(f"Using cached text for PDF: {pdf_path.name}")
+            if self.stage_timer is not None:
+                self.stage_timer(
+                    "pdf_text_cache_hit",
+                    time.perf_counter() - started,
+                    1,
+                    pdf_path.stat().st_size,
+                )
+        return cache_key, cached_text
+
+    def _iter_page_texts(
+        self, pdf_path: Path, progress: Dict[str, int]
+    ) -> Iterator[str]:
+        """
+        Read, clean and yield page texts until the length budget is spent.
+
+        Educational Note:
+        Every chunk is charged against max_text_length together with the
+        space that joins it to the next one, and the page that crosses the
+        budget is cut to fit, so the joined chunks never exceed the limit.
+        Pages after that are never parsed, which is where long documents
+        (theses, proceedings) save most of their extraction time.
+
+        Args:
+            pdf_path: Validated path of the PDF
+            progress: Updated with the number of pages read so far, for
+                the stage timer
+
+        Raises:
+            ValueError: If the PDF is password protected or has no pages
+        """
+        document = self.normalizer.document()
+        budget = self.max_text_length
+        for page_num, total_pages, page_text in self._iter_raw_pages(
+            pdf_path, progress
+        ):
+            if not page_text or not page_text.strip():
+                logger.warning(f"No text extracted from page {page_num + 1}")
+                continue
+
+            if self.clean_text:
+                # The document normalizer remembers the section the
+                # previous page ended in (e.g. a multi-page reference list)
+                page_text = document.normalize_page(page_text)
+                if not page_text:
+                    continue
+
+            if len(page_text) >= budget:
+                if page_num + 1 < total_pages or len(page_text) > budget:
+                    logger.warning(
+                        f"Text reached {self.max_text_length} chars on page "
+                        f"{page_num + 1} of {total_pages}, truncating: "
+                        f"{pdf_path.name}"
+                    )
+                yield page_text[:budget]
+                return
+
+            yield page_text
+            budget -= len(page_text) + 1
+
+    def _iter_raw_pages(
+        self, pdf_path: Path, progress: Dict[str, int]
+    ) -> Iterator[Tuple[int, int, Optional[str]]]:
+        """
+        Read raw page texts with the first backend that can.
+
+        Educational Note:
+        Backends are tried in order. When one fails, on opening the file
+        or on any page, the next one takes over at the page where it
+        failed, so pages already handed out are not read twice. Only the
+        last backend (PyPDF2 by default) may skip a page it cannot read.
+
+        Args:
+            pdf_path: Validated path of the PDF
+            progress: Updated with the number of pages read so far
+
+        Yields:
+            (zero-based page index, page count, raw page text or None)
+
+        Raises:
+            ValueError: If the PDF is password protected or has no pages
+        """
+        next_page = 0
+        for position, backend in enumerate(self.backends):
+            last_resort = position == len(self.backends) - 1
+            try:
+                with backend.open(pdf_path) as pdf_document:
+                    total_pages = pdf_document.page_count
+                    if total_pages == 0:
+                        raise ValueError(f"PDF has no pages: {pdf_path}")
+
+                    if next_page == 0:
+                        logger.info(
+                            f"Processing {total_pages} pages from "
+                            f"{pdf_path.name} with {backend.name}"
+                        )
+
+                    for page_num in range(next_page, total_pages):
+                        progress["pages"] = page_num + 1
+                        try:
+                            page_text = pdf_document.page_text(page_num)
+                        except Exception as e:
+                            if not last_resort:
+                                raise
+                            logger.warning(f"Error extracting page {page_num + 1}: {e}")
+                            page_text = None
+                        next_page = page_num + 1
+                        yield page_num, total_pages, page_text
+                return
+            except Exception as e:
+                if last_resort:
+                    raise
+                logger.warning(
+                    f"{backend.name} could not read {pdf_path.name} ({e}); "
+                    f"falling back to {self.backends[position + 1].name}"
+                )
+
+    def _report_extraction(self, started: float, pages: int, pdf_path: Path) -> None:
+        """Report one extraction attempt to the stage timer, if any."""
+        if self.stage_timer is not None:
+            self.stage_timer(
+                "pdf_text_extraction",
+                time.perf_counter() - started,
+                pages,
+                pdf_path.stat().st_size,
+            )
+
+    def _cache_settings(self) -> Dict[str, Any]:
+        """Settings that shape the extracted text, part of its cache key."""
+        return {
+            "version": self.TEXT_CACHE_VERSION,
+            "clean_text": self.clean_text,
+            "min_text_length": self.min_text_length,
+            "max_text_length": self.max_text_length,
+            "drop_sections": sorted(self.normalizer.drop_sections),
+            "backends": [backend.name for backend in self.backends],
+        }
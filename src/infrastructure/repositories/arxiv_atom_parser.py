@@ -0,0 +1,163 @@
+"""
+ArxivAtomParser - Streaming, arXiv-specific parser for Atom search results.
+
+feedparser is a general-purpose feed library: before the repository sees a
+single entry it has sniffed encodings, normalized every element of the feed
+into generic dictionaries and sanitized text, and it holds the whole page in
+memory. For 1,000-entry arXiv pages that work dominates ingestion profiles.
+This module parses arXiv's Atom responses incrementally with ElementTree's
+iterparse and yields one lightweight entry per <entry> element, freeing each
+element as soon as it has been converted.
+
+Educational Notes:
+- Demonstrates event-driven (pull) XML parsing: memory stays proportional to
+  one entry instead of one page
+- Shows the Adapter Pattern at the parsing boundary: entries expose the same
+  attribute names as feedparser's FeedParserDict, so the repository's
+  _convert_arxiv_entry_to_paper and SourceMetadata.from_arxiv_response work
+  unchanged with either parser
+- Illustrates clearing processed elements from the root so the partially
+  built tree never grows
+
+Design Decisions:
+- Only the fields the arXiv API actually returns are extracted
+- The standard library parser (expat) is used, so no new dependency
+- Malformed XML raises xml.etree.ElementTree.ParseError; the repository
+  reports it like any other processing error
+
+Use Cases:
+- High-volume arXiv ingestion in batch processing
+- Benchmarking against feedparser (scripts/benchmark_arxiv_parser.py)
+"""
+
+import io
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+
+
+class AtomEntry(dict):
+    """
+    Dictionary with attribute access, mirroring feedparser's FeedParserDict.
+
+    Educational Note:
+    Missing keys raise AttributeError (not KeyError) on attribute access, so
+    `hasattr(entry, "authors")` behaves exactly as it does with feedparser.
+    """
+
+    def __getattr__(self, name: str):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def iter_arxiv_entries(source: Union[bytes, BinaryIO]) -> Iterator[AtomEntry]:
+    """
+    Yield the entries of an arXiv Atom response one at a time.
+
+    Args:
+        source: Response body, or a binary file-like object to read from
+
+    Yields:
+        AtomEntry objects with feedparser-compatible keys
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is not well-formed
+    """
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    root = None
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if root is None:
+            root = element
+        elif event == "end" and element.tag == ATOM_NS + "entry":
+            yield _entry_from_element(element)
+            # Drop the converted entry (and anything before it) from the tree
+            root.clear()
+
+
+def parse_arxiv_entries(source: Union[bytes, BinaryIO]) -> List[AtomEntry]:
+    """Parse every entry of an arXiv Atom response into a list."""
+    return list(iter_arxiv_entries(source))
+
+
+def _entry_from_element(element: ET.Element) -> AtomEntry:
+    """Convert one <entry> element into a feedparser-compatible AtomEntry."""
+    entry = AtomEntry()
+
+    for key, tag in (
+        ("id", ATOM_NS + "id"),
+        ("title", ATOM_NS + "title"),
+        ("summary", ATOM_NS + "summary"),
+        ("published", ATOM_NS + "published"),
+        ("updated", ATOM_NS + "updated"),
+        ("arxiv_doi", ARXIV_NS + "doi"),
+        ("arxiv_comment", ARXIV_NS + "comment"),
+        ("arxiv_journal_ref", ARXIV_NS + "journal_ref"),
+    ):
+        text = element.findtext(tag)
+        if text is not None:
+            # feedparser strips surrounding whitespace but keeps inner newlines
+            entry[key] = text.strip()
+
+    for key in ("published", "updated"):
+        if key in entry:
+            parsed = _parse_timestamp(entry[key])
+            if parsed is not None:
+                entry[f"{key}_parsed"] = parsed
+
+    authors = [
+        AtomEntry(name=(author.findtext(ATOM_NS + "name") or "").strip())
+        for author in element.findall(ATOM_NS + "author")
+    ]
+    if authors:
+        entry["authors"] = authors
+        # feedparser reports the last author parsed as the entry's author
+        entry["author"] = authors[-1]["name"]
+
+    primary = element.find(ARXIV_NS + "primary_category")
+    if primary is not None:
+        entry["arxiv_primary_category"] = AtomEntry(
+            term=primary.get("term", ""), scheme=primary.get("scheme", "")
+        )
+
+    links = []
+    for link in element.findall(ATOM_NS + "link"):
+        parsed_link = AtomEntry(
+            href=link.get("href", ""),
+            rel=link.get("rel", "alternate"),
+            type=link.get("type", "text/html"),
+        )
+        if link.get("title"):
+            parsed_link["title"] = link.get("title")
+        links.append(parsed_link)
+        if parsed_link["rel"] == "alternate" and "link" not in entry:
+            entry["link"] = parsed_link["href"]
+    if links:
+        entry["links"] = links
+
+    tags = [
+        AtomEntry(
+            term=category.get("term", ""), scheme=category.get("scheme"), label=None
+        )
+        for category in element.findall(ATOM_NS + "category")
+    ]
+    if tags:
+        entry["tags"] = tags
+
+    return entry
+
+
+def _parse_timestamp(value: str) -> Optional[time.struct_time]:
+    """Parse an Atom timestamp into a UTC struct_time, as feedparser does."""
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.utctimetuple()
@@ -18,6 +18,9 @@ Design Decisions:
 - Rate limiting and API etiquette for responsible usage
 - Comprehensive error handling with informative messages
 - PDF download capabilities with validation
+- Paginated, streaming search so memory stays constant per result page
+- Atom responses parsed incrementally by arxiv_atom_parser; feedparser
+  remains available as a fallback parser
 
 Multi-Source Features:
 - Source capability reporting (rate limits, download support)
@@ -33,9 +36,10 @@ Use Cases:
 """
 
 import re
+import time
 import requests
 import feedparser
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterator, List, Optional, Dict, Any
 from datetime import datetime, timezone
 
 from src.application.ports.paper_source_port import PaperSourcePort
@@ -43,6 +47,9 @@ from src.domain.entities.research_paper import ResearchPaper
 from src.domain.value_objects.search_query import SearchQuery
 from src.domain.value_objects.source_metadata import SourceMetadata
 from src.domain.value_objects.paper_fingerprint import PaperFingerprint
+from src.infrastructure.http_response_cache import HttpResponseCache, create_session
+from src.infrastructure.shared_rate_limiter import SharedRateLimiter
+from src.infrastructure.repositories.arxiv_atom_parser import iter_arxiv_entries
 
 
 class ArxivPaperRepository(PaperSourcePort):
@@ -54,18 +61,74 @@ class ArxivPaperRepository(PaperSourcePort):
     ResearchPaper objects work with both in-memory and arXiv data.
     """
 
-    def __init__(self, base_url: str = "http://export.arxiv.org/api/query"):
+    # arXiv recommends pages of at most a few hundred entries
+    DEFAULT_PAGE_SIZE = 100
+
+    # arXiv API user manual: "incorporate a 3 second delay" between calls
+    DEFAULT_PAGE_DELAY_SECONDS = 3.0
+
+    # Entries scanned per wanted paper before a heavily filtered search
+    # gives up, so a query whose filters reject nearly everything still ends
+    SCAN_LIMIT_FACTOR = 10
+
+    # Atom parsers selectable with the feed_parser argument
+    FEED_PARSERS = ("streaming", "feedparser")
+
+    def __init__(
+        self,
+        base_url: str = "http://export.arxiv.org/api/query",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        page_delay: float = DEFAULT_PAGE_DELAY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        response_cache: Optional[HttpResponseCache] = None,
+        feed_parser: str = "streaming",
+        rate_limiter: Optional[SharedRateLimiter] = None,
+        max_scanned_entries: Optional[int] = None,
+    ):
         """
         Initialize arXiv repository with API endpoint.
 
         Args:
             base_url: arXiv API base URL for queries
-        """
+            page_size: Maximum entries requested per page of a search
+            page_delay: Minimum seconds between consecutive page requests
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+            response_cache: Optional on-disk cache shared with other sources;
+                cached queries are answered without touching the network
+            feed_parser: "streaming" for the incremental arXiv Atom parser,
+                or "feedparser" for the general-purpose feedparser library
+            rate_limiter: Optional host-wide limiter; every request this
+                repository sends takes a token from the "ArXiv" bucket
+            max_scanned_entries: Entries a search may page through before it
+                stops (default: SCAN_LIMIT_FACTOR times max_results, and at
+                least one page)
+        """
+        if feed_parser not in self.FEED_PARSERS:
+            raise ValueError(
+                f"feed_parser must be one of {', '.join(self.FEED_PARSERS)}"
+            )
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "HRV-Research-Tool/1.0 (Educational Purpose)"}
+        self.page_size = max(1, page_size)
+        self.page_delay = max(0.0, page_delay)
+        self.max_scanned_entries = max_scanned_entries
+        self._clock = clock
+        self._sleep = sleep
+        self.response_cache = response_cache
+        self.feed_parser = feed_parser
+        self.session = create_session(
+            response_cache,
+            {"User-Agent": "HRV-Research-Tool/1.0 (Educational Purpose)"},
         )
+        self.rate_limiter = rate_limiter
+        if rate_limiter is not None:
+            # PDFs are served from arxiv.org, the API from export.arxiv.org
+            key = rate_limiter.configure_from_source(
+                self, base_url, "https://arxiv.org"
+            )
+            if key:
+                rate_limiter.attach(self.session, key)
 
     def find_by_query(self, query: SearchQuery) -> List[ResearchPaper]:
         """
@@ -80,39 +143,143 @@ class ArxivPaperRepository(PaperSourcePort):
         Returns:
             List of ResearchPaper entities from arXiv
         """
-        try:
-            # Build arXiv search query from domain SearchQuery
-            arxiv_query = self._build_arxiv_query(query)
-
-            # Query arXiv API
-            params = {
-                "search_query": arxiv_query,
-                "start": 0,
-                "max_results": query.max_results or 10,
-                "sortBy": "relevance",
-                "sortOrder": "descending",
-            }
+        return list(self.iter_by_query(query))
 
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
+    def iter_by_query(self, query: SearchQuery) -> Iterator[ResearchPaper]:
+        """
+        Stream papers matching the search query, one result page at a time.
+
+        Educational Notes:
+        - Generator-based pagination: only the current page's response is held
+          in memory, and each entry is converted as soon as it has been parsed,
+          so callers can start processing the first papers right away
+        - Pages advance through the API's `start` offset; iteration stops as
+          soon as `query.max_results` papers have passed the filters, when a
+          page comes back short (the last page), on an API error, or once
+          the scan budget is spent, so filters that reject most entries
+          cannot page through the whole archive
+        - Every page of a search asks for the same number of entries
+          (`page_size`, or fewer if the query wants fewer papers): shrinking
+          pages to the papers still missing would multiply the requests when
+          filters reject entries, and make a full page look like the last one
+        - Consecutive page requests are spaced by `page_delay` seconds as the
+          arXiv API user manual asks. Pages answered by the response cache
+          (or replayed offline) send no request, so they are not delayed.
+          Spacing requests from *different* searches is left to
+          RateLimitedPaperRepository, or across processes to the shared
+          rate_limiter.
+
+        Args:
+            query: SearchQuery with search terms and filters
+
+        Yields:
+            ResearchPaper entities from arXiv, in relevance order
+        """
+        wanted = query.max_results or 10
+        page_size = min(self.page_size, wanted)
+        scan_budget = self.max_scanned_entries or max(
+            wanted * self.SCAN_LIMIT_FACTOR, page_size
+        )
+        arxiv_query = self._build_arxiv_query(query)
+        yielded = 0
+        start = 0
+        last_request_at: Optional[float] = None
+
+        while yielded < wanted:
+            if start >= scan_budget:
+                print(
+                    f"arXiv search stopped after scanning {start} entries "
+                    f"({yielded} of {wanted} papers matched the filters)"
+                )
+                return
+
+            params = self._page_params(arxiv_query, start, page_size)
+            cached = self._cached_page(params)
+            if cached is not None:
+                content = cached.content
+            else:
+                if last_request_at is not None and not self._replay_only():
+                    remaining_delay = self.page_delay - (
+                        self._clock() - last_request_at
+                    )
+                    if remaining_delay > 0:
+                        self._sleep(remaining_delay)
+                last_request_at = self._clock()
+                content = self._fetch_page(params)
+            if content is None:
+                return
+
+            entry_count = 0
+            try:
+                for entry in self._parse_entries(content):
+                    entry_count += 1
+                    paper = self._convert_arxiv_entry_to_paper(entry)
+                    if paper and self._matches_query_filters(paper, query):
+                        yield paper
+                        yielded += 1
+                        if yielded >= wanted:
+                            return
+            except Exception as e:
+                print(f"Error processing arXiv results: {e}")
+                return
+
+            if entry_count < page_size:
+                return
+            start += entry_count
+
+    @staticmethod
+    def _page_params(arxiv_query: str, start: int, page_size: int) -> Dict[str, Any]:
+        """Query parameters requesting one page of search results."""
+        return {
+            "search_query": arxiv_query,
+            "start": start,
+            "max_results": page_size,
+            "sortBy": "relevance",
+            "sortOrder": "descending",
+        }
 
-            # Parse RSS feed response
-            feed = feedparser.parse(response.content)
+    def _cached_page(self, params: Dict[str, Any]) -> Optional[requests.Response]:
+        """Return the fresh cached response for a page, if the cache has one."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get("GET", self.base_url, params)
 
-            papers = []
-            for entry in feed.entries:
-                paper = self._convert_arxiv_entry_to_paper(entry)
-                if paper and self._matches_query_filters(paper, query):
-                    papers.append(paper)
+    def _replay_only(self) -> bool:
+        """Whether every request is answered by the cache, never the network."""
+        return self.response_cache is not None and self.response_cache.replay_only
 
-            return papers[: query.max_results] if query.max_results else papers
+    def _fetch_page(self, params: Dict[str, Any]) -> Optional[bytes]:
+        """
+        Request one page of search results.
+
+        Returns:
+            Raw Atom response body, or None if the request failed
+        """
+        try:
+            response = self.session.get(self.base_url, params=params, timeout=30)
+            response.raise_for_status()
+            return response.content
 
         except requests.RequestException as e:
             print(f"Error querying arXiv API: {e}")
-            return []
+            return None
         except Exception as e:
             print(f"Error processing arXiv results: {e}")
-            return []
+            return None
+
+    def _parse_entries(self, content: bytes) -> Iterator[Any]:
+        """
+        Parse an Atom response into feed entries with the configured parser.
+
+        Educational Note:
+        Both parsers produce entries with the same attribute names, so
+        _convert_arxiv_entry_to_paper does not care which one ran. The
+        streaming parser yields each entry as soon as its closing tag is
+        read; feedparser builds the whole feed first.
+        """
+        if self.feed_parser == "feedparser":
+            return iter(feedparser.parse(content).entries)
+        return iter_arxiv_entries(content)
 
     def find_by_doi(self, doi: str) -> Optional[ResearchPaper]:
         """
@@ -142,10 +309,9 @@ class ArxivPaperRepository(PaperSourcePort):
             response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
 
-            feed = feedparser.parse(response.content)
-
-            if feed.entries:
-                return self._convert_arxiv_entry_to_paper(feed.entries[0])
+            entry = next(self._parse_entries(response.content), None)
+            if entry is not None:
+                return self._convert_arxiv_entry_to_paper(entry)
 
             return None
 
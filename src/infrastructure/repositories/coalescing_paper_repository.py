@@ -0,0 +1,287 @@
+"""
+CoalescingPaperRepository - Merge overlapping strategy queries into fewer API calls.
+
+Strategies across the configuration files overlap heavily in their search
+terms, yet each one sends its own arXiv query. Because arXiv's rate limit is
+the hard ceiling on batch throughput, every avoided request is time saved.
+QueryPlanner groups compatible strategy queries before the run starts;
+CoalescingPaperRepository then answers each strategy's query from a single
+merged request per group, filtering the shared results back down client-side.
+
+Educational Notes:
+- Demonstrates request coalescing: many logical queries, one physical call
+- Works because arXiv queries OR their terms together, so a query over the
+  union of several strategies' terms returns a superset of each one's results
+- Shows fan-out through client-side filters: term matching on title and
+  abstract, then the source's own _matches_query_filters for dates
+- Another Decorator over PaperRepositoryPort, like RateLimitedPaperRepository
+
+Design Decisions:
+- Planning is greedy: each term set joins the compatible group it overlaps
+  most, as long as the merged query stays under a term limit (long queries
+  hit URL length limits and dilute relevance ranking)
+- A merged query asks for the sum of its members' result limits
+- If a member's share of a truncated merged result falls short of its own
+  limit, that member falls back to its own query rather than losing papers
+- Queries the plan did not anticipate pass straight through unchanged
+- Merged results are fetched once per (group, date range) under a per-key
+  lock, so concurrent strategies wait for the first fetch instead of racing
+
+Use Cases:
+- Batch runs over many overlapping configurations against arXiv
+- Any OR-semantics source where request count, not result size, is the bottleneck
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+from src.application.ports.paper_repository_port import PaperRepositoryPort
+from src.domain.entities.research_paper import ResearchPaper
+from src.domain.value_objects.search_query import SearchQuery
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def normalize_terms(terms: Iterable[str]) -> FrozenSet[str]:
+    """Case- and whitespace-insensitive identity of a set of search terms."""
+    return frozenset(" ".join(term.lower().split()) for term in terms if term)
+
+
+@dataclass
+class QueryGroup:
+    """
+    A set of strategy queries answered by one merged request.
+
+    Attributes:
+        terms: Search terms of the merged query, in first-seen order
+        max_results: Result limit of the merged query
+        members: Names of the strategies served by this group
+        compatibility_key: Settings all members share (e.g. date range)
+    """
+
+    terms: List[str] = field(default_factory=list)
+    max_results: int = 0
+    members: List[str] = field(default_factory=list)
+    compatibility_key: Hashable = None
+
+    @property
+    def normalized_terms(self) -> FrozenSet[str]:
+        """Normalized form of the merged terms."""
+        return normalize_terms(self.terms)
+
+    def add(self, name: str, terms: Iterable[str], max_results: int) -> None:
+        """Add a strategy query to the group."""
+        known = self.normalized_terms
+        for term in terms:
+            normalized = normalize_terms([term])
+            if normalized and not normalized <= known:
+                self.terms.append(term)
+                known = known | normalized
+        self.max_results += max_results
+        self.members.append(name)
+
+
+class QueryPlanner:
+    """
+    Group strategy queries so that as few API calls as possible are needed.
+
+    Educational Note:
+    Finding the true minimum number of groups is a bin-packing problem;
+    the greedy largest-first heuristic gets close and runs instantly for
+    the few hundred strategies a batch run has.
+    """
+
+    DEFAULT_MAX_TERMS_PER_QUERY = 40
+
+    def __init__(self, max_terms_per_query: int = DEFAULT_MAX_TERMS_PER_QUERY):
+        """
+        Args:
+            max_terms_per_query: Upper bound on terms in one merged query
+        """
+        self.max_terms_per_query = max(1, max_terms_per_query)
+
+    def plan(
+        self, queries: Dict[str, Tuple[List[str], int, Hashable]]
+    ) -> List[QueryGroup]:
+        """
+        Group strategy queries.
+
+        Args:
+            queries: Strategy name -> (terms, max_results, compatibility key).
+                Only queries with equal compatibility keys are merged.
+
+        Returns:
+            Query groups; a group with one member needs no coalescing
+        """
+        groups: List[QueryGroup] = []
+        ordered = sorted(
+            queries.items(),
+            key=lambda item: len(normalize_terms(item[1][0])),
+            reverse=True,
+        )
+
+        for name, (terms, max_results, compatibility_key) in ordered:
+            normalized = normalize_terms(terms)
+            best: Optional[QueryGroup] = None
+            best_overlap = -1
+            for group in groups:
+                if group.compatibility_key != compatibility_key:
+                    continue
+                merged_size = len(group.normalized_terms | normalized)
+                if merged_size > self.max_terms_per_query:
+                    continue
+                overlap = len(group.normalized_terms & normalized)
+                if overlap > best_overlap:
+                    best, best_overlap = group, overlap
+
+            if best is None:
+                best = QueryGroup(compatibility_key=compatibility_key)
+                groups.append(best)
+            best.add(name, terms, max_results)
+
+        return groups
+
+
+class CoalescingPaperRepository(PaperRepositoryPort):
+    """
+    Decorator that serves planned strategy queries from merged requests.
+
+    Educational Note:
+    The strategy's own SearchQuery still drives the call; this repository
+    only recognizes that its terms belong to a planned group and swaps in
+    the group's merged query, so use cases need no changes.
+    """
+
+    def __init__(self, repository: PaperRepositoryPort, groups: List[QueryGroup]):
+        """
+        Wrap a repository with query coalescing.
+
+        Args:
+            repository: Repository that executes the actual searches
+            groups: Plan produced by QueryPlanner.plan()
+        """
+        self._repository = repository
+        self._groups = [group for group in groups if len(group.members) > 1]
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._merged_results: Dict[Tuple, List[ResearchPaper]] = {}
+        self.api_calls = 0
+        self.queries_served = 0
+
+    @property
+    def wrapped_repository(self) -> PaperRepositoryPort:
+        """Return the repository executing the merged queries."""
+        return self._repository
+
+    def find_by_query(self, query: SearchQuery) -> List[ResearchPaper]:
+        """
+        Answer a query from its group's merged results when possible.
+
+        Returns:
+            Papers matching the query's own terms and filters, in the
+            merged query's relevance order, limited to query.max_results
+        """
+        with self._lock:
+            self.queries_served += 1
+
+        group_index = self._group_index_for(query)
+        if group_index is None:
+            return self._search(query)
+
+        group = self._groups[group_index]
+        merged_query = SearchQuery(
+            terms=list(group.terms),
+            start_date=query.start_date,
+            end_date=query.end_date,
+            max_results=group.max_results,
+            min_citations=query.min_citations,
+        )
+        key = (group_index, query.start_date, query.end_date, query.min_citations)
+        papers = self._merged_search(key, merged_query)
+
+        matching = [paper for paper in papers if self._matches(paper, query)]
+        limit = query.max_results
+        truncated = len(papers) >= group.max_results
+        if truncated and limit and len(matching) < limit:
+            # The shared budget went to other members; fetch this one alone
+            return self._search(query)
+        return matching[:limit] if limit else matching
+
+    def find_by_doi(self, doi: str) -> Optional[ResearchPaper]:
+        """Delegate DOI lookups to the wrapped repository (not coalesced)."""
+        return self._repository.find_by_doi(doi)
+
+    def save_paper(self, paper: ResearchPaper) -> None:
+        """Delegate persistence to the wrapped repository."""
+        self._repository.save_paper(paper)
+
+    def save_papers(self, papers: List[ResearchPaper]) -> None:
+        """Delegate bulk persistence to the wrapped repository."""
+        self._repository.save_papers(papers)
+
+    def count_all(self) -> int:
+        """Delegate counting to the wrapped repository."""
+        return self._repository.count_all()
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward source-specific helpers to the wrapped repository."""
+        if name.startswith("__") or name == "_repository":
+            raise AttributeError(name)
+        return getattr(self._repository, name)
+
+    def _group_index_for(self, query: SearchQuery) -> Optional[int]:
+        """Return the planned group containing every term of the query."""
+        terms = normalize_terms(query.terms)
+        if not terms:
+            return None
+        for index, group in enumerate(self._groups):
+            if terms <= group.normalized_terms:
+                return index
+        return None
+
+    def _merged_search(
+        self, key: Tuple, merged_query: SearchQuery
+    ) -> List[ResearchPaper]:
+        """Run a merged query once; concurrent callers wait for the result."""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key not in self._merged_results:
+                self._merged_results[key] = self._search(merged_query)
+            return self._merged_results[key]
+
+    def _search(self, query: SearchQuery) -> List[ResearchPaper]:
+        """Send one query to the wrapped repository, counting the API call."""
+        with self._lock:
+            self.api_calls += 1
+        return self._repository.find_by_query(query)
+
+    def _matches(self, paper: ResearchPaper, query: SearchQuery) -> bool:
+        """
+        Decide whether a merged-query paper belongs to the original query.
+
+        Educational Note:
+        Mirrors arXiv's `ti:term OR abs:term` clause per term: a paper
+        matches when every word of at least one term occurs as a whole word
+        in its title or abstract, so "ai" does not match "again". Date
+        filters come from the source's _matches_query_filters.
+        """
+        words = set(
+            _WORD_PATTERN.findall(f"{paper.title} {paper.abstract or ''}".lower())
+        )
+        if not any(
+            term_words and term_words <= words
+            for term_words in (
+                set(_WORD_PATTERN.findall(term))
+                for term in normalize_terms(query.terms)
+            )
+        ):
+            return False
+
+        source_filter = getattr(self._repository, "_matches_query_filters", None)
+        if callable(source_filter):
+            return source_filter(paper, query)
+        return query.is_within_date_range(paper.publication_date)
@@ -0,0 +1,269 @@
+"""
+FederatedPaperRepository - Search every paper source at once.
+
+arXiv, PubMed Central and MDPI each implement PaperSourcePort, but callers
+query them one at a time, so a multi-source search takes as long as all the
+sources combined, and a single hung source stalls it. This repository fans
+one SearchQuery out to every registered source concurrently and merges the
+results as they arrive. Search latency becomes that of the slowest source,
+bounded by a per-source timeout and an overall deadline.
+
+Educational Notes:
+- Demonstrates the Composite Pattern: many repositories behind the same
+  PaperRepositoryPort interface as one
+- Shows scatter-gather with deadlines: wait for whichever source finishes
+  next, but never past the earliest deadline still pending
+- Deduplicates by PaperFingerprint, so the same paper reported by arXiv
+  (by arXiv ID and DOI) and PMC (by DOI) is returned once
+
+Design Decisions:
+- First arrival wins: when sources report the same paper, the copy from the
+  source that answered first is kept
+- find_by_query waits for every source (within the deadline) and takes
+  results from each in turn before capping at max_results, so one source
+  returning a full page cannot crowd out the others
+- Timed-out sources are abandoned, not cancelled: a blocking HTTP call cannot
+  be interrupted, so its worker thread finishes in the background and its
+  late result is discarded
+- A failing source is logged and reported in last_outcomes; the other
+  sources' results are still returned
+- Persistence is not federated: the sources are read-only
+
+Use Cases:
+- Multi-source literature searches (arXiv + PMC + MDPI)
+- Interactive searches that must answer within a fixed time budget
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import zip_longest
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.application.ports.paper_repository_port import PaperRepositoryPort
+from src.domain.entities.research_paper import ResearchPaper
+from src.domain.value_objects.paper_fingerprint import PaperFingerprint
+from src.domain.value_objects.search_query import SearchQuery
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourceOutcome:
+    """
+    How one source fared in a federated search.
+
+    Attributes:
+        source: Name of the source
+        papers: Papers the source returned
+        duplicates: Returned papers already reported by another source
+        dropped: Unique papers left out by the max_results cap
+        elapsed_seconds: Time until the source answered (or was abandoned)
+        timed_out: True if the source missed its timeout or the deadline
+        error: Error message if the source raised
+    """
+
+    source: str
+    papers: int = 0
+    duplicates: int = 0
+    dropped: int = 0
+    elapsed_seconds: float = 0.0
+    timed_out: bool = False
+    error: Optional[str] = None
+
+
+class FederatedPaperRepository(PaperRepositoryPort):
+    """
+    Query several paper sources concurrently and merge their results.
+
+    Educational Note:
+    Each search gets its own thread pool, shut down without waiting, so a
+    source that hangs past its timeout only ties up its own thread; the
+    next search starts with fresh workers.
+    """
+
+    DEFAULT_SOURCE_TIMEOUT_SECONDS = 30.0
+    DEFAULT_DEADLINE_SECONDS = 60.0
+
+    def __init__(
+        self,
+        sources: List[PaperRepositoryPort],
+        source_timeout: float = DEFAULT_SOURCE_TIMEOUT_SECONDS,
+        deadline: float = DEFAULT_DEADLINE_SECONDS,
+        source_timeouts: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Register the sources to federate.
+
+        Args:
+            sources: Repositories to search, e.g. arXiv, PMC and MDPI
+            source_timeout: Seconds each source may take before it is abandoned
+            deadline: Seconds after which the whole search returns what it has
+            source_timeouts: Per-source overrides of source_timeout, keyed by
+                source name (e.g. {"MDPI": 90.0} for a slow OAI-PMH server)
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If no sources are given or a timeout is not positive
+        """
+        if not sources:
+            raise ValueError("FederatedPaperRepository needs at least one source")
+        source_timeouts = dict(source_timeouts or {})
+        if min([source_timeout, deadline, *source_timeouts.values()]) <= 0:
+            raise ValueError("Timeouts and deadline must be positive")
+
+        self._sources = list(sources)
+        self.source_timeout = source_timeout
+        self.deadline = deadline
+        self.source_timeouts = source_timeouts
+        self._clock = clock
+        self.last_outcomes: List[SourceOutcome] = []
+
+    @property
+    def sources(self) -> List[PaperRepositoryPort]:
+        """Return the federated repositories."""
+        return list(self._sources)
+
+    @staticmethod
+    def source_name(source: PaperRepositoryPort) -> str:
+        """Name a source by get_source_name(), falling back to its class name."""
+        get_source_name = getattr(source, "get_source_name", None)
+        if callable(get_source_name):
+            return get_source_name()
+        return type(source).__name__
+
+    def find_by_query(self, query: SearchQuery) -> List[ResearchPaper]:
+        """
+        Search all sources and return the merged, deduplicated results.
+
+        Returns:
+            Papers taken from each source in turn (sources in the order
+            they answered), limited to query.max_results
+        """
+        by_source: Dict[int, List[Tuple[SourceOutcome, ResearchPaper]]] = {}
+        for outcome, paper in self._unique_papers(query):
+            by_source.setdefault(id(outcome), []).append((outcome, paper))
+
+        interleaved = [
+            entry
+            for turn in zip_longest(*by_source.values())
+            for entry in turn
+            if entry is not None
+        ]
+        limit = query.max_results or len(interleaved)
+        for outcome, _ in interleaved[limit:]:
+            outcome.dropped += 1
+        return [paper for _, paper in interleaved[:limit]]
+
+    def iter_by_query(self, query: SearchQuery) -> Iterator[ResearchPaper]:
+        """
+        Yield deduplicated papers as each source answers.
+
+        Educational Note:
+        Papers from a fast source are available while slower sources are
+        still working, so callers can start downloading immediately.
+        Outcomes for every source are in last_outcomes once iteration ends.
+        """
+        for _, paper in self._unique_papers(query):
+            yield paper
+
+    def _unique_papers(
+        self, query: SearchQuery
+    ) -> Iterator[Tuple[SourceOutcome, ResearchPaper]]:
+        """Yield (outcome, paper) for each paper not reported before."""
+        seen: Set[PaperFingerprint] = set()
+        for outcome, papers in self._gather(lambda source: source.find_by_query(query)):
+            for paper in papers or []:
+                fingerprint = getattr(paper, "paper_fingerprint", None)
+                fingerprint = fingerprint or PaperFingerprint.from_paper(paper)
+                if fingerprint in seen:
+                    outcome.duplicates += 1
+                    continue
+                seen.add(fingerprint)
+                yield outcome, paper
+
+    def find_by_doi(self, doi: str) -> Optional[ResearchPaper]:
+        """Ask every source for a DOI and return the first paper found."""
+        for _, paper in self._gather(lambda source: source.find_by_doi(doi)):
+            if paper is not None:
+                return paper
+        return None
+
+    def save_paper(self, paper: ResearchPaper) -> None:
+        """Federated sources are read-only."""
+        raise NotImplementedError("FederatedPaperRepository is read-only")
+
+    def save_papers(self, papers: List[ResearchPaper]) -> None:
+        """Federated sources are read-only."""
+        raise NotImplementedError("FederatedPaperRepository is read-only")
+
+    def count_all(self) -> int:
+        """Remote sources cannot be counted; -1 means unknown, as for arXiv."""
+        return -1
+
+    def get_source_name(self) -> str:
+        """Name the federation after its members."""
+        return " + ".join(self.source_name(source) for source in self._sources)
+
+    def _gather(self, call: Callable[[PaperRepositoryPort], Any]) -> Iterator[tuple]:
+        """
+        Run `call` against every source and yield (outcome, result) pairs.
+
+        Results are yielded in completion order. Sources that raise are
+        logged; sources still running at their timeout or the overall
+        deadline are marked as timed out and never yielded.
+        """
+        started = self._clock()
+        outcomes = [SourceOutcome(self.source_name(source)) for source in self._sources]
+        self.last_outcomes = outcomes
+
+        pool = ThreadPoolExecutor(
+            max_workers=len(self._sources), thread_name_prefix="federated-search"
+        )
+        try:
+            pending: Dict[Future, SourceOutcome] = {
+                pool.submit(call, source): outcome
+                for source, outcome in zip(self._sources, outcomes)
+            }
+            deadlines = {
+                future: started + min(self._timeout_for(outcome.source), self.deadline)
+                for future, outcome in pending.items()
+            }
+            while pending:
+                now = self._clock()
+                for future in [f for f in pending if deadlines[f] <= now]:
+                    self._abandon(future, pending.pop(future), started)
+                if not pending:
+                    break
+                remaining = min(deadlines[future] for future in pending) - now
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcome = pending.pop(future)
+                    outcome.elapsed_seconds = self._clock() - started
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        outcome.error = str(e)
+                        logger.error(f"Error searching {outcome.source}: {e}")
+                        continue
+                    if isinstance(result, list):
+                        outcome.papers = len(result)
+                    yield outcome, result
+        finally:
+            pool.shutdown(wait=False)
+
+    def _timeout_for(self, source_name: str) -> float:
+        """Return the timeout configured for a source."""
+        return self.source_timeouts.get(source_name, self.source_timeout)
+
+    def _abandon(self, future: Future, outcome: SourceOutcome, started: float) -> None:
+        """Stop waiting for a source that missed its timeout."""
+        future.cancel()
+        outcome.timed_out = True
+        outcome.elapsed_seconds = self._clock() - started
+        logger.warning(
+            f"{outcome.source} did not answer within "
+            f"{outcome.elapsed_seconds:.1f}s; continuing without it"
+        )
@@ -15,6 +15,9 @@ Design Decisions:
 - Implements comprehensive error handling for network and protocol issues
 - Extracts rich metadata from Dublin Core format following academic standards
 - Supports journal-specific harvesting through OAI-PMH sets
+- Optional local harvest store: date ranges are harvested month by month,
+  several months at once under a per-host concurrency cap, and searched
+  locally; months already harvested are never fetched again
 
 Real-World Application:
 - Academic researchers can access MDPI's 400+ open access journals
@@ -24,8 +27,9 @@ Real-World Application:
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import logging
+import requests
 from sickle import Sickle
 from sickle.oaiexceptions import NoRecordsMatch, BadArgument, OAIError
 
@@ -34,6 +38,17 @@ from src.domain.entities.research_paper import ResearchPaper
 from src.domain.value_objects.search_query import SearchQuery
 from src.domain.value_objects.source_metadata import SourceMetadata
 from src.domain.value_objects.paper_fingerprint import PaperFingerprint
+from src.infrastructure.http_response_cache import HttpResponseCache, create_session
+from src.infrastructure.repositories.oai_harvest_store import (
+    HarvestedRecord,
+    HarvestStats,
+    OaiHarvestStore,
+)
+from src.infrastructure.repositories.session_sickle import SessionSickle
+from src.infrastructure.shared_rate_limiter import SharedRateLimiter
+from src.infrastructure.repositories.windowed_oai_harvester import (
+    WindowedOaiHarvester,
+)
 
 
 class MDPIPaperRepository(PaperSourcePort):
@@ -52,17 +67,37 @@ class MDPIPaperRepository(PaperSourcePort):
     interface to the application layer.
     """
 
+    # Searches without a start date cover this many days back
+    DEFAULT_HARVEST_LOOKBACK_DAYS = 2 * 365
+
     def __init__(
         self,
         base_url: str = "https://oai.mdpi.com/oai/oai2.php",
         journal_sets: Optional[List[str]] = None,
+        response_cache: Optional[HttpResponseCache] = None,
+        harvest_store: Optional[OaiHarvestStore] = None,
+        max_concurrent_requests: int = WindowedOaiHarvester.DEFAULT_MAX_CONCURRENT_REQUESTS,
+        harvest_lookback_days: int = DEFAULT_HARVEST_LOOKBACK_DAYS,
+        rate_limiter: Optional[SharedRateLimiter] = None,
     ):
         """
         Initialize MDPI repository with OAI-PMH endpoint configuration.
         
         Educational Note:
         Dependency Injection principle - accepts configuration rather than
-        hardcoding values, enabling testability and flexibility.
+        hardcoding values, enabling testability and flexibility. A shared
+        response_cache lets repeated harvests be served from disk.
+
+        Args:
+            base_url: MDPI OAI-PMH endpoint
+            journal_sets: OAI sets to search
+            response_cache: Optional on-disk cache shared with other sources
+            harvest_store: Optional local store; when given, searches harvest
+                missing months concurrently and then run locally
+            max_concurrent_requests: Cap on concurrent requests to MDPI
+            harvest_lookback_days: Range searched when a query has no start date
+            rate_limiter: Optional host-wide limiter; every OAI-PMH request
+                takes a token from the "MDPI" bucket
         """
         self._base_url = base_url
         self._journal_sets = journal_sets or [
@@ -71,6 +106,45 @@ class MDPIPaperRepository(PaperSourcePort):
             "journal:electronics",
         ]
         self._logger = logging.getLogger(__name__)
+        self._response_cache = response_cache
+        self._rate_limiter = rate_limiter
+        self._rate_limit_key = (
+            rate_limiter.configure_from_source(self, base_url)
+            if rate_limiter is not None
+            else None
+        )
+        self._session = (
+            self._create_session()
+            if response_cache is not None or rate_limiter is not None
+            else None
+        )
+        self._harvest_store = harvest_store
+        self._harvest_lookback_days = harvest_lookback_days
+        self._harvester = (
+            WindowedOaiHarvester(
+                harvest_store,
+                self._list_records_factory,
+                self._to_harvested_record,
+                base_url,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+            if harvest_store is not None
+            else None
+        )
+
+    def _create_session(self) -> requests.Session:
+        """Create a session using the response cache and the rate limiter."""
+        session = create_session(self._response_cache, {})
+        if self._rate_limit_key:
+            self._rate_limiter.attach(session, self._rate_limit_key)
+        return session
+
+    def _create_sickle(self, session: Optional[requests.Session] = None) -> Sickle:
+        """Create the OAI-PMH client, routed through a session if needed."""
+        session = session or self._session
+        if session is None:
+            return Sickle(self._base_url)
+        return SessionSickle(self._base_url, session=session)
 
     def get_source_name(self) -> str:
         """Get human-readable source name for identification."""
@@ -164,8 +238,11 @@ class MDPIPaperRepository(PaperSourcePort):
         It shows proper error handling, resource management, and data transformation
         in the infrastructure layer.
         """
+        if self._harvester is not None:
+            return self._find_in_harvest_store(query)
+
         try:
-            sickle = Sickle(self._base_url)
+            sickle = self._create_sickle()
             papers = []
             
             # Search across configured journal sets or all sets if none specified  
@@ -215,6 +292,119 @@ class MDPIPaperRepository(PaperSourcePort):
             self._logger.error(f"Error during OAI-PMH harvesting: {e}")
             return []
 
+    def harvest(
+        self, start_date: datetime, end_date: Optional[datetime] = None
+    ) -> HarvestStats:
+        """
+        Harvest the journal sets for a date range into the local store.
+
+        Educational Note:
+        The range is split into calendar months which are fetched
+        concurrently; months already in the store are skipped, so repeated
+        and overlapping ranges cost nothing after the first harvest.
+
+        Raises:
+            ValueError: If the repository has no harvest store
+        """
+        if self._harvester is None:
+            raise ValueError("MDPIPaperRepository has no harvest store configured")
+        return self._harvester.harvest(
+            self._journal_sets or [None], start_date, end_date
+        )
+
+    def _find_in_harvest_store(self, query: SearchQuery) -> List[ResearchPaper]:
+        """
+        Answer a search from the local harvest, fetching missing months first.
+
+        Educational Note:
+        The same matching rules as the network path apply
+        (_record_matches_query), but only to the index candidates.
+        """
+        start_date = query.start_date or (
+            datetime.now(timezone.utc) - timedelta(days=self._harvest_lookback_days)
+        )
+        try:
+            self.harvest(start_date, query.end_date)
+        except Exception as e:
+            # Whatever was harvested before the failure is still searchable
+            self._logger.error(f"Error during windowed OAI-PMH harvesting: {e}")
+
+        papers = []
+        for set_name in self._journal_sets or [None]:
+            try:
+                candidates = self._harvest_store.search(
+                    query.terms,
+                    set_name,
+                    start_date=query.start_date,
+                    end_date=query.end_date,
+                )
+                for identifier, metadata in candidates:
+                    if len(papers) >= query.max_results:
+                        return papers
+                    if not self._record_matches_query(metadata, query):
+                        continue
+                    try:
+                        paper = self._convert_oai_record_to_paper(metadata, identifier)
+                    except Exception as e:
+                        self._logger.warning(
+                            f"Failed to convert record {identifier}: {e}"
+                        )
+                        continue
+                    if set_name and set_name.startswith("journal:"):
+                        paper.source_metadata.source_specific_data.update(
+                            {"journal": set_name.replace("journal:", "")}
+                        )
+                    papers.append(paper)
+            except Exception as e:
+                self._logger.error(f"Error searching harvested set {set_name}: {e}")
+                continue
+        return papers
+
+    def _list_records_factory(self):
+        """
+        ListRecords callable with its own client, for one harvest window.
+
+        Windows run on separate threads, and requests.Session is not
+        guaranteed thread-safe, so each gets its own session; the cache
+        and the rate limiter bucket are still shared.
+        """
+        session = self._create_session() if self._session is not None else None
+        sickle = self._create_sickle(session)
+
+        def list_records(**params):
+            try:
+                return sickle.ListRecords(ignore_deleted=False, **params)
+            except (NoRecordsMatch, BadArgument):
+                return []
+
+        return list_records
+
+    def _to_harvested_record(self, record) -> Optional[HarvestedRecord]:
+        """Prepare a Sickle record for the harvest store."""
+        header = record.header
+        if getattr(header, "deleted", False):
+            return HarvestedRecord(
+                identifier=header.identifier, datestamp=header.datestamp, deleted=True
+            )
+
+        metadata = record.metadata or {}
+        # Index the same fields _record_matches_query searches
+        text = " ".join(
+            " ".join(values) if isinstance(values, list) else str(values)
+            for values in (
+                metadata.get(field_name, [])
+                for field_name in ["title", "creator", "subject", "description"]
+            )
+        )
+        date_str = self._extract_first_value(metadata, "date", "")
+        return HarvestedRecord(
+            identifier=header.identifier,
+            datestamp=header.datestamp,
+            metadata=metadata,
+            text=text,
+            published=self._parse_date(date_str) if date_str else None,
+        )
+
     def find_by_doi(self, doi: str) -> Optional[ResearchPaper]:
         """
         Find paper by DOI using OAI-PMH identifier search.
@@ -225,7 +415,7 @@ class MDPIPaperRepository(PaperSourcePort):
         OAI-PMH GetRecord if the repository supports direct identifier lookup.
         """
         try:
-            sickle = Sickle(self._base_url)
+            sickle = self._create_sickle()
             
             # Search across configured journal sets
             sets_to_search = self._journal_sets if self._journal_sets else [None]
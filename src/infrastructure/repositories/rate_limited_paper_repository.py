@@ -0,0 +1,156 @@
+"""
+RateLimitedPaperRepository - Thread-safe throttling decorator for paper sources.
+
+When several search strategies run concurrently they share the same paper
+source. Without coordination each worker would issue requests as fast as it
+can and the source (arXiv in particular) would start rejecting or delaying
+our traffic. This decorator wraps any PaperRepositoryPort implementation and
+spaces out its remote calls according to the source's published limits.
+
+Educational Notes:
+- Demonstrates the Decorator Pattern: same interface, added behaviour
+- Shows how to share a scarce resource (request slots) between threads
+- Reads limits from get_rate_limit_info() so each source declares its own policy
+- Keeps the wrapped repository unaware of concurrency concerns
+
+Design Decisions:
+- Slot reservation happens under a lock, sleeping happens outside it
+- Only search methods are throttled; metadata helpers pass straight through
+- Clock and sleep functions are injectable for deterministic testing
+
+Use Cases:
+- Parallel batch processing against a single arXiv repository
+- Any multi-threaded caller that must honour a per-source request rate
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.application.ports.paper_repository_port import PaperRepositoryPort
+from src.domain.entities.research_paper import ResearchPaper
+from src.domain.value_objects.search_query import SearchQuery
+
+
+class RateLimitedPaperRepository(PaperRepositoryPort):
+    """
+    Decorator that enforces a minimum interval between remote repository calls.
+
+    Educational Note:
+    Each call reserves the next free time slot while holding a lock, then
+    sleeps until that slot arrives. Reserving before sleeping means N threads
+    waiting on the same source are released one interval apart rather than
+    all at once when the interval elapses.
+    """
+
+    THROTTLED_METHODS = frozenset({"find_by_query", "find_by_doi", "find_by_arxiv_id"})
+
+    def __init__(
+        self,
+        repository: PaperRepositoryPort,
+        requests_per_second: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Wrap a repository with request throttling.
+
+        Args:
+            repository: Repository whose remote calls should be rate limited
+            requests_per_second: Explicit rate; read from the repository's
+                get_rate_limit_info() when omitted
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        if requests_per_second is None:
+            requests_per_second = self._read_requests_per_second(repository)
+
+        self._repository = repository
+        self._min_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @property
+    def wrapped_repository(self) -> PaperRepositoryPort:
+        """Return the repository being throttled."""
+        return self._repository
+
+    @property
+    def min_interval(self) -> float:
+        """Return the enforced minimum number of seconds between calls."""
+        return self._min_interval
+
+    def wait_for_slot(self) -> float:
+        """
+        Block until the caller may issue its next request.
+
+        Returns:
+            Number of seconds the caller was delayed
+        """
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._min_interval
+
+        delay = slot - now
+        if delay > 0:
+            self._sleep(delay)
+        return max(delay, 0.0)
+
+    def find_by_query(self, query: SearchQuery) -> List[ResearchPaper]:
+        """Search the wrapped repository once a request slot is available."""
+        self.wait_for_slot()
+        return self._repository.find_by_query(query)
+
+    def find_by_doi(self, doi: str) -> Optional[ResearchPaper]:
+        """Look up a DOI in the wrapped repository once a slot is available."""
+        self.wait_for_slot()
+        return self._repository.find_by_doi(doi)
+
+    def save_paper(self, paper: ResearchPaper) -> None:
+        """Delegate persistence to the wrapped repository (not throttled)."""
+        self._repository.save_paper(paper)
+
+    def save_papers(self, papers: List[ResearchPaper]) -> None:
+        """Delegate bulk persistence to the wrapped repository (not throttled)."""
+        self._repository.save_papers(papers)
+
+    def count_all(self) -> int:
+        """Delegate counting to the wrapped repository (not throttled)."""
+        return self._repository.count_all()
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward source-specific helpers to the wrapped repository.
+
+        Educational Note:
+        __getattr__ is only consulted when normal lookup fails, so the
+        explicit port methods above always win. Extra search entry points
+        such as find_by_arxiv_id are throttled; everything else passes through.
+        """
+        if name.startswith("__") or name == "_repository":
+            raise AttributeError(name)
+        attribute = getattr(self._repository, name)
+        if name in self.THROTTLED_METHODS and callable(attribute):
+
+            def throttled(*args: Any, **kwargs: Any) -> Any:
+                self.wait_for_slot()
+                return attribute(*args, **kwargs)
+
+            return throttled
+        return attribute
+
+    @staticmethod
+    def _read_requests_per_second(repository: Any) -> Optional[float]:
+        """Read the advertised request rate from a PaperSourcePort, if any."""
+        get_info = getattr(repository, "get_rate_limit_info", None)
+        if not callable(get_info):
+            return None
+        try:
+            info: Dict[str, Any] = get_info()
+        except Exception:
+            return None
+        rate = info.get("requests_per_second") if isinstance(info, dict) else None
+        return float(rate) if rate else None
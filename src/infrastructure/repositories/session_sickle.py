@@ -0,0 +1,47 @@
+"""
+SessionSickle - Sickle OAI-PMH client that sends requests through a Session.
+
+Sickle issues its requests with module-level requests.get(), which bypasses
+any session a repository has configured. This subclass routes them through a
+supplied requests.Session instead, so the OAI-PMH repositories (PMC, MDPI)
+share User-Agent headers, connection pooling, the on-disk response cache and
+the shared rate limiter with the arXiv repository.
+
+Educational Notes:
+- Demonstrates extending a third-party client at its documented seam
+  (Sickle._request) instead of monkey-patching the requests module
+- Every page of a ListRecords harvest, including resumption-token pages,
+  goes through the session and can therefore be cached and replayed
+
+Design Decisions:
+- Repositories use SessionSickle when a response cache or a rate limiter is
+  configured, since both live on the session; otherwise they keep
+  constructing Sickle directly
+"""
+
+from typing import Any, Dict
+
+import requests
+from sickle import Sickle
+
+
+class SessionSickle(Sickle):
+    """Sickle client whose HTTP requests go through a requests.Session."""
+
+    def __init__(self, endpoint: str, session: requests.Session, **kwargs: Any):
+        """
+        Create an OAI-PMH client bound to a session.
+
+        Args:
+            endpoint: OAI-PMH base URL
+            session: Session used for every request (e.g. a CachingSession)
+            **kwargs: Passed through to Sickle
+        """
+        super().__init__(endpoint, **kwargs)
+        self.session = session
+
+    def _request(self, kwargs: Dict[str, Any]) -> requests.Response:
+        """Send one OAI-PMH request through the session."""
+        if self.http_method == "GET":
+            return self.session.get(self.endpoint, params=kwargs, **self.request_args)
+        return self.session.post(self.endpoint, data=kwargs, **self.request_args)
@@ -0,0 +1,275 @@
+"""
+Run Metrics - Per-stage timing and throughput for batch runs.
+
+Counting papers tells us *what* a batch run did but not *where the time
+went*. RunMetrics records one sample per unit of work (an arXiv query, a PDF
+download, one concept strategy on one paper...) with its wall time, item
+count and byte count, and summarizes each stage with latency percentiles and
+throughput. The summary is written as JSON for scripts and in the Prometheus
+text exposition format for dashboards.
+
+Educational Notes:
+- Demonstrates percentile-based latency reporting: p50 shows the typical
+  case, p95 the slow tail, max the worst outlier; averages hide all three
+- Shows a callback-based instrumentation seam: domain services accept a
+  plain `stage_timer(stage, seconds, items, nbytes)` callable, so they stay
+  independent of this infrastructure module
+- Illustrates merging samples recorded in worker processes back into the
+  parent, since process pools share no memory
+
+Design Decisions:
+- Raw durations are kept per stage so percentiles are exact; a batch run
+  produces thousands of samples at most, not millions
+- Nearest-rank percentiles: simple, deterministic and always an observed value
+- Thread-safe recording so concurrent strategies share one recorder
+
+Use Cases:
+- Explaining a slow nightly run (arXiv? PyPDF2? hierarchy building?)
+- Scraping batch performance into Prometheus via the textfile collector
+"""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+# One recorded unit of work: (stage, seconds, items, nbytes)
+StageSample = Tuple[str, float, int, int]
+
+
+class StageTiming:
+    """
+    Mutable handle yielded by RunMetrics.stage() to report counts.
+
+    Educational Note:
+    Item and byte counts are often only known once the work is done (how
+    many papers did the query return?), so the timed block fills them in.
+    """
+
+    def __init__(self, items: int = 1, nbytes: int = 0):
+        self.items = items
+        self.nbytes = nbytes
+
+
+class RunMetrics:
+    """
+    Thread-safe recorder of per-stage samples with summary reporting.
+
+    Educational Note:
+    `record` has the same signature as the stage_timer callbacks accepted by
+    ConceptExtractor and PyPDF2TextExtractor, so `metrics.record` can be
+    passed to them directly.
+    """
+
+    JSON_FILENAME = "run_metrics.json"
+    PROMETHEUS_FILENAME = "run_metrics.prom"
+    PERCENTILES = (0.5, 0.95)
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Create an empty recorder.
+
+        Args:
+            clock: Monotonic time source (injectable for testing)
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._samples: List[StageSample] = []
+        self.started_at = datetime.now(timezone.utc)
+
+    def record(
+        self, stage: str, seconds: float, items: int = 1, nbytes: int = 0
+    ) -> None:
+        """
+        Record one completed unit of work.
+
+        Args:
+            stage: Stage name, e.g. "pdf_download"
+            seconds: Wall time spent
+            items: Number of items processed (papers, pages, concepts...)
+            nbytes: Number of bytes processed
+        """
+        with self._lock:
+            self._samples.append((stage, float(seconds), int(items), int(nbytes)))
+
+    @contextmanager
+    def stage(
+        self, stage: str, items: int = 1, nbytes: int = 0
+    ) -> Iterator[StageTiming]:
+        """
+        Time a block of code as one sample of a stage.
+
+        The sample is recorded even if the block raises, so failures still
+        show up in the latency distribution.
+
+        Example:
+            with metrics.stage("search") as timing:
+                papers = use_case.execute_strategy(...)
+                timing.items = len(papers)
+        """
+        timing = StageTiming(items, nbytes)
+        start = self._clock()
+        try:
+            yield timing
+        finally:
+            self.record(stage, self._clock() - start, timing.items, timing.nbytes)
+
+    def samples(self) -> List[StageSample]:
+        """Return a copy of every recorded sample."""
+        with self._lock:
+            return list(self._samples)
+
+    def drain(self) -> List[StageSample]:
+        """Return and forget every recorded sample (for worker processes)."""
+        with self._lock:
+            samples, self._samples = self._samples, []
+            return samples
+
+    def merge(self, samples: List[StageSample]) -> None:
+        """Add samples recorded elsewhere, e.g. in a worker process."""
+        with self._lock:
+            self._samples.extend(tuple(sample) for sample in samples)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize every stage.
+
+        Returns:
+            Mapping of stage name to count, total seconds, one
+            p<percentile>_seconds entry per PERCENTILES fraction, max seconds,
+            items, bytes and throughput (items and bytes per second)
+        """
+        by_stage: Dict[str, List[StageSample]] = {}
+        for sample in self.samples():
+            by_stage.setdefault(sample[0], []).append(sample)
+
+        summary = {}
+        for stage in sorted(by_stage):
+            stage_samples = by_stage[stage]
+            durations = sorted(sample[1] for sample in stage_samples)
+            total_seconds = sum(durations)
+            items = sum(sample[2] for sample in stage_samples)
+            nbytes = sum(sample[3] for sample in stage_samples)
+            percentiles = {
+                self._percentile_key(fraction): self._percentile(durations, fraction)
+                for fraction in self.PERCENTILES
+            }
+            summary[stage] = {
+                "count": len(durations),
+                "total_seconds": total_seconds,
+                **percentiles,
+                "max_seconds": durations[-1],
+                "items": items,
+                "bytes": nbytes,
+                "items_per_second": items / total_seconds if total_seconds else 0.0,
+                "bytes_per_second": nbytes / total_seconds if total_seconds else 0.0,
+            }
+        return summary
+
+    def to_report(self) -> Dict[str, Any]:
+        """Build the JSON-serializable run report."""
+        finished_at = datetime.now(timezone.utc)
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "wall_seconds": (finished_at - self.started_at).total_seconds(),
+            "stages": self.summary(),
+        }
+
+    def to_prometheus(self, prefix: str = "batch") -> str:
+        """
+        Render the summary in the Prometheus text exposition format.
+
+        Educational Note:
+        Latencies are exposed as a Prometheus *summary* (quantiles plus
+        _sum and _count); items and bytes as counters; max as a gauge.
+        """
+        summary = self.summary()
+        duration = f"{prefix}_stage_duration_seconds"
+        lines = [
+            f"# HELP {duration} Wall time per unit of work in a batch stage",
+            f"# TYPE {duration} summary",
+        ]
+        for stage, stats in summary.items():
+            label = self._label(stage)
+            for fraction in self.PERCENTILES:
+                lines.append(
+                    f'{duration}{{stage="{label}",quantile="{fraction:g}"}} '
+                    f"{stats[self._percentile_key(fraction)]:.6f}"
+                )
+            lines.append(
+                f'{duration}_sum{{stage="{label}"}} {stats["total_seconds"]:.6f}'
+            )
+            lines.append(f'{duration}_count{{stage="{label}"}} {stats["count"]}')
+
+        for metric, key, kind, help_text in (
+            (
+                "stage_duration_max_seconds",
+                "max_seconds",
+                "gauge",
+                "Slowest unit of work",
+            ),
+            ("stage_items_total", "items", "counter", "Items processed"),
+            ("stage_bytes_total", "bytes", "counter", "Bytes processed"),
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {help_text} per batch stage")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for stage, stats in summary.items():
+                value = stats[key]
+                formatted = f"{value:.6f}" if isinstance(value, float) else str(value)
+                lines.append(
+                    f'{prefix}_{metric}{{stage="{self._label(stage)}"}} {formatted}'
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, output_dir: Path) -> Tuple[Path, Path]:
+        """
+        Write the JSON and Prometheus reports.
+
+        Each file is written to a temporary sibling and renamed into place,
+        so a scraper or script never reads a half-written report.
+
+        Args:
+            output_dir: Directory receiving run_metrics.json and run_metrics.prom
+
+        Returns:
+            Paths of the JSON and Prometheus files
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        json_path = output_dir / self.JSON_FILENAME
+        prometheus_path = output_dir / self.PROMETHEUS_FILENAME
+
+        self._write_atomically(json_path, json.dumps(self.to_report(), indent=2))
+        self._write_atomically(prometheus_path, self.to_prometheus())
+
+        return json_path, prometheus_path
+
+    @staticmethod
+    def _write_atomically(path: Path, content: str) -> None:
+        """Write content to a temporary file, then rename it over path."""
+        temp_path = path.with_name(f"{path.name}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        temp_path.replace(path)
+
+    @staticmethod
+    def _percentile_key(fraction: float) -> str:
+        """Summary key of a percentile, e.g. 0.95 -> "p95_seconds"."""
+        return f"p{fraction * 100:g}_seconds"
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], fraction: float) -> float:
+        """Nearest-rank percentile of an already sorted, non-empty list."""
+        rank = max(1, math.ceil(fraction * len(sorted_values)))
+        return sorted_values[rank - 1]
+
+    @staticmethod
+    def _label(value: str) -> str:
+        """Escape a Prometheus label value."""
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,336 @@
+"""
+Shared Rate Limiter - Token buckets shared by every process on a host.
+
+Each paper source publishes its limits through get_rate_limit_info(), and
+RateLimitedPaperRepository honours them, but only inside one process. Run
+two batch workers and each one spends the whole budget on its own, so arXiv
+sees twice the allowed rate, starts throttling, and both workers end up
+slower than one. This limiter keeps one token bucket per source in a small
+file under a host-wide directory and updates it under an exclusive file
+lock, so every thread of every process draws from the same bucket.
+
+Educational Notes:
+- Demonstrates the token-bucket algorithm: tokens refill at the allowed
+  rate up to a burst capacity, and each request takes one. Short bursts go
+  out immediately; sustained traffic settles at exactly the allowed rate
+- Shows cross-process coordination with advisory file locks (flock): the
+  critical section is a read-modify-write of a few bytes, so the lock is
+  held for microseconds
+- Illustrates limiting at the transport layer: RateLimitedAdapter is mounted
+  on a requests.Session, so every request is counted, including Sickle's
+  resumption-token pages, while responses served by CachingSession from
+  disk never reach the adapter and cost nothing
+
+Design Decisions:
+- Reservation before sleeping: a caller takes its token even if the bucket
+  is empty (the balance goes negative) and then sleeps outside the lock
+  until the token exists, so waiting callers are released one interval
+  apart, as in RateLimitedPaperRepository
+- Wall-clock time (time.time) rather than a monotonic clock, because the
+  bucket timestamp is compared across processes
+- Keys without a configured rate are not limited
+- Without fcntl (Windows) the buckets are still shared by the threads of a
+  process, but not across processes
+- The bucket directory is private to the user (XDG_RUNTIME_DIR, or a
+  per-user directory in the temp dir) with mode 0700, and bucket files are
+  opened 0600 without following symlinks, so another local user can
+  neither read nor redirect them
+
+Use Cases:
+- Several batch processors running against arXiv on one machine
+- Limiting PDF downloads by the host they are served from
+"""
+
+import json
+import os
+import re
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+def site_of(url_or_host: str) -> str:
+    """
+    Return the site a URL or host name belongs to (its last two labels).
+
+    Example:
+        site_of("http://export.arxiv.org/api/query") == "arxiv.org"
+    """
+    host = urlsplit(url_or_host).hostname if "//" in url_or_host else url_or_host
+    labels = (host or "").lower().rstrip(".").split(".")
+    return ".".join(labels[-2:])
+
+
+def rate_limit_from_info(info: Dict[str, Any]) -> Tuple[Optional[float], int]:
+    """
+    Read (requests_per_second, burst) from a get_rate_limit_info() result.
+
+    Sources name the burst size differently ("burst_allowance" for arXiv,
+    "burst_limit" for the OAI-PMH sources); a missing burst means 1.
+    """
+    rate = info.get("requests_per_second")
+    burst = info.get("burst_allowance") or info.get("burst_limit") or 1
+    return (float(rate) if rate else None), max(1, int(burst))
+
+
+class SharedRateLimiter:
+    """
+    Per-source token buckets stored in a per-user directory on the host.
+
+    Educational Note:
+    Rates are configured per process (usually by the repositories, from
+    their own get_rate_limit_info()); only the bucket balance lives on disk.
+    Processes configured with the same rate for a key therefore share one
+    budget.
+    """
+
+    DIRNAME = "academic-paper-discovery-rate-limits"
+
+    def __init__(
+        self,
+        state_dir: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Create a limiter over a bucket directory.
+
+        Args:
+            state_dir: Directory holding the bucket files; defaults to a
+                per-user directory shared by all of the user's processes
+            clock: Wall-clock time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.state_dir = Path(state_dir or self.default_state_dir())
+        self._clock = clock
+        self._sleep = sleep
+        self._rates: Dict[str, Tuple[float, int]] = {}
+        self._sites: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    @classmethod
+    def default_state_dir(cls) -> Path:
+        """
+        Return the user's bucket directory.
+
+        XDG_RUNTIME_DIR is already private to the user; otherwise the
+        directory lives in the system temp dir under a name carrying the
+        user id.
+        """
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir:
+            return Path(runtime_dir) / cls.DIRNAME
+        getuid = getattr(os, "getuid", None)
+        suffix = f"-{getuid()}" if getuid else ""
+        return Path(tempfile.gettempdir()) / f"{cls.DIRNAME}{suffix}"
+
+    def configure(
+        self,
+        key: str,
+        requests_per_second: float,
+        burst: int = 1,
+        urls: Tuple[str, ...] = (),
+    ) -> None:
+        """
+        Set the rate of a bucket.
+
+        Args:
+            key: Bucket name, normally the source name (e.g. "ArXiv")
+            requests_per_second: Sustained request rate
+            burst: Bucket capacity, i.e. requests allowed back to back
+            urls: URLs whose site should also draw from this bucket (see
+                acquire_for_url), e.g. the source's API endpoint
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        with self._lock:
+            self._rates[key] = (float(requests_per_second), max(1, int(burst)))
+            for url in urls:
+                self._sites[site_of(url)] = key
+
+    def configure_from_source(self, source: Any, *urls: str) -> Optional[str]:
+        """
+        Configure a bucket from a PaperSourcePort's get_rate_limit_info().
+
+        Args:
+            source: Repository exposing get_source_name() and
+                get_rate_limit_info()
+            *urls: URLs whose site belongs to the source
+
+        Returns:
+            The bucket key, or None if the source advertises no rate
+        """
+        key = source.get_source_name()
+        rate, burst = rate_limit_from_info(source.get_rate_limit_info() or {})
+        if rate is None:
+            return None
+        self.configure(key, rate, burst, urls)
+        return key
+
+    def rate_for(self, key: str) -> Optional[Tuple[float, int]]:
+        """Return the (requests_per_second, burst) configured for a key."""
+        return self._rates.get(key)
+
+    def key_for_url(self, url: str) -> Optional[str]:
+        """Return the bucket whose site serves a URL, if any."""
+        return self._sites.get(site_of(url))
+
+    def acquire(self, key: str) -> float:
+        """
+        Take one token from a bucket, waiting until it is available.
+
+        Args:
+            key: Bucket name; unconfigured keys return immediately
+
+        Returns:
+            Number of seconds the caller was delayed
+        """
+        rate = self._rates.get(key)
+        if rate is None:
+            return 0.0
+        requests_per_second, burst = rate
+
+        with self._key_lock(key):
+            with self._locked_state(key) as state:
+                now = self._clock()
+                elapsed = max(0.0, now - state.get("updated", now))
+                tokens = min(
+                    float(burst),
+                    state.get("tokens", float(burst)) + elapsed * requests_per_second,
+                )
+                tokens -= 1.0
+                state["tokens"] = tokens
+                state["updated"] = now
+
+        delay = -tokens / requests_per_second if tokens < 0 else 0.0
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def acquire_for_url(self, url: str) -> float:
+        """Take a token from the bucket of the site serving a URL."""
+        key = self.key_for_url(url)
+        return self.acquire(key) if key else 0.0
+
+    def attach(self, session: requests.Session, key: str) -> requests.Session:
+        """
+        Route every request a session sends through a bucket.
+
+        Returns:
+            The same session, for chaining
+        """
+        adapter = RateLimitedAdapter(self, key)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Serialize this process's threads before they contend for the file."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _bucket_path(self, key: str) -> Path:
+        """File holding a bucket's balance."""
+        return self.state_dir / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.bucket"
+
+    def _locked_state(self, key: str) -> "_LockedBucketFile":
+        """Open a bucket file under an exclusive lock."""
+        self._ensure_private_dir()
+        return _LockedBucketFile(self._bucket_path(key))
+
+    def _ensure_private_dir(self) -> None:
+        """
+        Create the bucket directory (mode 0700) and check it is ours.
+
+        Raises:
+            PermissionError: If the path is a symlink, not a directory, or
+                owned by another user
+        """
+        self.state_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        info = os.lstat(self.state_dir)
+        if not stat.S_ISDIR(info.st_mode):
+            raise PermissionError(
+                f"Rate limit dir is not a directory: {self.state_dir}"
+            )
+        getuid = getattr(os, "getuid", None)
+        if getuid is None:
+            return
+        if info.st_uid != getuid():
+            raise PermissionError(
+                f"Rate limit dir is owned by another user: {self.state_dir}"
+            )
+        if stat.S_IMODE(info.st_mode) & 0o077:
+            os.chmod(self.state_dir, 0o700)
+
+
+class _LockedBucketFile:
+    """
+    Context manager giving read-modify-write access to a bucket file.
+
+    The state dict is loaded on entry and written back on exit, all while
+    an exclusive flock is held on the file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._state: Dict[str, float] = {}
+
+    def __enter__(self) -> Dict[str, float]:
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        self._fd = os.open(str(self.path), flags, 0o600)
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        raw = os.read(self._fd, 4096)
+        try:
+            self._state = json.loads(raw) if raw else {}
+        except ValueError:
+            # A torn or foreign file only costs the bucket its history
+            self._state = {}
+        return self._state
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                data = json.dumps(self._state).encode("utf-8")
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.ftruncate(self._fd, 0)
+                os.write(self._fd, data)
+        finally:
+            # Closing the descriptor also releases the flock
+            os.close(self._fd)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter that takes a token before sending each request.
+
+    Educational Note:
+    requests hands every outgoing request to the adapter mounted for its URL
+    prefix, so this is the one place all of a session's traffic passes,
+    whether it comes from the repository itself or from a client library
+    such as Sickle using the session.
+    """
+
+    def __init__(self, limiter: SharedRateLimiter, key: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.key = key
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any):
+        """Wait for a token, then send the request."""
+        self.limiter.acquire(self.key)
+        return super().send(request, **kwargs)
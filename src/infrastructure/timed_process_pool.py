@@ -0,0 +1,367 @@
+"""
+Timed Process Pool - A concurrent.futures executor with per-task deadlines.
+
+The batch processor extracts concepts in a shared process pool. A
+ProcessPoolExecutor has no per-task timeout: a pathological PDF (a cyclic
+object graph, a page with millions of operators) keeps its worker busy
+forever, the pipeline waits on that future forever, and the run never
+ends. This executor gives every task a wall-clock budget, terminates the
+one worker that exceeded it, fails that task's future with TimeoutError
+and starts a fresh worker in its place, while the other tasks carry on.
+
+Educational Notes:
+- Uses the worker-per-pipe design of BatchPdfExtractor behind the standard
+  Executor interface, so DownloadExtractPipeline and as_completed() work
+  with it unchanged
+- A supervisor thread owns every worker: it hands out queued tasks, waits
+  on the worker pipes (and a wake-up pipe for new submissions) with a
+  timeout equal to the nearest deadline, and settles futures
+- Demonstrates why a stuck computation needs a process, not a thread: only
+  a process can be stopped from outside
+
+Design Decisions:
+- One task per worker at a time, so a deadline measures the task itself,
+  never time spent queued behind other tasks; a new worker's clock is
+  restarted once it reports ready, so process start-up is not charged to
+  its first task
+- Workers are recycled after max_tasks_per_worker tasks, bounding the
+  memory long-lived PDF parsers accumulate
+- A worker that dies fails only its current task (with BrokenProcessPool);
+  unlike ProcessPoolExecutor the pool itself stays usable
+- The "forkserver" start method is preferred: forking a multi-threaded
+  parent could copy locks held by other threads into the child
+
+Use Cases:
+- Concept extraction over PDFs of unknown quality in batch runs
+- Any CPU-bound task that may hang on hostile input
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sent by a worker once it has started, before its first result
+_READY = "ready"
+
+_Task = Tuple[Future, Callable[..., Any], tuple, dict]
+
+
+def _task_worker(connection: Connection) -> None:
+    """
+    Worker process loop: run each task sent over the pipe.
+
+    Announces itself with _READY, then receives (fn, args, kwargs) until it
+    gets None and answers each with (succeeded, result or exception).
+    """
+    try:
+        connection.send(_READY)
+        while True:
+            task = connection.recv()
+            if task is None:
+                break
+            fn, args, kwargs = task
+            try:
+                outcome = (True, fn(*args, **kwargs))
+            except Exception as e:
+                outcome = (False, e)
+            try:
+                connection.send(outcome)
+            except Exception as e:
+                # The result (or the exception) could not be pickled
+                connection.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        connection.close()
+
+
+class _Worker:
+    """Parent-side handle of one worker process and its current task."""
+
+    def __init__(self, process: multiprocessing.Process, connection: Connection):
+        self.process = process
+        self.connection = connection
+        self.completed = 0
+        self.future: Optional[Future] = None
+        self.started = 0.0
+
+    def stop(self, graceful: bool = True) -> None:
+        """End the process, asking politely first unless it is stuck."""
+        if graceful and self.process.is_alive():
+            try:
+                self.connection.send(None)
+                self.process.join(1.0)
+            except (BrokenPipeError, OSError):
+                pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class TimedProcessPoolExecutor(Executor):
+    """
+    Process pool whose tasks fail with TimeoutError instead of hanging.
+
+    Educational Note:
+    Submitted callables and their arguments must be picklable, exactly as
+    with ProcessPoolExecutor.
+
+    Example:
+        with TimedProcessPoolExecutor(max_workers=4, timeout=120) as pool:
+            future = pool.submit(extract, pdf_path)
+    """
+
+    DEFAULT_TIMEOUT_SECONDS = 120.0
+    DEFAULT_MAX_TASKS_PER_WORKER = 50
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        """
+        Configure the pool; workers start on the first submission.
+
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            timeout: Wall-clock seconds one task may run before its worker
+                is terminated
+            max_tasks_per_worker: Tasks a worker runs before it is replaced
+            mp_context: multiprocessing context (default: forkserver where
+                available, otherwise spawn)
+
+        Raises:
+            ValueError: If timeout or max_tasks_per_worker is not positive
+        """
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if max_tasks_per_worker < 1:
+            raise ValueError("max_tasks_per_worker must be at least 1")
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        if mp_context is None:
+            method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            mp_context = multiprocessing.get_context(method)
+        self.mp_context = mp_context
+        self.workers_started = 0
+
+        self._tasks: Deque[_Task] = deque()
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._supervisor: Optional[threading.Thread] = None
+        # At most one wake-up is ever unread, so the pipe cannot fill up
+        self._wakeup_pending = False
+        self._wakeup_reader, self._wakeup_writer = mp_context.Pipe(duplex=False)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Schedule fn(*args, **kwargs) and return its Future."""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._tasks.append((future, fn, args, kwargs))
+            if self._supervisor is None:
+                self._supervisor = threading.Thread(
+                    target=self._supervise, name="timed-process-pool", daemon=True
+                )
+                self._supervisor.start()
+            self._wake()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """
+        Stop accepting tasks; queued tasks still run unless cancelled.
+
+        Args:
+            wait: Block until every task has finished and workers exited
+            cancel_futures: Cancel tasks that have not started yet
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while self._tasks:
+                    self._tasks.popleft()[0].cancel()
+            supervisor = self._supervisor
+            if supervisor is not None:
+                self._wake()
+        if supervisor is None:
+            self._close_wakeup_pipe()
+        elif wait:
+            supervisor.join()
+
+    def _wake(self) -> None:
+        """Interrupt the supervisor's wait (call with the lock held)."""
+        if self._wakeup_pending:
+            return
+        try:
+            self._wakeup_writer.send(None)
+            self._wakeup_pending = True
+        except OSError:
+            pass
+
+    def _close_wakeup_pipe(self) -> None:
+        self._wakeup_reader.close()
+        self._wakeup_writer.close()
+
+    def _next_task(self) -> Optional[_Task]:
+        """Take the next queued task that has not been cancelled."""
+        with self._lock:
+            while self._tasks:
+                task = self._tasks.popleft()
+                if task[0].set_running_or_notify_cancel():
+                    return task
+            return None
+
+    def _supervise(self) -> None:
+        """Supervisor thread: run queued tasks until shut down and drained."""
+        idle: List[_Worker] = []
+        busy: Dict[Connection, _Worker] = {}
+        try:
+            while True:
+                # Hand out work while there is both work and capacity
+                while len(busy) < self.max_workers:
+                    task = self._next_task()
+                    if task is None:
+                        break
+                    worker = self._assign(idle, task)
+                    if worker is not None:
+                        busy[worker.connection] = worker
+
+                with self._lock:
+                    finished = self._shutdown and not self._tasks
+                if finished and not busy:
+                    return
+
+                timeout = None
+                if busy:
+                    next_deadline = min(w.started for w in busy.values()) + self.timeout
+                    timeout = max(0.0, next_deadline - time.monotonic())
+                ready = wait([self._wakeup_reader, *busy], timeout=timeout)
+
+                for connection in ready:
+                    if connection is self._wakeup_reader:
+                        with self._lock:
+                            self._wakeup_reader.recv()
+                            self._wakeup_pending = False
+                        continue
+                    self._receive(busy, idle, busy[connection])
+
+                now = time.monotonic()
+                for connection, worker in list(busy.items()):
+                    if now - worker.started >= self.timeout:
+                        del busy[connection]
+                        worker.stop(graceful=False)
+                        logger.warning(
+                            f"Task exceeded {self.timeout:g}s; worker terminated"
+                        )
+                        worker.future.set_exception(
+                            TimeoutError(f"Timed out after {self.timeout:g}s")
+                        )
+        finally:
+            for worker in busy.values():
+                worker.stop(graceful=False)
+                if not worker.future.done():
+                    worker.future.set_exception(BrokenProcessPool("Pool stopped"))
+            for worker in idle:
+                worker.stop()
+            self._close_wakeup_pipe()
+
+    def _receive(
+        self, busy: Dict[Connection, _Worker], idle: List[_Worker], worker: _Worker
+    ) -> None:
+        """Handle one message from a busy worker."""
+        try:
+            message = worker.connection.recv()
+        except (EOFError, OSError):
+            message = None
+        except Exception as e:
+            # The result arrived but could not be unpickled
+            message = (False, RuntimeError(f"Unreadable task result: {e}"))
+        if message == _READY:
+            worker.started = time.monotonic()
+            return
+
+        del busy[worker.connection]
+        future, worker.future = worker.future, None
+        if message is None:
+            # The worker died mid-task (crash or OOM kill)
+            worker.process.join(1.0)
+            code = worker.process.exitcode
+            worker.stop(graceful=False)
+            future.set_exception(
+                BrokenProcessPool(f"Worker process died (exit code {code})")
+            )
+            return
+
+        succeeded, value = message
+        if succeeded:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+        worker.completed += 1
+        if worker.completed >= self.max_tasks_per_worker:
+            worker.stop()
+        else:
+            idle.append(worker)
+
+    def _assign(self, idle: List[_Worker], task: _Task) -> Optional[_Worker]:
+        """
+        Send one task to an idle or new worker and start its clock.
+
+        An idle worker whose pipe turns out to be broken is replaced. A task
+        that cannot be pickled fails its future and is not assigned.
+
+        Returns:
+            The worker now running the task, or None if the task failed
+        """
+        future, fn, args, kwargs = task
+        worker = idle.pop() if idle else None
+        for _ in range(2):
+            if worker is None:
+                worker = self._start_worker()
+            try:
+                worker.connection.send((fn, args, kwargs))
+            except OSError:
+                worker.stop(graceful=False)
+                worker = None
+                continue
+            except Exception as e:
+                idle.append(worker)
+                future.set_exception(e)
+                return None
+            worker.future = future
+            worker.started = time.monotonic()
+            return worker
+        future.set_exception(BrokenProcessPool("Could not start a worker process"))
+        return None
+
+    def _start_worker(self) -> _Worker:
+        """Start a worker process connected by a fresh pipe."""
+        parent_end, child_end = self.mp_context.Pipe()
+        process = self.mp_context.Process(
+            target=_task_worker, args=(child_end,), daemon=True
+        )
+        process.start()
+        child_end.close()
+        self.workers_started += 1
+        return _Worker(process, parent_end)
@@ -83,7 +83,7 @@ class TestArxivRepositoryExternalIntegration:
         mock_get.return_value = mock_response
 
         # Create repository and search query
-        repository = ArxivPaperRepository()
+        repository = ArxivPaperRepository(feed_parser="feedparser")
         query = SearchQuery(terms=["cybersecurity", "deep learning"], max_results=10)
 
         # Act: Execute search
@@ -200,7 +200,7 @@ class TestArxivRepositoryExternalIntegration:
                 ]
             )
 
-            repository = ArxivPaperRepository()
+            repository = ArxivPaperRepository(feed_parser="feedparser")
 
             # Act: Find by specific arXiv ID
             paper = repository.find_by_arxiv_id("2306.12345")
@@ -430,7 +430,7 @@ class TestNetworkResilienceIntegration:
                 ]
             )
 
-            repository = ArxivPaperRepository()
+            repository = ArxivPaperRepository(feed_parser="feedparser")
             query = SearchQuery(terms=["test"], max_results=10)
 
             # Act: Process malformed response
@@ -0,0 +1,272 @@
+"""
+Tests for chunked concept extraction in the ConceptExtractor domain service.
+
+Educational Notes:
+- Streaming must not change results: extracting from chunks is compared
+  with extracting from the joined text, including n-grams that straddle
+  a chunk boundary
+- Errors of the chunk source (an unreadable PDF) must surface, not be
+  mistaken for a failing strategy
+"""
+
+from collections import Counter
+
+import pytest
+
+from src.domain.services.concept_extractor import (
+    ConceptExtractionStrategy,
+    ConceptExtractor,
+    TFIDFConceptExtractor,
+    _InternedNgramCounter,
+)
+from src.domain.value_objects.document_frequencies import (
+    DocumentFrequencies,
+    DocumentFrequencySource,
+)
+
+TEXT = (
+    "Heart rate variability reflects autonomic nervous function. "
+    "Reduced heart rate variability predicts cardiac events. "
+    "Wearable sensors record heart rate variability continuously. "
+) * 3
+
+
+def split_mid_phrase(text):
+    """Split text into chunks whose boundaries fall inside phrases."""
+    words = text.split()
+    return [" ".join(words[i : i + 7]) for i in range(0, len(words), 7)]
+
+
+class FixedFrequencies(DocumentFrequencySource):
+    """Document frequencies of a fixed corpus, recording each lookup."""
+
+    def __init__(self, document_count, frequencies):
+        self.corpus = DocumentFrequencies(document_count, frequencies)
+        self.lookups = []
+
+    def lookup(self, domain, terms):
+        self.lookups.append((domain, list(terms)))
+        return self.corpus
+
+
+class JoiningStrategy(ConceptExtractionStrategy):
+    """Strategy relying on the default chunk handling."""
+
+    def __init__(self):
+        self.texts = []
+
+    def extract_concepts(self, text, paper_doi, domain=None):
+        self.texts.append(text)
+        return []
+
+    def get_strategy_name(self):
+        return "joining"
+
+
+class TestChunkedConceptExtraction:
+    """Chunks give the same concepts as the whole text."""
+
+    def test_tfidf_counts_ngrams_across_chunk_boundaries(self):
+        strategy = TFIDFConceptExtractor()
+
+        whole = strategy.extract_concepts(TEXT, "10.1000/hrv")
+        streamed = strategy.extract_concepts_from_chunks(
+            iter(split_mid_phrase(TEXT)), "10.1000/hrv"
+        )
+
+        assert [(c.text, c.frequency, c.relevance_score) for c in streamed] == [
+            (c.text, c.frequency, c.relevance_score) for c in whole
+        ]
+        frequencies = {c.text: c.frequency for c in streamed}
+        assert frequencies["heart rate variability"] == 9
+
+    def test_default_strategy_joins_chunks(self):
+        strategy = JoiningStrategy()
+
+        strategy.extract_concepts_from_chunks(["first page", "second page"], "10.1/x")
+
+        assert strategy.texts == ["first page second page"]
+
+    def test_several_strategies_each_see_every_chunk(self):
+        first, second = JoiningStrategy(), JoiningStrategy()
+        extractor = ConceptExtractor(strategies=[first, second])
+
+        extractor.extract_concepts_from_chunks(
+            (chunk for chunk in ["a b", "c d"]), "10.1/x", "Title"
+        )
+
+        assert first.texts == second.texts == ["a b c d"]
+
+    def test_matches_extraction_from_the_whole_paper(self):
+        extractor = ConceptExtractor()
+
+        whole = extractor.extract_concepts_from_paper(TEXT, "10.1000/hrv", "HRV")
+        streamed = extractor.extract_concepts_from_chunks(
+            split_mid_phrase(TEXT), "10.1000/hrv", "HRV"
+        )
+
+        assert [c.text for c in streamed.concepts] == [c.text for c in whole.concepts]
+
+    def test_blank_chunks_are_rejected(self):
+        with pytest.raises(ValueError, match="text cannot be empty"):
+            ConceptExtractor().extract_concepts_from_chunks(
+                ["", "  "], "10.1/x", "Title"
+            )
+
+    def test_chunk_source_errors_propagate(self):
+        def pages():
+            yield TEXT
+            raise ValueError("PDF format error in paper.pdf")
+
+        with pytest.raises(ValueError, match="PDF format error"):
+            ConceptExtractor().extract_concepts_from_chunks(pages(), "10.1/x", "Title")
+
+
+class TestBatchedScoring:
+    """All terms of a document are scored in one vectorized pass."""
+
+    def test_scores_follow_the_relevance_formula(self):
+        strategy = TFIDFConceptExtractor()
+
+        scores = strategy._score_terms(
+            ["variability", "hrv-index", "prediction model", "heart rate model"],
+            [2, 3, 4, 500],
+            1000,
+        )
+
+        assert scores.tolist() == pytest.approx([0.3, 0.5, 0.75, 1.0])
+
+    def test_single_term_scoring_matches_the_batch(self):
+        strategy = TFIDFConceptExtractor()
+        text = " ".join(["word"] * 200)
+
+        assert strategy._calculate_relevance_score(
+            "analysis framework", 3, text
+        ) == pytest.approx(strategy._score_terms(["analysis framework"], [3], 200)[0])
+
+    def test_only_top_concepts_are_returned_in_score_order(self):
+        strategy = TFIDFConceptExtractor(top_n_concepts=3)
+
+        concepts = strategy.extract_concepts(TEXT, "10.1000/hrv")
+
+        assert len(concepts) == 3
+        scores = [c.relevance_score for c in concepts]
+        assert scores == sorted(scores, reverse=True)
+        assert all(isinstance(score, float) for score in scores)
+
+
+def reference_candidate_counts(words, min_length, max_length, stopwords):
+    """Count unigram, bigram and trigram candidates as plain strings."""
+    counts = Counter()
+    for n in (1, 2, 3):
+        for start in range(len(words) - n + 1):
+            gram = words[start : start + n]
+            term = " ".join(gram)
+            if min_length <= len(term) <= max_length and not any(
+                word in stopwords for word in gram
+            ):
+                counts[term] += 1
+    return counts
+
+
+class TestInternedCandidateCounting:
+    """Integer-id n-gram counting agrees with counting candidate strings."""
+
+    def counter(self, strategy):
+        return _InternedNgramCounter(
+            strategy.min_term_length,
+            strategy.max_term_length,
+            strategy.research_stopwords,
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+    def test_counts_match_the_string_candidates(self, chunk_size):
+        strategy = TFIDFConceptExtractor()
+        words = strategy._preprocess_text(TEXT + "of the ab x-ray 3d").split()
+        counter = self.counter(strategy)
+
+        for start in range(0, len(words), chunk_size):
+            counter.add(words[start : start + chunk_size])
+        terms, counts = counter.frequent_terms(1)
+
+        assert dict(zip(terms, counts)) == reference_candidate_counts(
+            words,
+            strategy.min_term_length,
+            strategy.max_term_length,
+            strategy.research_stopwords,
+        )
+
+    def test_only_frequent_terms_are_materialized(self):
+        strategy = TFIDFConceptExtractor()
+        counter = self.counter(strategy)
+
+        counter.add("wearable sensors record wearable sensors".split())
+        terms, counts = counter.frequent_terms(2)
+
+        assert sorted(zip(terms, counts)) == [
+            ("sensors", 2),
+            ("wearable", 2),
+            ("wearable sensors", 2),
+        ]
+
+    def test_empty_text_has_no_terms(self):
+        counter = self.counter(TFIDFConceptExtractor())
+
+        counter.add([])
+
+        assert counter.frequent_terms(1) == ([], [])
+
+
+class TestDocumentFrequencyWeighting:
+    """Stored document frequencies turn the simplified score into TF-IDF."""
+
+    def test_terms_common_in_the_domain_are_demoted(self):
+        source = FixedFrequencies(100, {"heart rate variability": 100})
+        plain = TFIDFConceptExtractor(top_n_concepts=500)
+        weighted = TFIDFConceptExtractor(
+            top_n_concepts=500, document_frequencies=source
+        )
+
+        before = {c.text: c.relevance_score for c in plain.extract_concepts(TEXT, "x")}
+        after = {
+            c.text: c.relevance_score
+            for c in weighted.extract_concepts(TEXT, "x", domain="hrv")
+        }
+
+        corpus = source.corpus
+        assert after["heart rate variability"] == pytest.approx(
+            before["heart rate variability"]
+            * corpus.idf("heart rate variability")
+            / corpus.max_idf()
+        )
+        assert after["wearable sensors"] == pytest.approx(before["wearable sensors"])
+        assert source.lookups[0][0] == "hrv"
+
+    def test_without_a_domain_or_corpus_scores_are_unchanged(self):
+        plain = TFIDFConceptExtractor().extract_concepts(TEXT, "x", domain="hrv")
+        empty = FixedFrequencies(0, {})
+
+        for strategy, domain in [
+            (TFIDFConceptExtractor(document_frequencies=empty), "hrv"),
+            (TFIDFConceptExtractor(document_frequencies=FixedFrequencies(5, {})), None),
+        ]:
+            concepts = strategy.extract_concepts(TEXT, "x", domain=domain)
+            assert [(c.text, c.relevance_score) for c in concepts] == [
+                (c.text, c.relevance_score) for c in plain
+            ]
+
+    def test_scored_terms_are_recorded_before_scoring(self):
+        source = FixedFrequencies(5, {})
+        calls = []
+        source.add_document = lambda domain, doc_id, terms: calls.append(
+            (domain, doc_id, set(terms), len(source.lookups))
+        )
+        strategy = TFIDFConceptExtractor(top_n_concepts=1, document_frequencies=source)
+
+        concepts = strategy.extract_concepts(TEXT + " polysomnography", "x", "hrv")
+
+        [(domain, doc_id, terms, lookups_before)] = calls
+        assert (domain, doc_id, lookups_before) == ("hrv", "x", 0)
+        assert "wearable sensors" in terms
+        assert "polysomnography" not in terms
+        assert {c.text for c in concepts} < terms
@@ -24,6 +24,7 @@ import numpy as np
 
 from src.domain.entities.concept import Concept
 from src.domain.value_objects.embedding_vector import EmbeddingVector
+from src.domain.value_objects.document_frequencies import DocumentFrequencies
 from src.domain.services.multi_strategy_concept_extractor import (
     ConceptExtractionStrategy,
     RuleBasedExtractionStrategy,
@@ -228,6 +229,62 @@ class TestStatisticalExtractionStrategy:
             assert concept.relevance_score > 0
             assert concept.extraction_method == "tfidf"
 
+    def test_single_document_tfidf_uses_stored_document_frequencies(self):
+        """Test true TF-IDF for one paper against its domain's corpus."""
+        source = Mock()
+        source.lookup.return_value = DocumentFrequencies(
+            10, {"heart": 10, "variability": 10}
+        )
+        strategy = StatisticalExtractionStrategy(document_frequencies=source)
+        text = "heart heart heart variability variability wearable wearable"
+
+        concepts = strategy.extract_tfidf_concepts([text], domain="hrv")
+
+        # The rarer term outranks the more frequent but ubiquitous one
+        assert [concept.text for concept in concepts] == [
+            "wearable",
+            "heart",
+            "variability",
+        ]
+        assert concepts[0].relevance_score == pytest.approx(1.0)
+        assert all(concept.source_domain == "hrv" for concept in concepts)
+        source.lookup.assert_called_once()
+
+    def test_multi_document_tfidf_uses_stored_document_frequencies(self):
+        """Test that several documents are scored without fitting a vectorizer."""
+        source = Mock()
+        source.lookup.return_value = DocumentFrequencies(
+            10, {"heart": 10, "variability": 10}
+        )
+        strategy = StatisticalExtractionStrategy(document_frequencies=source)
+        corpus = ["heart heart variability wearable", "heart variability wearable"]
+
+        with patch(
+            "src.domain.services.multi_strategy_concept_extractor.TfidfVectorizer"
+        ) as vectorizer:
+            concepts = strategy.extract_tfidf_concepts(corpus, domain="hrv")
+
+        vectorizer.assert_not_called()
+        assert [concept.text for concept in concepts] == [
+            "wearable",
+            "heart",
+            "variability",
+        ]
+        source.lookup.assert_called_once()
+
+    def test_multi_strategy_extractor_shares_document_frequencies(self):
+        """Test that the default statistical strategy gets the given source."""
+        source = Mock()
+
+        extractor = MultiStrategyConceptExtractor(document_frequencies=source)
+
+        statistical = [
+            strategy
+            for strategy in extractor.strategies
+            if isinstance(strategy, StatisticalExtractionStrategy)
+        ]
+        assert [strategy.document_frequencies for strategy in statistical] == [source]
+
     def test_textrank_keyphrase_extraction(self, stats_strategy):
         """Test TextRank algorithm for keyphrase extraction."""
         text = """
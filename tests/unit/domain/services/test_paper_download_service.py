@@ -28,7 +28,11 @@ Testing Philosophy for Domain Services:
 """
 
 import pytest
+import email.utils
+import http.server
 import json
+import threading
+import time
 from unittest.mock import Mock, patch, mock_open, MagicMock
 from pathlib import Path
 from datetime import datetime, timezone
@@ -253,6 +257,30 @@ class TestPaperDownloadServiceSingleDownload:
         assert result_path is not None
         assert "Single_Download_Paper.pdf" in str(result_path)
 
+    @patch("src.domain.services.paper_download_service.Path.mkdir")
+    @patch("src.domain.services.paper_download_service.requests.Session.get")
+    @patch("builtins.open", mock_open())
+    def test_download_single_paper_uses_configured_timeout(
+        self, mock_requests_get, mock_mkdir
+    ):
+        """The constructor timeout applies to plain (non-resumable) fetches."""
+        paper = ResearchPaper(
+            title="Timeout Paper",
+            authors=["Solo Author"],
+            abstract="Test configured timeout",
+            publication_date=datetime.now(timezone.utc),
+            arxiv_id="2301.22222",
+        )
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.iter_content.return_value = [b"PDF content"]
+        mock_requests_get.return_value = mock_response
+
+        service = PaperDownloadService(timeout=7)
+        service.download_single_paper(paper)
+
+        assert mock_requests_get.call_args.kwargs["timeout"] == 7
+
     @patch("src.domain.services.paper_download_service.Path.mkdir")
     @patch("src.domain.services.paper_download_service.requests.Session.get")
     def test_download_single_paper_network_failure(self, mock_requests_get, mock_mkdir):
@@ -631,3 +659,423 @@ class TestPaperDownloadServiceErrorHandling:
 
         # Assert: Should handle HTTP error gracefully
         assert result_path is None
+
+
+class TestPaperDownloadServiceRateLimiting:
+    """PDF requests share the request budget of the source serving them."""
+
+    @patch("src.domain.services.paper_download_service.requests.Session.get")
+    def test_download_waits_for_rate_limiter(self, mock_requests_get, tmp_path):
+        """The limiter is asked for a token for the PDF URL before the request."""
+        calls = []
+        rate_limiter = Mock()
+        rate_limiter.acquire_for_url.side_effect = lambda url: calls.append(url)
+        mock_response = Mock()
+        mock_response.iter_content.return_value = [b"%PDF-1.4"]
+        mock_requests_get.side_effect = lambda url, **kwargs: (
+            calls.append("GET") or mock_response
+        )
+        paper = ResearchPaper(
+            title="Rate Limited Paper",
+            authors=["Author"],
+            publication_date=datetime.now(timezone.utc),
+            arxiv_id="2301.00003",
+        )
+
+        service = PaperDownloadService(rate_limiter=rate_limiter)
+        result_path = service._download_paper_pdf(paper, tmp_path)
+
+        assert result_path is not None
+        assert calls == ["https://arxiv.org/pdf/2301.00003.pdf", "GET"]
+
+
+class RangeServer:
+    """
+    Local HTTP server for PDFs that honours Range requests.
+
+    It can cut the first response short to simulate a dropped connection,
+    and records the Range header and concurrency of every request. With an
+    etag or last_modified it also answers conditional requests with 304, and
+    sends the whole body when If-Range names another version. With
+    unsatisfiable_once the first ranged request gets a bare 416.
+    """
+
+    def __init__(
+        self,
+        body,
+        delay=0.0,
+        cut_first_response_at=None,
+        etag=None,
+        last_modified=None,
+        unsatisfiable_once=False,
+    ):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server.lock:
+                    server.ranges.append(self.headers.get("Range"))
+                    server.if_ranges.append(self.headers.get("If-Range"))
+                    server.conditions.append(
+                        (
+                            self.headers.get("If-None-Match"),
+                            self.headers.get("If-Modified-Since"),
+                        )
+                    )
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                    cut = server.cut_first_response_at
+                    server.cut_first_response_at = None
+                try:
+                    time.sleep(server.delay)
+                    if self.path.startswith("/missing"):
+                        self.send_error(404)
+                        return
+                    if server.not_modified(self.headers):
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    body = server.body
+                    start = 0
+                    if self.headers.get("Range") and server.unsatisfiable_once:
+                        server.unsatisfiable_once = False
+                        self.send_response(416)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    if_range = self.headers.get("If-Range")
+                    if self.headers.get("Range") and if_range not in (
+                        None,
+                        server.etag,
+                        server.last_modified,
+                    ):
+                        self.send_response(200)
+                    elif self.headers.get("Range"):
+                        start = int(self.headers["Range"][6:].rstrip("-"))
+                        self.send_response(206)
+                        self.send_header(
+                            "Content-Range",
+                            f"bytes {start}-{len(body) - 1}/{len(body)}",
+                        )
+                    else:
+                        self.send_response(200)
+                    if server.etag:
+                        self.send_header("ETag", server.etag)
+                    if server.last_modified:
+                        self.send_header("Last-Modified", server.last_modified)
+                    self.send_header("Content-Length", str(len(body) - start))
+                    self.end_headers()
+                    self.wfile.write(body[start:cut] if cut else body[start:])
+                    if cut:
+                        self.close_connection = True
+                finally:
+                    with server.lock:
+                        server.in_flight -= 1
+
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.delay = delay
+        self.cut_first_response_at = cut_first_response_at
+        self.unsatisfiable_once = unsatisfiable_once
+        self.ranges = []
+        self.if_ranges = []
+        self.conditions = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(
+            target=self.httpd.serve_forever, args=(0.01,), daemon=True
+        ).start()
+
+    def not_modified(self, headers):
+        """Evaluate If-None-Match, then If-Modified-Since, as HTTP does."""
+        if headers.get("If-None-Match"):
+            return headers["If-None-Match"] == self.etag
+        if headers.get("If-Modified-Since") and self.last_modified:
+            since = email.utils.parsedate_to_datetime(headers["If-Modified-Since"])
+            return email.utils.parsedate_to_datetime(self.last_modified) <= since
+        return False
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def paper_named(title):
+    return ResearchPaper(
+        title=title,
+        authors=["Author"],
+        publication_date=datetime.now(timezone.utc),
+        arxiv_id=title.replace(" ", "-"),
+    )
+
+
+def serve_from(service, server):
+    """Point the service's PDF URLs at the local server."""
+    service._get_pdf_url = lambda paper: f"{server.url}/{paper.arxiv_id}.pdf"
+    return service
+
+
+class TestPaperDownloadServiceResumableDownloads:
+    """Concurrent downloads through resumable, atomically renamed .part files."""
+
+    BODY = b"%PDF-1.4\n" + bytes(range(256)) * 200
+
+    def test_interrupted_transfer_resumes_with_range(self, tmp_path):
+        server = RangeServer(self.BODY, cut_first_response_at=20_480)
+        service = serve_from(
+            PaperDownloadService(
+                str(tmp_path), resume_partial_downloads=True, chunk_size=4096
+            ),
+            server,
+        )
+
+        pdf_path = service._download_paper_pdf(paper_named("Resumed paper"), tmp_path)
+        server.close()
+
+        assert pdf_path.read_bytes() == self.BODY
+        assert server.ranges == [None, "bytes=20480-"]
+        assert not list(tmp_path.glob("*.part"))
+
+    def _earlier_part(self, tmp_path, validators):
+        """Leave a part file (and its validators, if given) from an earlier run."""
+        (tmp_path / "Earlier_paper.pdf.part").write_bytes(self.BODY[:1000])
+        if validators is not None:
+            (tmp_path / "Earlier_paper.pdf.part.json").write_text(
+                json.dumps(validators)
+            )
+
+    def _download_earlier_paper(self, tmp_path, server):
+        service = serve_from(
+            PaperDownloadService(str(tmp_path), resume_partial_downloads=True),
+            server,
+        )
+        pdf_path = service._download_paper_pdf(paper_named("Earlier paper"), tmp_path)
+        server.close()
+        return pdf_path
+
+    def test_part_file_from_earlier_run_is_resumed(self, tmp_path):
+        server = RangeServer(self.BODY, etag='"v1"')
+        self._earlier_part(tmp_path, {"etag": '"v1"'})
+
+        pdf_path = self._download_earlier_paper(tmp_path, server)
+
+        assert pdf_path.read_bytes() == self.BODY
+        assert server.ranges == ["bytes=1000-"]
+        assert server.if_ranges == ['"v1"']
+        assert not list(tmp_path.glob("*.part*"))
+
+    def test_part_of_a_changed_pdf_is_restarted(self, tmp_path):
+        """If-Range fails, the server sends the new file whole: start over."""
+        server = RangeServer(self.BODY, etag='"v2"')
+        self._earlier_part(tmp_path, {"etag": '"v1"'})
+        (tmp_path / "Earlier_paper.pdf.part").write_bytes(b"x" * 1000)
+
+        pdf_path = self._download_earlier_paper(tmp_path, server)
+
+        assert pdf_path.read_bytes() == self.BODY
+        assert server.if_ranges == ['"v1"']
+        assert not list(tmp_path.glob("*.part*"))
+
+    def test_part_without_recorded_validators_is_not_resumed(self, tmp_path):
+        server = RangeServer(self.BODY, etag='"v1"')
+        self._earlier_part(tmp_path, None)
+
+        pdf_path = self._download_earlier_paper(tmp_path, server)
+
+        assert pdf_path.read_bytes() == self.BODY
+        assert server.ranges == [None]
+
+    def test_416_without_total_size_discards_the_part(self, tmp_path):
+        """A bare 416 does not prove the part is complete."""
+        server = RangeServer(self.BODY, etag='"v1"', unsatisfiable_once=True)
+        self._earlier_part(tmp_path, {"etag": '"v1"'})
+
+        pdf_path = self._download_earlier_paper(tmp_path, server)
+
+        assert pdf_path.read_bytes() == self.BODY
+        assert server.ranges == ["bytes=1000-", None]
+
+    def test_client_errors_are_not_retried(self, tmp_path):
+        server = RangeServer(self.BODY)
+        service = PaperDownloadService(str(tmp_path), resume_partial_downloads=True)
+        service._get_pdf_url = lambda paper: f"{server.url}/missing.pdf"
+
+        pdf_path = service._download_paper_pdf(paper_named("Missing paper"), tmp_path)
+        server.close()
+
+        assert pdf_path is None
+        assert len(server.ranges) == 1
+
+    def test_concurrent_downloads_respect_host_limit(self, tmp_path):
+        """Six PDFs, four workers, at most two connections to the host."""
+        server = RangeServer(self.BODY, delay=0.05)
+        service = serve_from(
+            PaperDownloadService(
+                str(tmp_path), max_concurrent_downloads=4, max_connections_per_host=2
+            ),
+            server,
+        )
+        papers = [paper_named(f"Concurrent paper {name}") for name in "ABCDEF"]
+        progress = []
+
+        results = service.download_papers(
+            papers,
+            "hrv",
+            progress_callback=lambda *args: progress.append(args),
+            output_dir=tmp_path,
+        )
+        server.close()
+
+        assert list(results) == [paper.title for paper in papers]
+        assert all(Path(path).read_bytes() == self.BODY for path in results.values())
+        assert server.max_in_flight == 2
+        assert [update[0] for update in progress] == [1, 2, 3, 4, 5, 6]
+        assert all(len(update) == 4 and update[3] > 0 for update in progress)
+        assert (tmp_path / "pdfs" / "metadata.json").exists()
+
+    def test_host_limit_applies_without_part_files(self, tmp_path):
+        """The plain download path takes the per-service host slots too."""
+        server = RangeServer(self.BODY, delay=0.05)
+        service = serve_from(
+            PaperDownloadService(
+                str(tmp_path),
+                max_concurrent_downloads=4,
+                max_connections_per_host=2,
+                resume_partial_downloads=False,
+            ),
+            server,
+        )
+        papers = [paper_named(f"Plain paper {name}") for name in "ABCDEF"]
+
+        service.download_papers(papers, "hrv", output_dir=tmp_path)
+        server.close()
+
+        assert server.max_in_flight == 2
+
+    def test_papers_sharing_a_filename_never_share_a_part(self, tmp_path):
+        """Same title, different sources: the downloads take turns."""
+        server = RangeServer(self.BODY, delay=0.05)
+        service = serve_from(
+            PaperDownloadService(str(tmp_path), max_concurrent_downloads=4), server
+        )
+        papers = [
+            ResearchPaper(
+                title="Common title",
+                authors=["Author"],
+                publication_date=datetime.now(timezone.utc),
+                arxiv_id=f"2401.0000{index}",
+            )
+            for index in range(4)
+        ]
+
+        service.download_papers(papers, "hrv", output_dir=tmp_path)
+        server.close()
+
+        assert server.max_in_flight == 1
+        assert (tmp_path / "pdfs" / "Common_title.pdf").read_bytes() == self.BODY
+        assert not list(tmp_path.glob("**/*.part*"))
+
+    def test_blob_store_skips_downloads_of_known_pdfs(self, tmp_path):
+        """Two strategies matching one paper cost one download and one copy."""
+        from src.infrastructure.pdf_blob_store import PdfBlobStore
+
+        server = RangeServer(self.BODY)
+        store = PdfBlobStore(tmp_path / PdfBlobStore.DIRNAME)
+        service = serve_from(
+            PaperDownloadService(str(tmp_path), blob_store=store), server
+        )
+        paper = paper_named("Shared paper")
+        views = [tmp_path / strategy / "pdfs" for strategy in ("a", "b")]
+        for view in views:
+            view.mkdir(parents=True)
+
+        first = service.download_single_paper(paper, views[0])
+        second = service.download_single_paper(paper, views[1])
+        server.close()
+
+        assert len(server.ranges) == 1
+        assert first.read_bytes() == second.read_bytes() == self.BODY
+        assert first.stat().st_ino == second.stat().st_ino
+        store.close()
+
+
+class TestPaperDownloadServiceRefresh:
+    """Refresh mode re-requests known PDFs conditionally."""
+
+    BODY = b"%PDF-1.4\nversion one\n%%EOF\n"
+    UPDATED = b"%PDF-1.4\nversion two, revised\n%%EOF\n"
+    LAST_MODIFIED = "Mon, 06 Jan 2025 10:00:00 GMT"
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        from src.infrastructure.pdf_blob_store import PdfBlobStore
+
+        store = PdfBlobStore(tmp_path / PdfBlobStore.DIRNAME)
+        yield store
+        store.close()
+
+    def test_unchanged_pdf_costs_a_bodiless_304(self, tmp_path, store):
+        server = RangeServer(self.BODY, etag='"v1"')
+        paper = paper_named("Stable paper")
+        first = serve_from(
+            PaperDownloadService(str(tmp_path), blob_store=store), server
+        ).download_single_paper(paper, tmp_path)
+        digest = store.digest_of(first)
+
+        refreshed = serve_from(
+            PaperDownloadService(str(tmp_path), blob_store=store, refresh=True),
+            server,
+        ).download_single_paper(paper, tmp_path)
+        server.close()
+
+        assert server.conditions == [(None, None), ('"v1"', None)]
+        assert store.digest_of(refreshed) == digest
+        assert store.validators(f"{server.url}/Stable-paper.pdf") == {
+            "etag": '"v1"',
+            "content_length": str(len(self.BODY)),
+        }
+
+    def test_changed_pdf_is_replaced(self, tmp_path, store):
+        server = RangeServer(self.BODY, etag='"v1"')
+        paper = paper_named("Revised paper")
+        serve_from(
+            PaperDownloadService(str(tmp_path), blob_store=store), server
+        ).download_single_paper(paper, tmp_path)
+
+        server.body, server.etag = self.UPDATED, '"v2"'
+        refreshed = serve_from(
+            PaperDownloadService(str(tmp_path), blob_store=store, refresh=True),
+            server,
+        ).download_single_paper(paper, tmp_path)
+        server.close()
+
+        assert refreshed.read_bytes() == self.UPDATED
+        assert store.lookup(f"{server.url}/Revised-paper.pdf") == store.digest_of(
+            refreshed
+        )
+        assert store.validators(f"{server.url}/Revised-paper.pdf")["etag"] == '"v2"'
+
+    def test_without_store_file_time_is_the_validator(self, tmp_path):
+        """Downloaded files carry Last-Modified, so If-Modified-Since works."""
+        server = RangeServer(self.BODY, last_modified=self.LAST_MODIFIED)
+        paper = paper_named("Dated paper")
+        pdf_path = serve_from(
+            PaperDownloadService(str(tmp_path), resume_partial_downloads=True),
+            server,
+        ).download_single_paper(paper, tmp_path)
+
+        serve_from(
+            PaperDownloadService(str(tmp_path), refresh=True), server
+        ).download_single_paper(paper, tmp_path)
+        server.close()
+
+        assert server.conditions[1] == (None, self.LAST_MODIFIED)
+        assert len(server.conditions) == 2
+        assert pdf_path.read_bytes() == self.BODY
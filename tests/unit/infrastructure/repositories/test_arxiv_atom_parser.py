@@ -0,0 +1,163 @@
+"""
+Test suite for the streaming arXiv Atom parser.
+
+Educational Concepts Demonstrated:
+- Parity testing: a replacement parser must produce the same domain objects
+  as the library it replaces, checked on a recorded arXiv response
+- Testing generators: entries are produced one by one, not all at once
+- Testing malformed input handling at the repository boundary
+"""
+
+import tracemalloc
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.infrastructure.repositories.arxiv_atom_parser import (
+    iter_arxiv_entries,
+    parse_arxiv_entries,
+)
+from src.infrastructure.repositories.arxiv_paper_repository import ArxivPaperRepository
+from src.domain.value_objects.search_query import SearchQuery
+
+SAMPLE_FEED = Path(__file__).parents[3] / "fixtures" / "arxiv_sample_feed.xml"
+
+
+def _synthetic_feed(entry_count: int) -> bytes:
+    """Repeat the first recorded entry to build a large feed."""
+    content = SAMPLE_FEED.read_text(encoding="utf-8")
+    start = content.index("<entry>")
+    end = content.index("</entry>") + len("</entry>")
+    entries = "".join(
+        content[start:end].replace("2401.01234", f"2401.{index:05d}")
+        for index in range(entry_count)
+    )
+    return (content[:start] + entries + "</feed>").encode("utf-8")
+
+
+class TestArxivAtomParser:
+    """Entries carry the fields feedparser would give the repository."""
+
+    def test_parses_recorded_entries(self):
+        """Every field used by the repository is extracted."""
+        entries = parse_arxiv_entries(SAMPLE_FEED.read_bytes())
+
+        assert len(entries) == 2
+        first = entries[0]
+        assert first.id == "http://arxiv.org/abs/2401.01234v2"
+        assert first.title.startswith("Heart Rate Variability")
+        assert first.summary.endswith("Results are promising.")
+        assert [author.name for author in first.authors] == [
+            "Jane Smith",
+            "John Doe",
+        ]
+        assert first.arxiv_doi == "10.1000/hrv.2024"
+        assert first.arxiv_journal_ref == "J. Physiol. 1 (2024)"
+        assert first.arxiv_primary_category["term"] == "eess.SP"
+        assert [tag.term for tag in first.tags] == ["eess.SP", "cs.LG"]
+        assert first.published_parsed[:6] == (2024, 1, 3, 9, 30, 0)
+        assert first.link == "http://arxiv.org/abs/2401.01234v2"
+        # Optional elements are absent, not empty, as with feedparser
+        assert not hasattr(entries[1], "arxiv_doi")
+
+    def test_matches_feedparser_entries(self):
+        """Each extracted field equals feedparser's value for the same entry."""
+        feedparser = pytest.importorskip("feedparser")
+        content = SAMPLE_FEED.read_bytes()
+
+        for expected, entry in zip(
+            feedparser.parse(content).entries, parse_arxiv_entries(content)
+        ):
+            for key, value in entry.items():
+                assert expected[key] == value, key
+
+    def test_entries_are_streamed_and_released(self):
+        """Memory stays flat: converted entries are cleared from the tree."""
+        content = _synthetic_feed(2000)
+
+        tracemalloc.start()
+        try:
+            peak = 0
+            count = 0
+            for _ in iter_arxiv_entries(content):
+                count += 1
+                peak = max(peak, tracemalloc.get_traced_memory()[0])
+        finally:
+            tracemalloc.stop()
+
+        assert count == 2000
+        # Holding 2,000 parsed entries would take several megabytes
+        assert peak < len(content)
+
+    def test_malformed_xml_raises_parse_error(self):
+        """A truncated document is reported, after the complete entries."""
+        content = SAMPLE_FEED.read_bytes()
+        truncated = content[: content.index(b"<entry>", content.index(b"</entry>"))]
+        truncated += b"<entry><id>broken"
+
+        entries = iter_arxiv_entries(truncated)
+        assert next(entries).id.endswith("2401.01234v2")
+        with pytest.raises(ET.ParseError):
+            next(entries)
+
+
+class TestArxivPaperRepositoryStreamingParser:
+    """The repository produces the same papers with either parser."""
+
+    def _papers(self, feed_parser):
+        response = Mock(content=SAMPLE_FEED.read_bytes())
+        response.raise_for_status.return_value = None
+        with patch(
+            "src.infrastructure.repositories.arxiv_paper_repository.requests.Session.get",
+            return_value=response,
+        ):
+            repo = ArxivPaperRepository(feed_parser=feed_parser)
+            return repo.find_by_query(SearchQuery(terms=["hrv"], max_results=5))
+
+    def test_papers_match_feedparser_path(self):
+        """Titles, authors, dates, identifiers and metadata are identical."""
+        pytest.importorskip("feedparser")
+        streaming = self._papers("streaming")
+        reference = self._papers("feedparser")
+
+        assert len(streaming) == len(reference) == 2
+        for paper, expected in zip(streaming, reference):
+            assert paper.title == expected.title
+            assert paper.abstract == expected.abstract
+            assert paper.authors == expected.authors
+            assert paper.publication_date == expected.publication_date
+            assert paper.doi == expected.doi
+            assert paper.arxiv_id == expected.arxiv_id
+            assert paper.keywords == expected.keywords
+            assert paper.url == expected.url
+            assert (
+                paper.source_metadata.source_specific_data
+                == expected.source_metadata.source_specific_data
+            )
+            assert (
+                paper.source_metadata.quality_score
+                == expected.source_metadata.quality_score
+            )
+
+    @patch(
+        "src.infrastructure.repositories.arxiv_paper_repository.requests.Session.get"
+    )
+    def test_malformed_page_keeps_earlier_entries(self, mock_get, capsys):
+        """Entries before the parse error are still returned."""
+        content = SAMPLE_FEED.read_bytes()
+        response = Mock(content=content[: content.rindex(b"</entry>")])
+        response.raise_for_status.return_value = None
+        mock_get.return_value = response
+
+        repo = ArxivPaperRepository()
+        papers = repo.find_by_query(SearchQuery(terms=["hrv"], max_results=5))
+
+        assert [paper.arxiv_id for paper in papers] == ["2401.01234v2"]
+        assert "Error processing arXiv results" in capsys.readouterr().out
+
+    def test_unknown_parser_is_rejected(self):
+        """Only the supported parsers can be selected."""
+        with pytest.raises(ValueError):
+            ArxivPaperRepository(feed_parser="lxml")
@@ -31,6 +31,11 @@ from datetime import datetime, timezone
 from requests import RequestException
 
 from src.infrastructure.repositories.arxiv_paper_repository import ArxivPaperRepository
+from src.infrastructure.http_response_cache import HttpResponseCache
+from src.infrastructure.shared_rate_limiter import (
+    RateLimitedAdapter,
+    SharedRateLimiter,
+)
 from src.domain.value_objects.search_query import SearchQuery
 from src.domain.entities.research_paper import ResearchPaper
 
@@ -140,7 +145,7 @@ class TestArxivPaperRepositoryQuerySearch:
         mock_feedparser.parse.return_value = mock_feed
 
         # Act: Execute the search
-        repo = ArxivPaperRepository()
+        repo = ArxivPaperRepository(feed_parser="feedparser")
         query = SearchQuery(terms=["heart rate variability"], max_results=5)
         results = repo.find_by_query(query)
 
@@ -222,7 +227,7 @@ class TestArxivPaperRepositoryQuerySearch:
         mock_feedparser.parse.side_effect = Exception("XML parsing failed")
 
         # Act: Attempt search with parsing failure
-        repo = ArxivPaperRepository()
+        repo = ArxivPaperRepository(feed_parser="feedparser")
         query = SearchQuery(terms=["test"], max_results=1)
         results = repo.find_by_query(query)
 
@@ -246,7 +251,7 @@ class TestArxivPaperRepositoryQuerySearch:
         mock_feedparser.parse.return_value = mock_feed
 
         # Act: Search for non-existent terms
-        repo = ArxivPaperRepository()
+        repo = ArxivPaperRepository(feed_parser="feedparser")
         query = SearchQuery(terms=["nonexistent_unique_term_xyz"], max_results=10)
         results = repo.find_by_query(query)
 
@@ -294,7 +299,7 @@ class TestArxivPaperRepositorySpecificLookups:
         mock_feedparser.parse.return_value = mock_feed
 
         # Act: Look up paper by arXiv ID
-        repo = ArxivPaperRepository()
+        repo = ArxivPaperRepository(feed_parser="feedparser")
         paper = repo.find_by_arxiv_id("2301.12345")
 
         # Assert: Should return the paper
@@ -926,3 +931,211 @@ class TestArxivRepositoryMultiSourceIntegration:
         # Verify educational completeness - this demonstrates the full
         # multi-source architecture working end-to-end from external API
         # to enhanced domain entities ready for multi-source aggregation
+
+
+class TestArxivPaperRepositoryPagination:
+    """
+    Test streaming, paginated search with iter_by_query.
+
+    Educational Note:
+    Each mocked response carries a page number; the mocked feedparser turns
+    it into that many entry ids, and entry conversion is stubbed out so the
+    tests focus on the paging logic alone.
+    """
+
+    def _repository(self, mock_get, mock_feedparser, pages, sleeps, page_size=2):
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.raise_for_status.return_value = None
+            response.content = page
+            responses.append(response)
+        mock_get.side_effect = responses
+        mock_feedparser.parse.side_effect = lambda content: Mock(entries=content)
+
+        repo = ArxivPaperRepository(
+            page_size=page_size,
+            page_delay=3.0,
+            clock=lambda: 100.0,
+            sleep=sleeps.append,
+            feed_parser="feedparser",
+        )
+        repo._convert_arxiv_entry_to_paper = lambda entry: ResearchPaper(
+            title=f"Paginated paper {entry}",
+            authors=["Author"],
+            abstract="Abstract",
+            publication_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            arxiv_id=entry,
+        )
+        return repo
+
+    @patch("src.infrastructure.repositories.arxiv_paper_repository.feedparser")
+    @patch(
+        "src.infrastructure.repositories.arxiv_paper_repository.requests.Session.get"
+    )
+    def test_pages_advance_through_start_offsets(self, mock_get, mock_feedparser):
+        """Successive requests use increasing start offsets until a short page."""
+        sleeps = []
+        repo = self._repository(
+            mock_get, mock_feedparser, [["a", "b"], ["c", "d"], ["e"]], sleeps
+        )
+
+        papers = list(repo.iter_by_query(SearchQuery(terms=["hrv"], max_results=10)))
+
+        assert [paper.arxiv_id for paper in papers] == ["a", "b", "c", "d", "e"]
+        starts = [call.kwargs["params"]["start"] for call in mock_get.call_args_list]
+        assert starts == [0, 2, 4]
+        # The documented delay separates every pair of consecutive pages
+        assert sleeps == [3.0, 3.0]
+
+    @patch("src.infrastructure.repositories.arxiv_paper_repository.feedparser")
+    @patch(
+        "src.infrastructure.repositories.arxiv_paper_repository.requests.Session.get"
+    )
+    def test_stops_once_enough_papers_are_found(self, mock_get, mock_feedparser):
+        """No further pages are requested after max_results papers."""
+        sleeps = []
+        repo = self._repository(
+            mock_get, mock_feedparser, [["a", "b"], ["c", "d"]], sleeps
+        )
+
+        papers = list(repo.iter_by_query(SearchQuery(terms=["hrv"], max_results=3)))
+
+        assert len(papers) == 3
+        assert mock_get.call_count == 2
+        # The last page asks for a full page, not just the papers still missing
+        assert mock_get.call_args.kwargs["params"]["max_results"] == 2
+
+    @patch("src.infrastructure.repositories.arxiv_paper_repository.feedparser")
+    @patch(
+        "src.infrastructure.repositories.arxiv_paper_repository.requests.Session.get"
+    )
+    def test_filtered_search_stops_at_the_scan_budget(self, mock_get, mock_feedparser):
+        """Filters that reject every entry do not page through the archive."""
+        pages = [[f"p{page}-{index}" for index in range(2)] for page in range(50)]
+        repo = self._repository(mock_get, mock_feedparser, pages, [])
+        repo.max_scanned_entries = 6
+        repo._matches_query_filters = lambda paper, query: False
+
+        papers = list(repo.iter_by_query(SearchQuery(terms=["hrv"], max_results=3)))
+
+        assert papers == []
+        starts = [call.kwargs["params"]["start"] for call in mock_get.call_args_list]
+        assert starts == [0, 2, 4]
+
+    @patch("src.infrastructure.repositories.arxiv_paper_repository.feedparser")
+    @patch(
+        "src.infrastructure.repositories.arxiv_paper_repository.requests.Session.get"
+    )
+    def test_papers_are_yielded_before_the_next_page_is_fetched(
+        self, mock_get, mock_feedparser
+    ):
+        """Consumers receive the first page before the second is requested."""
+        repo = self._repository(mock_get, mock_feedparser, [["a", "b"], ["c"]], [])
+
+        iterator = repo.iter_by_query(SearchQuery(terms=["hrv"], max_results=10))
+        first = next(iterator)
+
+        assert first.arxiv_id == "a"
+        assert mock_get.call_count == 1
+
+    @patch("src.infrastructure.repositories.arxiv_paper_repository.feedparser")
+    @patch(
+        "src.infrastructure.repositories.arxiv_paper_repository.requests.Session.get"
+    )
+    def test_error_on_later_page_keeps_earlier_results(self, mock_get, mock_feedparser):
+        """A failing page ends the stream without discarding earlier papers."""
+        repo = self._repository(mock_get, mock_feedparser, [["a", "b"]], [])
+        mock_get.side_effect = list(mock_get.side_effect) + [
+            RequestException("503 Service Unavailable")
+        ]
+
+        papers = repo.find_by_query(SearchQuery(terms=["hrv"], max_results=10))
+
+        assert [paper.arxiv_id for paper in papers] == ["a", "b"]
+
+
+class TestArxivPaperRepositoryResponseCache:
+    """Repeated queries are answered from the shared response cache."""
+
+    @patch("src.infrastructure.repositories.arxiv_paper_repository.feedparser")
+    @patch("requests.Session.request")
+    def test_repeated_query_is_served_from_cache(
+        self, mock_request, mock_feedparser, tmp_path
+    ):
+        """The second identical search sends no request."""
+        response = Mock(status_code=200, content=b"<feed/>", headers={})
+        response.url = "http://export.arxiv.org/api/query"
+        response.encoding = "utf-8"
+        mock_request.return_value = response
+        mock_feedparser.parse.return_value = Mock(entries=[])
+        cache = HttpResponseCache(tmp_path / "http_cache")
+        repo = ArxivPaperRepository(response_cache=cache, feed_parser="feedparser")
+        query = SearchQuery(terms=["heart rate variability"], max_results=5)
+
+        repo.find_by_query(query)
+        repo.find_by_query(query)
+
+        assert mock_request.call_count == 1
+        assert mock_feedparser.parse.call_args_list[-1].args[0] == b"<feed/>"
+        cache.close()
+
+    @patch("src.infrastructure.repositories.arxiv_paper_repository.feedparser")
+    @patch("requests.Session.request")
+    def test_cached_pages_are_not_delayed(
+        self, mock_request, mock_feedparser, tmp_path
+    ):
+        """page_delay only spaces pages that actually reach the network."""
+        responses = []
+        for page in (b"a b", b"c d", b"e"):
+            response = Mock(status_code=200, content=page, headers={})
+            response.url = "http://export.arxiv.org/api/query"
+            response.encoding = "utf-8"
+            responses.append(response)
+        mock_request.side_effect = responses
+        mock_feedparser.parse.side_effect = lambda content: Mock(
+            entries=content.decode().split()
+        )
+        cache = HttpResponseCache(tmp_path / "http_cache")
+        sleeps = []
+        repo = ArxivPaperRepository(
+            page_size=2,
+            page_delay=3.0,
+            clock=lambda: 100.0,
+            sleep=sleeps.append,
+            response_cache=cache,
+            feed_parser="feedparser",
+        )
+        repo._convert_arxiv_entry_to_paper = lambda entry: ResearchPaper(
+            title=f"Cached paper {entry}",
+            authors=["Author"],
+            abstract="Abstract",
+            publication_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            arxiv_id=entry,
+        )
+        query = SearchQuery(terms=["hrv"], max_results=10)
+
+        first = repo.find_by_query(query)
+        first_sleeps, sleeps[:] = list(sleeps), []
+        second = repo.find_by_query(query)
+
+        assert [p.arxiv_id for p in second] == [p.arxiv_id for p in first]
+        assert len(second) == 5
+        assert mock_request.call_count == 3
+        assert first_sleeps == [3.0, 3.0]
+        assert sleeps == []
+        cache.close()
+
+
+class TestArxivPaperRepositorySharedRateLimit:
+    """Every arXiv request draws from the host-wide "ArXiv" bucket."""
+
+    def test_rate_limiter_is_configured_from_rate_limit_info(self, tmp_path):
+        """The advertised rate becomes the bucket; API and PDF hosts map to it."""
+        limiter = SharedRateLimiter(tmp_path)
+
+        repo = ArxivPaperRepository(rate_limiter=limiter)
+
+        assert limiter.rate_for("ArXiv") == (1.0, 5)
+        assert isinstance(repo.session.get_adapter(repo.base_url), RateLimitedAdapter)
+        assert limiter.key_for_url("https://arxiv.org/pdf/2301.00001.pdf") == "ArXiv"
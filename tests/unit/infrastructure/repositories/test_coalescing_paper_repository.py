@@ -0,0 +1,202 @@
+"""
+Test suite for QueryPlanner and CoalescingPaperRepository.
+
+These tests verify that overlapping strategy queries are planned into shared
+groups, that each group costs one API call, and that every strategy still
+receives only the papers matching its own terms.
+
+Educational Notes:
+- Uses a Mock spec'd on PaperRepositoryPort as the remote source, so calls
+  can be counted and the source has no extra filter hooks
+- Hammers the decorator from threads to prove one merged fetch per group
+"""
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from src.application.ports.paper_repository_port import PaperRepositoryPort
+from src.domain.entities.research_paper import ResearchPaper
+from src.domain.value_objects.search_query import SearchQuery
+from src.infrastructure.repositories.coalescing_paper_repository import (
+    CoalescingPaperRepository,
+    QueryPlanner,
+)
+
+
+def make_paper(title, abstract="Physiological signal study"):
+    """Create a paper for the fake source."""
+    return ResearchPaper(
+        title=title,
+        authors=["Author"],
+        abstract=abstract,
+        publication_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+PAPERS = [
+    make_paper("Heart rate variability in athletes"),
+    make_paper("Deep learning for ECG arrhythmia"),
+    make_paper("Heart rate variability and deep learning"),
+    make_paper("Sleep staging", abstract="Uses polysomnography recordings"),
+]
+
+
+def source_returning(papers):
+    source = Mock(spec=PaperRepositoryPort)
+    source.find_by_query.return_value = list(papers)
+    return source
+
+
+class TestQueryPlanner:
+    """Grouping of strategy queries."""
+
+    def test_overlapping_strategies_share_a_group(self):
+        """Strategies with shared terms are merged into one group."""
+        groups = QueryPlanner().plan(
+            {
+                "hrv/basic": (["heart rate variability", "HRV"], 20, "2015-2025"),
+                "hrv/clinical": (["heart rate variability", "ECG"], 30, "2015-2025"),
+            }
+        )
+
+        assert len(groups) == 1
+        assert sorted(groups[0].members) == ["hrv/basic", "hrv/clinical"]
+        assert groups[0].max_results == 50
+        assert len(groups[0].terms) == 3
+
+    def test_incompatible_date_settings_are_never_merged(self):
+        """Queries with different compatibility keys stay separate."""
+        groups = QueryPlanner().plan(
+            {
+                "a": (["heart rate variability"], 20, "2015-2025"),
+                "b": (["heart rate variability"], 20, "2020-2025"),
+            }
+        )
+
+        assert len(groups) == 2
+
+    def test_term_limit_splits_large_unions(self):
+        """A merged query never exceeds max_terms_per_query terms."""
+        groups = QueryPlanner(max_terms_per_query=3).plan(
+            {
+                "a": (["t1", "t2"], 10, None),
+                "b": (["t3", "t4"], 10, None),
+            }
+        )
+
+        assert len(groups) == 2
+        assert all(len(group.terms) <= 3 for group in groups)
+
+
+class TestCoalescingPaperRepository:
+    """Serving planned queries from merged requests."""
+
+    def _repository(self, source):
+        groups = QueryPlanner().plan(
+            {
+                "hrv": (["heart rate variability"], 10, None),
+                "dl": (["deep learning"], 10, None),
+            }
+        )
+        return CoalescingPaperRepository(source, groups)
+
+    def test_group_members_share_one_api_call(self):
+        """Two planned strategies cost a single merged query."""
+        source = source_returning(PAPERS)
+        repository = self._repository(source)
+
+        hrv = repository.find_by_query(
+            SearchQuery(terms=["heart rate variability"], max_results=10)
+        )
+        dl = repository.find_by_query(
+            SearchQuery(terms=["Deep Learning"], max_results=10)
+        )
+
+        assert source.find_by_query.call_count == 1
+        merged = source.find_by_query.call_args[0][0]
+        assert set(merged.terms) == {"heart rate variability", "deep learning"}
+        assert merged.max_results == 20
+        assert [p.title for p in hrv] == [
+            "Heart rate variability in athletes",
+            "Heart rate variability and deep learning",
+        ]
+        assert [p.title for p in dl] == [
+            "Deep learning for ECG arrhythmia",
+            "Heart rate variability and deep learning",
+        ]
+        assert repository.queries_served == 2
+        assert repository.api_calls == 1
+
+    def test_terms_match_whole_words_only(self):
+        """A term inside a longer word does not pull a paper into a strategy."""
+        papers = [
+            make_paper("AI for arrhythmia detection"),
+            make_paper("Heart rate variability again", abstract="A journal study"),
+        ]
+        source = source_returning(papers)
+        groups = QueryPlanner().plan(
+            {"ai": (["ai"], 10, None), "rna": (["rna"], 10, None)}
+        )
+        repository = CoalescingPaperRepository(source, groups)
+
+        ai = repository.find_by_query(SearchQuery(terms=["AI"], max_results=10))
+        rna = repository.find_by_query(SearchQuery(terms=["RNA"], max_results=10))
+
+        assert [p.title for p in ai] == ["AI for arrhythmia detection"]
+        assert rna == []
+
+    def test_unplanned_queries_pass_through(self):
+        """A query outside every group is sent unchanged."""
+        source = source_returning([])
+        repository = self._repository(source)
+        query = SearchQuery(terms=["polysomnography"], max_results=5)
+
+        repository.find_by_query(query)
+
+        source.find_by_query.assert_called_once_with(query)
+
+    def test_short_share_of_truncated_results_falls_back(self):
+        """A member starved by a full merged result gets its own query."""
+        crowded = [make_paper(f"Deep learning model {i}") for i in range(20)]
+        source = Mock(spec=PaperRepositoryPort)
+        source.find_by_query.side_effect = [crowded, [PAPERS[0]]]
+        repository = self._repository(source)
+
+        hrv = repository.find_by_query(
+            SearchQuery(terms=["heart rate variability"], max_results=10)
+        )
+
+        assert source.find_by_query.call_count == 2
+        assert source.find_by_query.call_args[0][0].terms == ("heart rate variability",)
+        assert [p.title for p in hrv] == ["Heart rate variability in athletes"]
+
+    def test_concurrent_members_trigger_a_single_fetch(self):
+        """Strategies running in parallel wait for the first merged fetch."""
+        release = threading.Event()
+        source = Mock(spec=PaperRepositoryPort)
+
+        def slow_search(query):
+            release.wait(timeout=5)
+            return list(PAPERS)
+
+        source.find_by_query.side_effect = slow_search
+        repository = self._repository(source)
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda terms=terms: results.append(
+                    repository.find_by_query(SearchQuery(terms=terms, max_results=10))
+                )
+            )
+            for terms in (["heart rate variability"], ["deep learning"]) * 3
+        ]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert source.find_by_query.call_count == 1
+        assert len(results) == 6
@@ -0,0 +1,186 @@
+"""
+Test suite for FederatedPaperRepository - concurrent multi-source search.
+
+Educational Notes:
+- Fake sources sleep or block on an Event, so timing behavior (concurrency,
+  timeouts, deadlines) is tested with real threads but short waits
+- Duplicate detection is tested through shared DOIs, the strongest
+  PaperFingerprint identifier
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.entities.research_paper import ResearchPaper
+from src.domain.value_objects.search_query import SearchQuery
+from src.infrastructure.repositories.federated_paper_repository import (
+    FederatedPaperRepository,
+)
+
+
+def make_paper(title, doi=None):
+    """Create a paper with an optional DOI."""
+    return ResearchPaper(
+        title=title,
+        authors=["Author"],
+        doi=doi,
+        publication_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+class FakeSource:
+    """Paper source answering after a delay, or never, or with an error."""
+
+    def __init__(self, name, papers=(), delay=0.0, hang=False, error=None):
+        self.name = name
+        self.papers = list(papers)
+        self.delay = delay
+        self.error = error
+        self.release = threading.Event()
+        if not hang:
+            self.release.set()
+
+    def get_source_name(self):
+        return self.name
+
+    def find_by_query(self, query):
+        time.sleep(self.delay)
+        self.release.wait(5)
+        if self.error:
+            raise self.error
+        return list(self.papers)
+
+    def find_by_doi(self, doi):
+        self.release.wait(5)
+        return next((p for p in self.papers if p.doi == doi), None)
+
+
+QUERY = SearchQuery(terms=["heart rate variability"], max_results=10)
+
+
+class TestFederatedPaperRepository:
+    """Fan-out, merging and failure isolation."""
+
+    def test_sources_are_searched_concurrently_and_deduplicated(self):
+        """Latency is the slowest source, and shared DOIs appear once."""
+        shared = "10.1000/hrv.2024"
+        repository = FederatedPaperRepository(
+            [
+                FakeSource("ArXiv", [make_paper("HRV preprint", shared)], delay=0.2),
+                FakeSource(
+                    "PMC",
+                    [make_paper("HRV article", shared), make_paper("HRV in sleep")],
+                    delay=0.2,
+                ),
+            ]
+        )
+
+        started = time.monotonic()
+        papers = repository.find_by_query(QUERY)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.35
+        assert len(papers) == 2
+        assert [paper.doi for paper in papers].count(shared) == 1
+        outcomes = {o.source: o for o in repository.last_outcomes}
+        assert sum(o.duplicates for o in outcomes.values()) == 1
+
+    def test_hung_source_is_abandoned_at_its_timeout(self):
+        hung = FakeSource("MDPI", [make_paper("Never returned")], hang=True)
+        repository = FederatedPaperRepository(
+            [FakeSource("ArXiv", [make_paper("HRV preprint")]), hung],
+            source_timeout=0.2,
+        )
+
+        started = time.monotonic()
+        papers = repository.find_by_query(QUERY)
+        elapsed = time.monotonic() - started
+        hung.release.set()
+
+        assert [paper.title for paper in papers] == ["HRV preprint"]
+        assert elapsed < 1.0
+        outcomes = {o.source: o for o in repository.last_outcomes}
+        assert outcomes["MDPI"].timed_out
+        assert not outcomes["ArXiv"].timed_out
+
+    def test_overall_deadline_caps_per_source_overrides(self):
+        slow = FakeSource("MDPI", [make_paper("Slow answer")], delay=0.5)
+        repository = FederatedPaperRepository(
+            [FakeSource("ArXiv", [make_paper("HRV preprint")]), slow],
+            source_timeout=0.1,
+            deadline=0.25,
+            source_timeouts={"MDPI": 10.0},
+        )
+
+        started = time.monotonic()
+        repository.find_by_query(QUERY)
+
+        assert time.monotonic() - started < 0.45
+        assert repository.last_outcomes[1].timed_out
+
+    def test_failing_source_does_not_hide_other_results(self):
+        repository = FederatedPaperRepository(
+            [
+                FakeSource("PMC", error=ConnectionError("503 Service Unavailable")),
+                FakeSource("ArXiv", [make_paper("HRV preprint")]),
+            ]
+        )
+
+        papers = repository.find_by_query(QUERY)
+
+        assert [paper.title for paper in papers] == ["HRV preprint"]
+        assert "503" in repository.last_outcomes[0].error
+
+    def test_results_are_capped_at_max_results(self):
+        topics = ["sleep", "stress", "exercise"]
+        repository = FederatedPaperRepository(
+            [
+                FakeSource("ArXiv", [make_paper(f"HRV during {t}") for t in topics]),
+                FakeSource(
+                    "PMC", [make_paper(f"HRV and {t} outcomes") for t in topics]
+                ),
+            ]
+        )
+
+        papers = repository.find_by_query(
+            SearchQuery(terms=["heart rate variability"], max_results=4)
+        )
+
+        assert len(papers) == 4
+
+    def test_capped_results_are_shared_across_sources(self):
+        topics = ["sleep", "stress", "exercise", "aging", "diabetes"]
+        repository = FederatedPaperRepository(
+            [
+                FakeSource(name, [make_paper(f"HRV {t} via {name}") for t in topics])
+                for name in ("ArXiv", "PMC", "MDPI")
+            ]
+        )
+
+        papers = repository.find_by_query(
+            SearchQuery(terms=["heart rate variability"], max_results=5)
+        )
+
+        assert {p.title.split(" via ")[1] for p in papers} == {"ArXiv", "PMC", "MDPI"}
+        outcomes = repository.last_outcomes
+        assert sorted(o.papers for o in outcomes) == [5, 5, 5]
+        assert sum(o.dropped for o in outcomes) == 10
+        assert all(not o.timed_out for o in outcomes)
+
+    def test_find_by_doi_returns_first_match(self):
+        paper = make_paper("HRV article", "10.1000/hrv.2024")
+        repository = FederatedPaperRepository(
+            [FakeSource("ArXiv"), FakeSource("PMC", [paper])]
+        )
+
+        assert repository.find_by_doi("10.1000/hrv.2024") is paper
+        assert repository.find_by_doi("10.1000/missing") is None
+
+    def test_requires_sources_and_positive_timeouts(self):
+        with pytest.raises(ValueError):
+            FederatedPaperRepository([])
+        with pytest.raises(ValueError):
+            FederatedPaperRepository([FakeSource("ArXiv")], deadline=0)
@@ -26,7 +26,7 @@ is available as a separate 'set' (e.g., 'journal:sensors', 'journal:mathematics'
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 # Import domain objects and interfaces
@@ -38,6 +38,7 @@ from src.application.ports.paper_source_port import PaperSourcePort
 
 # Import the repository we're testing (will fail initially - RED phase)
 from src.infrastructure.repositories.mdpi_paper_repository import MDPIPaperRepository
+from src.infrastructure.repositories.oai_harvest_store import OaiHarvestStore
 
 
 class TestMDPIPaperRepositoryInterface:
@@ -458,3 +459,78 @@ class TestMDPIPaperRepositoryIntegration:
 #    - Tests ensure SourceMetadata and PaperFingerprint integration
 #    - Enables duplicate detection across different sources
 #    - Source-specific capabilities are properly reported
+
+
+class TestMDPIPaperRepositoryWindowedHarvesting:
+    """Searches harvest missing months into a local store, then run locally."""
+
+    @patch("src.infrastructure.repositories.mdpi_paper_repository.Sickle")
+    def test_repeated_searches_reuse_harvested_months(
+        self, mock_sickle_class, tmp_path
+    ):
+        """A second search over the same months sends no OAI-PMH requests."""
+        today = datetime.now(timezone.utc)
+        record = Mock()
+        record.header.identifier = "oai:mdpi.com:/sensors/24/1/1/"
+        record.header.datestamp = today.strftime("%Y-%m-%d")
+        record.header.deleted = False
+        record.metadata = {
+            "title": ["Wearable Sensors for Heart Rate Variability"],
+            "creator": ["Smith, John"],
+            "description": ["HRV monitoring with wearables."],
+            "date": [today.strftime("%Y-%m-%d")],
+            "identifier": ["https://doi.org/10.3390/s24010001"],
+        }
+        list_records = mock_sickle_class.return_value.ListRecords
+        list_records.side_effect = lambda **params: [record]
+
+        store = OaiHarvestStore(tmp_path / OaiHarvestStore.FILENAME)
+        repository = MDPIPaperRepository(
+            base_url="https://oai.mdpi-test.example/oai",
+            journal_sets=["journal:sensors"],
+            harvest_store=store,
+        )
+        query = SearchQuery(
+            terms=["heart rate variability"],
+            start_date=today - timedelta(days=40),
+            max_results=10,
+        )
+
+        first = repository.find_by_query(query)
+        requests_after_first = list_records.call_count
+        second = repository.find_by_query(query)
+
+        assert requests_after_first >= 2  # one request per month window
+        assert list_records.call_count == requests_after_first
+        assert [paper.doi for paper in first] == ["10.3390/s24010001"]
+        assert [paper.doi for paper in second] == ["10.3390/s24010001"]
+        assert first[0].source_metadata.source_specific_data["journal"] == "sensors"
+        store.close()
+
+    @patch("src.infrastructure.repositories.mdpi_paper_repository.SessionSickle")
+    def test_each_harvest_window_gets_its_own_limited_session(
+        self, mock_session_sickle, tmp_path
+    ):
+        """Windows run on threads, so they must not share one session."""
+        from src.infrastructure.shared_rate_limiter import (
+            RateLimitedAdapter,
+            SharedRateLimiter,
+        )
+
+        repository = MDPIPaperRepository(
+            harvest_store=OaiHarvestStore(tmp_path / OaiHarvestStore.FILENAME),
+            rate_limiter=SharedRateLimiter(tmp_path / "limits"),
+        )
+
+        repository._list_records_factory()
+        repository._list_records_factory()
+
+        sessions = [
+            call.kwargs["session"] for call in mock_session_sickle.call_args_list
+        ]
+        assert len({id(session) for session in sessions}) == 2
+        assert repository._session not in sessions
+        for session in sessions:
+            adapter = session.get_adapter("https://oai.mdpi.com/oai/oai2.php")
+            assert isinstance(adapter, RateLimitedAdapter)
+            assert adapter.key == "MDPI"
@@ -0,0 +1,263 @@
+"""
+Test suite for OaiHarvestStore - incremental OAI-PMH harvesting.
+
+Educational Concepts Demonstrated:
+- Faking a paginated OAI-PMH source: the fake iterator exposes the current
+  resumption token the way Sickle's does, so page checkpoints are exercised
+- Testing incremental behavior through the arguments of the next request
+- Testing an inverted index through its search results
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.infrastructure.repositories.oai_harvest_store import (
+    HarvestedRecord,
+    OaiHarvestStore,
+)
+
+
+class FakeRecords:
+    """
+    Sickle-like record iterator over pages of records.
+
+    Like Sickle, the first page is loaded on creation and `resumption_token`
+    always holds the token for the page after the one being iterated.
+    """
+
+    def __init__(self, pages, start_page=0, fail_on_page=None):
+        self.pages = pages
+        self.page = start_page
+        self.position = 0
+        self.fail_on_page = fail_on_page
+        self._update_token()
+
+    def _update_token(self):
+        more = self.page + 1 < len(self.pages)
+        self.resumption_token = f"token-{self.page + 1}" if more else None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self.position >= len(self.pages[self.page]):
+            if self.page + 1 >= len(self.pages):
+                raise StopIteration
+            if self.page + 1 == self.fail_on_page:
+                raise ConnectionError("network down")
+            self.page += 1
+            self.position = 0
+            self._update_token()
+        record = self.pages[self.page][self.position]
+        self.position += 1
+        return record
+
+
+class FakeSource:
+    """Records every ListRecords call and serves the configured pages."""
+
+    def __init__(self, pages, fail_on_page=None):
+        self.pages = pages
+        self.fail_on_page = fail_on_page
+        self.calls = []
+
+    def list_records(self, **params):
+        self.calls.append(params)
+        if "resumptionToken" in params:
+            start_page = int(params["resumptionToken"].split("-")[1])
+            return FakeRecords(self.pages, start_page=start_page)
+        return FakeRecords(self.pages, fail_on_page=self.fail_on_page)
+
+
+def record(identifier, datestamp, title, deleted=False):
+    """Build a harvested record whose publication date is its datestamp."""
+    return HarvestedRecord(
+        identifier=identifier,
+        datestamp=datestamp,
+        metadata={"title": [title]},
+        text=title,
+        published=datetime.fromisoformat(datestamp).replace(tzinfo=timezone.utc),
+        deleted=deleted,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = OaiHarvestStore(tmp_path / OaiHarvestStore.FILENAME, clock=lambda: 1000.0)
+    yield store
+    store.close()
+
+
+class TestOaiHarvestStoreHarvesting:
+    """Harvests follow pages, checkpoint progress and only fetch what is new."""
+
+    def test_harvest_stores_every_page(self, store):
+        """All pages are followed and each is committed separately."""
+        source = FakeSource(
+            [
+                [record("oai:1", "2024-01-01", "Heart rate variability")],
+                [record("oai:2", "2024-01-02", "Sleep staging")],
+            ]
+        )
+
+        stats = store.harvest(source.list_records, lambda r: r, from_date="2024-01-01")
+
+        assert (stats.fetched, stats.stored, stats.pages) == (2, 2, 2)
+        assert len(store) == 2
+        assert source.calls == [{"metadataPrefix": "oai_dc", "from_": "2024-01-01"}]
+        state = store.state()
+        assert state.watermark == "2024-01-02"
+        assert state.harvested_at == 1000.0
+
+    def test_next_harvest_starts_at_watermark(self, store):
+        """A second harvest only asks for records since the newest one seen."""
+        source = FakeSource([[record("oai:1", "2024-01-05", "Heart rate")]])
+        store.harvest(source.list_records, lambda r: r, from_date="2024-01-01")
+
+        store.harvest(source.list_records, lambda r: r, from_date="2024-01-01")
+
+        assert source.calls[-1]["from_"] == "2024-01-05"
+
+    def test_earlier_from_date_is_back_filled(self, store):
+        """Dates before the harvested range are fetched once, then covered."""
+        source = FakeSource([[record("oai:1", "2024-01-05", "Heart rate")]])
+        store.harvest(source.list_records, lambda r: r, from_date="2024-01-01")
+
+        store.harvest(source.list_records, lambda r: r, from_date="2023-06-01")
+
+        assert {
+            "metadataPrefix": "oai_dc",
+            "from_": "2023-06-01",
+            "until": "2024-01-01",
+        } in source.calls
+        assert store.state().coverage_from == "2023-06-01"
+
+    def test_interrupted_harvest_resumes_from_token(self, store):
+        """Committed pages survive an error and the next harvest resumes."""
+        pages = [
+            [record("oai:1", "2024-01-01", "Heart rate")],
+            [record("oai:2", "2024-01-02", "Sleep staging")],
+        ]
+        failing = FakeSource(pages, fail_on_page=1)
+        with pytest.raises(ConnectionError):
+            store.harvest(failing.list_records, lambda r: r)
+
+        assert len(store) == 1
+        assert store.state().pending_token == "token-1"
+
+        source = FakeSource(pages)
+        stats = store.harvest(source.list_records, lambda r: r)
+
+        assert stats.resumed
+        assert source.calls == [{"resumptionToken": "token-1"}]
+        assert len(store) == 2
+        assert store.state().pending_token is None
+
+    def test_watermark_waits_for_the_harvest_to_complete(self, store):
+        """Pages of an unfinished harvest do not move the watermark."""
+        pages = [
+            [record("oai:1", "2024-01-09", "Heart rate")],
+            [record("oai:2", "2024-01-03", "Sleep staging")],
+        ]
+        failing = FakeSource(pages, fail_on_page=1)
+        with pytest.raises(ConnectionError):
+            store.harvest(failing.list_records, lambda r: r, from_date="2024-01-01")
+
+        state = store.state()
+        assert state.watermark is None
+        assert state.pending_watermark == "2024-01-09"
+
+        store.harvest(FakeSource(pages).list_records, lambda r: r)
+
+        state = store.state()
+        assert state.watermark == "2024-01-09"
+        assert state.pending_watermark is None
+
+    def test_expired_token_restarts_from_the_watermark(self, store):
+        """A lost resumption token re-requests everything after the watermark."""
+        store.harvest(
+            FakeSource([[record("oai:1", "2024-01-02", "Heart rate")]]).list_records,
+            lambda r: r,
+        )
+        pages = [
+            [record("oai:2", "2024-01-09", "Sleep staging")],
+            [record("oai:3", "2024-01-04", "Stress")],
+        ]
+        with pytest.raises(ConnectionError):
+            store.harvest(FakeSource(pages, fail_on_page=1).list_records, lambda r: r)
+
+        source = FakeSource(pages)
+        source.calls = []
+        serve = source.list_records
+
+        def list_records(**params):
+            if "resumptionToken" in params:
+                raise ValueError("badResumptionToken")
+            return serve(**params)
+
+        store.harvest(list_records, lambda r: r)
+
+        assert source.calls == [{"metadataPrefix": "oai_dc", "from_": "2024-01-02"}]
+        assert len(store) == 3
+        assert store.state().watermark == "2024-01-09"
+
+    def test_deleted_and_rejected_records(self, store):
+        """Deleted records leave the store; rejected ones are counted."""
+        source = FakeSource([[record("oai:1", "2024-01-01", "Heart rate")]])
+        store.harvest(source.list_records, lambda r: r)
+
+        source.pages = [
+            [record("oai:1", "2024-01-03", "", deleted=True), "not a record"]
+        ]
+        stats = store.harvest(
+            source.list_records, lambda r: r if isinstance(r, HarvestedRecord) else None
+        )
+
+        assert (stats.deleted, stats.skipped) == (1, 1)
+        assert len(store) == 0
+        assert list(store.search(["heart"])) == []
+
+
+class TestOaiHarvestStoreSearch:
+    """The inverted index answers keyword and date-range searches."""
+
+    @pytest.fixture(autouse=True)
+    def harvested(self, store):
+        source = FakeSource(
+            [
+                [
+                    record("oai:1", "2023-05-01", "Heart rate variability in athletes"),
+                    record("oai:2", "2024-02-01", "Variability of heart sounds"),
+                    record("oai:3", "2024-03-01", "Sleep staging with EEG"),
+                ]
+            ]
+        )
+        store.harvest(source.list_records, lambda r: r)
+
+    def test_term_requires_all_of_its_words(self, store):
+        """Multi-word terms match records containing every word."""
+        identifiers = [i for i, _ in store.search(["heart rate"])]
+
+        assert identifiers == ["oai:1"]
+
+    def test_terms_are_combined_with_or(self, store):
+        """A record matching any term is returned, in datestamp order."""
+        identifiers = [i for i, _ in store.search(["heart rate", "EEG"])]
+
+        assert identifiers == ["oai:1", "oai:3"]
+
+    def test_date_range_and_metadata(self, store):
+        """Dates pre-filter candidates and stored metadata is returned."""
+        results = list(
+            store.search(
+                ["variability"],
+                start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+        )
+
+        assert results == [("oai:2", {"title": ["Variability of heart sounds"]})]
+
+    def test_no_indexable_terms_returns_everything(self, store):
+        """Without usable terms the whole set is returned."""
+        assert len(list(store.search([]))) == 3
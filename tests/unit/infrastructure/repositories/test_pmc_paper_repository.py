@@ -31,7 +31,7 @@ Architecture Validation:
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List
 
 from src.domain.entities.research_paper import ResearchPaper
@@ -39,6 +39,7 @@ from src.domain.value_objects.search_query import SearchQuery
 from src.domain.value_objects.source_metadata import SourceMetadata
 from src.domain.value_objects.paper_fingerprint import PaperFingerprint
 from src.infrastructure.repositories.pmc_paper_repository import PMCPaperRepository
+from src.infrastructure.repositories.oai_harvest_store import OaiHarvestStore
 
 
 class TestPMCPaperRepositoryInitialization:
@@ -668,3 +669,80 @@ class TestPMCRepositoryMultiSourceIntegration:
         assert "Neurology" in source_specific_data["subject"]
         assert "Cardiology" in source_specific_data["subject"]
         assert "doi:10.1089/neu.2024.0123" in source_specific_data["relation"]
+
+
+class TestPMCPaperRepositoryHarvestStore:
+    """Searches run against the local harvest store when one is configured."""
+
+    def _record(self, identifier, datestamp, title):
+        record = Mock()
+        record.header.identifier = identifier
+        record.header.datestamp = datestamp
+        record.header.deleted = False
+        record.metadata = {
+            "identifier": [identifier],
+            "title": [title],
+            "creator": ["Smith, John"],
+            "description": ["Study of autonomic function."],
+            "date": [datestamp],
+        }
+        return record
+
+    @patch("src.infrastructure.repositories.pmc_paper_repository.Sickle")
+    def test_repeated_searches_use_the_local_index(self, mock_sickle, tmp_path):
+        """Only the first search harvests; later ones are local lookups."""
+        mock_sickle.return_value.ListRecords.return_value = [
+            self._record("oai:pmc:PMC1", "2024-01-15", "Heart Rate Variability"),
+            self._record("oai:pmc:PMC2", "2024-01-16", "Sleep Apnea Screening"),
+        ]
+        store = OaiHarvestStore(tmp_path / OaiHarvestStore.FILENAME)
+        repository = PMCPaperRepository(harvest_store=store)
+
+        first = repository.find_by_query(
+            SearchQuery(terms=["heart rate variability"], max_results=10)
+        )
+        second = repository.find_by_query(
+            SearchQuery(terms=["sleep apnea"], max_results=10)
+        )
+
+        assert [paper.title for paper in first] == ["Heart Rate Variability"]
+        assert [paper.title for paper in second] == ["Sleep Apnea Screening"]
+        assert mock_sickle.return_value.ListRecords.call_count == 1
+        store.close()
+
+    @patch("src.infrastructure.repositories.pmc_paper_repository.Sickle")
+    def test_stale_harvest_fetches_only_new_records(self, mock_sickle, tmp_path):
+        """A refresh asks for records from the previous watermark onwards."""
+        list_records = mock_sickle.return_value.ListRecords
+        list_records.return_value = [
+            self._record("oai:pmc:PMC1", "2024-01-15", "Heart Rate Variability")
+        ]
+        now = [0.0]
+        store = OaiHarvestStore(
+            tmp_path / OaiHarvestStore.FILENAME, clock=lambda: now[0]
+        )
+        repository = PMCPaperRepository(harvest_store=store, harvest_refresh_seconds=60)
+        repository.find_by_query(SearchQuery(terms=["heart"], max_results=10))
+
+        now[0] = 3600.0
+        repository.find_by_query(SearchQuery(terms=["heart"], max_results=10))
+
+        assert list_records.call_count == 2
+        assert list_records.call_args.kwargs["from_"] == "2024-01-15"
+        store.close()
+
+    @patch("src.infrastructure.repositories.pmc_paper_repository.Sickle")
+    def test_query_without_start_date_harvests_the_lookback_window(
+        self, mock_sickle, tmp_path
+    ):
+        """An open-ended query never harvests the whole archive."""
+        list_records = mock_sickle.return_value.ListRecords
+        list_records.return_value = []
+        store = OaiHarvestStore(tmp_path / OaiHarvestStore.FILENAME)
+        repository = PMCPaperRepository(harvest_store=store, harvest_lookback_days=30)
+
+        repository.find_by_query(SearchQuery(terms=["heart"], max_results=10))
+
+        expected = datetime.now(timezone.utc) - timedelta(days=30)
+        assert list_records.call_args.kwargs["from_"] == expected.strftime("%Y-%m-%d")
+        store.close()
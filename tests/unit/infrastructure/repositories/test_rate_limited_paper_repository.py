@@ -0,0 +1,135 @@
+"""
+Test suite for RateLimitedPaperRepository.
+
+These tests verify that the throttling decorator spaces out remote calls
+according to the wrapped source's rate limits while leaving the repository
+interface unchanged.
+
+Educational Notes:
+- Injects a fake clock and sleep so timing assertions are deterministic
+- Verifies thread safety by hammering the decorator from several threads
+- Confirms the Decorator Pattern keeps the port contract intact
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.ports.paper_repository_port import PaperRepositoryPort
+from src.domain.value_objects.search_query import SearchQuery
+from src.infrastructure.repositories.rate_limited_paper_repository import (
+    RateLimitedPaperRepository,
+)
+
+
+class FakeClock:
+    """Deterministic monotonic clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        with self._lock:
+            return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def source():
+    """Mock paper source advertising two requests per second."""
+    repository = Mock(spec=PaperRepositoryPort)
+    repository.get_rate_limit_info = Mock(return_value={"requests_per_second": 2})
+    repository.find_by_query.return_value = []
+    return repository
+
+
+class TestRateLimitedPaperRepository:
+    """Behaviour of the throttling decorator."""
+
+    def test_is_a_paper_repository_port(self, source):
+        """Decorated repositories remain substitutable for the port."""
+        assert isinstance(RateLimitedPaperRepository(source), PaperRepositoryPort)
+
+    def test_reads_rate_from_source_rate_limit_info(self, source):
+        """The minimum interval is derived from get_rate_limit_info()."""
+        limited = RateLimitedPaperRepository(source)
+
+        assert limited.min_interval == pytest.approx(0.5)
+
+    def test_explicit_rate_overrides_source_info(self, source):
+        """An explicit requests_per_second takes precedence."""
+        limited = RateLimitedPaperRepository(source, requests_per_second=4)
+
+        assert limited.min_interval == pytest.approx(0.25)
+
+    def test_source_without_rate_info_is_not_throttled(self):
+        """Sources that publish no limits pass calls straight through."""
+        repository = Mock(spec=PaperRepositoryPort)
+        clock = FakeClock()
+        limited = RateLimitedPaperRepository(
+            repository, clock=clock.time, sleep=clock.sleep
+        )
+
+        limited.find_by_doi("10.1000/a")
+        limited.find_by_doi("10.1000/b")
+
+        assert limited.min_interval == 0.0
+        assert clock.sleeps == []
+
+    def test_consecutive_queries_are_spaced_by_interval(self, source):
+        """Back-to-back searches wait for successive slots."""
+        clock = FakeClock()
+        limited = RateLimitedPaperRepository(
+            source, clock=clock.time, sleep=clock.sleep
+        )
+        query = SearchQuery(terms=["heart rate variability"])
+
+        limited.find_by_query(query)
+        limited.find_by_query(query)
+        limited.find_by_query(query)
+
+        assert clock.sleeps == pytest.approx([0.5, 1.0])
+        assert source.find_by_query.call_count == 3
+
+    def test_concurrent_callers_receive_distinct_slots(self, source):
+        """Threads sharing the decorator are released one interval apart."""
+        clock = FakeClock()
+        limited = RateLimitedPaperRepository(
+            source, clock=clock.time, sleep=clock.sleep
+        )
+
+        threads = [threading.Thread(target=limited.wait_for_slot) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(clock.sleeps) == pytest.approx([0.5, 1.0, 1.5, 2.0])
+
+    def test_source_specific_helpers_pass_through(self, source):
+        """Methods outside the port are forwarded to the wrapped source."""
+        source.get_source_name = Mock(return_value="ArXiv")
+        limited = RateLimitedPaperRepository(source)
+
+        assert limited.get_source_name() == "ArXiv"
+        assert limited.wrapped_repository is source
+
+    def test_find_by_arxiv_id_is_throttled(self, source):
+        """Extra search entry points also consume request slots."""
+        source.find_by_arxiv_id = Mock(return_value=None)
+        clock = FakeClock()
+        limited = RateLimitedPaperRepository(
+            source, clock=clock.time, sleep=clock.sleep
+        )
+
+        limited.find_by_arxiv_id("2301.12345")
+        limited.find_by_arxiv_id("2301.54321")
+
+        assert clock.sleeps == pytest.approx([0.5])
+        assert source.find_by_arxiv_id.call_count == 2
@@ -0,0 +1,141 @@
+"""
+Test suite for WindowedOaiHarvester - concurrent date-windowed harvesting.
+
+Educational Concepts Demonstrated:
+- Measuring concurrency in a test: a fake source counts how many requests
+  are in flight at once
+- Testing caching behavior by counting requests on repeated harvests
+- Injecting a clock so "today" is fixed and windows are deterministic
+"""
+
+import threading
+import time
+from datetime import date, datetime, timezone
+
+from src.infrastructure.repositories.oai_harvest_store import (
+    HarvestedRecord,
+    OaiHarvestStore,
+)
+from src.infrastructure.repositories.windowed_oai_harvester import (
+    WindowedOaiHarvester,
+    host_semaphore,
+    month_windows,
+)
+
+# 2024-06-15 12:00 UTC
+NOW = datetime(2024, 6, 15, 12, tzinfo=timezone.utc).timestamp()
+
+
+class MonthlySource:
+    """Fake OAI-PMH source returning one record per requested window."""
+
+    def __init__(self, delay=0.0, failing_from=None):
+        self.delay = delay
+        self.failing_from = failing_from
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def factory(self):
+        return self.list_records
+
+    def list_records(self, **params):
+        with self._lock:
+            self.calls.append(params)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if params.get("from_") == self.failing_from:
+                raise ConnectionError("503 Service Unavailable")
+            window_from = params["from_"]
+            return [
+                HarvestedRecord(
+                    identifier=f"oai:{params.get('set')}:{window_from}",
+                    datestamp=window_from,
+                    metadata={"title": [f"Sensors paper {window_from}"]},
+                    text=f"Sensors paper {window_from}",
+                )
+            ]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def make_harvester(tmp_path, source, url, clock=lambda: NOW, **kwargs):
+    store = OaiHarvestStore(tmp_path / OaiHarvestStore.FILENAME, clock=clock)
+    harvester = WindowedOaiHarvester(
+        store, source.factory, lambda r: r, url, clock=clock, **kwargs
+    )
+    return store, harvester
+
+
+class TestMonthWindows:
+    """Date ranges are split into whole calendar months."""
+
+    def test_windows_cover_whole_months(self):
+        windows = month_windows(date(2023, 12, 20), date(2024, 2, 5))
+
+        assert [(w.from_date, w.until_date) for w in windows] == [
+            ("2023-12-01", "2023-12-31"),
+            ("2024-01-01", "2024-01-31"),
+            ("2024-02-01", "2024-02-29"),
+        ]
+
+
+class TestWindowedOaiHarvester:
+    """Windows are fetched concurrently, capped per host and cached."""
+
+    def test_windows_are_harvested_concurrently_under_the_cap(self, tmp_path):
+        source = MonthlySource(delay=0.05)
+        store, harvester = make_harvester(
+            tmp_path, source, "https://oai.test-cap.org/oai", max_concurrent_requests=2
+        )
+
+        stats = harvester.harvest(["journal:sensors"], date(2024, 1, 1))
+
+        assert stats.stored == 6  # January to June
+        assert len(store) == 6
+        assert source.max_in_flight == 2
+
+    def test_harvested_months_are_not_fetched_again(self, tmp_path):
+        """Closed months are final; only the open month is refreshed."""
+        now = [NOW]
+        source = MonthlySource()
+        _, harvester = make_harvester(
+            tmp_path,
+            source,
+            "https://oai.test-cache.org/oai",
+            clock=lambda: now[0],
+            refresh_seconds=3600,
+        )
+        harvester.harvest(["journal:sensors"], date(2024, 1, 1))
+        assert len(source.calls) == 6
+
+        harvester.harvest(["journal:sensors"], date(2024, 3, 1))
+        assert len(source.calls) == 6
+
+        now[0] += 7200
+        harvester.harvest(["journal:sensors"], date(2024, 3, 1))
+        assert [call["from_"] for call in source.calls[6:]] == ["2024-06-01"]
+
+    def test_failed_window_is_retried_without_losing_others(self, tmp_path):
+        source = MonthlySource(failing_from="2024-02-01")
+        store, harvester = make_harvester(
+            tmp_path, source, "https://oai.test-fail.org/oai"
+        )
+
+        harvester.harvest([None], date(2024, 1, 1), date(2024, 3, 31))
+        assert len(store) == 2
+
+        source.failing_from = None
+        harvester.harvest([None], date(2024, 1, 1), date(2024, 3, 31))
+        assert [call["from_"] for call in source.calls[3:]] == ["2024-02-01"]
+        assert len(store) == 3
+
+    def test_host_cap_is_shared_across_harvesters(self):
+        first = host_semaphore("https://oai.shared.org/oai", 2)
+        second = host_semaphore("https://OAI.shared.org/other", 5)
+
+        assert first is second
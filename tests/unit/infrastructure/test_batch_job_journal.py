@@ -0,0 +1,129 @@
+"""
+Tests for BatchJobJournal - durable stage completion records.
+
+Educational Notes:
+- Verifies the journal survives a "crash" by re-opening it from disk
+- Simulates a torn write to prove recovery ignores partial records
+- Exercises concurrent writers to confirm no records are lost
+"""
+
+import json
+import threading
+
+import pytest
+
+from src.infrastructure.batch_job_journal import BatchJobJournal
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    """Location of a journal file inside a temporary outputs directory."""
+    return tmp_path / "outputs" / ".batch_journal.jsonl"
+
+
+class TestBatchJobJournal:
+    """Behaviour of the append-only job journal."""
+
+    def test_new_journal_is_empty_and_creates_no_file(self, journal_path):
+        """Opening a journal does not touch the filesystem."""
+        journal = BatchJobJournal(journal_path)
+
+        assert len(journal) == 0
+        assert not journal.journal_path.exists()
+
+    def test_completed_stage_is_visible_immediately(self, journal_path):
+        """A recorded stage is reported as completed with its details."""
+        journal = BatchJobJournal(journal_path)
+
+        journal.mark_completed("hrv", "basic", "search", {"papers_found": 12})
+
+        assert journal.is_completed("hrv", "basic", "search")
+        assert not journal.is_completed("hrv", "basic", "download")
+        assert journal.stage_details("hrv", "basic", "search") == {"papers_found": 12}
+
+    def test_completions_survive_reopening(self, journal_path):
+        """A new process sees everything an earlier process recorded."""
+        first = BatchJobJournal(journal_path)
+        first.mark_completed("hrv", "basic", "search")
+        first.mark_completed("hrv", "basic", "download")
+        first.mark_completed("pqc", "lattice", "search")
+
+        reopened = BatchJobJournal(journal_path)
+
+        assert reopened.completed_stages("hrv", "basic") == {"search", "download"}
+        assert reopened.completed_stages("pqc", "lattice") == {"search"}
+        assert reopened.completed_stages("pqc", "unknown") == set()
+
+    def test_truncated_last_line_is_ignored(self, journal_path):
+        """A record torn by a crash mid-write does not break recovery."""
+        journal = BatchJobJournal(journal_path)
+        journal.mark_completed("hrv", "basic", "search")
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"config": "hrv", "strategy": "basic", "sta')
+
+        reopened = BatchJobJournal(journal_path)
+
+        assert reopened.completed_stages("hrv", "basic") == {"search"}
+
+    def test_records_after_a_torn_line_survive_replay(self, journal_path):
+        """Appending after a torn line does not merge the new record into it."""
+        journal = BatchJobJournal(journal_path)
+        journal.mark_completed("hrv", "basic", "search")
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"config": "hrv", "strategy": "basic", "sta')
+
+        resumed = BatchJobJournal(journal_path)
+        resumed.mark_completed("hrv", "basic", "download")
+
+        assert BatchJobJournal(journal_path).completed_stages("hrv", "basic") == {
+            "search",
+            "download",
+        }
+
+    def test_unknown_stage_is_rejected(self, journal_path):
+        """Only the documented stages may be recorded."""
+        journal = BatchJobJournal(journal_path)
+
+        with pytest.raises(ValueError, match="Unknown batch stage"):
+            journal.mark_completed("hrv", "basic", "publish")
+
+    def test_reset_discards_file_and_memory(self, journal_path):
+        """Reset starts a clean journal for a fresh run."""
+        journal = BatchJobJournal(journal_path)
+        journal.mark_completed("hrv", "basic", "search")
+
+        journal.reset()
+
+        assert len(journal) == 0
+        assert not journal_path.exists()
+        assert len(BatchJobJournal(journal_path)) == 0
+
+    def test_records_are_json_lines(self, journal_path):
+        """Each completion is one self-contained JSON object per line."""
+        journal = BatchJobJournal(journal_path)
+        journal.mark_completed("hrv", "basic", "hierarchy", {"total_concepts": 3})
+
+        lines = journal_path.read_text(encoding="utf-8").splitlines()
+
+        assert len(lines) == 1
+        record = json.loads(lines[0])
+        assert record["stage"] == "hierarchy"
+        assert record["details"] == {"total_concepts": 3}
+        assert "completed_at" in record
+
+    def test_concurrent_writers_do_not_lose_records(self, journal_path):
+        """Strategy workers may share one journal safely."""
+        journal = BatchJobJournal(journal_path)
+
+        def record(worker: int) -> None:
+            for stage in BatchJobJournal.STAGES:
+                journal.mark_completed("cfg", f"strategy_{worker}", stage)
+
+        threads = [threading.Thread(target=record, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        reopened = BatchJobJournal(journal_path)
+        assert len(reopened) == 8 * len(BatchJobJournal.STAGES)
@@ -0,0 +1,181 @@
+"""
+Tests for ConceptExtractionManifest - incremental concept extraction state.
+
+Educational Notes:
+- Uses small byte strings as stand-in PDFs; only their hashes matter
+- Re-opens the manifest from disk to simulate the next nightly run
+- Covers the invalidation triggers: content change, removal, new version
+"""
+
+import json
+import os
+
+import pytest
+
+from src.infrastructure.concept_extraction_manifest import (
+    ConceptExtractionManifest,
+    compute_file_sha256,
+)
+
+
+@pytest.fixture
+def pdfs_dir(tmp_path):
+    """A strategy pdfs/ folder with two fake PDFs."""
+    folder = tmp_path / "pdfs"
+    folder.mkdir()
+    (folder / "a.pdf").write_bytes(b"paper a")
+    (folder / "b.pdf").write_bytes(b"paper b")
+    return folder
+
+
+def open_manifest(pdfs_dir, version="v1"):
+    """Open the manifest stored next to the pdfs/ folder."""
+    return ConceptExtractionManifest(
+        pdfs_dir.parent / ConceptExtractionManifest.FILENAME, version
+    )
+
+
+def extract_all(manifest, pdfs_dir, prefix):
+    """Plan, record each pending PDF with a concept named after it and save."""
+    pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+    for path in pending:
+        extracted = [{"text": f"{prefix}:{path.stem}"}]
+        manifest.record(path, {"concepts": extracted, "total_extracted": 1})
+    manifest.save()
+    return pending
+
+
+def concept_texts(manifest):
+    """Texts of the concepts in the merged result."""
+    return [c["text"] for c in manifest.merged_extraction_result()["concepts"]]
+
+
+class TestConceptExtractionManifest:
+    """Behaviour of the per-strategy extraction manifest."""
+
+    def test_everything_is_pending_on_first_run(self, pdfs_dir):
+        """Without a manifest every PDF needs extraction."""
+        manifest = open_manifest(pdfs_dir)
+
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        assert [p.name for p in pending] == ["a.pdf", "b.pdf"]
+
+    def test_unchanged_folder_needs_no_extraction(self, pdfs_dir):
+        """A second run over the same files reuses cached concepts."""
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "hrv")
+
+        manifest = open_manifest(pdfs_dir)
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        assert pending == []
+        assert not manifest.has_changes
+        assert manifest.merged_extraction_result() == {
+            "concepts": [{"text": "hrv:a"}, {"text": "hrv:b"}],
+            "total_extracted": 2,
+        }
+
+    def test_new_pdf_is_extracted_alone_and_merged(self, pdfs_dir):
+        """Only the new file is pending; its result merges with the cached ones."""
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "hrv")
+        (pdfs_dir / "c.pdf").write_bytes(b"paper c")
+
+        manifest = open_manifest(pdfs_dir)
+        pending = extract_all(manifest, pdfs_dir, "ecg")
+
+        assert [p.name for p in pending] == ["c.pdf"]
+        assert concept_texts(manifest) == ["hrv:a", "hrv:b", "ecg:c"]
+
+    def test_changed_pdf_is_the_only_one_re_extracted(self, pdfs_dir):
+        """A modified file invalidates its own result and nothing else."""
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "hrv")
+        (pdfs_dir / "a.pdf").write_bytes(b"paper a, revised")
+
+        manifest = open_manifest(pdfs_dir)
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        assert [p.name for p in pending] == ["a.pdf"]
+        assert concept_texts(manifest) == ["hrv:b"]
+
+    def test_removed_pdf_no_longer_contributes(self, pdfs_dir):
+        """Concepts from a deleted file must not linger in the results."""
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "hrv")
+        (pdfs_dir / "b.pdf").unlink()
+
+        manifest = open_manifest(pdfs_dir)
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        assert pending == []
+        assert manifest.has_changes
+        assert concept_texts(manifest) == ["hrv:a"]
+
+    def test_identical_content_shares_one_result(self, pdfs_dir):
+        """A copy under a new name reuses the cached result and counts once."""
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "hrv")
+        (pdfs_dir / "a copy.pdf").write_bytes(b"paper a")
+
+        manifest = open_manifest(pdfs_dir)
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        assert pending == []
+        assert concept_texts(manifest) == ["hrv:a", "hrv:b"]
+
+    def test_touched_but_identical_pdf_stays_cached(self, pdfs_dir):
+        """A new mtime with the same bytes is not a content change."""
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "hrv")
+        stat = (pdfs_dir / "a.pdf").stat()
+        os.utime(pdfs_dir / "a.pdf", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        manifest = open_manifest(pdfs_dir)
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        assert pending == []
+        assert concept_texts(manifest) == ["hrv:a", "hrv:b"]
+
+    def test_extractor_version_change_discards_cache(self, pdfs_dir):
+        """Upgrading the extractor re-extracts everything."""
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "hrv")
+
+        manifest = open_manifest(pdfs_dir, version="v2")
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        assert len(pending) == 2
+        assert manifest.merged_extraction_result()["concepts"] == []
+
+    def test_per_batch_manifest_from_older_release_is_discarded(self, pdfs_dir):
+        """Manifests written before per-PDF caching start from scratch."""
+        manifest_path = pdfs_dir.parent / ConceptExtractionManifest.FILENAME
+        manifest_path.write_text(
+            json.dumps(
+                {
+                    "manifest_version": "1.0",
+                    "extractor_version": "v1",
+                    "pdfs": {"a.pdf": {"sha256": "x", "batch": "batch-1"}},
+                    "batches": {"batch-1": {"pdfs": ["a.pdf"], "concepts": []}},
+                }
+            )
+        )
+
+        manifest = open_manifest(pdfs_dir)
+
+        assert len(manifest.plan(sorted(pdfs_dir.glob("*.pdf")))) == 2
+
+    def test_hierarchy_flag_resets_when_cache_changes(self, pdfs_dir):
+        """A rebuilt hierarchy is only current until the next extraction."""
+        manifest = open_manifest(pdfs_dir)
+        extract_all(manifest, pdfs_dir, "hrv")
+        manifest.mark_hierarchy_built()
+        assert open_manifest(pdfs_dir).hierarchy_built
+
+        (pdfs_dir / "c.pdf").write_bytes(b"paper c")
+        extract_all(open_manifest(pdfs_dir), pdfs_dir, "ecg")
+
+        assert not open_manifest(pdfs_dir).hierarchy_built
+
+    def test_compute_file_sha256_matches_hashlib(self, pdfs_dir):
+        """Chunked hashing gives the same digest as hashing in one go."""
+        import hashlib
+
+        digest = compute_file_sha256(pdfs_dir / "a.pdf", chunk_size=2)
+
+        assert digest == hashlib.sha256(b"paper a").hexdigest()
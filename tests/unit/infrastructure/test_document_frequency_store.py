@@ -0,0 +1,105 @@
+"""
+Test suite for DocumentFrequencyStore - persistent per-domain document frequencies.
+
+Educational Concepts Demonstrated:
+- Checking incremental updates against counts worked out by hand
+- Verifying idempotency: saving the same paper twice counts it once
+"""
+
+import multiprocessing
+
+import pytest
+
+from src.infrastructure.document_frequency_store import DocumentFrequencyStore
+
+
+def readd_document(directory, times):
+    """Re-add one document repeatedly from a separate process."""
+    store = DocumentFrequencyStore(directory)
+    for _ in range(times):
+        store.remove_document("hrv", "10.1/a")
+        store.add_document("hrv", "10.1/a", ["ecg", "sleep"])
+    store.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DocumentFrequencyStore(tmp_path)
+    yield store
+    store.close()
+
+
+class TestDocumentFrequencyStore:
+    """Document frequencies follow the documents added to each domain."""
+
+    def test_counts_documents_containing_each_term(self, store):
+        store.add_document("hrv", "10.1/a", ["heart rate", "ECG", "heart rate"])
+        store.add_document("hrv", "10.1/b", ["Heart  Rate", "sleep"])
+
+        corpus = store.lookup("hrv", ["heart rate", "ecg", "sleep", "unknown"])
+
+        assert corpus.document_count == 2
+        assert corpus.frequencies == {"heart rate": 2, "ecg": 1, "sleep": 1}
+
+    def test_domains_are_counted_separately(self, store):
+        store.add_document("hrv", "10.1/a", ["security"])
+        store.add_document("cyber", "10.1/b", ["security"])
+        store.add_document("cyber", "10.1/c", ["security"])
+
+        assert store.lookup("hrv", ["security"]).frequencies == {"security": 1}
+        assert store.lookup("cyber", ["security"]).frequencies == {"security": 2}
+        assert store.domains() == ["cyber", "hrv"]
+        assert store.lookup("unknown", ["security"]).is_empty
+
+    def test_saving_a_document_again_replaces_its_terms(self, store):
+        store.add_document("hrv", "10.1/a", ["ecg", "sleep"])
+        store.add_document("hrv", "10.1/a", ["ecg", "stress"])
+
+        corpus = store.lookup("hrv", ["ecg", "sleep", "stress"])
+
+        assert corpus.document_count == 1
+        assert corpus.frequencies == {"ecg": 1, "stress": 1}
+
+    def test_removed_documents_no_longer_count(self, store):
+        store.add_document("hrv", "10.1/a", ["ecg"])
+        store.add_document("hrv", "10.1/b", ["ecg"])
+
+        store.remove_document("hrv", "10.1/a")
+
+        assert store.document_count("hrv") == 1
+        assert store.lookup("hrv", ["ecg"]).frequencies == {"ecg": 1}
+
+    def test_lookups_larger_than_a_batch(self, store):
+        terms = [f"term {index}" for index in range(1200)]
+        store.add_document("hrv", "10.1/a", terms)
+
+        corpus = store.lookup("hrv", terms)
+
+        assert len(corpus.frequencies) == 1200
+
+    def test_frequencies_persist_across_instances(self, store, tmp_path):
+        store.add_document("hrv", "10.1/a", ["ecg"])
+        store.close()
+
+        reopened = DocumentFrequencyStore(tmp_path)
+        try:
+            assert reopened.lookup("hrv", ["ecg"]).frequencies == {"ecg": 1}
+        finally:
+            reopened.close()
+
+    def test_processes_re_adding_a_document_count_it_once(self, store, tmp_path):
+        """Concurrent writers from separate processes keep df consistent."""
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=readd_document, args=(str(tmp_path), 200))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        corpus = store.lookup("hrv", ["ecg", "sleep"])
+        assert corpus.document_count == 1
+        assert corpus.frequencies == {"ecg": 1, "sleep": 1}
@@ -0,0 +1,201 @@
+"""
+Tests for DownloadExtractPipeline - overlapped downloads and extraction.
+
+Educational Notes:
+- Uses events to prove extraction starts while downloads are still running
+- Counts concurrent extractions to verify the in-flight bound
+- Runs one test through a real process pool with a module-level function
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.download_extract_pipeline import DownloadExtractPipeline
+
+
+def word_count(paper, pdf_path):
+    """Module-level (picklable) extraction function for the process pool."""
+    return len(Path(pdf_path).read_text().split())
+
+
+class TestDownloadExtractPipeline:
+    """Behaviour of the two-stage pipeline."""
+
+    def _write_pdf(self, tmp_path, name, text="some extracted words"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_text(text)
+        return path
+
+    def test_results_are_delivered_for_every_download(self, tmp_path):
+        """Each downloaded PDF is extracted and reported once."""
+        results = {}
+        pipeline = DownloadExtractPipeline(
+            download=lambda paper: self._write_pdf(tmp_path, paper),
+            extract=lambda paper, path: path.name.upper(),
+            on_result=lambda paper, path, result: results.update({paper: result}),
+            download_workers=3,
+            executor_factory=ThreadPoolExecutor,
+        )
+
+        stats = pipeline.run([f"paper{i}" for i in range(10)])
+
+        assert stats.downloaded == 10
+        assert stats.extracted == 10
+        assert results["paper3"] == "PAPER3.PDF"
+
+    def test_extraction_overlaps_with_downloads(self, tmp_path):
+        """The first PDF is extracted before the last download finishes."""
+        first_extracted = threading.Event()
+
+        def download(paper):
+            if paper == "last":
+                # Blocks forever (and times out) if extraction waits for all downloads
+                assert first_extracted.wait(timeout=5)
+            return self._write_pdf(tmp_path, paper)
+
+        def extract(paper, path):
+            if paper == "first":
+                first_extracted.set()
+            return paper
+
+        pipeline = DownloadExtractPipeline(
+            download=download,
+            extract=extract,
+            download_workers=1,
+            executor_factory=ThreadPoolExecutor,
+        )
+
+        stats = pipeline.run(["first", "last"])
+
+        assert stats.downloaded == 2
+        assert stats.extracted == 2
+
+    def test_in_flight_extractions_are_bounded(self, tmp_path):
+        """No more than queue_size extractions run at the same time."""
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def extract(paper, path):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.01)
+            with lock:
+                active["now"] -= 1
+            return paper
+
+        pipeline = DownloadExtractPipeline(
+            download=lambda paper: self._write_pdf(tmp_path, paper),
+            extract=extract,
+            download_workers=4,
+            extract_workers=8,
+            queue_size=2,
+            executor_factory=ThreadPoolExecutor,
+        )
+
+        stats = pipeline.run([f"paper{i}" for i in range(20)])
+
+        assert stats.extracted == 20
+        assert active["peak"] <= 2
+
+    def test_failures_are_counted_not_raised(self, tmp_path):
+        """A failing download or extraction does not stop the other papers."""
+
+        def download(paper):
+            if paper == "offline":
+                raise ConnectionError("host unreachable")
+            if paper == "no_pdf":
+                return None
+            return self._write_pdf(tmp_path, paper)
+
+        def extract(paper, path):
+            if paper == "corrupt":
+                raise ValueError("not a PDF")
+            return paper
+
+        pipeline = DownloadExtractPipeline(
+            download=download, extract=extract, executor_factory=ThreadPoolExecutor
+        )
+
+        stats = pipeline.run(["ok", "offline", "no_pdf", "corrupt"])
+
+        assert stats.downloaded == 2
+        assert stats.download_failures == 2
+        assert stats.extracted == 1
+        assert stats.extraction_failures == 1
+        assert any("host unreachable" in error for error in stats.errors)
+        assert any("not a PDF" in error for error in stats.errors)
+
+    def test_downloads_only_without_extract_stage(self, tmp_path):
+        """The pipeline can be used as a plain concurrent downloader."""
+        pipeline = DownloadExtractPipeline(
+            download=lambda paper: self._write_pdf(tmp_path, paper)
+        )
+
+        stats = pipeline.run(["a", "b", "c"])
+
+        assert stats.downloaded == 3
+        assert stats.extracted == 0
+        assert len(list(tmp_path.glob("*.pdf"))) == 3
+
+    def test_default_process_pool_runs_picklable_extractors(self, tmp_path):
+        """CPU-bound extraction runs in worker processes by default."""
+        results = {}
+        pipeline = DownloadExtractPipeline(
+            download=lambda paper: self._write_pdf(tmp_path, paper, "one two three"),
+            extract=word_count,
+            on_result=lambda paper, path, result: results.update({paper: result}),
+            extract_workers=2,
+        )
+
+        stats = pipeline.run(["x", "y"])
+
+        assert stats.extracted == 2
+        assert results == {"x": 3, "y": 3}
+
+    def test_shared_executor_is_reused_and_left_running(self, tmp_path):
+        """A caller-owned executor serves several runs and is not shut down."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for run in range(2):
+                pipeline = DownloadExtractPipeline(
+                    download=lambda paper: self._write_pdf(tmp_path, paper),
+                    extract=lambda paper, path: paper,
+                    executor=executor,
+                )
+                assert pipeline.run([f"run{run}-{i}" for i in range(3)]).extracted == 3
+
+            assert executor.submit(lambda: "still open").result() == "still open"
+
+    def test_broken_extraction_stage_releases_download_threads(self, tmp_path):
+        """If submitting fails, downloads stop and no thread stays blocked."""
+        downloads = []
+
+        class BrokenExecutor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                raise RuntimeError("pool is broken")
+
+        def download(paper):
+            downloads.append(paper)
+            return self._write_pdf(tmp_path, paper)
+
+        threads_before = threading.active_count()
+        pipeline = DownloadExtractPipeline(
+            download=download,
+            extract=lambda paper, path: paper,
+            download_workers=2,
+            queue_size=2,
+            executor_factory=BrokenExecutor,
+        )
+
+        with pytest.raises(RuntimeError, match="pool is broken"):
+            pipeline.run([f"paper{i}" for i in range(100)])
+
+        deadline = time.monotonic() + 5
+        while threading.active_count() > threads_before and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert threading.active_count() == threads_before
+        assert len(downloads) < 100
@@ -0,0 +1,109 @@
+"""
+Test suite for ExtractedTextCache - extracted PDF text by content hash.
+
+Educational Concepts Demonstrated:
+- Keys built from file content and settings: renaming a file keeps the
+  key, changing one byte or one setting changes it
+- LRU eviction under a byte budget, driven by an injected clock
+- Pickling a cache for a worker process and seeing the worker's lookups in
+  the shared counters
+"""
+
+import pickle
+
+import pytest
+
+from src.infrastructure.extracted_text_cache import ExtractedTextCache
+
+SETTINGS = {"clean_text": True, "min_text_length": 100, "max_text_length": 1000}
+TEXT = "Heart rate variability reflects autonomic balance. " * 40
+
+
+class FakeClock:
+    """Settable wall clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = ExtractedTextCache(tmp_path / ExtractedTextCache.DIRNAME, clock=clock)
+    yield cache
+    cache.close()
+
+
+def pdf(tmp_path, name="paper.pdf", content=b"%PDF-1.4 hrv"):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+class TestExtractedTextCache:
+    """Keys, storage, statistics and eviction."""
+
+    def test_key_depends_on_content_and_settings_not_name(self, tmp_path):
+        key = ExtractedTextCache.key_for(pdf(tmp_path), SETTINGS)
+
+        renamed = ExtractedTextCache.key_for(pdf(tmp_path, "copy.pdf"), SETTINGS)
+        changed = ExtractedTextCache.key_for(
+            pdf(tmp_path, "v2.pdf", b"%PDF-1.4 hrv v2"), SETTINGS
+        )
+        reconfigured = ExtractedTextCache.key_for(
+            pdf(tmp_path), {**SETTINGS, "clean_text": False}
+        )
+
+        assert key == renamed
+        assert len({key, changed, reconfigured}) == 3
+
+    def test_round_trip_is_compressed_and_counted(self, cache, tmp_path):
+        key = ExtractedTextCache.key_for(pdf(tmp_path), SETTINGS)
+
+        assert cache.get(key) is None
+        assert cache.put(key, TEXT)
+        assert cache.get(key) == TEXT
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+        assert stats["bytes"] < len(TEXT) / 5
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, clock):
+        """A budget one byte short of three texts evicts the stalest one."""
+        texts = [f"{n} " + "unique words " * 10 * n for n in (1, 2, 3)]
+        probe = ExtractedTextCache(tmp_path / "probe", clock=clock)
+        for n, text in enumerate(texts):
+            probe.put(f"key-{n}", text)
+        budget = probe.total_bytes() - 1
+        probe.close()
+        cache = ExtractedTextCache(tmp_path / "bounded", max_bytes=budget, clock=clock)
+
+        for n, text in enumerate(texts[:2]):
+            clock.now += 1
+            cache.put(f"key-{n}", text)
+        clock.now += 1
+        cache.get("key-0")
+        clock.now += 1
+        cache.put("key-2", texts[2])
+
+        assert cache.get("key-1") is None
+        assert cache.get("key-0") == texts[0]
+        assert cache.total_bytes() <= budget
+        cache.close()
+
+    def test_pickled_cache_shares_the_database(self, cache):
+        cache.put("key", TEXT)
+
+        copy = pickle.loads(pickle.dumps(cache))
+
+        assert copy.get("key") == TEXT
+        assert cache.stats()["hits"] == 1
+        copy.close()
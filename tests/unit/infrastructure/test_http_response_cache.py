@@ -0,0 +1,174 @@
+"""
+Tests for HttpResponseCache and CachingSession - on-disk API response reuse.
+
+Educational Notes:
+- Builds real requests.Response objects so cached replies are checked with
+  the same attributes repositories read (content, text, status_code)
+- Patches requests.Session.request, the network boundary below CachingSession
+- Uses a fake clock to age entries past their TTL
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.infrastructure.http_response_cache import (
+    CacheMissError,
+    CachingSession,
+    HttpResponseCache,
+)
+
+ARXIV_URL = "http://export.arxiv.org/api/query"
+
+
+def make_response(body=b"<feed>papers</feed>", status_code=200):
+    """Create a response as requests would return it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers["Content-Type"] = "application/atom+xml"
+    response.encoding = "utf-8"
+    response.url = ARXIV_URL
+    return response
+
+
+class FakeClock:
+    """Settable wall clock."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = HttpResponseCache(tmp_path / "http", ttl_seconds=60, clock=clock)
+    yield cache
+    cache.close()
+
+
+class TestHttpResponseCache:
+    """Storage, freshness and eviction."""
+
+    def test_equivalent_requests_share_a_key(self):
+        """Parameter order, None values and host case do not matter."""
+        key = HttpResponseCache.cache_key(
+            "get", ARXIV_URL, {"search_query": "hrv", "start": 0, "set": None}
+        )
+
+        assert key == HttpResponseCache.cache_key(
+            "GET", "http://EXPORT.arxiv.org/api/query?start=0", {"search_query": "hrv"}
+        )
+        assert key != HttpResponseCache.cache_key(
+            "GET", ARXIV_URL, {"search_query": "hrv", "start": 100}
+        )
+
+    def test_stored_response_is_replayed(self, cache):
+        """A cached reply carries the original body, status and headers."""
+        cache.put("GET", ARXIV_URL, {"start": 0}, make_response())
+
+        cached = cache.get("GET", ARXIV_URL, {"start": 0})
+
+        assert cached.from_cache is True
+        assert cached.status_code == 200
+        assert cached.content == b"<feed>papers</feed>"
+        assert cached.text == "<feed>papers</feed>"
+        assert cached.headers["content-type"] == "application/atom+xml"
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        """A response older than the TTL is a miss."""
+        cache.put("GET", ARXIV_URL, None, make_response())
+
+        clock.now += 61
+
+        assert cache.get("GET", ARXIV_URL) is None
+
+    def test_error_responses_are_not_cached(self, cache):
+        """Failures are always retried against the network."""
+        assert not cache.put("GET", ARXIV_URL, None, make_response(status_code=503))
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path, clock):
+        """The cache stays under max_bytes by dropping the oldest accessed entry."""
+        body = os.urandom(2000)  # random bytes do not compress
+        cache = HttpResponseCache(tmp_path / "http", max_bytes=5000, clock=clock)
+        for start in range(2):
+            cache.put("GET", ARXIV_URL, {"start": start}, make_response(body))
+            clock.now += 1
+        cache.get("GET", ARXIV_URL, {"start": 0})  # refresh the first entry
+        clock.now += 1
+
+        cache.put("GET", ARXIV_URL, {"start": 2}, make_response(body))
+
+        assert cache.total_bytes() <= 5000
+        assert cache.get("GET", ARXIV_URL, {"start": 0}) is not None
+        assert cache.get("GET", ARXIV_URL, {"start": 1}) is None
+        cache.close()
+
+    def test_entries_survive_reopening(self, tmp_path, cache, clock):
+        """A later run reads responses recorded by an earlier one."""
+        cache.put("GET", ARXIV_URL, {"start": 0}, make_response())
+        cache.close()
+
+        reopened = HttpResponseCache(tmp_path / "http", clock=clock)
+
+        assert reopened.get("GET", ARXIV_URL, {"start": 0}) is not None
+        reopened.close()
+
+
+class TestCachingSession:
+    """Network behaviour of the caching session."""
+
+    @patch("requests.Session.request")
+    def test_second_identical_get_skips_the_network(self, mock_request, cache):
+        """Only the first of two identical queries is sent."""
+        mock_request.return_value = make_response()
+        session = CachingSession(cache)
+
+        first = session.get(ARXIV_URL, params={"search_query": "hrv"}, timeout=30)
+        second = session.get(ARXIV_URL, params={"search_query": "hrv"}, timeout=30)
+
+        assert mock_request.call_count == 1
+        assert second.content == first.content
+        assert second.from_cache is True
+
+    @patch("requests.Session.request")
+    def test_replay_only_mode_never_touches_the_network(
+        self, mock_request, tmp_path, clock
+    ):
+        """Stale entries are served and misses raise a connection error."""
+        cache = HttpResponseCache(
+            tmp_path / "http", ttl_seconds=1, replay_only=True, clock=clock
+        )
+        cache.put("GET", ARXIV_URL, {"start": 0}, make_response())
+        clock.now += 3600
+        session = CachingSession(cache)
+
+        assert session.get(ARXIV_URL, params={"start": 0}).status_code == 200
+        with pytest.raises(requests.ConnectionError):
+            session.get(ARXIV_URL, params={"start": 100})
+        mock_request.assert_not_called()
+        cache.close()
+
+    @patch("requests.Session.request")
+    def test_streaming_requests_bypass_the_cache(self, mock_request, cache):
+        """PDF downloads (stream=True) are never stored."""
+        mock_request.return_value = make_response(b"%PDF-1.4")
+        session = CachingSession(cache)
+
+        session.get("https://arxiv.org/pdf/2401.00001.pdf", stream=True)
+
+        assert len(cache) == 0
+
+    def test_cache_miss_error_is_a_request_exception(self):
+        """Repositories' existing network error handling covers replay misses."""
+        assert issubclass(CacheMissError, requests.RequestException)
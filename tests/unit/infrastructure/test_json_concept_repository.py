@@ -0,0 +1,85 @@
+"""
+Test suite for JSONConceptRepository's document frequency store.
+
+Educational Concepts Demonstrated:
+- Wiring the repository's store into the TF-IDF extractor the way the batch
+  processor does, and observing the corpus the extractor builds
+- Checking that scoring depends on what papers contain, not on which of
+  their terms were picked as concepts, so re-saving papers is harmless
+"""
+
+from src.domain.entities.concept import Concept
+from src.domain.entities.paper_concepts import PaperConcepts
+from src.domain.services.concept_extractor import TFIDFConceptExtractor
+from src.infrastructure.json_concept_repository import JSONConceptRepository
+
+TEXTS = {
+    "10.1/a": "Heart rate variability predicts stress. " * 3 + "Wearable sensor. " * 2,
+    "10.1/b": "Sleep staging with polysomnography recordings. " * 3
+    + "Wearable sensor. " * 2,
+    "10.1/c": "Electrodermal activity tracks arousal. " * 3 + "Wearable sensor. " * 2,
+}
+
+
+def paper(doi, concepts):
+    return PaperConcepts(paper_doi=doi, paper_title=f"Paper {doi}", concepts=concepts)
+
+
+def ranking(concepts):
+    return [(c.text, c.relevance_score) for c in concepts]
+
+
+class TestDocumentFrequencyStore:
+    """The repository owns the store; the extractor fills it."""
+
+    def extract_all(self, repository, extractor):
+        results = {}
+        for doi, text in TEXTS.items():
+            results[doi] = extractor.extract_concepts(text, doi, domain="hrv")
+            repository.save_paper_concepts(paper(doi, results[doi]))
+        return results
+
+    def test_corpus_counts_every_scored_term(self, tmp_path):
+        repository = JSONConceptRepository(tmp_path)
+        extractor = TFIDFConceptExtractor(
+            top_n_concepts=1, document_frequencies=repository.document_frequencies
+        )
+
+        results = self.extract_all(repository, extractor)
+
+        picked = {c.text for concepts in results.values() for c in concepts}
+        corpus = repository.document_frequencies.lookup("hrv", ["wearable sensor"])
+        assert "wearable sensor" not in picked
+        assert corpus.document_count == 3
+        assert corpus.frequencies == {"wearable sensor": 3}
+        assert (tmp_path / "statistics" / "document_frequency.sqlite").exists()
+
+    def test_rankings_are_stable_when_papers_are_saved_again(self, tmp_path):
+        repository = JSONConceptRepository(tmp_path)
+        extractor = TFIDFConceptExtractor(
+            min_frequency=1, document_frequencies=repository.document_frequencies
+        )
+
+        self.extract_all(repository, extractor)
+        before = self.extract_all(repository, extractor)
+        after = self.extract_all(repository, extractor)
+
+        assert {doi: ranking(c) for doi, c in after.items()} == {
+            doi: ranking(c) for doi, c in before.items()
+        }
+        assert repository.document_frequencies.document_count("hrv") == 3
+
+    def test_saving_concepts_leaves_the_corpus_unchanged(self, tmp_path):
+        repository = JSONConceptRepository(tmp_path)
+        concept = Concept(
+            text="ecg",
+            frequency=2,
+            relevance_score=0.5,
+            source_papers={"10.1/a"},
+            source_domain="hrv",
+        )
+
+        repository.save_paper_concepts(paper("10.1/a", [concept]))
+
+        assert repository.find_paper_concepts_by_doi("10.1/a") is not None
+        assert repository.document_frequencies.document_count("hrv") == 0
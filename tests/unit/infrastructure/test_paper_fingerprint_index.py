@@ -0,0 +1,144 @@
+"""
+Tests for PaperFingerprintIndex - persistent cross-run duplicate detection.
+
+Educational Notes:
+- Re-opens the index from disk to simulate a later batch run
+- Uses fingerprint-equivalent papers (same DOI, different titles) to verify
+  that identity follows PaperFingerprint rather than raw metadata
+- Reads from several threads to exercise per-thread connections
+"""
+
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from src.domain.entities.research_paper import ResearchPaper
+from src.domain.value_objects.paper_fingerprint import PaperFingerprint
+from src.infrastructure.paper_fingerprint_index import PaperFingerprintIndex
+
+
+def make_paper(title, doi=None, arxiv_id=None, year=2024, authors=None):
+    """Create a minimal paper for indexing."""
+    return ResearchPaper(
+        title=title,
+        authors=authors or ["Jane Smith"],
+        abstract="Abstract",
+        publication_date=datetime(year, 5, 1, tzinfo=timezone.utc),
+        doi=doi,
+        arxiv_id=arxiv_id,
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    """A fresh index stored in a temporary outputs directory."""
+    idx = PaperFingerprintIndex(tmp_path / "outputs" / PaperFingerprintIndex.FILENAME)
+    yield idx
+    idx.close()
+
+
+class TestPaperFingerprintIndex:
+    """Behaviour of the on-disk fingerprint index."""
+
+    def test_empty_index_contains_nothing(self, index):
+        """A new index reports no papers."""
+        assert len(index) == 0
+        assert make_paper("Anything", doi="10.1/x") not in index
+
+    def test_added_papers_are_found_with_their_location(self, index):
+        """Bulk-added papers are members and remember where they were stored."""
+        papers = [
+            make_paper("HRV Study", doi="10.1/hrv"),
+            make_paper("ECG Study", doi="10.1/ecg"),
+        ]
+
+        added = index.add_many(papers, "heart_rate_variability", "basic")
+
+        assert added == 2
+        assert papers[0] in index
+        assert index.locate(papers[1]) == ("heart_rate_variability", "basic")
+
+    def test_identity_follows_fingerprint_not_title(self, index):
+        """The same DOI with a reformatted title is the same paper."""
+        index.add_many([make_paper("Deep Learning", doi="10.1/dl")], "cfg", "a")
+
+        assert make_paper("DEEP LEARNING: a survey", doi="10.1/dl") in index
+
+    def test_arxiv_versions_share_an_entry(self, index):
+        """Preprint versions collapse onto one fingerprint."""
+        index.add_many([make_paper("Preprint", arxiv_id="2401.00001v1")], "cfg", "a")
+
+        assert make_paper("Preprint", arxiv_id="2401.00001v3") in index
+
+    def test_composite_fingerprints_include_publication_year(self, index):
+        """Without identifiers, a different year is a different paper."""
+        index.add_many([make_paper("Untracked Paper", year=2022)], "cfg", "a")
+
+        assert make_paper("Untracked Paper", year=2022) in index
+        assert make_paper("Untracked Paper", year=2023) not in index
+
+    def test_first_location_wins(self, index):
+        """Re-adding a paper from another strategy keeps the original owner."""
+        paper = make_paper("Shared", doi="10.1/shared")
+        index.add_many([paper], "cfg_one", "a")
+
+        added = index.add_many([paper], "cfg_two", "b")
+
+        assert added == 0
+        assert index.locate(paper) == ("cfg_one", "a")
+        assert len(index) == 1
+
+    def test_fingerprints_are_accepted_directly(self, index):
+        """Callers holding a PaperFingerprint need not rebuild the paper."""
+        fingerprint = PaperFingerprint.from_paper(
+            make_paper("Fingerprinted", doi="10.1/fp")
+        )
+
+        index.add_many([fingerprint], "cfg", "a")
+
+        assert fingerprint in index
+
+    def test_entries_survive_reopening(self, index):
+        """A later run sees papers stored by earlier runs."""
+        index.add_many([make_paper("Persisted", doi="10.1/p")], "cfg", "a")
+        index.close()
+
+        reopened = PaperFingerprintIndex(index.index_path)
+
+        assert reopened.locate(make_paper("Persisted", doi="10.1/p")) == ("cfg", "a")
+        reopened.close()
+
+    def test_concurrent_readers_and_writer(self, index):
+        """Threads can query the index while another thread writes to it."""
+        index.add_many(
+            [make_paper(f"Seed {i}", doi=f"10.1/s{i}") for i in range(50)], "cfg", "a"
+        )
+        failures = []
+
+        def read():
+            try:
+                for i in range(50):
+                    assert make_paper(f"Seed {i}", doi=f"10.1/s{i}") in index
+            except Exception as e:  # pragma: no cover - reported below
+                failures.append(e)
+            finally:
+                index.close()
+
+        def write():
+            index.add_many(
+                [make_paper(f"New {i}", doi=f"10.1/n{i}") for i in range(50)],
+                "cfg",
+                "b",
+            )
+            index.close()
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert failures == []
+        assert len(index) == 100
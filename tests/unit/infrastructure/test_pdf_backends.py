@@ -0,0 +1,159 @@
+"""
+Test suite for the pluggable PDF backends.
+
+Educational Concepts Demonstrated:
+- Building a minimal, valid PDF in memory instead of shipping binary fixtures
+- Simulating installed and missing optional libraries by patching the probe
+"""
+
+import sys
+import threading
+import time
+import types
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure import pdf_backends
+from src.infrastructure.pdf_backends import (
+    PdfiumBackend,
+    PyMuPDFBackend,
+    PyPDF2Backend,
+    available_backends,
+    select_backends,
+)
+
+
+def minimal_pdf(*page_texts):
+    """Return the bytes of a PDF with one Helvetica text line per page."""
+    page_count = len(page_texts)
+    kids = " ".join(f"{3 + 2 * index} 0 R" for index in range(page_count))
+    font = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>".encode(),
+    ]
+    for index, text in enumerate(page_texts):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {4 + 2 * index} 0 R "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> >>".encode()
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    content = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(content))
+        content += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(content)
+    content += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        content += b"%010d 00000 n \n" % offset
+    content += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(content)
+
+
+class TestPyPDF2Backend:
+    """The fallback backend reads real PDFs page by page."""
+
+    def test_reads_each_page(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(minimal_pdf("Heart rate variability", "Sleep stages"))
+
+        with PyPDF2Backend().open(pdf_path) as document:
+            texts = [document.page_text(i) for i in range(document.page_count)]
+
+        assert texts == ["Heart rate variability", "Sleep stages"]
+
+    def test_unreadable_file_raises(self, tmp_path):
+        pdf_path = tmp_path / "broken.pdf"
+        pdf_path.write_bytes(b"not a pdf at all")
+
+        with pytest.raises(Exception):
+            PyPDF2Backend().open(pdf_path)
+
+
+class TestBackendSelection:
+    """Installed libraries are probed and PyPDF2 always comes last."""
+
+    def test_available_backends_follow_installed_libraries(self):
+        installed = {"fitz", "PyPDF2"}
+
+        with patch.object(
+            pdf_backends.importlib.util,
+            "find_spec",
+            side_effect=lambda name: object() if name in installed else None,
+        ):
+            backends = available_backends()
+
+        assert [backend.name for backend in backends] == ["pymupdf", "pypdf2"]
+
+    def test_pypdf2_is_appended_as_last_resort(self):
+        with patch.object(PdfiumBackend, "is_available", return_value=True):
+            backends = select_backends(["pypdf2", "pypdfium2"])
+
+        assert [backend.name for backend in backends] == ["pypdfium2", "pypdf2"]
+
+    def test_unknown_and_missing_backends_are_rejected(self):
+        with pytest.raises(ValueError, match="Unknown PDF backends"):
+            select_backends(["ghostscript"])
+        with patch.object(PyMuPDFBackend, "is_available", return_value=False):
+            with pytest.raises(ValueError, match="not installed"):
+                select_backends(["pymupdf"])
+
+
+class TestThreadSafety:
+    """MuPDF is not thread-safe, so its calls never overlap."""
+
+    def test_pymupdf_calls_from_threads_take_turns(self, tmp_path):
+        in_flight = []
+        overlaps = []
+        guard = threading.Lock()
+
+        def exclusive(result):
+            with guard:
+                in_flight.append(1)
+                overlaps.append(len(in_flight))
+            time.sleep(0.002)
+            with guard:
+                in_flight.pop()
+            return result
+
+        class FakePage:
+            def get_text(self):
+                return exclusive("page text")
+
+        class FakeDocument:
+            needs_pass = False
+            page_count = 3
+
+            def load_page(self, index):
+                return exclusive(FakePage())
+
+            def close(self):
+                exclusive(None)
+
+        fake_fitz = types.SimpleNamespace(open=lambda path: exclusive(FakeDocument()))
+
+        def read_pdf():
+            with PyMuPDFBackend().open(tmp_path / "paper.pdf") as document:
+                for index in range(document.page_count):
+                    document.page_text(index)
+
+        with patch.dict(sys.modules, {"fitz": fake_fitz}):
+            threads = [threading.Thread(target=read_pdf) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(overlaps) == 6 * (1 + 3 * 2 + 1)
+        assert max(overlaps) == 1
@@ -0,0 +1,106 @@
+"""
+Test suite for BatchPdfExtractor - process-pool PDF extraction.
+
+Educational Concepts Demonstrated:
+- Testing process pools with a fake extractor whose behavior is chosen by
+  file name: it can answer, fail, hang or kill its own process
+- Observing worker recycling through the process ids that produced each
+  result
+- Bounding test run time with short per-file timeouts
+"""
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from src.infrastructure.pdf_batch_extractor import BatchPdfExtractor
+
+
+class FakeExtractor:
+    """Extractor that reports its process id instead of parsing PDFs."""
+
+    def __init__(self, prefix="text"):
+        self.prefix = prefix
+
+    def extract_text_from_pdf(self, pdf_path):
+        if pdf_path.stem.startswith("hang"):
+            time.sleep(60)
+        if pdf_path.stem.startswith("crash"):
+            os._exit(3)
+        if pdf_path.stem.startswith("bad"):
+            raise ValueError(f"PDF format error in {pdf_path}")
+        return f"{self.prefix}:{pdf_path.stem}:{os.getpid()}"
+
+
+def make_extractor(**kwargs):
+    kwargs.setdefault("extractor_factory", FakeExtractor)
+    return BatchPdfExtractor(**kwargs)
+
+
+def pdfs(tmp_path, *stems):
+    return [tmp_path / f"{stem}.pdf" for stem in stems]
+
+
+class TestBatchPdfExtractor:
+    """Parallel extraction, isolation of bad files and recycling."""
+
+    def test_results_stream_back_for_every_file(self, tmp_path):
+        extractor = make_extractor(workers=2, extractor_options={"prefix": "ok"})
+        paths = pdfs(tmp_path, "alpha", "beta", "gamma")
+
+        results = list(extractor.iter_extract(paths))
+
+        assert sorted(r.pdf_path for r in results) == sorted(paths)
+        assert all(r.succeeded and r.text.startswith("ok:") for r in results)
+
+    def test_hung_file_times_out_without_stalling_others(self, tmp_path):
+        extractor = make_extractor(workers=2, timeout=1.0)
+        paths = pdfs(tmp_path, "hang", "alpha", "beta", "gamma")
+
+        started = time.monotonic()
+        results = extractor.extract_all(paths)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 10
+        assert results[paths[0]].timed_out
+        assert not results[paths[0]].succeeded
+        assert all(results[path].succeeded for path in paths[1:])
+
+    def test_errors_and_crashes_fail_only_their_file(self, tmp_path):
+        extractor = make_extractor(workers=1)
+        paths = pdfs(tmp_path, "bad", "crash", "alpha")
+
+        results = extractor.extract_all(paths)
+
+        assert "PDF format error" in results[paths[0]].error
+        assert "exit code 3" in results[paths[1]].error
+        assert results[paths[2]].succeeded
+        assert list(results) == paths
+
+    def test_workers_are_recycled_after_their_quota(self, tmp_path):
+        extractor = make_extractor(workers=1, max_files_per_worker=2)
+        paths = pdfs(tmp_path, "a", "b", "c", "d", "e")
+
+        results = extractor.extract_all(paths)
+
+        pids = [results[path].text.rsplit(":", 1)[1] for path in paths]
+        assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+        assert extractor.workers_started == 3
+
+    def test_closing_the_iterator_stops_the_workers(self, tmp_path):
+        extractor = make_extractor(workers=2)
+        iterator = extractor.iter_extract(pdfs(tmp_path, "hang", "alpha"))
+
+        first = next(iterator)
+        iterator.close()
+
+        assert first.succeeded
+        assert not multiprocessing.active_children()
+
+    def test_rejects_non_positive_limits(self):
+        with pytest.raises(ValueError):
+            BatchPdfExtractor(timeout=0)
+        with pytest.raises(ValueError):
+            BatchPdfExtractor(max_files_per_worker=0)
@@ -0,0 +1,107 @@
+"""
+Test suite for PdfBlobStore - content-addressed PDF storage.
+
+Educational Concepts Demonstrated:
+- Verifying deduplication through inode numbers: hard links to one object
+  share an inode, copies do not
+- Testing fallbacks by making the preferred operation (os.link) fail
+"""
+
+import hashlib
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.pdf_blob_store import PdfBlobStore
+
+PDF = b"%PDF-1.4\nheart rate variability\n%%EOF\n"
+DIGEST = hashlib.sha256(PDF).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PdfBlobStore(tmp_path / PdfBlobStore.DIRNAME)
+    yield store
+    store.close()
+
+
+def downloaded(tmp_path, name="download.pdf", content=PDF):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+class TestPdfBlobStore:
+    """Objects are stored once, found by URL and linked into place."""
+
+    def test_put_moves_file_under_its_digest(self, store, tmp_path):
+        path = downloaded(tmp_path)
+
+        digest = store.put(path, "https://arxiv.org/pdf/2301.00001.pdf")
+
+        assert digest == DIGEST
+        assert not path.exists()
+        assert store.path_for(digest).read_bytes() == PDF
+        assert digest in store
+        assert store.lookup("https://arxiv.org/pdf/2301.00001.pdf") == DIGEST
+        assert store.lookup("https://arxiv.org/pdf/unknown.pdf") is None
+
+    def test_identical_content_is_stored_once(self, store, tmp_path):
+        first = store.put(downloaded(tmp_path, "a.pdf"), "https://a.org/1.pdf")
+        second = store.put(downloaded(tmp_path, "b.pdf"), "https://b.org/2.pdf")
+
+        assert first == second
+        assert len(list(store.objects_dir.rglob("*.pdf"))) == 1
+
+    def test_strategy_views_are_hard_links(self, store, tmp_path):
+        digest = store.put(downloaded(tmp_path))
+
+        first = store.link_into(digest, tmp_path / "config_a" / "pdfs" / "Paper.pdf")
+        second = store.link_into(digest, tmp_path / "config_b" / "pdfs" / "Paper.pdf")
+
+        inode = store.path_for(digest).stat().st_ino
+        assert first.stat().st_ino == second.stat().st_ino == inode
+        assert first.read_bytes() == PDF
+        assert store.digest_of(first) == digest
+        assert not list(first.parent.glob(".*.tmp"))
+
+    def test_symlink_fallback_across_file_systems(self, store, tmp_path):
+        digest = store.put(downloaded(tmp_path))
+
+        with patch("os.link", side_effect=OSError("cross-device link")):
+            view = store.link_into(digest, tmp_path / "pdfs" / "Paper.pdf")
+
+        assert view.is_symlink()
+        assert store.digest_of(view) == digest
+
+    def test_objects_are_read_only(self, store, tmp_path):
+        digest = store.put(downloaded(tmp_path))
+
+        assert not os.stat(store.path_for(digest)).st_mode & 0o222
+
+    def test_validators_are_recorded_and_updated(self, store, tmp_path):
+        url = "https://arxiv.org/pdf/2301.00001.pdf"
+        store.put(downloaded(tmp_path), url, {"etag": '"v1"', "content_length": "38"})
+
+        store.update_validators(url, {"etag": '"v2"', "content_length": "38"})
+
+        assert store.validators(url) == {"etag": '"v2"', "content_length": "38"}
+        assert store.validators("https://arxiv.org/pdf/unknown.pdf") == {}
+
+    def test_index_without_validator_columns_is_upgraded(self, tmp_path):
+        """Stores created before validators were recorded keep working."""
+        root = tmp_path / PdfBlobStore.DIRNAME
+        root.mkdir()
+        with sqlite3.connect(str(root / PdfBlobStore.INDEX_FILENAME)) as connection:
+            connection.execute(
+                "CREATE TABLE urls (url TEXT PRIMARY KEY, digest TEXT NOT NULL, "
+                "size INTEGER NOT NULL, added_at TEXT NOT NULL)"
+            )
+        store = PdfBlobStore(root)
+
+        store.put(downloaded(tmp_path), "https://a.org/1.pdf", {"etag": '"v1"'})
+
+        assert store.validators("https://a.org/1.pdf") == {"etag": '"v1"'}
+        store.close()
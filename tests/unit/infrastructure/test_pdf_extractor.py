@@ -0,0 +1,204 @@
+"""
+Test suite for PyPDF2TextExtractor's extracted-text cache and streaming.
+
+Educational Concepts Demonstrated:
+- Counting parses by patching PdfReader where the PyPDF2 backend looks it up
+- Proving that pages past the length budget are never read
+- Faking a fast backend that fails to exercise the per-file fallback
+- Running one test against both extractor modules with parametrization
+"""
+
+import importlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure import pdf_backends
+from src.infrastructure.extracted_text_cache import ExtractedTextCache
+
+PAGE_TEXT = "Heart rate variability is a marker of autonomic function. " * 5
+
+EXTRACTOR_MODULES = [
+    "src.infrastructure.pdf_extractor",
+    "src.infrastructure.services.pdf_extractor",
+]
+
+
+def fake_reader(*args, pages=1, **kwargs):
+    reader = MagicMock()
+    reader.is_encrypted = False
+    reader.pages = [MagicMock() for _ in range(pages)]
+    for page in reader.pages:
+        page.extract_text.return_value = PAGE_TEXT
+    return reader
+
+
+def pypdf2_extractor(module, **options):
+    """An extractor reading with PyPDF2 only, whatever else is installed."""
+    return module.PyPDF2TextExtractor(
+        backends=[pdf_backends.PyPDF2Backend()], **options
+    )
+
+
+@pytest.fixture(params=EXTRACTOR_MODULES)
+def module(request):
+    return importlib.import_module(request.param)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ExtractedTextCache(tmp_path / ExtractedTextCache.DIRNAME)
+    yield cache
+    cache.close()
+
+
+class TestExtractedTextCaching:
+    """Text is parsed once per PDF content and settings."""
+
+    def test_second_extraction_is_served_from_cache(self, module, cache, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+        timings = []
+
+        with patch.object(pdf_backends, "PdfReader", side_effect=fake_reader) as reader:
+            first = pypdf2_extractor(module, text_cache=cache).extract_text_from_pdf(
+                pdf_path
+            )
+            second = pypdf2_extractor(
+                module,
+                text_cache=cache,
+                stage_timer=lambda *sample: timings.append(sample),
+            ).extract_text_from_pdf(pdf_path)
+
+        assert first == second
+        assert reader.call_count == 1
+        assert [sample[0] for sample in timings] == ["pdf_text_cache_hit"]
+        assert cache.stats()["hits"] == 1
+
+    def test_different_settings_extract_again(self, module, cache, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+
+        with patch.object(pdf_backends, "PdfReader", side_effect=fake_reader) as reader:
+            pypdf2_extractor(module, text_cache=cache).extract_text_from_pdf(pdf_path)
+            pypdf2_extractor(
+                module, text_cache=cache, clean_text=False
+            ).extract_text_from_pdf(pdf_path)
+
+        assert reader.call_count == 2
+
+
+class TestStreamingExtraction:
+    """Pages are cleaned one at a time and reading stops at the budget."""
+
+    def test_chunks_join_to_the_extracted_text(self, module, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+        extractor = pypdf2_extractor(module)
+
+        with patch.object(
+            pdf_backends, "PdfReader", side_effect=lambda *args: fake_reader(pages=3)
+        ):
+            chunks = list(extractor.iter_text_chunks(pdf_path))
+            text = extractor.extract_text_from_pdf(pdf_path)
+
+        assert len(chunks) == 3
+        assert chunks[0] == PAGE_TEXT.strip()
+        assert " ".join(chunks) == text
+
+    def test_pages_past_the_budget_are_not_read(self, module, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+        document = fake_reader(pages=10)
+        timings = []
+        extractor = pypdf2_extractor(
+            module,
+            max_text_length=len(PAGE_TEXT) + 10,
+            stage_timer=lambda *sample: timings.append(sample),
+        )
+
+        with patch.object(pdf_backends, "PdfReader", return_value=document):
+            text = extractor.extract_text_from_pdf(pdf_path)
+
+        assert len(text) == len(PAGE_TEXT) + 10
+        assert [page.extract_text.called for page in document.pages] == [
+            True,
+            True,
+        ] + [False] * 8
+        assert timings[0][0] == "pdf_text_extraction"
+        assert timings[0][2] == 2
+
+    def test_stopping_early_stops_reading(self, module, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+        document = fake_reader(pages=5)
+
+        with patch.object(pdf_backends, "PdfReader", return_value=document):
+            chunks = pypdf2_extractor(module).iter_text_chunks(pdf_path)
+            next(chunks)
+            chunks.close()
+
+        assert sum(page.extract_text.called for page in document.pages) == 1
+
+    def test_reference_pages_are_dropped(self, module, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+        document = fake_reader(pages=3)
+        document.pages[1].extract_text.return_value = "References\n[1] A. Smith"
+        document.pages[2].extract_text.return_value = "[2] B. Jones, 2019."
+
+        with patch.object(pdf_backends, "PdfReader", return_value=document):
+            text = pypdf2_extractor(module).extract_text_from_pdf(pdf_path)
+
+        assert text == PAGE_TEXT.strip()
+
+
+class FlakyBackend(pdf_backends.PdfBackend):
+    """A fast backend that fails when opening or at a given page."""
+
+    name = "flaky"
+
+    def __init__(self, fail_at_page=None):
+        self.fail_at_page = fail_at_page
+
+    def open(self, pdf_path):
+        if self.fail_at_page is None:
+            raise RuntimeError("cannot parse xref")
+
+        def page_text(index):
+            if index == self.fail_at_page:
+                raise RuntimeError("bad content stream")
+            return f"Fast page {index + 1} on heart rate variability. " * 3
+
+        return pdf_backends.PdfDocument(3, page_text, lambda: None)
+
+
+class TestBackendFallback:
+    """Faster backends are tried first, PyPDF2 takes over on error."""
+
+    def test_unopenable_file_falls_back_to_pypdf2(self, module, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+        extractor = module.PyPDF2TextExtractor(
+            backends=[FlakyBackend(), pdf_backends.PyPDF2Backend()]
+        )
+
+        with patch.object(pdf_backends, "PdfReader", side_effect=fake_reader):
+            text = extractor.extract_text_from_pdf(pdf_path)
+
+        assert text == PAGE_TEXT.strip()
+
+    def test_fallback_resumes_at_the_failing_page(self, module, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 hrv")
+        document = fake_reader(pages=3)
+        extractor = module.PyPDF2TextExtractor(
+            backends=[FlakyBackend(fail_at_page=1), pdf_backends.PyPDF2Backend()]
+        )
+
+        with patch.object(pdf_backends, "PdfReader", return_value=document):
+            chunks = list(extractor.iter_text_chunks(pdf_path))
+
+        assert chunks[0].startswith("Fast page 1")
+        assert chunks[1:] == [PAGE_TEXT.strip()] * 2
+        assert not document.pages[0].extract_text.called
@@ -0,0 +1,145 @@
+"""
+Tests for RunMetrics - per-stage timing and throughput reporting.
+
+Educational Notes:
+- Uses a fake clock so durations and percentiles are deterministic
+- Checks the Prometheus text format line by line
+- Verifies the stage_timer seam on ConceptExtractor without any I/O
+"""
+
+import json
+
+from src.domain.services.concept_extractor import (
+    ConceptExtractor,
+    TFIDFConceptExtractor,
+)
+from src.infrastructure.run_metrics import RunMetrics
+
+
+class FakeClock:
+    """Clock that advances by a scripted amount on each reading."""
+
+    def __init__(self, steps):
+        self.now = 0.0
+        self.steps = iter(steps)
+
+    def __call__(self):
+        current = self.now
+        self.now += next(self.steps, 0.0)
+        return current
+
+
+class TestRunMetrics:
+    """Behaviour of the per-stage recorder."""
+
+    def test_percentiles_use_nearest_rank(self):
+        """p50, p95 and max are observed durations."""
+        metrics = RunMetrics()
+        for seconds in range(1, 21):
+            metrics.record("pdf_download", float(seconds))
+
+        stats = metrics.summary()["pdf_download"]
+
+        assert stats["count"] == 20
+        assert stats["p50_seconds"] == 10.0
+        assert stats["p95_seconds"] == 19.0
+        assert stats["max_seconds"] == 20.0
+
+    def test_stage_context_records_counts_and_throughput(self):
+        """The timed block reports items and bytes once they are known."""
+        metrics = RunMetrics(clock=FakeClock([2.0]))
+
+        with metrics.stage("pdf_download") as timing:
+            timing.nbytes = 4096
+
+        stats = metrics.summary()["pdf_download"]
+        assert stats["total_seconds"] == 2.0
+        assert stats["items"] == 1
+        assert stats["bytes_per_second"] == 2048.0
+
+    def test_failed_blocks_are_still_timed(self):
+        """An exception inside the block still produces a sample."""
+        metrics = RunMetrics(clock=FakeClock([0.5]))
+
+        try:
+            with metrics.stage("search"):
+                raise ConnectionError("arXiv unavailable")
+        except ConnectionError:
+            pass
+
+        assert metrics.summary()["search"]["max_seconds"] == 0.5
+
+    def test_drained_samples_merge_into_parent(self):
+        """Worker-process samples are carried back and merged."""
+        worker, parent = RunMetrics(), RunMetrics()
+        worker.record("pdf_text_extraction", 1.0, items=12, nbytes=1000)
+
+        parent.merge(worker.drain())
+
+        assert worker.samples() == []
+        assert parent.summary()["pdf_text_extraction"]["items"] == 12
+
+    def test_prometheus_exposition(self):
+        """Stages become labelled summary, gauge and counter series."""
+        metrics = RunMetrics()
+        metrics.record("search", 1.5, items=40)
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE batch_stage_duration_seconds summary" in text
+        assert (
+            'batch_stage_duration_seconds{stage="search",quantile="0.95"} 1.500000'
+            in text
+        )
+        assert 'batch_stage_duration_seconds_count{stage="search"} 1' in text
+        assert 'batch_stage_items_total{stage="search"} 40' in text
+
+    def test_reported_percentiles_follow_the_class_setting(self):
+        """Both reports expose exactly the configured PERCENTILES."""
+
+        class TailMetrics(RunMetrics):
+            PERCENTILES = (0.5, 0.99)
+
+        metrics = TailMetrics()
+        for seconds in range(1, 101):
+            metrics.record("search", float(seconds))
+
+        stats = metrics.summary()["search"]
+        text = metrics.to_prometheus()
+
+        assert stats["p99_seconds"] == 99.0
+        assert "p95_seconds" not in stats
+        assert 'quantile="0.99"} 99.000000' in text
+        assert 'quantile="0.95"' not in text
+
+    def test_write_report_creates_json_and_prometheus_files(self, tmp_path):
+        """Both report files land in the output directory."""
+        metrics = RunMetrics()
+        metrics.record("hierarchy_building", 0.25, items=30)
+
+        json_path, prometheus_path = metrics.write_report(tmp_path)
+
+        with open(json_path) as f:
+            report = json.load(f)
+        assert report["stages"]["hierarchy_building"]["items"] == 30
+        assert "hierarchy_building" in prometheus_path.read_text()
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "run_metrics.json",
+            "run_metrics.prom",
+        ]
+
+    def test_concept_extractor_reports_each_strategy(self):
+        """ConceptExtractor times every strategy through its stage_timer."""
+        metrics = RunMetrics()
+        extractor = ConceptExtractor(
+            strategies=[TFIDFConceptExtractor()], stage_timer=metrics.record
+        )
+
+        extractor.extract_concepts_from_paper(
+            paper_text="Heart rate variability analysis of heart rate signals. " * 5,
+            paper_doi="10.1000/hrv",
+            paper_title="HRV Analysis",
+        )
+
+        stages = metrics.summary()
+        assert [stage for stage in stages if stage.startswith("concept_strategy.")]
@@ -0,0 +1,200 @@
+"""
+Test suite for SharedRateLimiter - host-wide token buckets.
+
+Educational Concepts Demonstrated:
+- Testing a token bucket with an injected clock and a no-op sleep: the
+  returned delays are exact and the tests never actually wait
+- Simulating several processes with several limiters over one directory,
+  plus one real multi-process test for the file lock
+- Testing transport-level limiting without a network by stubbing the
+  underlying HTTPAdapter.send
+"""
+
+import multiprocessing
+import os
+import stat
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.infrastructure.shared_rate_limiter import (
+    RateLimitedAdapter,
+    SharedRateLimiter,
+    rate_limit_from_info,
+    site_of,
+)
+
+
+class FakeClock:
+    """Wall clock that only moves when a test moves it."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_limiter(state_dir, clock):
+    return SharedRateLimiter(state_dir, clock=clock, sleep=lambda seconds: None)
+
+
+def take_tokens(state_dir, count):
+    """Worker process: take `count` tokens from the shared test bucket."""
+    limiter = SharedRateLimiter(state_dir)
+    limiter.configure("Test", requests_per_second=20, burst=1)
+    for _ in range(count):
+        limiter.acquire("Test")
+
+
+class TestTokenBucket:
+    """Burst capacity, sustained rate and refill."""
+
+    def test_burst_then_sustained_rate(self, tmp_path):
+        clock = FakeClock()
+        limiter = make_limiter(tmp_path, clock)
+        limiter.configure("ArXiv", requests_per_second=2, burst=3)
+
+        delays = [limiter.acquire("ArXiv") for _ in range(5)]
+
+        assert delays == [0.0, 0.0, 0.0, 0.5, 1.0]
+
+    def test_tokens_refill_over_time(self, tmp_path):
+        clock = FakeClock()
+        limiter = make_limiter(tmp_path, clock)
+        limiter.configure("ArXiv", requests_per_second=1, burst=2)
+        limiter.acquire("ArXiv")
+        limiter.acquire("ArXiv")
+
+        clock.now += 10
+
+        assert limiter.acquire("ArXiv") == 0.0
+        assert limiter.acquire("ArXiv") == 0.0
+        assert limiter.acquire("ArXiv") == 1.0
+
+    def test_unconfigured_keys_are_not_limited(self, tmp_path):
+        limiter = make_limiter(tmp_path, FakeClock())
+
+        assert limiter.acquire("Unknown") == 0.0
+        assert limiter.acquire_for_url("https://example.org/paper.pdf") == 0.0
+
+
+class TestSharing:
+    """Buckets are shared through the state directory."""
+
+    def test_limiters_over_one_directory_share_a_bucket(self, tmp_path):
+        """Two limiters stand in for two processes on the same host."""
+        clock = FakeClock()
+        first = make_limiter(tmp_path, clock)
+        second = make_limiter(tmp_path, clock)
+        for limiter in (first, second):
+            limiter.configure("ArXiv", requests_per_second=1, burst=1)
+
+        assert first.acquire("ArXiv") == 0.0
+        assert second.acquire("ArXiv") == 1.0
+        assert first.acquire("ArXiv") == 2.0
+
+    def test_processes_share_the_rate(self, tmp_path):
+        """Six requests from two processes at 20/s take at least 0.25s."""
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=take_tokens, args=(str(tmp_path), 3))
+            for _ in range(2)
+        ]
+        started = time.monotonic()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert time.monotonic() - started >= 0.25
+
+
+class TestPrivateState:
+    """Bucket state is private to the user."""
+
+    def test_default_dir_is_per_user(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert SharedRateLimiter.default_state_dir() == (
+            tmp_path / SharedRateLimiter.DIRNAME
+        )
+
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert SharedRateLimiter.default_state_dir().name.endswith(f"-{os.getuid()}")
+
+    def test_directory_and_buckets_are_owner_only(self, tmp_path):
+        state_dir = tmp_path / "buckets"
+        state_dir.mkdir(mode=0o777)
+        os.chmod(state_dir, 0o777)
+        limiter = make_limiter(state_dir, FakeClock())
+        limiter.configure("ArXiv", requests_per_second=1)
+
+        limiter.acquire("ArXiv")
+
+        assert stat.S_IMODE(state_dir.stat().st_mode) == 0o700
+        bucket = state_dir / "ArXiv.bucket"
+        assert stat.S_IMODE(bucket.stat().st_mode) == 0o600
+
+    def test_symlinked_bucket_is_refused(self, tmp_path):
+        target = tmp_path / "elsewhere"
+        target.write_text("keep")
+        state_dir = tmp_path / "buckets"
+        state_dir.mkdir()
+        (state_dir / "ArXiv.bucket").symlink_to(target)
+        limiter = make_limiter(state_dir, FakeClock())
+        limiter.configure("ArXiv", requests_per_second=1)
+
+        with pytest.raises(OSError):
+            limiter.acquire("ArXiv")
+        assert target.read_text() == "keep"
+
+
+class TestSourceConfiguration:
+    """Rates come from get_rate_limit_info(); URLs map to sources by site."""
+
+    def test_rate_limit_info_variants(self):
+        arxiv = {"requests_per_second": 1, "burst_allowance": 5}
+        oai_pmh = {"requests_per_second": 2.0, "burst_limit": 10}
+
+        assert rate_limit_from_info(arxiv) == (1.0, 5)
+        assert rate_limit_from_info(oai_pmh) == (2.0, 10)
+        assert rate_limit_from_info({}) == (None, 1)
+
+    def test_configure_from_source_registers_sites(self, tmp_path):
+        source = Mock()
+        source.get_source_name.return_value = "ArXiv"
+        source.get_rate_limit_info.return_value = {
+            "requests_per_second": 1,
+            "burst_allowance": 5,
+        }
+        limiter = make_limiter(tmp_path, FakeClock())
+
+        key = limiter.configure_from_source(source, "http://export.arxiv.org/api/query")
+
+        assert key == "ArXiv"
+        assert limiter.rate_for("ArXiv") == (1.0, 5)
+        assert limiter.key_for_url("https://arxiv.org/pdf/2301.00001") == "ArXiv"
+        assert site_of("https://www.ncbi.nlm.nih.gov/pmc/") == "nih.gov"
+
+
+class TestRateLimitedAdapter:
+    """Sessions take a token per request sent over the network."""
+
+    def test_attached_session_acquires_before_sending(self, tmp_path):
+        limiter = make_limiter(tmp_path, FakeClock())
+        limiter.configure("ArXiv", requests_per_second=1)
+        session = limiter.attach(requests.Session(), "ArXiv")
+        response = requests.Response()
+        response.status_code = 200
+
+        with patch.object(limiter, "acquire", wraps=limiter.acquire) as acquire:
+            with patch.object(HTTPAdapter, "send", return_value=response):
+                session.get("https://export.arxiv.org/api/query")
+                session.get("https://export.arxiv.org/api/query")
+
+        assert isinstance(session.get_adapter("https://arxiv.org"), RateLimitedAdapter)
+        assert acquire.call_count == 2
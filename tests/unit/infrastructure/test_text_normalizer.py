@@ -0,0 +1,103 @@
+"""
+Test suite for TextNormalizer - section-aware PDF text cleanup.
+
+Educational Concepts Demonstrated:
+- Checking each cleanup rule on a minimal input
+- Feeding pages one by one to verify section state carries across pages
+"""
+
+import pytest
+
+from src.infrastructure.text_normalizer import TextNormalizer
+
+PAPER = """Wearable HRV Monitoring
+Jane Doe
+Abstract—Heart rate variability (HRV) tracks autonomic function [1].
+1. Introduction
+HRV = 52 ± 8 ms , measured daily (3).
+12
+© 2021 IEEE. All rights reserved.
+References
+[1] A. Smith, Heart rhythm journal, 2020. https://doi.org/10.1/hr
+Appendix A: Sensor details
+The sensor samples at 250 Hz."""
+
+
+@pytest.fixture
+def normalizer():
+    return TextNormalizer()
+
+
+class TestCleanup:
+    """Layout artifacts are removed in one compiled pass."""
+
+    @pytest.mark.parametrize(
+        "raw, cleaned",
+        [
+            ("heart  rate\n\nvariability", "heart rate variability"),
+            ("as shown [ 12 ] before", "as shown before"),
+            ("as shown [4].", "as shown."),
+            ("counted (3) twice", "counted twice"),
+            ("see https://example.org/a?b=1 now", "see now"),
+            ("see doi: 10.1000/182 now", "see now"),
+            ("word , next ;then", "word, next;then"),
+            ("pi is 3.14", "pi is 3.14"),
+            ("x=5±2", "x = 5 ± 2"),
+            ("text\n 7 \nmore", "text more"),
+            ("text\nCopyright 2020 Elsevier Ltd.\nmore", "text more"),
+        ],
+    )
+    def test_clean(self, normalizer, raw, cleaned):
+        assert normalizer.clean(raw) == cleaned
+
+
+class TestSections:
+    """Headings split a paper and references are dropped."""
+
+    def test_sections_are_recognized(self, normalizer):
+        sections = normalizer.split_sections(PAPER)
+
+        assert [section.kind for section in sections] == [
+            "body",
+            "abstract",
+            "body",
+            "references",
+            "appendix",
+        ]
+        assert sections[3].heading == "References"
+        assert sections[4].heading == "Appendix A: Sensor details"
+
+    def test_references_are_dropped(self, normalizer):
+        text = normalizer.normalize(PAPER)
+
+        assert "Smith" not in text
+        assert "autonomic function." in text
+        assert "The sensor samples at 250 Hz." in text
+
+    def test_sentence_starting_with_references_is_not_a_heading(self, normalizer):
+        text = "References to prior work are listed below.\nHRV matters."
+
+        assert normalizer.normalize(text) == (
+            "References to prior work are listed below. HRV matters."
+        )
+
+    def test_reference_list_spanning_pages_is_dropped(self, normalizer):
+        document = normalizer.document()
+        pages = [
+            "Results hold.\nReferences",
+            "[7] B. Jones, Sleep, 2019.",
+            "[8] C. Lee, HRV, 2018.\nAppendices\nExtra tables.",
+        ]
+
+        assert [document.normalize_page(page) for page in pages] == [
+            "Results hold.",
+            "",
+            "Extra tables.",
+        ]
+
+    def test_kept_sections_are_configurable(self):
+        normalizer = TextNormalizer(drop_sections=[])
+
+        assert "Smith" in normalizer.normalize(PAPER)
+        with pytest.raises(ValueError, match="Unknown section kinds"):
+            TextNormalizer(drop_sections=["preface"])
@@ -0,0 +1,103 @@
+"""
+Test suite for TimedProcessPoolExecutor - a process pool with deadlines.
+
+Educational Concepts Demonstrated:
+- Testing a process pool with module-level task functions (tasks must be
+  picklable) whose behavior is chosen by argument: answer, fail, hang or
+  kill their own process
+- Observing worker replacement through the process ids that ran each task
+- Bounding test run time with short per-task timeouts
+"""
+
+import os
+import time
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.infrastructure.timed_process_pool import TimedProcessPoolExecutor
+
+
+def work(name):
+    """Task whose behavior is picked by its argument."""
+    if name == "hang":
+        time.sleep(60)
+    if name == "crash":
+        os._exit(3)
+    if name == "bad":
+        raise ValueError(f"PDF format error in {name}")
+    return f"{name}:{os.getpid()}"
+
+
+def results_of(futures):
+    """Map each future's name to its result or its exception."""
+    outcomes = {}
+    for name, future in futures.items():
+        try:
+            outcomes[name] = future.result(timeout=30)
+        except Exception as e:
+            outcomes[name] = e
+    return outcomes
+
+
+class TestTimedProcessPoolExecutor:
+    """Deadlines, isolation of failures and worker recycling."""
+
+    def test_results_come_back_for_every_task(self):
+        with TimedProcessPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(work, name) for name in ("a", "b", "c")]
+            names = sorted(f.result().split(":")[0] for f in as_completed(futures))
+
+        assert names == ["a", "b", "c"]
+
+    def test_hung_task_times_out_and_its_worker_is_replaced(self):
+        with TimedProcessPoolExecutor(max_workers=1, timeout=1.0) as pool:
+            started = time.monotonic()
+            futures = {name: pool.submit(work, name) for name in ("hang", "a", "b")}
+            outcomes = results_of(futures)
+            elapsed = time.monotonic() - started
+
+        assert elapsed < 20
+        assert isinstance(outcomes["hang"], TimeoutError)
+        assert outcomes["a"].startswith("a:") and outcomes["b"].startswith("b:")
+        assert pool.workers_started == 2
+
+    def test_errors_and_crashes_fail_only_their_task(self):
+        with TimedProcessPoolExecutor(max_workers=1) as pool:
+            futures = {name: pool.submit(work, name) for name in ("bad", "crash", "a")}
+            outcomes = results_of(futures)
+
+        assert isinstance(outcomes["bad"], ValueError)
+        assert isinstance(outcomes["crash"], BrokenProcessPool)
+        assert "exit code 3" in str(outcomes["crash"])
+        assert outcomes["a"].startswith("a:")
+
+    def test_workers_are_recycled(self):
+        with TimedProcessPoolExecutor(max_workers=1, max_tasks_per_worker=2) as pool:
+            pids = [pool.submit(work, "a").result().split(":")[1] for _ in range(4)]
+
+        assert len(set(pids)) == 2
+        assert pool.workers_started == 2
+
+    def test_unpicklable_task_fails_its_future(self):
+        with TimedProcessPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(lambda: "never sent")
+            later = pool.submit(work, "a")
+
+            with pytest.raises(Exception):
+                future.result(timeout=30)
+            assert later.result(timeout=30).startswith("a:")
+
+    def test_submit_after_shutdown_is_rejected(self):
+        pool = TimedProcessPoolExecutor(max_workers=1)
+        pool.shutdown()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(work, "a")
+
+    def test_invalid_settings_are_rejected(self):
+        with pytest.raises(ValueError):
+            TimedProcessPoolExecutor(timeout=0)
+        with pytest.raises(ValueError):
+            TimedProcessPoolExecutor(max_tasks_per_worker=0)
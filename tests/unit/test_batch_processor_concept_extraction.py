@@ -190,8 +190,8 @@ class TestBatchProcessorConceptExtraction:
             strategy_name="test_strategy",
         )
 
-        # Assert: Concept extraction was called
-        mock_concept_extractor.extract_from_directory.assert_called_once_with(pdfs_dir)
+        # Assert: Concept extraction was called once per PDF
+        assert mock_concept_extractor.extract_from_directory.call_count == 2
 
         # Assert: Concept files were created
         assert (strategy_dir / "concepts.json").exists()
@@ -442,3 +442,150 @@ class TestBatchProcessorConceptExtraction:
             assert "name" in concept
             assert "level" in concept
             assert "children" in concept
+
+
+class TestBatchProcessorPerPdfExtraction:
+    """
+    Production extraction works one PDF at a time.
+
+    Educational Notes:
+    - PDFs with a known paper go through extract_concepts_from_paper,
+      the call pipeline workers make
+    - Each PDF's result is cached on its own, so changing one PDF only
+      re-extracts that PDF
+    """
+
+    @pytest.fixture
+    def papers(self):
+        return [
+            ResearchPaper(
+                title=f"HRV study {index}",
+                authors=["Author"],
+                publication_date=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                doi=f"10.1234/hrv-{index}",
+            )
+            for index in range(2)
+        ]
+
+    @staticmethod
+    def paper_concepts(text):
+        concept = Mock()
+        concept.to_dict.return_value = {"text": text}
+        return Mock(concepts=[concept])
+
+    def test_known_papers_are_extracted_individually(self, tmp_path, papers):
+        from domain.services.paper_download_service import PaperDownloadService
+
+        strategy_dir = tmp_path / "cfg" / "basic"
+        pdfs_dir = strategy_dir / "pdfs"
+        pdfs_dir.mkdir(parents=True)
+        for paper in papers:
+            pdf_path = pdfs_dir / PaperDownloadService.pdf_filename(paper)
+            pdf_path.write_bytes(paper.doi.encode())
+        (pdfs_dir / "orphan.pdf").write_bytes(b"no paper")
+
+        use_case = Mock()
+        use_case.extract_concepts_from_paper.side_effect = (
+            lambda paper, pdf_path: self.paper_concepts(paper.doi)
+        )
+        use_case.extract_concepts_from_domain.return_value = [
+            self.paper_concepts("orphan")
+        ]
+        builder = Mock()
+        builder.build_hierarchy.return_value = {"root_concepts": []}
+        processor = BatchProcessor(
+            output_dir=str(tmp_path),
+            enable_concept_extraction=True,
+            hierarchy_builder=builder,
+        )
+
+        with patch.object(
+            BatchProcessor, "_create_default_concept_extractor", return_value=use_case
+        ):
+            processor.save_strategy_results(papers, strategy_dir, "cfg", "basic")
+
+            assert use_case.extract_concepts_from_paper.call_count == 2
+            assert use_case.extract_concepts_from_domain.call_count == 1
+            with open(strategy_dir / "concepts.json") as f:
+                texts = sorted(c["text"] for c in json.load(f)["concepts"])
+            assert texts == ["10.1234/hrv-0", "10.1234/hrv-1", "orphan"]
+
+            # Changing one PDF re-extracts only that PDF
+            use_case.reset_mock()
+            changed = pdfs_dir / PaperDownloadService.pdf_filename(papers[1])
+            changed.write_bytes(b"revised")
+            processor.save_strategy_results(papers, strategy_dir, "cfg", "basic")
+
+        use_case.extract_concepts_from_paper.assert_called_once_with(
+            paper=papers[1], pdf_path=changed
+        )
+        use_case.extract_concepts_from_domain.assert_not_called()
+
+    def test_production_extraction_runs_in_the_shared_pool(self, tmp_path, papers):
+        """Each PDF is a pool task, so a PDF that times out fails alone."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from domain.services.paper_download_service import PaperDownloadService
+
+        strategy_dir = tmp_path / "cfg" / "basic"
+        pdfs_dir = strategy_dir / "pdfs"
+        pdfs_dir.mkdir(parents=True)
+        for paper in papers:
+            (pdfs_dir / PaperDownloadService.pdf_filename(paper)).write_bytes(
+                paper.doi.encode()
+            )
+        (pdfs_dir / "orphan.pdf").write_bytes(b"hangs the parser")
+
+        def extract_in_worker(paper, pdf_path, text_cache=None):
+            if paper is None:
+                raise TimeoutError("Timed out after 120s")
+            return {
+                "concepts": [{"text": paper.doi}],
+                "total_extracted": 1,
+                "stage_samples": [],
+            }
+
+        processor = BatchProcessor(
+            output_dir=str(tmp_path), enable_concept_extraction=True
+        )
+        manifest = processor._open_concept_manifest(strategy_dir)
+        pending = manifest.plan(sorted(pdfs_dir.glob("*.pdf")))
+
+        with (
+            patch("batch_processor._extract_concepts_in_worker", extract_in_worker),
+            patch.object(
+                processor,
+                "_shared_extraction_pool",
+                return_value=ThreadPoolExecutor(max_workers=2),
+            ) as shared_pool,
+        ):
+            processor._extract_pending_pdfs(pending, manifest, papers)
+
+        shared_pool.assert_called_once_with(in_threads=False)
+        texts = sorted(
+            c["text"] for c in manifest.merged_extraction_result()["concepts"]
+        )
+        assert texts == ["10.1234/hrv-0", "10.1234/hrv-1"]
+        errors = processor.processing_stats["errors"]
+        assert len(errors) == 1 and "orphan.pdf" in errors[0]
+        assert "Timed out" in errors[0]
+
+    def test_default_extractor_scores_against_repository_frequencies(self, tmp_path):
+        """The production TF-IDF strategy reads the repository's frequency store."""
+        use_case_class = Mock()
+
+        with patch.multiple(
+            "batch_processor",
+            CONCEPT_EXTRACTION_AVAILABLE=True,
+            ExtractPaperConceptsUseCase=use_case_class,
+            JSONConceptRepository=lambda storage_directory: Mock(
+                document_frequencies="store"
+            ),
+            create=True,
+        ):
+            BatchProcessor._create_default_concept_extractor()
+
+        concept_extractor = use_case_class.call_args.kwargs["concept_extractor"]
+        assert [s.document_frequencies for s in concept_extractor.strategies] == [
+            "store"
+        ]
@@ -0,0 +1,151 @@
+"""
+Tests for concurrent strategy execution in the batch processor.
+
+These tests verify that running strategies on a worker pool produces the same
+results as sequential processing: every strategy runs exactly once, the
+cross-strategy deduplication set stays consistent, and processing statistics
+are merged without lost updates.
+
+Educational Notes:
+- Uses a barrier to prove strategies genuinely overlap in time
+- Uses overlapping paper sets to exercise the shared deduplication lock
+- Mocks the search use case so no network access is required
+"""
+
+import threading
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock, patch
+from datetime import datetime, timezone
+
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from batch_processor import BatchProcessor
+from src.domain.entities.research_paper import ResearchPaper
+
+
+def make_paper(index: int) -> ResearchPaper:
+    """Create a minimal paper with a stable DOI."""
+    return ResearchPaper(
+        title=f"Parallel Paper {index}",
+        authors=["Author"],
+        abstract="Abstract",
+        publication_date=datetime(2024, 1, 1 + index % 28, tzinfo=timezone.utc),
+        doi=f"10.1000/parallel.{index:03d}",
+    )
+
+
+class TestBatchProcessorParallelExecution:
+    """Test suite for the strategy worker pool."""
+
+    def setup_method(self):
+        """Set up an isolated output directory for each test."""
+        self.test_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.test_dir) / "outputs"
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+    def test_max_workers_defaults_to_sequential(self):
+        """Existing callers keep sequential behaviour."""
+        processor = BatchProcessor(output_dir=str(self.output_dir))
+
+        assert processor.max_workers == 1
+
+    def test_max_workers_is_clamped_to_at_least_one(self):
+        """Non-positive worker counts fall back to sequential processing."""
+        processor = BatchProcessor(output_dir=str(self.output_dir), max_workers=0)
+
+        assert processor.max_workers == 1
+
+    def test_strategies_overlap_when_workers_available(self):
+        """All strategies are in flight at the same time with enough workers."""
+        processor = BatchProcessor(output_dir=str(self.output_dir), max_workers=3)
+        barrier = threading.Barrier(3, timeout=5)
+        use_case = Mock()
+
+        def execute_strategy(strategy_name, download_papers, output_dir):
+            barrier.wait()  # Deadlocks (and times out) if run sequentially
+            return []
+
+        use_case.execute_strategy.side_effect = execute_strategy
+
+        processor._run_strategy_jobs(
+            [(use_case, "config", f"strategy_{i}") for i in range(3)]
+        )
+
+        assert use_case.execute_strategy.call_count == 3
+        assert not barrier.broken
+
+    def test_overlapping_results_are_deduplicated_across_workers(self):
+        """A paper found by several concurrent strategies is stored once."""
+        processor = BatchProcessor(
+            output_dir=str(self.output_dir), max_papers=100, max_workers=4
+        )
+        shared = [make_paper(i) for i in range(20)]
+        use_case = Mock()
+        use_case.execute_strategy.side_effect = lambda *a, **k: list(shared)
+
+        processor._run_strategy_jobs(
+            [(use_case, "config", f"strategy_{i}") for i in range(4)]
+        )
+
+        stats = processor.processing_stats
+        assert stats["strategies_processed"] == 4
+        assert stats["papers_found"] == 80
+        assert stats["papers_stored"] == 20
+        assert stats["duplicates_filtered"] == 60
+        assert len(processor.processed_papers) == 20
+
+    def test_strategy_errors_are_recorded_without_stopping_pool(self):
+        """One failing strategy does not prevent the others from finishing."""
+        processor = BatchProcessor(output_dir=str(self.output_dir), max_workers=2)
+        use_case = Mock()
+
+        def execute_strategy(strategy_name, download_papers, output_dir):
+            if strategy_name == "broken":
+                raise RuntimeError("arXiv unavailable")
+            return [make_paper(ord(strategy_name[-1]))]
+
+        use_case.execute_strategy.side_effect = execute_strategy
+
+        processor._run_strategy_jobs(
+            [(use_case, "config", name) for name in ("ok_a", "broken", "ok_b")]
+        )
+
+        assert processor.processing_stats["strategies_processed"] == 2
+        assert len(processor.processing_stats["errors"]) == 1
+        assert "arXiv unavailable" in processor.processing_stats["errors"][0]
+
+    @patch("batch_processor.ExecuteKeywordSearchUseCase")
+    def test_run_all_configurations_shares_pool_across_configs(self, mock_use_case):
+        """Every configuration is counted once all its strategies are queued."""
+        config_dir = Path(self.test_dir) / "config"
+        config_dir.mkdir()
+        for name in ("alpha", "beta"):
+            (config_dir / f"{name}.yaml").write_text(
+                "search_configuration:\n"
+                "  default_strategy: s1\n"
+                "strategies:\n"
+                "  s1:\n"
+                "    name: S1\n"
+                "    description: first\n"
+                "    primary_keywords: [one]\n"
+                "  s2:\n"
+                "    name: S2\n"
+                "    description: second\n"
+                "    primary_keywords: [two]\n"
+            )
+        mock_use_case.return_value.execute_strategy.return_value = []
+
+        processor = BatchProcessor(
+            config_dir=str(config_dir), output_dir=str(self.output_dir), max_workers=4
+        )
+        processor.run_all_configurations(use_arxiv=False)
+
+        assert processor.processing_stats["configs_processed"] == 2
+        assert mock_use_case.return_value.execute_strategy.call_count == 4
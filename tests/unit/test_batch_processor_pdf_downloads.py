@@ -172,20 +172,24 @@ strategies:
 
         mock_use_case = Mock(spec=ExecuteKeywordSearchUseCase)
         mock_use_case.execute_strategy.return_value = sample_papers
+        service = Mock()
+        service.download_single_paper.return_value = None
+        self.processor._download_service = lambda: service
 
         # Act
         self.processor.process_strategy(mock_use_case, "test_config", "test_strategy")
 
-        # Assert - Verify download_papers=True was passed
-        # This will fail initially because current implementation doesn't pass this parameter
+        # Assert - The search only searches; the processor downloads the PDFs
+        # of the deduplicated papers itself
         call_args = mock_use_case.execute_strategy.call_args
         assert call_args is not None, "execute_strategy should be called"
-
-        # Check if download_papers was passed as True
         args, kwargs = call_args
-        assert (
-            kwargs.get("download_papers", False) is True
-        ), "download_papers should be True to enable PDF downloads"
+        assert kwargs.get("download_papers") is False
+
+        pdfs_dir = self.output_dir / "test_config" / "test_strategy" / "pdfs"
+        service.download_single_paper.assert_called_once_with(
+            sample_papers[0], pdfs_dir
+        )
 
     def test_batch_processor_pdf_structure_compatible_with_concept_extraction(self):
         """
@@ -406,3 +410,99 @@ class TestBatchProcessorConceptExtractionCompatibility:
 
         finally:
             shutil.rmtree(test_dir)
+
+
+class TestBatchProcessorBlobStoreDownloads:
+    """Default (non-pipeline) runs download through the PDF blob store."""
+
+    def setup_method(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.test_dir) / "outputs"
+        self.paper = ResearchPaper(
+            title="Stored Once",
+            authors=["Author"],
+            publication_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            arxiv_id="2401.00001",
+        )
+        self.fetched = []
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir)
+
+    def _run(self):
+        processor = BatchProcessor(output_dir=str(self.output_dir))
+        use_case = Mock()
+        use_case.execute_strategy.return_value = [self.paper]
+
+        def fetch(service, url, pdf_path, title, conditions=None):
+            self.fetched.append(url)
+            Path(pdf_path).write_bytes(b"%PDF-1.4 stored once")
+            return True, {}
+
+        with patch("batch_processor.PaperDownloadService._fetch_if_modified", fetch):
+            processor.process_strategy(use_case, "config", "strategy")
+        return processor
+
+    def test_pdfs_are_linked_from_the_store(self):
+        processor = self._run()
+
+        pdf_path = self.output_dir / "config" / "strategy" / "pdfs" / "Stored_Once.pdf"
+        digest = processor.pdf_store.lookup("https://arxiv.org/pdf/2401.00001.pdf")
+        assert digest is not None
+        assert pdf_path.samefile(processor.pdf_store.path_for(digest))
+
+    def test_stored_pdfs_are_relinked_without_downloading(self):
+        self._run()
+        strategy_dir = self.output_dir / "config" / "strategy"
+        # The strategy's files are lost, but the store still has the PDF
+        shutil.rmtree(strategy_dir)
+
+        self._run()
+
+        assert self.fetched == ["https://arxiv.org/pdf/2401.00001.pdf"]
+        assert (strategy_dir / "pdfs" / "Stored_Once.pdf").exists()
+
+
+class TestBatchProcessorDownloadMetrics:
+    """Default runs time the search apart from the downloads."""
+
+    def setup_method(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.test_dir) / "outputs"
+
+    def teardown_method(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_search_timing_excludes_downloads(self):
+        processor = BatchProcessor(output_dir=str(self.output_dir))
+        papers = [
+            ResearchPaper(
+                title=f"Timed Paper {i}",
+                authors=["Author"],
+                publication_date=datetime(2024, 1, 1 + i, tzinfo=timezone.utc),
+                doi=f"10.1000/timed.{i}",
+            )
+            for i in range(2)
+        ]
+        searches_finished_at_download = []
+
+        def download_single_paper(paper, output_dir):
+            stages = processor.metrics.summary()
+            searches_finished_at_download.append(stages["search"]["count"])
+            path = Path(output_dir) / f"{paper.doi.rsplit('.', 1)[-1]}.pdf"
+            path.write_bytes(b"%PDF-1.4")
+            return path
+
+        service = Mock()
+        service.download_single_paper.side_effect = download_single_paper
+        processor._download_service = lambda: service
+        use_case = Mock()
+        use_case.execute_strategy.return_value = papers
+
+        processor.process_strategy(use_case, "config", "strategy")
+
+        stages = processor.metrics.summary()
+        assert searches_finished_at_download == [1, 1]
+        assert stages["search"]["items"] == 2
+        assert stages["pdf_download"]["count"] == 2
+        assert stages["pdf_download"]["bytes"] == 16
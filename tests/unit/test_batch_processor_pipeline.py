@@ -0,0 +1,162 @@
+"""
+Tests for pipelined downloads in the batch processor.
+
+In pipeline mode the processor downloads PDFs itself and extracts concepts
+from each one as it arrives, caching the results in the concept manifest so
+the final concept step only merges them and builds the hierarchy.
+
+Educational Notes:
+- Replaces the download service with a fake that writes small files
+- Uses a mock extractor that reports the PDFs it was given
+"""
+
+import json
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock, patch
+from datetime import datetime, timezone
+
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from batch_processor import BatchProcessor
+from src.domain.entities.research_paper import ResearchPaper
+
+
+class TestBatchProcessorPipeline:
+    """Test suite for pipeline_downloads mode."""
+
+    def setup_method(self):
+        """Set up an isolated output directory for each test."""
+        self.test_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.test_dir) / "outputs"
+        self.papers = [
+            ResearchPaper(
+                title=f"Pipelined Paper {i}",
+                authors=["Author"],
+                abstract="Abstract",
+                publication_date=datetime(2024, 1, 1 + i, tzinfo=timezone.utc),
+                doi=f"10.1000/pipe.{i:03d}",
+            )
+            for i in range(3)
+        ]
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+    def _processor(self, **kwargs):
+        extractor = Mock()
+        extractor.extract_from_directory.side_effect = lambda pdfs_dir: {
+            "concepts": [
+                {"text": p.stem} for p in sorted(Path(pdfs_dir).glob("*.pdf"))
+            ],
+            "total_extracted": 1,
+        }
+        builder = Mock()
+        builder.build_hierarchy.return_value = {
+            "root_concepts": [],
+            "total_concepts": 3,
+        }
+
+        processor = BatchProcessor(
+            output_dir=str(self.output_dir),
+            enable_concept_extraction=True,
+            concept_extractor=extractor,
+            hierarchy_builder=builder,
+            pipeline_downloads=True,
+            download_workers=2,
+            **kwargs,
+        )
+
+        def download_single_paper(paper, output_dir):
+            path = Path(output_dir) / f"{paper.doi.rsplit('.', 1)[-1]}.pdf"
+            path.write_bytes(paper.title.encode())
+            return path
+
+        service = Mock()
+        service.download_single_paper.side_effect = download_single_paper
+        processor._download_service = lambda: service
+        return processor, extractor, builder, service
+
+    def test_search_does_not_download_in_pipeline_mode(self):
+        """The use case only searches; the pipeline performs the downloads."""
+        processor, _, _, service = self._processor()
+        use_case = Mock()
+        use_case.execute_strategy.return_value = list(self.papers)
+
+        processor.process_strategy(use_case, "cfg", "basic")
+
+        assert use_case.execute_strategy.call_args.kwargs["download_papers"] is False
+        assert service.download_single_paper.call_count == 3
+
+    def test_each_pdf_is_extracted_individually_and_merged(self):
+        """Concepts are extracted per PDF and merged into concepts.json."""
+        processor, extractor, builder, _ = self._processor()
+        use_case = Mock()
+        use_case.execute_strategy.return_value = list(self.papers)
+
+        processor.process_strategy(use_case, "cfg", "basic")
+
+        output_path = self.output_dir / "cfg" / "basic"
+        # One extractor call per downloaded PDF, none for the final merge
+        assert extractor.extract_from_directory.call_count == 3
+        with open(output_path / "concepts.json") as f:
+            concepts = json.load(f)["concepts"]
+        assert sorted(c["text"] for c in concepts) == ["000", "001", "002"]
+        builder.build_hierarchy.assert_called_once()
+        assert not list(output_path.glob(".concept_staging_*"))
+
+    def test_stage_metrics_are_recorded(self):
+        """Search, downloads and concept steps appear in the run metrics."""
+        processor, _, _, _ = self._processor()
+        use_case = Mock()
+        use_case.execute_strategy.return_value = list(self.papers)
+
+        processor.process_strategy(use_case, "cfg", "basic")
+
+        stages = processor.metrics.summary()
+        assert stages["search"]["items"] == 3
+        assert stages["pdf_download"]["count"] == 3
+        assert stages["pdf_download"]["bytes"] > 0
+        assert stages["strategy"]["count"] == 1
+        assert "hierarchy_building" in stages
+
+    def test_strategies_share_one_extraction_pool(self):
+        """Every strategy submits to the same pool until the run closes it."""
+        processor, extractor, _, _ = self._processor()
+        use_case = Mock()
+        use_case.execute_strategy.return_value = list(self.papers)
+        other_use_case = Mock()
+        other_use_case.execute_strategy.return_value = [
+            ResearchPaper(
+                title=f"Other Paper {i}",
+                authors=["Author"],
+                publication_date=datetime(2024, 2, 1 + i, tzinfo=timezone.utc),
+                doi=f"10.1000/other.{i + 3:03d}",
+            )
+            for i in range(3)
+        ]
+
+        processor.process_strategy(use_case, "cfg", "basic")
+        pool = processor._extraction_pool
+        processor.process_strategy(other_use_case, "cfg", "advanced")
+
+        assert pool is not None
+        assert processor._extraction_pool is pool
+        assert extractor.extract_from_directory.call_count == 6
+
+        processor.close_extraction_pool()
+        assert processor._extraction_pool is None
+
+    def test_process_pool_never_forks_the_threaded_parent(self):
+        """Extraction workers start from forkserver (or spawn), never fork."""
+        processor, _, _, _ = self._processor()
+
+        with patch("batch_processor.TimedProcessPoolExecutor") as pool_class:
+            processor._shared_extraction_pool(in_threads=False)
+
+        context = pool_class.call_args.kwargs["mp_context"]
+        assert context.get_start_method() in ("forkserver", "spawn")
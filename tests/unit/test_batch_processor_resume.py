@@ -0,0 +1,282 @@
+"""
+Tests for checkpointed, resumable batch processing.
+
+These tests define how the batch processor uses its job journal: a fresh run
+records each completed stage, and a resumed run skips stages the journal
+already holds instead of re-querying arXiv or re-extracting concepts.
+
+Educational Notes:
+- Simulates a crash by constructing a second processor over the same outputs
+- Uses mock use cases and extractors so no network or PDFs are needed
+- Verifies both skipping and the restoration of cross-strategy dedup state
+"""
+
+import json
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock
+from datetime import datetime, timezone
+
+import pytest
+
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from batch_processor import BatchProcessor
+from src.domain.entities.research_paper import ResearchPaper
+
+
+class TestBatchProcessorResume:
+    """Test suite for journal-driven resumption."""
+
+    def setup_method(self):
+        """Set up an isolated output directory for each test."""
+        self.test_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.test_dir) / "outputs"
+        self.papers = [
+            ResearchPaper(
+                title="Resumable Paper",
+                authors=["Author"],
+                abstract="Abstract",
+                publication_date=datetime(2024, 3, 1, tzinfo=timezone.utc),
+                doi="10.1000/resume.001",
+            )
+        ]
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.test_dir)
+
+    def _use_case(self):
+        use_case = Mock()
+        use_case.execute_strategy.return_value = list(self.papers)
+        return use_case
+
+    def _extractors(self):
+        extractor = Mock()
+        extractor.extract_from_directory.return_value = {
+            "concepts": [{"text": "heart rate variability"}],
+            "total_extracted": 1,
+        }
+        builder = Mock()
+        builder.build_hierarchy.return_value = {
+            "root_concepts": [],
+            "total_concepts": 1,
+        }
+        return extractor, builder
+
+    def test_fresh_run_journals_search_and_download(self):
+        """Completed search and download stages are written to the journal."""
+        processor = BatchProcessor(output_dir=str(self.output_dir))
+
+        processor.process_strategy(self._use_case(), "cfg", "basic")
+
+        assert processor.journal.completed_stages("cfg", "basic") == {
+            "search",
+            "download",
+        }
+        assert processor.journal.stage_details("cfg", "basic", "download") == {
+            "papers_stored": 1
+        }
+
+    def test_resume_skips_completed_search_and_download(self):
+        """A resumed run does not call the search use case again."""
+        BatchProcessor(output_dir=str(self.output_dir)).process_strategy(
+            self._use_case(), "cfg", "basic"
+        )
+
+        resumed = BatchProcessor(output_dir=str(self.output_dir), resume=True)
+        use_case = self._use_case()
+        resumed.process_strategy(use_case, "cfg", "basic")
+
+        use_case.execute_strategy.assert_not_called()
+        assert resumed.processing_stats["strategies_resumed"] == 1
+        assert "10.1000/resume.001" in resumed.processed_papers
+
+    def test_resume_after_search_reuses_saved_results(self):
+        """A run that crashed after searching does not query arXiv again."""
+        paper = ResearchPaper(
+            title="Searched Paper",
+            authors=["Author"],
+            publication_date=datetime(2024, 3, 2, tzinfo=timezone.utc),
+            arxiv_id="2403.00002",
+        )
+        processor = BatchProcessor(output_dir=str(self.output_dir))
+        output_path = processor.create_output_structure("cfg", "basic")
+        processor._save_search_results(output_path, [paper])
+        processor.journal.mark_completed("cfg", "basic", "search")
+
+        resumed = BatchProcessor(output_dir=str(self.output_dir), resume=True)
+        service = Mock()
+        service.download_single_paper.return_value = None
+        resumed._download_service = lambda: service
+        use_case = self._use_case()
+        resumed.process_strategy(use_case, "cfg", "basic")
+
+        use_case.execute_strategy.assert_not_called()
+        (restored, _), _ = service.download_single_paper.call_args
+        assert (restored.title, restored.arxiv_id, restored.publication_date) == (
+            paper.title,
+            paper.arxiv_id,
+            paper.publication_date,
+        )
+        assert resumed.journal.is_completed("cfg", "basic", "download")
+
+    def test_resume_extracts_concepts_after_a_crash_during_extraction(self):
+        """Papers stored before extraction died still get their concepts."""
+        extractor, builder = self._extractors()
+        extractor.extract_from_directory.side_effect = KeyboardInterrupt
+        processor = BatchProcessor(
+            output_dir=str(self.output_dir),
+            enable_concept_extraction=True,
+            concept_extractor=extractor,
+            hierarchy_builder=builder,
+        )
+
+        def download(paper, pdfs_dir):
+            pdf_path = pdfs_dir / "paper.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4")
+            return pdf_path
+
+        processor._download_service = lambda: Mock(
+            download_single_paper=Mock(side_effect=download)
+        )
+        with pytest.raises(KeyboardInterrupt):
+            processor.process_strategy(self._use_case(), "cfg", "basic")
+        assert not processor.journal.is_completed("cfg", "basic", "download")
+
+        extractor, builder = self._extractors()
+        resumed = BatchProcessor(
+            output_dir=str(self.output_dir),
+            enable_concept_extraction=True,
+            concept_extractor=extractor,
+            hierarchy_builder=builder,
+            resume=True,
+        )
+        use_case = self._use_case()
+        resumed.process_strategy(use_case, "cfg", "basic")
+
+        use_case.execute_strategy.assert_not_called()
+        extractor.extract_from_directory.assert_called_once()
+        builder.build_hierarchy.assert_called_once()
+        assert resumed.journal.completed_stages("cfg", "basic") == {
+            "search",
+            "download",
+            "concept_extraction",
+            "hierarchy",
+        }
+
+    def test_resume_repeats_empty_searches(self):
+        """An empty search (possibly an API error) is searched again."""
+        BatchProcessor(output_dir=str(self.output_dir)).process_strategy(
+            Mock(**{"execute_strategy.return_value": []}), "cfg", "basic"
+        )
+
+        resumed = BatchProcessor(output_dir=str(self.output_dir), resume=True)
+        use_case = self._use_case()
+        resumed.process_strategy(use_case, "cfg", "basic")
+
+        use_case.execute_strategy.assert_called_once()
+
+    def test_without_resume_completed_stages_are_rerun(self):
+        """Journal entries are ignored unless resume is requested."""
+        BatchProcessor(output_dir=str(self.output_dir)).process_strategy(
+            self._use_case(), "cfg", "basic"
+        )
+
+        processor = BatchProcessor(output_dir=str(self.output_dir))
+        use_case = self._use_case()
+        processor.process_strategy(use_case, "cfg", "basic")
+
+        use_case.execute_strategy.assert_called_once()
+
+    def test_no_papers_found_does_not_mark_download_complete(self):
+        """An empty search (possibly an API error) is retried on resume."""
+        processor = BatchProcessor(output_dir=str(self.output_dir))
+        use_case = Mock()
+        use_case.execute_strategy.return_value = []
+
+        processor.process_strategy(use_case, "cfg", "basic")
+
+        assert processor.journal.completed_stages("cfg", "basic") == {"search"}
+
+    def test_resume_rebuilds_hierarchy_from_saved_concepts(self):
+        """If only extraction finished, the hierarchy is rebuilt without re-extracting."""
+        extractor, builder = self._extractors()
+        processor = BatchProcessor(
+            output_dir=str(self.output_dir),
+            enable_concept_extraction=True,
+            concept_extractor=extractor,
+            hierarchy_builder=builder,
+        )
+        output_path = processor.create_output_structure("cfg", "basic")
+        (output_path / "pdfs" / "paper.pdf").touch()
+        processor._extract_and_save_concepts(output_path, "cfg", "basic")
+
+        # Simulate a crash between extraction and hierarchy building
+        lines = processor.journal.journal_path.read_text().splitlines()
+        processor.journal.journal_path.write_text(
+            "\n".join(l for l in lines if '"hierarchy"' not in l) + "\n"
+        )
+        manifest_file = output_path / "concept_manifest.json"
+        manifest = json.loads(manifest_file.read_text())
+        manifest["hierarchy_built"] = False
+        manifest_file.write_text(json.dumps(manifest))
+
+        extractor, builder = self._extractors()
+        resumed = BatchProcessor(
+            output_dir=str(self.output_dir),
+            enable_concept_extraction=True,
+            concept_extractor=extractor,
+            hierarchy_builder=builder,
+            resume=True,
+        )
+        resumed._extract_and_save_concepts(output_path, "cfg", "basic")
+
+        extractor.extract_from_directory.assert_not_called()
+        builder.build_hierarchy.assert_called_once_with(
+            [{"text": "heart rate variability"}]
+        )
+        assert resumed.journal.is_completed("cfg", "basic", "hierarchy")
+
+    def test_resume_skips_finished_concept_stages(self):
+        """Neither extraction nor hierarchy reruns once both are journaled."""
+        extractor, builder = self._extractors()
+        processor = BatchProcessor(
+            output_dir=str(self.output_dir),
+            enable_concept_extraction=True,
+            concept_extractor=extractor,
+            hierarchy_builder=builder,
+        )
+        output_path = processor.create_output_structure("cfg", "basic")
+        (output_path / "pdfs" / "paper.pdf").touch()
+        processor._extract_and_save_concepts(output_path, "cfg", "basic")
+
+        extractor, builder = self._extractors()
+        resumed = BatchProcessor(
+            output_dir=str(self.output_dir),
+            enable_concept_extraction=True,
+            concept_extractor=extractor,
+            hierarchy_builder=builder,
+            resume=True,
+        )
+        resumed._extract_and_save_concepts(output_path, "cfg", "basic")
+
+        extractor.extract_from_directory.assert_not_called()
+        builder.build_hierarchy.assert_not_called()
+
+    def test_run_all_without_resume_resets_journal(self):
+        """A fresh full run discards completions from earlier runs."""
+        config_dir = Path(self.test_dir) / "config"
+        config_dir.mkdir()
+        processor = BatchProcessor(
+            config_dir=str(config_dir), output_dir=str(self.output_dir)
+        )
+        processor.journal.mark_completed("old", "strategy", "search")
+
+        processor.run_all_configurations(use_arxiv=False)
+
+        reopened = BatchProcessor(output_dir=str(self.output_dir), resume=True)
+        assert len(reopened.journal) == 0
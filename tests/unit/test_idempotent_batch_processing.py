@@ -325,6 +325,85 @@ strategies:
                 assert "10.1000/day1.001" in downloaded_papers
                 assert "10.1000/day2.001" in downloaded_papers
 
+    def test_papers_stored_by_another_config_are_skipped_in_later_runs(self):
+        """
+        A paper stored under one configuration is not stored again by another
+        configuration in a later run, thanks to the persistent fingerprint index.
+        """
+        shared = ResearchPaper(
+            title="Shared Paper",
+            authors=["Author"],
+            abstract="Shared abstract",
+            publication_date=datetime(2023, 8, 1, tzinfo=timezone.utc),
+            doi="10.1000/shared.001",
+        )
+        mock_use_case = Mock()
+        mock_use_case.execute_strategy.return_value = [shared]
+
+        self.processor.process_strategy(mock_use_case, "config_a", "strategy")
+
+        next_run = BatchProcessor(
+            config_dir=str(self.config_dir), output_dir=str(self.output_dir)
+        )
+        next_run.process_strategy(mock_use_case, "config_b", "strategy")
+
+        assert next_run.processing_stats["papers_stored"] == 0
+        assert next_run.processing_stats["duplicates_filtered"] == 1
+        assert next_run.paper_index.locate(shared) == ("config_a", "strategy")
+
+    def test_papers_stored_elsewhere_are_not_downloaded(self):
+        """
+        Deduplication runs before downloads, so a paper another
+        configuration already stored is never fetched again.
+        """
+        shared = ResearchPaper(
+            title="Shared Paper",
+            authors=["Author"],
+            publication_date=datetime(2023, 8, 1, tzinfo=timezone.utc),
+            doi="10.1000/shared.001",
+        )
+        fresh = ResearchPaper(
+            title="Fresh Paper",
+            authors=["Author"],
+            publication_date=datetime(2023, 9, 1, tzinfo=timezone.utc),
+            doi="10.1000/fresh.001",
+        )
+        self.processor.paper_index.add_many([shared], "config_a", "strategy")
+        service = Mock()
+        service.download_single_paper.return_value = None
+        self.processor._download_service = lambda: service
+        mock_use_case = Mock()
+        mock_use_case.execute_strategy.return_value = [shared, fresh]
+
+        self.processor.process_strategy(mock_use_case, "config_b", "strategy")
+
+        search = mock_use_case.execute_strategy.call_args
+        assert search.kwargs["download_papers"] is False
+        downloaded = [call.args[0] for call in service.download_single_paper.mock_calls]
+        assert downloaded == [fresh]
+
+    def test_refresh_mode_rechecks_already_downloaded_papers(self):
+        """
+        Refresh runs hand known papers to the download service, which asks
+        the server whether each PDF changed instead of skipping it.
+        """
+        metadata = {"downloaded_papers": {"10.1000/test.001": {"title": "Test"}}}
+        paper = ResearchPaper(
+            title="Test Paper 1",
+            authors=["Author 1"],
+            publication_date=datetime(2023, 6, 15, tzinfo=timezone.utc),
+            doi="10.1000/test.001",
+        )
+        refreshing = BatchProcessor(
+            config_dir=str(self.config_dir),
+            output_dir=str(self.output_dir),
+            refresh_pdfs=True,
+        )
+
+        assert not self.processor._should_download_paper(paper, metadata)
+        assert refreshing._should_download_paper(paper, metadata)
+        assert refreshing._download_service().refresh
+
 
 class TestBatchProcessorMetadataManagement:
     """Tests for metadata management in idempotent operations."""